@@ -28,7 +28,9 @@ async def start_playground_match(payload: SessionCreationRequest) -> dict[str, s
         validate_cfg(p1_cfg)
         validate_cfg(p2_cfg)
 
-        session_id = await runtime.session_manager.create_session(p1_cfg, p2_cfg, visualize=payload.visualize)
+        session_id = await runtime.session_manager.create_session(
+            p1_cfg, p2_cfg, visualize=payload.visualize, pacing=payload.pacing
+        )
         return {"session_id": session_id}
 
     except HTTPException:
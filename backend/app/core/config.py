@@ -1,7 +1,9 @@
 """Configuration settings for the Spellcasters Playground Backend."""
 
+import os
 from pathlib import Path
 
+from pydantic import model_validator
 from pydantic_settings import BaseSettings
 
 
@@ -35,7 +37,12 @@ class Settings(BaseSettings):
 
     # Session management
     session_cleanup_minutes: int = 30
-    max_concurrent_sessions: int = 50
+    # Match loops run in this many worker processes, sessions routed to them by id; 1 keeps them
+    # in the server process, 0 starts one worker per core. Sharded sessions can't be visualized
+    session_shards: int = 1
+    max_sessions_per_core: int = 50
+    # 0: max_sessions_per_core for every core the sessions run on
+    max_concurrent_sessions: int = 0
 
     # Logging
     log_level: str = "INFO"
@@ -48,6 +55,12 @@ class Settings(BaseSettings):
     # Bot execution
     bot_execution_timeout: float = 1.0
     max_bot_memory_mb: int = 100
+    # Run builtin bots in resource-limited worker processes (enforces the two limits above)
+    bot_sandbox_enabled: bool = False
+    # Builtin bots decide on a pool of this many threads, off the event loop (0: decide on the loop).
+    # A decision that misses the deadline plays the default action; the bot sits out until it returns
+    engine_workers: int = 8
+    engine_decision_timeout_seconds: float = 2.0
 
     # Visualization
     enable_visualization: bool = True
@@ -56,9 +69,26 @@ class Settings(BaseSettings):
     visualizer_shutdown_timeout: float = 5.0
     visualizer_animation_duration: float = 0.5
     visualizer_initial_render_delay: float = 0.3
+    # A visualizer that falls behind the match catches up rather than slowing it down: with this many
+    # turns queued, or a turn this old, it skips to the newest turn; when slightly behind it animates faster
+    visualizer_max_backlog: int = 2
+    visualizer_max_lag_seconds: float = 1.0
+    visualizer_catchup_speed: float = 4.0
+    # Draw all visualized sessions as tiles of one window in a single renderer process
+    # (at most max_visualized_sessions) instead of a process and window per session
+    visualizer_shared_renderer: bool = False
+    visualizer_shared_window_size: tuple[int, int] = (1280, 960)
 
     model_config = {"env_file": ".env", "env_prefix": "PLAYGROUND_", "case_sensitive": False}
 
+    @model_validator(mode="after")
+    def _scale_sessions_with_cores(self) -> "Settings":
+        if self.session_shards <= 0:
+            self.session_shards = os.cpu_count() or 1
+        if self.max_concurrent_sessions <= 0:
+            self.max_concurrent_sessions = self.max_sessions_per_core * self.session_shards
+        return self
+
 
 # Global settings instance
 settings = Settings()
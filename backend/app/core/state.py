@@ -7,15 +7,17 @@ and health monitoring for all backend services.
 import logging
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 from ..services.admin_service import AdminService
 from ..services.database import DatabaseService
 from ..services.lobby_service import LobbyService
 from ..services.match_logger import MatchLogger
 from ..services.session_manager import SessionManager
+from ..services.sharding import ShardedSessionManager
 from ..services.sse_manager import SSEManager
 from ..services.visualizer_service import VisualizerService
+from .config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -49,7 +51,7 @@ class StateManager:
         self._sse_manager: Optional[SSEManager] = None
         self._match_logger: Optional[MatchLogger] = None
         self._visualizer_service: Optional[VisualizerService] = None
-        self._session_manager: Optional[SessionManager] = None
+        self._session_manager: Optional[Union[SessionManager, ShardedSessionManager]] = None
         self._lobby_service: Optional[LobbyService] = None
         self._admin_service: Optional[AdminService] = None
 
@@ -98,7 +100,7 @@ class StateManager:
         return self._match_logger
 
     @property
-    def session_manager(self) -> SessionManager:
+    def session_manager(self) -> Union[SessionManager, ShardedSessionManager]:
         """Get session manager instance."""
         if not self._session_manager:
             raise RuntimeError("Session manager not initialized")
@@ -253,11 +255,23 @@ class StateManager:
             if not self._sse_manager or not self._match_logger or not self._visualizer_service:
                 raise RuntimeError("SSE manager, match logger, and visualizer service must be initialized first")
 
-            self._session_manager = SessionManager(
-                sse_manager=self._sse_manager,
-                match_logger=self._match_logger,
-                visualizer_service=self._visualizer_service,
-            )
+            if settings.session_shards > 1:
+                # Match loops run in worker processes; their events come back to this process's services
+                sharded = ShardedSessionManager.with_processes(
+                    settings.session_shards,
+                    sse_manager=self._sse_manager,
+                    match_logger=self._match_logger,
+                    max_sessions=settings.max_concurrent_sessions,
+                )
+                await sharded.start()
+                self._session_manager = sharded
+            else:
+                self._session_manager = SessionManager(
+                    sse_manager=self._sse_manager,
+                    match_logger=self._match_logger,
+                    visualizer_service=self._visualizer_service,
+                    max_sessions=settings.max_concurrent_sessions,
+                )
 
             self._service_status[service_name] = ServiceStatus.READY
             logger.info(f"{service_name} initialized")
@@ -344,6 +358,7 @@ class StateManager:
                         await self._session_manager.cleanup_session(session_id)
                     except Exception as e:
                         logger.error(f"Error terminating session {session_id}: {e}")
+                await self._session_manager.shutdown()
                 self._service_status["session_manager"] = ServiceStatus.SHUTDOWN
 
             # Shutdown match logger
@@ -355,6 +370,7 @@ class StateManager:
             if self._visualizer_service:
                 logger.info("Shutting down visualizer service...")
                 # Note: Individual visualizers are terminated when sessions are terminated above
+                self._visualizer_service.shutdown_shared_renderer()
                 self._service_status["visualizer_service"] = ServiceStatus.SHUTDOWN
 
             # Shutdown SSE manager
@@ -414,7 +430,7 @@ class StateManager:
         if self._session_manager:
             # Note: list_active_sessions is async but get_statistics is sync
             # For now, we'll just count sessions from the internal state
-            stats["active_sessions"] = len(self._session_manager._sessions)
+            stats["active_sessions"] = self._session_manager.session_count
 
         if self._sse_manager:
             stats["active_sse_connections"] = self._sse_manager.get_connection_count()
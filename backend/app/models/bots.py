@@ -49,6 +49,20 @@ class BotInterface(ABC):
         """
         pass
 
+    async def decide_async(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Awaitable decision method used by the async turn loop.
+
+        Defaults to the synchronous decide; bots doing I/O override this
+        so they don't block the event loop.
+        """
+        return self.decide(state)
+
+    @property
+    def has_native_async(self) -> bool:
+        """True if decide_async is overridden rather than falling back to decide."""
+        return type(self).decide_async is not BotInterface.decide_async
+
     @property
     def is_builtin(self) -> bool:
         """Flag indicating if this is a built-in bot."""
@@ -16,6 +16,19 @@ class TurnStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+class PacingMode(str, Enum):
+    """How fast a session's match loop advances.
+
+    - realtime: pauses between turns so spectators can follow the match
+    - client: advances as soon as every player has acted, without pauses
+    - turbo: builtin bots only; plays the whole match without pauses or action collection
+    """
+
+    REALTIME = "realtime"
+    CLIENT = "client"
+    TURBO = "turbo"
+
+
 class PlayerSlot(BaseModel):
     """Represents a player slot in a game session."""
 
@@ -79,6 +92,7 @@ class SessionCreationRequest(BaseModel):
     player_2_config: Dict[str, Any] = Field(..., description="Player 2 configuration")
     settings: Optional[Dict[str, Any]] = Field(default=None, description="Optional game settings override")
     visualize: bool = Field(default=False, description="Enable pygame visualization for this session")
+    pacing: PacingMode = Field(default=PacingMode.REALTIME, description="How fast the match loop advances")
 
 
 class SessionInfo(BaseModel):
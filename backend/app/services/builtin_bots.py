@@ -1,9 +1,11 @@
 """Built-in bot registry and factory for the Spellcasters Playground Backend."""
 
+import asyncio
 import logging
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
+from ..core.config import settings
 from ..models.bots import BotInterface, BotInfo
 from ..models.players import Player
 
@@ -16,10 +18,35 @@ class BuiltinBotWrapper(BotInterface):
     This allows us to use existing bot implementations with the new player reference system.
     """
 
-    def __init__(self, player: Player, original_bot_class):
-        """Initialize wrapper with player reference and original bot class."""
+    def __init__(self, player: Player, original_bot_class, sandboxed: Optional[bool] = None):
+        """Initialize wrapper with player reference and original bot class.
+
+        Args:
+            player: Player this bot plays as
+            original_bot_class: Bot class (or factory) of the existing bot implementation
+            sandboxed: Run the bot in a resource-limited worker process.
+                Defaults to ``settings.bot_sandbox_enabled``. Starting the worker
+                blocks until the bot has loaded, so build sandboxed wrappers off
+                the event loop.
+        """
         super().__init__(player)
-        self._original_bot = original_bot_class()
+        if sandboxed is None:
+            sandboxed = settings.bot_sandbox_enabled
+
+        if sandboxed:
+            from simulator.loader import BotSpec
+            from simulator.sandbox import SandboxedBot
+
+            self._original_bot = SandboxedBot(
+                BotSpec.of(original_bot_class),
+                memory_limit_mb=settings.max_bot_memory_mb,
+                cpu_seconds=settings.bot_execution_timeout,
+                decide_timeout=settings.bot_execution_timeout,
+                # The server runs threads (engine executor, DB driver); don't fork it
+                start_method="spawn",
+            )
+        else:
+            self._original_bot = original_bot_class()
 
     def decide(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """Delegate decision to the original bot implementation."""
@@ -30,6 +57,35 @@ class BuiltinBotWrapper(BotInterface):
             # Return safe default action
             return {"move": [0, 0], "spell": None}
 
+    async def decide_async(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Await the original bot's decide_async if it has one, else call decide."""
+        decide_async = getattr(self._original_bot, "decide_async", None)
+        if not asyncio.iscoroutinefunction(decide_async):
+            return self.decide(state)
+        try:
+            return await decide_async(state)
+        except Exception as e:
+            logger.error(f"Built-in bot {self.name} execution error: {e}")
+            # Return safe default action
+            return {"move": [0, 0], "spell": None}
+
+    @property
+    def has_native_async(self) -> bool:
+        """True if the original bot awaits in decide_async rather than falling back to decide."""
+        from bots.bot_interface import has_native_async
+
+        decide_async = getattr(self._original_bot, "decide_async", None)
+        return asyncio.iscoroutinefunction(decide_async) and has_native_async(self._original_bot)
+
+    def close(self) -> None:
+        """Release resources held by the original bot (e.g. its sandbox worker)."""
+        close = getattr(self._original_bot, "close", None)
+        if callable(close):
+            try:
+                close()
+            except Exception as e:
+                logger.warning(f"Failed to close built-in bot {self.name}: {e}")
+
 
 class BuiltinBotRegistry:
     """Registry and factory for built-in bots with their default players."""
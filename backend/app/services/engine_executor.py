@@ -0,0 +1,70 @@
+"""Bounded thread pool running bot decisions off the event loop.
+
+Builtin bots decide synchronously, and some of them take a while: torch
+inference, deep heuristic searches, a sandboxed bot waiting on its worker.
+Called on the event loop, every such decision stalls every other session's SSE
+delivery and action submissions. ``EngineExecutor`` runs them on a fixed number
+of threads instead and gives each one a deadline. Threads rather than
+processes: the engine state lives in the server process, and the slow parts
+(torch, a sandbox's pipe) release the GIL.
+
+A decision that misses its deadline can't be stopped; it keeps its thread
+until it returns, which is why ``GameEngineAdapter`` doesn't ask that bot again
+until then.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+from typing import Any, Callable, Dict, Optional
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class EngineExecutor:
+    """Runs synchronous calls on a bounded thread pool, awaiting each with a deadline."""
+
+    def __init__(self, workers: Optional[int] = None, timeout: Optional[float] = None):
+        """Create the pool of engine threads.
+
+        Args:
+            workers: Threads in the pool; 0 disables it. Defaults to ``settings.engine_workers``.
+            timeout: Seconds a call may take. Defaults to ``settings.engine_decision_timeout_seconds``.
+
+        """
+        self.workers = settings.engine_workers if workers is None else workers
+        self.timeout = settings.engine_decision_timeout_seconds if timeout is None else timeout
+        self._pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        if self.workers > 0:
+            self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="engine")
+        self.calls = 0
+        self.timeouts = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._pool is not None
+
+    def submit(self, func: Callable[..., Any], *args: Any) -> concurrent.futures.Future:
+        if self._pool is None:
+            raise RuntimeError("Engine executor is disabled or shut down")
+        self.calls += 1
+        return self._pool.submit(func, *args)
+
+    async def wait(self, future: concurrent.futures.Future) -> Any:
+        """Result of a submitted call; raises asyncio.TimeoutError past the deadline, leaving the call running."""
+        try:
+            return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise
+
+    def stats(self) -> Dict[str, Any]:
+        return {"workers": self.workers, "calls": self.calls, "timeouts": self.timeouts}
+
+    def shutdown(self) -> None:
+        """Stop the pool without waiting for calls still running."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
@@ -1,6 +1,7 @@
 """Game engine adapter for the Spellcasters Playground Backend."""
 
 import asyncio
+import concurrent.futures
 import logging
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -8,6 +9,7 @@ from ..models.bots import BotInterface
 from ..models.actions import Move, MoveResult, SpellAction
 from ..models.results import GameResult, GameResultType, PlayerGameStats
 from ..models.events import TurnEvent, GameOverEvent
+from .engine_executor import EngineExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -22,21 +24,29 @@ class GameEngineAdapter:
     Bridges the gap between the new bot interface and existing game engine.
     """
 
-    def __init__(self):
-        """Initialize the game engine adapter."""
+    def __init__(self, executor: Optional[EngineExecutor] = None):
+        """Initialize the game engine adapter.
+
+        Args:
+            executor: Runs builtin bots' decisions off the event loop; without one they decide on it
+        """
         self.engine = None
         self.bot1 = None
         self.bot2 = None
         self._turn_events = []
         self._game_started = False
+        self._executor = executor
+        # Decision of each bot still running on the executor, if it missed its deadline
+        self._pending: Dict[int, concurrent.futures.Future] = {}
 
-    def initialize_match(self, bot1: BotInterface, bot2: BotInterface) -> None:
+    def initialize_match(self, bot1: BotInterface, bot2: BotInterface, quiet: bool = False) -> None:
         """
         Initialize game engine with bot instances.
 
         Args:
             bot1: First bot instance
             bot2: Second bot instance
+            quiet: Record game events without echoing them to the console
         """
         try:
             # Ensure GameEngine is available (allowing tests to patch this symbol)
@@ -50,7 +60,12 @@ class GameEngineAdapter:
             self.bot2 = bot2
 
             # Create the game engine with bot instances
-            self.engine = GameEngine(bot1, bot2)
+            if quiet:
+                from game.logger import LOG_LEVEL_QUIET, GameLogger
+
+                self.engine = GameEngine(bot1, bot2, logger=GameLogger(LOG_LEVEL_QUIET))
+            else:
+                self.engine = GameEngine(bot1, bot2)
             self._game_started = True
             self._turn_events = []
 
@@ -74,8 +89,19 @@ class GameEngineAdapter:
             # Store current turn number before execution
             current_turn = self.engine.turn
 
-            # Execute the turn using the existing game engine
-            self.engine.run_turn()
+            # Execute the turn using the existing game engine, awaiting
+            # async-capable bots natively when the engine supports it
+            run_turn_async = getattr(self.engine, "run_turn_async", None)
+            if self._executor is not None and self._executor.enabled and hasattr(self.engine, "begin_turn"):
+                states = self.engine.begin_turn()
+                actions = await asyncio.gather(
+                    self._decide(0, self.bot1, states[0]), self._decide(1, self.bot2, states[1])
+                )
+                self.engine.resolve_turn(list(actions))
+            elif run_turn_async is not None:
+                await run_turn_async()
+            else:
+                self.engine.run_turn()
 
             # Get the current game state after turn execution
             game_state = self.get_game_state()
@@ -102,6 +128,32 @@ class GameEngineAdapter:
             logger.error(f"Error executing turn: {e}")
             raise RuntimeError(f"Turn execution failed: {e}")
 
+    async def _decide(self, index: int, bot: BotInterface, state: Dict[str, Any]) -> Dict[str, Any]:
+        """One bot's action, decided on the executor unless the bot awaits natively.
+
+        Remote players' bots only return the action submitted over HTTP, so they
+        decide on the loop too.
+        """
+        if bot.has_native_async:
+            return await bot.decide_async(state)
+        if not bot.is_builtin:
+            return bot.decide(state)
+
+        pending = self._pending.get(index)
+        if pending is not None and not pending.done():
+            logger.warning(f"{bot.name} is still deciding an earlier turn; playing the default action")
+            return {"move": [0, 0], "spell": None}
+
+        future = self._executor.submit(bot.decide, state)
+        self._pending[index] = future
+        try:
+            return await self._executor.wait(future)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"{bot.name} did not decide within {self._executor.timeout:g}s; playing the default action"
+            )
+            return {"move": [0, 0], "spell": None}
+
     def get_game_state(self) -> Dict[str, Any]:
         """
         Get current game state for SSE streaming.
@@ -5,6 +5,7 @@ import logging
 from collections import deque
 from typing import TYPE_CHECKING, Deque, Dict, Optional
 
+from ..core.config import settings
 from ..core.exceptions import PlayerAlreadyInLobbyError, PlayerNotFoundError
 from ..models.lobby import LobbyJoinRequest, LobbyMatchResponse, QueueEntry
 
@@ -129,9 +130,9 @@ class LobbyService:
                 logger.error(f"Player not found during matching: p1={p1_player}, p2={p2_player}")
                 return
 
-            # Create session with visualization enabled
+            # Create session with visualization enabled, unless sessions are sharded and can't have it
             session_id = await self._session_manager.create_session(
-                player_1=p1_entry.bot_config, player_2=p2_entry.bot_config, visualize=True
+                player_1=p1_entry.bot_config, player_2=p2_entry.bot_config, visualize=settings.session_shards == 1
             )
 
             logger.info(f"Created lobby match session: {session_id}")
@@ -9,13 +9,14 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 from uuid import uuid4
 
-from ..core.exceptions import SessionNotFoundError
+from ..core.exceptions import RateLimitError, SessionNotFoundError
 from ..models.actions import ActionData
 from ..models.bots import BotInterface, HumanBot, PlayerBot
 from ..models.players import PlayerConfig
-from ..models.sessions import GameState, PlayerSlot, TurnStatus
+from ..models.sessions import GameState, PacingMode, PlayerSlot, TurnStatus
 from .builtin_bots import BuiltinBotRegistry
 from .database import DatabaseService
+from .engine_executor import EngineExecutor
 from .game_adapter import GameEngineAdapter
 from .match_logger import MatchLogger
 from .sse_manager import SSEManager
@@ -35,12 +36,33 @@ class SessionContext:
     adapter: GameEngineAdapter
     task: Optional[asyncio.Task]
     created_at: datetime
+    pacing: PacingMode = PacingMode.REALTIME
 
     # Visualization support
     visualizer_process: Optional[multiprocessing.Process] = None
     visualizer_queue: Optional[multiprocessing.Queue] = None
     visualizer_enabled: bool = False
 
+    def snapshot(self) -> "SessionSnapshot":
+        return SessionSnapshot(
+            session_id=self.session_id,
+            game_state=self.game_state.model_copy(deep=True),
+            created_at=self.created_at,
+            pacing=self.pacing,
+            visualizer_enabled=self.visualizer_enabled,
+        )
+
+
+@dataclass
+class SessionSnapshot:
+    """A session as seen from outside the process running it (see ShardedSessionManager)."""
+
+    session_id: str
+    game_state: GameState
+    created_at: datetime
+    pacing: PacingMode
+    visualizer_enabled: bool
+
 
 class SessionManager:
     """Creates and manages game sessions and the match loop."""
@@ -51,31 +73,64 @@ class SessionManager:
         sse_manager: Optional[SSEManager] = None,
         match_logger: Optional[MatchLogger] = None,
         visualizer_service: Optional[VisualizerService] = None,
+        engine_executor: Optional[EngineExecutor] = None,
+        max_sessions: Optional[int] = None,
     ):
         self._db = db_service or DatabaseService()
         self._sse = sse_manager
+        # Only touched from the event loop and never across an await, so it needs no lock
         self._sessions: dict[str, SessionContext] = {}
         self._turn_processor = TurnProcessor()
-        self._lock = asyncio.Lock()
         self._logger = match_logger
         self._visualizer_service = visualizer_service or VisualizerService()
+        # Shared by every session, so the worker count bounds the threads of the whole server
+        self._engine_executor = engine_executor or EngineExecutor()
+        self._max_sessions = max_sessions
+        # Sessions past the limit check but not in _sessions yet; they count towards the limit
+        self._pending = 0
 
-    async def create_session(self, player_1: PlayerConfig, player_2: PlayerConfig, visualize: bool = False) -> str:
+    async def create_session(
+        self,
+        player_1: PlayerConfig,
+        player_2: PlayerConfig,
+        visualize: bool = False,
+        pacing: PacingMode = PacingMode.REALTIME,
+        session_id: Optional[str] = None,
+    ) -> str:
         """Create a new session and start the match loop.
 
         Args:
             player_1: Configuration for player 1
             player_2: Configuration for player 2
             visualize: Whether to spawn a visualizer process for this session
+            pacing: How fast the match loop advances; turbo needs two builtin bots
+            session_id: Id for the session, chosen by a ShardedSessionManager; a new UUID by default
 
         Returns:
             The new session_id.
         """
-        session_id = str(uuid4())
+        # Checked and reserved before the first await, so concurrent creations can't overshoot the limit
+        if self._max_sessions is not None and self._active_count() + self._pending >= self._max_sessions:
+            raise RateLimitError(f"{self._max_sessions} concurrent sessions")
+        self._pending += 1
+        try:
+            return await self._create_session(player_1, player_2, visualize, pacing, session_id or str(uuid4()))
+        finally:
+            self._pending -= 1
 
+    async def _create_session(
+        self,
+        player_1: PlayerConfig,
+        player_2: PlayerConfig,
+        visualize: bool,
+        pacing: PacingMode,
+        session_id: str,
+    ) -> str:
         # Build bot instances from configs
         bot1 = await self._create_bot_from_config(player_1)
         bot2 = await self._create_bot_from_config(player_2)
+        if pacing == PacingMode.TURBO and not (bot1.is_builtin and bot2.is_builtin):
+            raise ValueError("Turbo pacing is only available for sessions between builtin bots")
 
         # Initialize game state
         game_state = GameState(
@@ -97,8 +152,9 @@ class SessionManager:
         await self._db.create_session_record(session_id, bot1.player_id, bot2.player_id)
 
         # Initialize engine adapter
-        adapter = GameEngineAdapter()
-        adapter.initialize_match(bot1, bot2)
+        adapter = GameEngineAdapter(executor=self._engine_executor)
+        # Turbo sessions play many matches back to back; echoing every event would dominate them
+        adapter.initialize_match(bot1, bot2, quiet=pacing == PacingMode.TURBO)
 
         # Save context
         context = SessionContext(
@@ -107,14 +163,16 @@ class SessionManager:
             adapter=adapter,
             task=None,
             created_at=datetime.now(),
+            pacing=pacing,
         )
-        async with self._lock:
-            self._sessions[session_id] = context
+        self._sessions[session_id] = context
 
         # Spawn visualizer if requested
         if visualize:
             try:
-                process, queue = self._visualizer_service.spawn_visualizer(
+                # Opening a tile of the shared renderer can wait for room in its queue
+                process, queue = await asyncio.to_thread(
+                    self._visualizer_service.spawn_visualizer,
                     session_id=session_id,
                     player1_name=bot1.name,
                     player2_name=bot2.name,
@@ -146,7 +204,8 @@ class SessionManager:
         if cfg.bot_type == "builtin":
             if not cfg.bot_id:
                 raise ValueError("bot_id required for builtin bot")
-            return BuiltinBotRegistry.create_bot(cfg.bot_id)
+            # Imports the bot and, when sandboxed, waits for its worker to start: keep it off the loop
+            return await asyncio.to_thread(BuiltinBotRegistry.create_bot, cfg.bot_id)
 
         # Remote player bot: create PlayerBot that waits for HTTP action submission
         if not cfg.player_id:
@@ -157,11 +216,13 @@ class SessionManager:
         return PlayerBot(player)
 
     async def _run_match_loop(self, ctx: SessionContext) -> None:
-        """Run the automated match loop until completion."""
+        """Run the automated match loop until completion, paced by ``ctx.pacing``."""
+        turbo = ctx.pacing == PacingMode.TURBO
         try:
             start_time = datetime.now()
-            # Small delay to allow SSE clients to connect before game starts
-            await asyncio.sleep(0.1)
+            if not turbo:
+                # Small delay to allow SSE clients to connect before game starts
+                await asyncio.sleep(0.1)
             while True:
                 expected_players = [ctx.game_state.player_1.player_id, ctx.game_state.player_2.player_id]
                 next_turn = ctx.game_state.turn_index + 1
@@ -172,9 +233,12 @@ class SessionManager:
                         pid == ctx.game_state.player_2.player_id and ctx.game_state.player_2.is_builtin_bot
                     )
 
-                collected_actions = await self._turn_processor.collect_actions(
-                    ctx.session_id, next_turn, expected_players, is_builtin=_is_builtin
-                )
+                # Builtin bots decide inside the engine, so a turbo session has nothing to collect
+                collected_actions = None
+                if not turbo:
+                    collected_actions = await self._turn_processor.collect_actions(
+                        ctx.session_id, next_turn, expected_players, is_builtin=_is_builtin
+                    )
 
                 # Execute a single turn on the engine
                 turn_event: TurnEvent = await ctx.adapter.execute_turn()  # type: ignore[assignment]
@@ -183,15 +247,16 @@ class SessionManager:
                 ctx.game_state.turn_index = turn_event.turn
                 ctx.game_state.current_game_state = turn_event.game_state
                 # Override/attach collected action summaries for observability
-                turn_event.actions = [
-                    {
-                        "player_id": move.player_id,
-                        "turn": move.turn,
-                        "move": move.move,
-                        "spell": (move.spell.model_dump() if move.spell else None),
-                    }
-                    for move in collected_actions.values()
-                ]
+                if collected_actions is not None:
+                    turn_event.actions = [
+                        {
+                            "player_id": move.player_id,
+                            "turn": move.turn,
+                            "move": move.move,
+                            "spell": (move.spell.model_dump() if move.spell else None),
+                        }
+                        for move in collected_actions.values()
+                    ]
                 ctx.game_state.add_log_entry(turn_event.log_line)
 
                 # Broadcast turn update over SSE if configured
@@ -212,15 +277,9 @@ class SessionManager:
                     except Exception as exc:
                         logger.warning(f"Failed to log turn for {ctx.session_id}: {exc}")
 
-                # Delay between turns to allow SSE event delivery and animation completion
-                # When visualizer is enabled, wait for animation duration to complete
-                # Otherwise, use minimal delay
-                if ctx.visualizer_enabled:
-                    from ..core.config import settings
-
-                    # Wait for animation to complete plus a small buffer for rendering
-                    await asyncio.sleep(settings.visualizer_animation_duration + 0.1)
-                else:
+                # Delay between turns to allow SSE event delivery. A visualizer doesn't hold the
+                # match back: it skips ahead on its own when it falls behind (see VisualizerAdapter)
+                if ctx.pacing == PacingMode.REALTIME:
                     await asyncio.sleep(0.01)
 
                 # Check game over
@@ -264,7 +323,8 @@ class SessionManager:
                     break
 
                 # Small scheduling yield to avoid blocking event loop
-                await asyncio.sleep(0)
+                if not turbo:
+                    await asyncio.sleep(0)
 
         except asyncio.CancelledError:
             logger.info(f"Session {ctx.session_id} cancelled")
@@ -283,22 +343,47 @@ class SessionManager:
             # NOTE: Visualizer is NOT terminated automatically when session ends.
             # It remains open to show the final game state.
             # Admin can manually terminate via cleanup_session() API or user can close the window.
-            pass
+            self._close_bots(ctx)
+            await self._turn_processor.cleanup_session(ctx.session_id)
+
+    @property
+    def session_count(self) -> int:
+        """Sessions held in memory, finished ones included until cleaned up."""
+        return len(self._sessions)
+
+    async def shutdown(self) -> None:
+        """Stop the threads bots decide on; call once no session is running."""
+        self._engine_executor.shutdown()
+
+    @staticmethod
+    def _close_bots(ctx: SessionContext) -> None:
+        """Release per-bot resources such as sandbox worker processes."""
+        for bot in (ctx.adapter.bot1, ctx.adapter.bot2):
+            close = getattr(bot, "close", None)
+            if callable(close):
+                close()
 
     async def get_session(self, session_id: str) -> SessionContext:
-        async with self._lock:
-            ctx = self._sessions.get(session_id)
+        ctx = self._sessions.get(session_id)
         if not ctx:
             raise SessionNotFoundError(session_id)
         return ctx
 
+    async def get_visualizer_metrics(self, session_id: str) -> Optional[dict]:
+        """Lag metrics of the session's visualizer, or None if it has none."""
+        ctx = await self.get_session(session_id)
+        if not ctx.visualizer_enabled:
+            return None
+        return self._visualizer_service.get_lag_metrics(ctx.visualizer_queue)
+
     async def list_active_sessions(self) -> list[str]:
-        async with self._lock:
-            return [s for s, c in self._sessions.items() if c.game_state.status == TurnStatus.ACTIVE]
+        return [s for s, c in self._sessions.items() if c.game_state.status == TurnStatus.ACTIVE]
+
+    def _active_count(self) -> int:
+        return sum(1 for c in self._sessions.values() if c.game_state.status == TurnStatus.ACTIVE)
 
     async def cleanup_session(self, session_id: str) -> bool:
-        async with self._lock:
-            ctx = self._sessions.get(session_id)
+        ctx = self._sessions.get(session_id)
         if not ctx:
             raise SessionNotFoundError(session_id)
 
@@ -306,7 +391,9 @@ class SessionManager:
         if ctx.visualizer_enabled and ctx.visualizer_process:
             try:
                 logger.info(f"Terminating visualizer for session {session_id} during cleanup")
-                self._visualizer_service.terminate_visualizer(ctx.visualizer_process, ctx.visualizer_queue)
+                await asyncio.to_thread(
+                    self._visualizer_service.terminate_visualizer, ctx.visualizer_process, ctx.visualizer_queue
+                )
             except Exception as exc:
                 logger.error(f"Error terminating visualizer during cleanup for {session_id}: {exc}", exc_info=True)
 
@@ -314,8 +401,7 @@ class SessionManager:
             ctx.task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await ctx.task
-        async with self._lock:
-            self._sessions.pop(session_id, None)
+        self._sessions.pop(session_id, None)
         return True
 
     async def submit_action(self, session_id: str, player_id: str, turn: int, action: ActionData) -> None:
@@ -340,8 +426,7 @@ class SessionManager:
             player_id,
             turn,
         )
-        async with self._lock:
-            ctx = self._sessions.get(session_id)
+        ctx = self._sessions.get(session_id)
         if not ctx:
             return
 
@@ -0,0 +1,407 @@
+"""Session sharding: match loops spread over several SessionManagers, one per worker process.
+
+A single ``SessionManager`` runs every match loop on the server's one event
+loop, so the backend uses one core however many matches run. With
+``session_shards`` above 1, ``ShardedSessionManager`` takes its place: it starts
+that many shards, each a worker process running its own ``SessionManager``,
+and routes every call about a session to the shard owning it, picked by a hash
+of the session id. Ids stay plain UUIDs: a new session's id is drawn until it
+hashes to the least loaded shard.
+
+Calls travel to a shard over a pipe and their results come back over another.
+A shard's ``SessionManager`` broadcasts and logs through stand-ins that
+forward those calls over the same return pipe, and the server hands them to
+its own ``SSEManager`` and ``MatchLogger``; SSE clients, match logs and replays
+therefore stay in the server process and don't care where a session runs.
+Callers get a ``SessionSnapshot`` of a session instead of its context.
+
+Sharded sessions can't be visualized: a shard's visualizer would open its
+window from a worker process, so ``create_session`` refuses ``visualize``.
+
+``LocalShard`` runs a shard's ``SessionManager`` in the calling process, behind
+the same interface, for tests.
+"""
+
+import asyncio
+import contextlib
+import itertools
+import logging
+import multiprocessing
+import pickle
+import sys
+import threading
+import zlib
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from uuid import uuid4
+
+from ..core.exceptions import RateLimitError
+from ..models.actions import ActionData
+from ..models.players import PlayerConfig
+from ..models.sessions import PacingMode
+from .match_logger import MatchLogger
+from .session_manager import SessionManager, SessionSnapshot
+from .sse_manager import SSEManager
+
+logger = logging.getLogger(__name__)
+
+# SessionManager methods a shard answers
+SHARD_CALLS = (
+    "create_session",
+    "get_session",
+    "get_visualizer_metrics",
+    "list_active_sessions",
+    "cleanup_session",
+    "submit_action",
+)
+SHARD_STOP_TIMEOUT = 10.0
+
+
+def _pack_error(exc: BaseException) -> Tuple[type, str, Dict[str, Any]]:
+    # Exceptions are rebuilt from their attributes: the playground errors' __init__ takes other arguments than args
+    return type(exc), str(exc), dict(vars(exc))
+
+
+def _unpack_error(cls: type, message: str, attributes: Dict[str, Any]) -> BaseException:
+    exc = cls.__new__(cls)
+    BaseException.__init__(exc, message)
+    exc.__dict__.update(attributes)
+    return exc
+
+
+async def _dispatch(manager: SessionManager, method: str, args: Sequence[Any], kwargs: Dict[str, Any]) -> Any:
+    if method not in SHARD_CALLS:
+        raise ValueError(f"Unknown shard call {method!r}")
+    result = await getattr(manager, method)(*args, **kwargs)
+    if method == "get_session":
+        result = result.snapshot()
+    return result
+
+
+async def _stop_manager(manager: SessionManager) -> None:
+    for session_id in await manager.list_active_sessions():
+        try:
+            await manager.cleanup_session(session_id)
+        except Exception as exc:
+            logger.error(f"Error terminating session {session_id}: {exc}")
+    await manager.shutdown()
+
+
+class _ForwardedSSE:
+    """Stands in for the server's SSEManager in a shard, forwarding what the match loop sends it."""
+
+    def __init__(self, send):
+        self._send = send
+
+    async def broadcast(self, session_id: str, event: Any) -> None:
+        self._send(("event", "sse", "broadcast", (session_id, event)))
+
+    async def close_session_streams(self, session_id: str) -> None:
+        self._send(("event", "sse", "close_session_streams", (session_id,)))
+
+
+class _ForwardedMatchLogger:
+    """Stands in for the server's MatchLogger in a shard."""
+
+    def __init__(self, send):
+        self._send = send
+
+    def start_session(self, *args: Any) -> None:
+        self._send(("event", "log", "start_session", args))
+
+    def log_turn(self, *args: Any) -> None:
+        self._send(("event", "log", "log_turn", args))
+
+    def log_game_over(self, *args: Any) -> None:
+        self._send(("event", "log", "log_game_over", args))
+
+
+async def _answer(manager: SessionManager, replies: Any, call_id: int, method: str, args: Any, kwargs: Any) -> None:
+    try:
+        reply = ("result", call_id, True, await _dispatch(manager, method, args, kwargs))
+    except Exception as exc:
+        reply = ("result", call_id, False, _pack_error(exc))
+    try:
+        replies.send(reply)
+    except (pickle.PicklingError, TypeError, AttributeError) as exc:
+        # Result or error that doesn't pickle
+        replies.send(("result", call_id, False, _pack_error(RuntimeError(f"{method} failed in shard: {exc}"))))
+
+
+async def _serve_shard(requests: Any, replies: Any) -> None:
+    loop = asyncio.get_running_loop()
+    inbox: asyncio.Queue = asyncio.Queue()
+
+    def read() -> None:
+        while True:
+            try:
+                message = requests.recv()
+            except (EOFError, OSError):
+                message = None  # the server is gone
+            loop.call_soon_threadsafe(inbox.put_nowait, message)
+            if message is None or message[0] == "stop":
+                return
+
+    threading.Thread(target=read, name="shard-requests", daemon=True).start()
+    manager = SessionManager(
+        sse_manager=_ForwardedSSE(replies.send),  # type: ignore[arg-type]
+        match_logger=_ForwardedMatchLogger(replies.send),  # type: ignore[arg-type]
+    )
+    calls = set()
+    while True:
+        message = await inbox.get()
+        if message is None or message[0] == "stop":
+            break
+        task = asyncio.create_task(_answer(manager, replies, *message[1:]))
+        calls.add(task)
+        task.add_done_callback(calls.discard)
+    await _stop_manager(manager)
+
+
+def run_shard(index: int, requests: Any, replies: Any) -> None:
+    """Entry point of a shard's worker process, started by ProcessShard."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format=f"[Shard {index}] %(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        stream=sys.stdout,
+    )
+    try:
+        asyncio.run(_serve_shard(requests, replies))
+    except Exception as exc:
+        logger.error(f"Error in session shard {index}: {exc}", exc_info=True)
+        sys.exit(1)
+
+
+class LocalShard:
+    """A shard whose SessionManager runs in this process; stands in for ProcessShard in tests."""
+
+    def __init__(
+        self,
+        index: int,
+        sse_manager: Optional[SSEManager] = None,
+        match_logger: Optional[MatchLogger] = None,
+        **manager_kwargs: Any,
+    ):
+        self.index = index
+        self.manager = SessionManager(sse_manager=sse_manager, match_logger=match_logger, **manager_kwargs)
+
+    async def start(self) -> None:
+        pass
+
+    async def call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        return await _dispatch(self.manager, method, args, kwargs)
+
+    async def stop(self) -> None:
+        await _stop_manager(self.manager)
+
+
+class ProcessShard:
+    """A shard running in a worker process, reached over a pair of pipes."""
+
+    def __init__(
+        self, index: int, sse_manager: Optional[SSEManager] = None, match_logger: Optional[MatchLogger] = None
+    ):
+        self.index = index
+        self._sse = sse_manager
+        self._logger = match_logger
+        self._process: Optional[multiprocessing.Process] = None
+        self._requests: Any = None
+        self._replies: Any = None
+        self._calls: Dict[int, asyncio.Future] = {}
+        self._call_ids = itertools.count()
+        self._events: asyncio.Queue = asyncio.Queue()
+        self._pump: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def start(self) -> None:
+        # Spawned, not forked: the server has threads and a running event loop
+        context = multiprocessing.get_context("spawn")
+        requests_out, self._requests = context.Pipe(duplex=False)
+        self._replies, replies_in = context.Pipe(duplex=False)
+        self._process = context.Process(
+            target=run_shard, args=(self.index, requests_out, replies_in), name=f"session-shard-{self.index}"
+        )
+        self._process.start()
+        requests_out.close()
+        replies_in.close()
+
+        self._loop = asyncio.get_running_loop()
+        self._pump = asyncio.create_task(self._pump_events())
+        threading.Thread(target=self._read_replies, name=f"shard-{self.index}-replies", daemon=True).start()
+        logger.info(f"Session shard {self.index} started (PID: {self._process.pid})")
+
+    def _read_replies(self) -> None:
+        while True:
+            try:
+                message = self._replies.recv()
+            except (EOFError, OSError):
+                self._loop.call_soon_threadsafe(self._fail_calls)
+                return
+            self._loop.call_soon_threadsafe(self._received, message)
+
+    def _received(self, message: tuple) -> None:
+        if message[0] == "result":
+            _, call_id, ok, value = message
+            future = self._calls.pop(call_id, None)
+            if future is None or future.done():
+                return
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(_unpack_error(*value))
+        else:
+            self._events.put_nowait(message)
+
+    def _fail_calls(self) -> None:
+        for future in self._calls.values():
+            if not future.done():
+                future.set_exception(RuntimeError(f"Session shard {self.index} exited"))
+        self._calls.clear()
+
+    async def _pump_events(self) -> None:
+        # One at a time, so a session's events reach its clients in the order they were sent
+        while True:
+            _, target, method, args = await self._events.get()
+            try:
+                if target == "sse" and self._sse:
+                    await getattr(self._sse, method)(*args)
+                elif target == "log" and self._logger:
+                    getattr(self._logger, method)(*args)
+            except Exception as exc:
+                logger.warning(f"Failed to forward {method} from session shard {self.index}: {exc}")
+
+    async def call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        if self._process is None or not self._process.is_alive():
+            raise RuntimeError(f"Session shard {self.index} is not running")
+        call_id = next(self._call_ids)
+        future = asyncio.get_running_loop().create_future()
+        self._calls[call_id] = future
+        self._requests.send(("call", call_id, method, args, kwargs))
+        return await future
+
+    async def stop(self, timeout: float = SHARD_STOP_TIMEOUT) -> None:
+        """Ask the worker to end its sessions and exit; terminate it if it doesn't in time."""
+        if self._process is None:
+            return
+        with contextlib.suppress(OSError):  # the worker is already gone
+            self._requests.send(("stop",))
+        await asyncio.to_thread(self._process.join, timeout)
+        if self._process.is_alive():
+            logger.warning(f"Session shard {self.index} did not stop in {timeout:g}s, terminating")
+            self._process.terminate()
+            await asyncio.to_thread(self._process.join, 1.0)
+        # Let the pump hand over what the shard sent last
+        while not self._events.empty():
+            await asyncio.sleep(0)
+        if self._pump:
+            self._pump.cancel()
+        self._requests.close()
+        self._process = None
+
+
+class ShardedSessionManager:
+    """SessionManager interface over several shards, each running its own SessionManager."""
+
+    def __init__(self, shards: Sequence[Any], max_sessions: Optional[int] = None):
+        if not shards:
+            raise ValueError("At least one shard is required")
+        self._shards = list(shards)
+        self._max_sessions = max_sessions
+        self._session_ids: set = set()
+        # Created sessions seen finished by a shard, and ids reserved by creations in flight
+        self._finished: set = set()
+        self._reserved: set = set()
+
+    @classmethod
+    def with_processes(
+        cls,
+        count: int,
+        sse_manager: Optional[SSEManager] = None,
+        match_logger: Optional[MatchLogger] = None,
+        max_sessions: Optional[int] = None,
+    ) -> "ShardedSessionManager":
+        return cls([ProcessShard(index, sse_manager, match_logger) for index in range(count)], max_sessions)
+
+    def shard_index(self, session_id: str) -> int:
+        return zlib.crc32(session_id.encode()) % len(self._shards)
+
+    def _shard(self, session_id: str) -> Any:
+        return self._shards[self.shard_index(session_id)]
+
+    def _new_session_id(self, shard: int) -> str:
+        while True:
+            session_id = str(uuid4())
+            if self.shard_index(session_id) == shard:
+                return session_id
+
+    async def start(self) -> None:
+        await asyncio.gather(*(shard.start() for shard in self._shards))
+
+    async def create_session(
+        self,
+        player_1: PlayerConfig,
+        player_2: PlayerConfig,
+        visualize: bool = False,
+        pacing: PacingMode = PacingMode.REALTIME,
+    ) -> str:
+        """Create a session on the least loaded shard; see SessionManager.create_session.
+
+        The limit and the load are counted from the ids known here: a session is
+        live until a shard has reported it finished, and a reserved id counts
+        from before the shard is asked to create it. Concurrent creations each
+        see the others' reservations, so they neither overshoot the limit nor
+        all pick the same shard.
+
+        Raises:
+            ValueError: If ``visualize`` is set; sharded sessions always run headless
+
+        """
+        if visualize:
+            raise ValueError("Visualization is not available when sessions are sharded (session_shards above 1)")
+        known = set(self._session_ids)
+        active = set(await self.list_active_sessions())
+        # Sessions that existed before the listing and aren't active any more have finished for good
+        self._finished |= (known & self._session_ids) - active
+
+        live = (self._session_ids - self._finished) | self._reserved
+        if self._max_sessions is not None and len(live) >= self._max_sessions:
+            raise RateLimitError(f"{self._max_sessions} concurrent sessions")
+        load = Counter(self.shard_index(session_id) for session_id in live)
+        target = min(range(len(self._shards)), key=lambda index: load[index])
+        session_id = self._new_session_id(target)
+        self._reserved.add(session_id)
+        try:
+            await self._shards[target].call(
+                "create_session", player_1, player_2, visualize=visualize, pacing=pacing, session_id=session_id
+            )
+            self._session_ids.add(session_id)
+        finally:
+            self._reserved.discard(session_id)
+        return session_id
+
+    async def get_session(self, session_id: str) -> SessionSnapshot:
+        return await self._shard(session_id).call("get_session", session_id)
+
+    async def get_visualizer_metrics(self, session_id: str) -> Optional[dict]:
+        return await self._shard(session_id).call("get_visualizer_metrics", session_id)
+
+    async def list_active_sessions(self) -> List[str]:
+        per_shard = await asyncio.gather(*(shard.call("list_active_sessions") for shard in self._shards))
+        return [session_id for session_ids in per_shard for session_id in session_ids]
+
+    async def cleanup_session(self, session_id: str) -> bool:
+        result = await self._shard(session_id).call("cleanup_session", session_id)
+        self._session_ids.discard(session_id)
+        self._finished.discard(session_id)
+        return result
+
+    async def submit_action(self, session_id: str, player_id: str, turn: int, action: ActionData) -> None:
+        await self._shard(session_id).call("submit_action", session_id, player_id, turn, action)
+
+    @property
+    def session_count(self) -> int:
+        """Sessions created here and not cleaned up yet, finished ones included."""
+        return len(self._session_ids)
+
+    async def shutdown(self) -> None:
+        await asyncio.gather(*(shard.stop() for shard in self._shards))
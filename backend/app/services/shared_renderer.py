@@ -0,0 +1,237 @@
+"""Single renderer process that draws every visualized session as a tile of one window.
+
+With ``visualizer_shared_renderer`` enabled, ``VisualizerService`` starts one
+renderer process fed by one queue, instead of a process, a pygame window and
+a queue per session. Sessions write to the shared queue through a
+``SessionChannel``, which tags each event with the session id. A session costs
+the renderer one offscreen surface and a ``Visualizer`` drawing on it, and the
+sprites are shared by all of them (see ``simulator.assets``).
+
+Tiles show the latest state of their session without animation. Turns that
+arrive before a tile is redrawn are coalesced, so the renderer keeps up
+however many sessions it shows.
+"""
+
+import logging
+import math
+import queue
+import sys
+import time
+from typing import Any, Optional
+
+from .visualizer_adapter import EmptyEventLog, VisualizerBot
+from .visualizer_service import OPEN_SESSION, STOP_RENDERER, VisualizerStats
+
+logger = logging.getLogger(__name__)
+
+# Events handled per redraw at most, so a flood of turns doesn't starve the window
+MAX_EVENTS_PER_FRAME = 1000
+
+
+class SessionTile:
+    """A session's offscreen surface and the visualizer drawing on it."""
+
+    def __init__(
+        self,
+        session_id: str,
+        player1_name: str,
+        player2_name: str,
+        player1_sprite: Optional[str],
+        player2_sprite: Optional[str],
+        stats: VisualizerStats,
+    ):
+        import pygame
+
+        from simulator.visualizer import BOTTOM_BAR_HEIGHT, HEIGHT, INFO_BAR_HEIGHT, WIDTH, Visualizer
+
+        self.session_id = session_id
+        self.stats = stats
+        self.surface = pygame.Surface((WIDTH, HEIGHT + INFO_BAR_HEIGHT + BOTTOM_BAR_HEIGHT))
+        self.visualizer = Visualizer(
+            EmptyEventLog(),
+            VisualizerBot(player1_name, player1_sprite),
+            VisualizerBot(player2_name, player2_sprite),
+            on_frame=lambda _surface: None,
+            screen=self.surface,
+        )
+        self.pending: Optional[dict[str, Any]] = None  # newest turn not drawn yet
+        self.result: Optional[str] = None
+        self.dirty = True
+
+    def receive_turn(self, event: dict[str, Any]) -> None:
+        self.stats.add("received")
+        if self.pending is not None:
+            self.stats.add("skipped")
+        self.pending = event
+        self.dirty = True
+
+    def finish(self, event: dict[str, Any]) -> None:
+        if event.get("final_state"):
+            self.pending = {"turn": event["final_state"].get("turn", 0), "game_state": event["final_state"]}
+        winner = event.get("winner_name")
+        self.result = f"{winner} wins" if winner else "Draw"
+        self.dirty = True
+
+    def render(self) -> None:
+        """Draw the newest state, and the result once the match is over."""
+        if self.pending is not None:
+            event, self.pending = self.pending, None
+            state = event["game_state"]
+            self.visualizer.info_bar_state = state
+            self.visualizer.render_frame(state, event.get("turn", 0))
+            self.stats.add("jumped")
+            if event.get("sent_at"):
+                lag = max(0.0, time.time() - event["sent_at"])
+                self.stats.set("lag_seconds", lag)
+                self.stats.set("max_lag_seconds", max(lag, self.stats.get("max_lag_seconds")))
+        if self.result is not None:
+            import pygame
+
+            text = self.visualizer.text(self.result, (255, 255, 255))
+            banner = text.get_rect(center=self.surface.get_rect().center).inflate(40, 20)
+            pygame.draw.rect(self.surface, (50, 50, 50), banner)
+            self.surface.blit(text, text.get_rect(center=banner.center))
+            self.visualizer.drawn.append(banner)
+        self.dirty = False
+
+
+class SharedRenderer:
+    """Draws the sessions of the shared queue side by side in one window."""
+
+    def __init__(self, event_queue: Any, stats_values: Any, window_size: tuple[int, int]):
+        self._queue = event_queue
+        self._stats_values = stats_values
+        self._window_size = tuple(window_size)
+        self._window: Optional[Any] = None
+        self._tiles: dict[str, SessionTile] = {}
+        self._layout_changed = True
+        self._running = True
+
+    def initialize(self) -> None:
+        import pygame
+
+        pygame.init()
+        self._window = pygame.display.set_mode(self._window_size)
+        pygame.display.set_caption("Spellcasters: live sessions")
+
+    def run(self) -> None:
+        """Handle events and redraw changed tiles until stopped or the window is closed."""
+        from simulator.visualizer import FPS
+
+        while self._running:
+            self.process_events(timeout=1 / FPS)
+            self.draw()
+            self._handle_pygame_events()
+
+    def process_events(self, timeout: float) -> int:
+        """Handle every queued event (waiting up to ``timeout`` for the first); returns how many."""
+        handled = 0
+        try:
+            item = self._queue.get(timeout=timeout)
+            while True:
+                self.handle(*item)
+                handled += 1
+                if handled >= MAX_EVENTS_PER_FRAME or not self._running:
+                    break
+                item = self._queue.get_nowait()
+        except queue.Empty:
+            pass
+        return handled
+
+    def handle(self, session_id: str, event: dict[str, Any]) -> None:
+        event_type = event.get("event")
+        tile = self._tiles.get(session_id)
+        if event_type == OPEN_SESSION:
+            stats = VisualizerStats(self._stats_values, event["stats_slot"])
+            self._tiles[session_id] = SessionTile(
+                session_id,
+                event["player1_name"],
+                event["player2_name"],
+                event.get("player1_sprite"),
+                event.get("player2_sprite"),
+                stats,
+            )
+            self._layout_changed = True
+            logger.info(f"Showing session {session_id} ({len(self._tiles)} sessions)")
+        elif event_type == STOP_RENDERER:
+            self._running = False
+        elif tile is None:
+            logger.debug(f"Event {event_type} for unknown session {session_id}")
+        elif event_type == "turn_update":
+            tile.receive_turn(event)
+        elif event_type == "game_over":
+            tile.finish(event)
+        elif event_type == "shutdown":
+            del self._tiles[session_id]
+            self._layout_changed = True
+        else:
+            logger.warning(f"Unknown event type: {event_type}")
+
+    def layout(self) -> list[Any]:
+        """Screen rect of each tile: a grid as square as possible, keeping the tiles' aspect ratio."""
+        import pygame
+
+        count = len(self._tiles)
+        if not count:
+            return []
+        columns = math.ceil(math.sqrt(count))
+        rows = math.ceil(count / columns)
+        width, height = self._window_size
+        tile_width, tile_height = next(iter(self._tiles.values())).surface.get_size()
+        scale = min(width / columns / tile_width, height / rows / tile_height)
+        size = (int(tile_width * scale), int(tile_height * scale))
+        return [
+            pygame.Rect((i % columns) * (width // columns), (i // columns) * (height // rows), *size)
+            for i in range(count)
+        ]
+
+    def draw(self) -> None:
+        import pygame
+
+        if self._window is None:
+            return
+        redraw_all = self._layout_changed
+        if redraw_all:
+            self._window.fill((0, 0, 0))
+            self._layout_changed = False
+        updated = []
+        for tile, rect in zip(self._tiles.values(), self.layout()):
+            if not (tile.dirty or redraw_all):
+                continue
+            tile.render()
+            self._window.blit(pygame.transform.smoothscale(tile.surface, rect.size), rect)
+            updated.append(rect)
+        if redraw_all:
+            pygame.display.flip()
+        elif updated:
+            pygame.display.update(updated)
+
+    def _handle_pygame_events(self) -> None:
+        import pygame
+
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                logger.info("Shared renderer window closed")
+                self._running = False
+
+    def shutdown(self) -> None:
+        import pygame
+
+        pygame.quit()
+
+
+def run_shared_renderer(event_queue: Any, stats_values: Any, window_size: tuple[int, int]) -> None:
+    """Entry point of the shared renderer process, started by VisualizerService."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="[Visualizer-shared] %(levelname)s: %(message)s",
+        stream=sys.stdout,
+    )
+    try:
+        renderer = SharedRenderer(event_queue, stats_values, window_size)
+        renderer.initialize()
+        renderer.run()
+        renderer.shutdown()
+    except Exception as exc:
+        logger.error(f"Error in shared renderer: {exc}", exc_info=True)
+        sys.exit(1)
@@ -2,9 +2,10 @@
 
 import asyncio
 import logging
-from typing import Any, AsyncGenerator, Dict, List, Optional
+from typing import Any, AsyncGenerator, Dict, Optional, Tuple
 
 from ..models.events import Event, HeartbeatEvent
+from ..utils.locks import KeyedLocks
 
 logger = logging.getLogger(__name__)
 
@@ -45,45 +46,47 @@ class SSEStream:
 
 
 class SSEManager:
-    """Manages SSE connections per session and broadcasting of events."""
+    """Manages SSE connections per session and broadcasting of events.
+
+    A session's streams are kept in a tuple that is replaced, never changed in
+    place, so broadcasts read it without a lock; connecting and closing take
+    the session's own lock, never one shared by all sessions.
+    """
 
     def __init__(self) -> None:
-        self._streams_by_session: Dict[str, List[SSEStream]] = {}
-        self._lock = asyncio.Lock()
+        self._streams_by_session: Dict[str, Tuple[SSEStream, ...]] = {}
+        self._locks = KeyedLocks()
 
     async def add_connection(self, session_id: str) -> SSEStream:
         stream = SSEStream()
-        async with self._lock:
-            self._streams_by_session.setdefault(session_id, []).append(stream)
+        async with self._locks(session_id):
+            self._streams_by_session[session_id] = self._streams_by_session.get(session_id, ()) + (stream,)
         return stream
 
     async def remove_connection(self, session_id: str, stream: SSEStream) -> None:
-        async with self._lock:
-            streams = self._streams_by_session.get(session_id, [])
-            if stream in streams:
-                streams.remove(stream)
-            if not streams and session_id in self._streams_by_session:
+        async with self._locks(session_id):
+            streams = tuple(s for s in self._streams_by_session.get(session_id, ()) if s is not stream)
+            if streams:
+                self._streams_by_session[session_id] = streams
+            else:
                 self._streams_by_session.pop(session_id, None)
 
     async def broadcast(self, session_id: str, event: Event) -> None:
         """Broadcast an event to all connected clients for a session."""
         try:
             payload = event.model_dump_json()
-            async with self._lock:
-                streams = list(self._streams_by_session.get(session_id, []))
-            for stream in streams:
+            for stream in self._streams_by_session.get(session_id, ()):
                 await stream.push(payload)
         except Exception as exc:
             logger.error(f"SSE broadcast failed: {exc}")
 
     async def close_session_streams(self, session_id: str) -> None:
         """Close all SSE streams for a session."""
-        async with self._lock:
-            streams = self._streams_by_session.get(session_id, [])
+        async with self._locks(session_id):
+            # Remove session from tracking
+            streams = self._streams_by_session.pop(session_id, ())
             for stream in streams:
                 await stream.close()
-            # Remove session from tracking
-            self._streams_by_session.pop(session_id, None)
 
     async def heartbeat(self, session_id: str) -> None:
         await self.broadcast(session_id, HeartbeatEvent())
@@ -105,8 +108,7 @@ class SSEManager:
         Used during server shutdown to gracefully close all client connections.
         """
         logger.info("Disconnecting all SSE connections...")
-        async with self._lock:
-            session_ids = list(self._streams_by_session.keys())
+        session_ids = list(self._streams_by_session.keys())
 
         for session_id in session_ids:
             await self.close_session_streams(session_id)
@@ -6,6 +6,10 @@ Responsibilities:
 - Validate actions against basic constraints (extensible for full rule checks)
 - Produce a complete action set for the current turn, filling in defaults for missing
 
+Collection doesn't poll: it registers a waiter for the turn that the
+submission completing the turn resolves, so it wakes once, either then or at
+the deadline.
+
 Integration with the game engine (applying actions) is handled in Task 7.3.
 """
 
@@ -13,10 +17,22 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, FrozenSet, List, Optional
 
 from ..models.actions import ActionData, Move, SpellAction
+from ..utils.locks import KeyedLocks
+
+
+@dataclass
+class _TurnWaiter:
+    """A collection waiting for every expected player of a turn to submit."""
+
+    expected: FrozenSet[str]
+    done: asyncio.Future
+
+    def notify(self, submitted: Dict[str, Move]) -> None:
+        if not self.done.done() and self.expected.issubset(submitted):
+            self.done.set_result(None)
 
 
 @dataclass
@@ -24,6 +40,7 @@ class _SessionTurnState:
     """Holds pending actions per turn for a specific session."""
 
     pending_by_turn: Dict[int, Dict[str, Move]] = field(default_factory=dict)
+    waiters: Dict[int, _TurnWaiter] = field(default_factory=dict)
 
 
 class TurnProcessor:
@@ -32,7 +49,8 @@ class TurnProcessor:
     def __init__(self, timeout_seconds: float = 5.0) -> None:
         self._timeout = timeout_seconds
         self._sessions: Dict[str, _SessionTurnState] = {}
-        self._lock = asyncio.Lock()
+        # Per-session locks: submissions and collections of different sessions never wait on each other
+        self._locks = KeyedLocks()
 
     async def submit_action(self, session_id: str, player_id: str, turn: int, action: ActionData) -> None:
         """Submit an action for a player for a given turn.
@@ -46,10 +64,13 @@ class TurnProcessor:
             spell=SpellAction(**action.spell) if action.spell else None,
         )
 
-        async with self._lock:
+        async with self._locks(session_id):
             state = self._sessions.setdefault(session_id, _SessionTurnState())
             turn_map = state.pending_by_turn.setdefault(turn, {})
             turn_map[player_id] = move
+            waiter = state.waiters.get(turn)
+            if waiter is not None:
+                waiter.notify(turn_map)
 
     async def collect_actions(
         self,
@@ -61,42 +82,42 @@ class TurnProcessor:
     ) -> Dict[str, Move]:
         """Collect actions for all expected players for the given turn.
 
-        - Waits up to timeout for all players to submit
+        - Waits up to timeout for all players to submit, woken by the last submission
         - Auto-fills built-in players immediately if is_builtin is provided and returns True
         - Fills safe defaults for any missing players on timeout
         """
-        async with self._lock:
+        waiter: Optional[_TurnWaiter] = None
+        async with self._locks(session_id):
             state = self._sessions.setdefault(session_id, _SessionTurnState())
             turn_map = state.pending_by_turn.setdefault(turn, {})
 
-        # Auto-fill for built-in players
-        if is_builtin is not None:
-            for pid in expected_players:
-                if is_builtin(pid):
-                    async with self._lock:
-                        turn_map = state.pending_by_turn.setdefault(turn, {})
+            # Auto-fill for built-in players
+            if is_builtin is not None:
+                for pid in expected_players:
+                    if is_builtin(pid):
                         turn_map.setdefault(pid, Move(player_id=pid, turn=turn, move=None, spell=None))
 
-        # Wait loop
-        start = datetime.now()
-        while True:
-            async with self._lock:
-                current = dict(state.pending_by_turn.get(turn, {}))
-            if all(pid in current for pid in expected_players):
-                break
-            elapsed = (datetime.now() - start).total_seconds()
-            if elapsed >= self._timeout:
-                # Fill defaults
-                async with self._lock:
-                    missing = [pid for pid in expected_players if pid not in state.pending_by_turn[turn]]
-                    for pid in missing:
-                        state.pending_by_turn[turn][pid] = Move(player_id=pid, turn=turn, move=[0, 0], spell=None)
-                break
-            await asyncio.sleep(0.01)
-
-        # Validate collected (basic structure checks)
-        async with self._lock:
-            collected = dict(state.pending_by_turn.get(turn, {}))
+            if not all(pid in turn_map for pid in expected_players):
+                waiter = _TurnWaiter(frozenset(expected_players), asyncio.get_running_loop().create_future())
+                state.waiters[turn] = waiter
+
+        if waiter is not None:
+            try:
+                await asyncio.wait_for(waiter.done, timeout=self._timeout)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                if state.waiters.get(turn) is waiter:
+                    del state.waiters[turn]
+
+        async with self._locks(session_id):
+            # Fill defaults for players that didn't submit in time
+            turn_map = state.pending_by_turn.setdefault(turn, {})
+            for pid in expected_players:
+                turn_map.setdefault(pid, Move(player_id=pid, turn=turn, move=[0, 0], spell=None))
+
+            # Validate collected (basic structure checks)
+            collected = dict(turn_map)
             # Cleanup turn storage after collection to avoid growth
             state.pending_by_turn.pop(turn, None)
 
@@ -131,5 +152,10 @@ class TurnProcessor:
 
     async def cleanup_session(self, session_id: str) -> None:
         """Cleanup any pending state for a session."""
-        async with self._lock:
-            self._sessions.pop(session_id, None)
+        async with self._locks(session_id):
+            state = self._sessions.pop(session_id, None)
+            if state is not None:
+                # A collection for a session that is gone shouldn't wait out its deadline
+                for waiter in state.waiters.values():
+                    if not waiter.done.done():
+                        waiter.done.set_result(None)
@@ -1,16 +1,47 @@
-"""Adapter for integrating backend events with pygame visualizer."""
+"""Adapter for integrating backend events with pygame visualizer.
+
+The match loop doesn't wait for the window: when turns arrive faster than they
+can be animated, the adapter catches up by animating faster, and once it is
+far enough behind it skips the queued turns and draws the newest one directly.
+Turns the server dropped on a full queue are noticed by the gap in turn
+numbers, and the next one received is drawn directly too.
+How far behind it is goes back to the server through ``VisualizerStats``.
+"""
 
 import logging
 import multiprocessing
 import queue
 import sys
-from typing import Any, Optional
+import time
+from typing import TYPE_CHECKING, Any, Optional
 
 from ..core.config import settings
 
+if TYPE_CHECKING:
+    from .visualizer_service import VisualizerStats
+
 logger = logging.getLogger(__name__)
 
 
+class VisualizerBot:
+    """Stands in for a bot: the visualizer only needs a name and sprite paths."""
+
+    def __init__(self, name: str, sprite_path: Optional[str] = None):
+        self.name = name
+        self.sprite_path = sprite_path or "assets/wizards/sample_bot1.png"
+        self.minion_sprite_path = (
+            sprite_path.replace("wizards", "minions") if sprite_path else "assets/minions/minion_1.png"
+        )
+
+
+class EmptyEventLog:
+    """Stands in for the game logger; backend events carry no spell or damage records."""
+
+    def __init__(self):
+        self.damage_events: list[dict[str, Any]] = []
+        self.spells: list[dict[str, Any]] = []
+
+
 class VisualizerAdapter:
     """Adapts backend events to visualizer-compatible format."""
 
@@ -22,6 +53,7 @@ class VisualizerAdapter:
         player2_name: str,
         player1_sprite: Optional[str] = None,
         player2_sprite: Optional[str] = None,
+        stats: Optional["VisualizerStats"] = None,
     ):
         """Initialize the visualizer adapter.
 
@@ -32,6 +64,7 @@ class VisualizerAdapter:
             player2_name: Name of player 2
             player1_sprite: Optional sprite path for player 1
             player2_sprite: Optional sprite path for player 2
+            stats: Lag counters shared with the parent process
 
         """
         self._session_id = session_id
@@ -44,6 +77,11 @@ class VisualizerAdapter:
         self._states: list[dict[str, Any]] = []
         self._logger = logging.getLogger(__name__)
         self._running = True
+        self._stats = stats
+        # Set when turns were skipped and the window no longer shows the latest state drawn
+        self._stale = False
+        # Last turn received, to notice turns the server dropped on a full queue
+        self._last_turn: Optional[int] = None
 
     def initialize_visualizer(self) -> None:
         """Initialize pygame and create Visualizer instance immediately.
@@ -63,34 +101,11 @@ class VisualizerAdapter:
             # Import the existing Visualizer class
             from simulator.visualizer import Visualizer
 
-            # Create mock bot objects for the visualizer
-            # The visualizer expects BotInterface objects, but we only need name and sprite paths
-            class MockBot:
-                def __init__(self, name: str, sprite_path: Optional[str], minion_sprite_path: Optional[str]):
-                    self.name = name
-                    self.sprite_path = sprite_path or "assets/wizards/sample_bot1.png"
-                    self.minion_sprite_path = minion_sprite_path or "assets/minions/minion_1.png"
-
-            # Create mock logger for visualizer
-            class MockLogger:
-                def __init__(self):
-                    self.damage_events = []
-                    self.spells = []
-
-            mock_logger = MockLogger()
-            bot1 = MockBot(
-                self._player1_name,
-                self._player1_sprite,
-                self._player1_sprite.replace("wizards", "minions") if self._player1_sprite else None,
-            )
-            bot2 = MockBot(
-                self._player2_name,
-                self._player2_sprite,
-                self._player2_sprite.replace("wizards", "minions") if self._player2_sprite else None,
-            )
+            bot1 = VisualizerBot(self._player1_name, self._player1_sprite)
+            bot2 = VisualizerBot(self._player2_name, self._player2_sprite)
 
             # Create visualizer instance - this creates the pygame window
-            self._visualizer = Visualizer(mock_logger, bot1, bot2)
+            self._visualizer = Visualizer(EmptyEventLog(), bot1, bot2)
             self._logger.info(f"Visualizer window created for session {self._session_id}")
 
         except ImportError as exc:
@@ -147,6 +162,7 @@ class VisualizerAdapter:
             event: Turn event data containing game state
 
         """
+        self._count("received")
         try:
             game_state = event.get("game_state")
             turn = event.get("turn", 0)
@@ -158,26 +174,49 @@ class VisualizerAdapter:
                 self._logger.warning("Visualizer not initialized, cannot render turn")
                 return
 
+            if "turn" in event:
+                if self._last_turn is not None and turn != self._last_turn + 1:
+                    # Turns were dropped before reaching us; animating across the gap would be wrong
+                    self._stale = True
+                self._last_turn = turn
+
             # Store previous state for animation
             prev_state = self._states[-1] if self._states else None
 
             # Accumulate game states
             self._states.append(game_state)
 
+            backlog = self._stats.backlog if self._stats is not None else 0
+            lagging = self._lag(event) > settings.visualizer_max_lag_seconds
+            if backlog and (lagging or backlog >= settings.visualizer_max_backlog):
+                # Far behind with newer turns waiting: don't draw this one at all
+                self._count("skipped")
+                self._stale = True
+                return
+
             # Render in real-time
-            if prev_state:
+            if prev_state is None or self._stale:
+                # First state, or turns were skipped or dropped - just render it
+                self._show_state(game_state, turn)
+                if prev_state is None:
+                    self._visualizer.wait_for(settings.visualizer_initial_render_delay)
+                self._count("jumped")
+            elif backlog or lagging:
+                # Slightly behind: animate quickly and move straight on to the next turn
+                self._visualizer.speed = settings.visualizer_catchup_speed
+                self._visualizer.animate_transition(prev_state, game_state, len(self._states) - 2)
+                self._count("collapsed")
+            else:
                 # Animate transition from previous state to current state
+                self._visualizer.speed = 1.0
                 self._visualizer.animate_transition(prev_state, game_state, len(self._states) - 2)
                 self._visualizer.wait_for(settings.visualizer_animation_duration)
-            else:
-                # First state - just render it
-                self._visualizer.info_bar_state = game_state
-                self._visualizer.render_frame(game_state, turn)
-                self._visualizer.wait_for(settings.visualizer_initial_render_delay)
+                self._count("animated")
 
             # Update info bar
             self._visualizer.info_bar_state = game_state
             self._visualizer.draw_wizard_info_bar()
+            self._record_lag(event)
 
             self._logger.debug(f"Rendered turn {turn} for session {self._session_id}")
 
@@ -202,7 +241,12 @@ class VisualizerAdapter:
             # Render final state if provided and not already rendered
             if final_state:
                 prev_state = self._states[-1] if self._states else None
-                if prev_state and prev_state != final_state:
+                if self._stale:
+                    # The last turns were skipped; show the result without animating
+                    self._show_state(final_state, final_state.get("turn", len(self._states)))
+                    if prev_state != final_state:
+                        self._states.append(final_state)
+                elif prev_state and prev_state != final_state:
                     self._visualizer.animate_transition(prev_state, final_state, len(self._states) - 1)
                     self._visualizer.wait_for(settings.visualizer_animation_duration)
                     self._states.append(final_state)
@@ -221,6 +265,27 @@ class VisualizerAdapter:
         except Exception as exc:
             self._logger.error(f"Error handling game over event: {exc}", exc_info=True)
 
+    def _show_state(self, state: dict[str, Any], turn: int) -> None:
+        """Draw ``state`` as a whole frame, without animating towards it."""
+        self._visualizer.info_bar_state = state
+        self._visualizer.render_frame(state, turn)
+        self._stale = False
+
+    def _lag(self, event: dict[str, Any]) -> float:
+        """Seconds since the server sent ``event``; 0 for events without a send time."""
+        sent_at = event.get("sent_at")
+        return max(0.0, time.time() - sent_at) if sent_at else 0.0
+
+    def _count(self, field: str) -> None:
+        if self._stats is not None:
+            self._stats.add(field)
+
+    def _record_lag(self, event: dict[str, Any]) -> None:
+        if self._stats is not None and event.get("sent_at"):
+            lag = self._lag(event)
+            self._stats.set("lag_seconds", lag)
+            self._stats.set("max_lag_seconds", max(lag, self._stats.get("max_lag_seconds")))
+
     def _handle_pygame_events(self) -> None:
         """Handle pygame events (window close, etc.)."""
         try:
@@ -261,6 +326,7 @@ def run_visualizer_adapter(
     player2_name: str,
     player1_sprite: Optional[str] = None,
     player2_sprite: Optional[str] = None,
+    stats: Optional["VisualizerStats"] = None,
 ) -> None:
     """Entry point for running the visualizer adapter in a child process.
 
@@ -273,6 +339,7 @@ def run_visualizer_adapter(
         player2_name: Name of player 2
         player1_sprite: Optional sprite path for player 1
         player2_sprite: Optional sprite path for player 2
+        stats: Lag counters shared with the parent process
 
     """
     # Set up logging for child process
@@ -294,6 +361,7 @@ def run_visualizer_adapter(
             player2_name=player2_name,
             player1_sprite=player1_sprite,
             player2_sprite=player2_sprite,
+            stats=stats,
         )
 
         # Initialize pygame
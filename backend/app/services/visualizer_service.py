@@ -1,21 +1,131 @@
 """Visualizer process lifecycle management for the Spellcasters Playground Backend."""
 
+import contextlib
 import logging
 import multiprocessing
-from typing import Optional, Union
+import queue as queue_module
+import threading
+import time
+from typing import Any, Optional, Union
 
 from ..core.config import settings
 from ..models.events import GameOverEvent, TurnEvent
 
 logger = logging.getLogger(__name__)
 
+# Control events of the shared renderer queue, next to turn_update / game_over / shutdown
+OPEN_SESSION = "open_session"
+STOP_RENDERER = "stop_renderer"
+
+# How long opening or closing a session's tile waits for room in a full shared queue. The
+# server calls spawn_visualizer and terminate_visualizer off the event loop, so this wait
+# only holds up the session being opened or closed
+CONTROL_PUT_TIMEOUT_SECONDS = 1.0
+
+
+class VisualizerStats:
+    """Lag counters shared between the server and one visualizer process.
+
+    The values live in shared memory without a lock: the server only writes
+    ``sent`` and ``dropped`` and the visualizer only the rest, so every field
+    has a single writer. Stats of several sessions can share one array (see
+    ``stats_array``), each using the fields of its ``slot``.
+    """
+
+    FIELDS = (
+        "sent",  # turn updates put on the queue
+        "dropped",  # turn updates not sent because the queue was full
+        "received",  # turn updates taken off the queue
+        "animated",  # turns shown with a full animation
+        "collapsed",  # turns animated at catch-up speed without the pause after
+        "jumped",  # turns drawn directly, without animation
+        "skipped",  # turns never drawn because newer ones were waiting
+        "lag_seconds",  # age of the last turn shown, from send to screen
+        "max_lag_seconds",
+    )
+
+    def __init__(self, values: Optional[Any] = None, slot: int = 0):
+        self._values = values if values is not None else stats_array(1)
+        self._offset = slot * len(self.FIELDS)
+
+    def _index(self, field: str) -> int:
+        return self._offset + self.FIELDS.index(field)
+
+    def reset(self) -> None:
+        for field in self.FIELDS:
+            self.set(field, 0)
+
+    def get(self, field: str) -> float:
+        return self._values[self._index(field)]
+
+    def set(self, field: str, value: float) -> None:
+        self._values[self._index(field)] = value
+
+    def add(self, field: str, amount: float = 1) -> None:
+        self._values[self._index(field)] += amount
+
+    @property
+    def backlog(self) -> int:
+        """Turn updates sent but not yet taken off the queue by the visualizer."""
+        return max(0, int(self.get("sent") - self.get("received")))
+
+    def snapshot(self) -> dict[str, Any]:
+        metrics: dict[str, Any] = {field: self.get(field) for field in self.FIELDS}
+        for field in self.FIELDS:
+            if not field.endswith("_seconds"):
+                metrics[field] = int(metrics[field])
+        metrics["backlog"] = self.backlog
+        return metrics
+
+
+def stats_array(slots: int) -> Any:
+    """Shared memory for the ``VisualizerStats`` of ``slots`` sessions."""
+    return multiprocessing.Array("d", slots * len(VisualizerStats.FIELDS), lock=False)
+
+
+class SessionChannel:
+    """One session's end of the shared renderer queue, used like a queue of its own."""
+
+    def __init__(self, shared_queue: multiprocessing.Queue, session_id: str, slot: int):
+        self.shared_queue = shared_queue
+        self.session_id = session_id
+        self.slot = slot  # index of the session's lag counters in the shared stats array
+
+    def put_nowait(self, event: dict[str, Any]) -> None:
+        self.shared_queue.put_nowait((self.session_id, event))
+
+    def put(self, event: dict[str, Any], timeout: float) -> None:
+        """Queue a control event, waiting up to ``timeout`` seconds for room; raises queue.Full."""
+        self.shared_queue.put((self.session_id, event), timeout=timeout)
+
+    def close(self) -> None:
+        """Nothing to close: the shared queue stays open for the other sessions."""
+
+    def join_thread(self) -> None:
+        pass
+
 
 class VisualizerService:
     """Manages visualizer process lifecycle and event communication."""
 
-    def __init__(self):
-        """Initialize the visualizer service."""
-        pass
+    def __init__(self, shared_renderer: Optional[bool] = None):
+        """Initialize the visualizer service.
+
+        Args:
+            shared_renderer: Draw every session in one renderer process
+                (default: ``settings.visualizer_shared_renderer``)
+
+        """
+        self._shared = settings.visualizer_shared_renderer if shared_renderer is None else shared_renderer
+        # Lag counters of each spawned visualizer, by its event queue
+        self._stats: dict[Any, VisualizerStats] = {}
+        # The shared renderer, if enabled: started with the first session that needs it
+        self._renderer: Optional[multiprocessing.Process] = None
+        self._renderer_queue: Optional[multiprocessing.Queue] = None
+        self._renderer_stats: Optional[Any] = None
+        self._free_slots: list[int] = []
+        # Sessions are opened and closed from worker threads: guards the renderer and its slots
+        self._renderer_lock = threading.RLock()
 
     def is_visualization_available(self) -> bool:
         """Check if visualization is available.
@@ -64,16 +174,21 @@ class VisualizerService:
                 )
                 return (None, None)
 
+            if self._shared:
+                return self._open_shared_session(session_id, player1_name, player2_name, player1_sprite, player2_sprite)
+
             # Create IPC queue for event communication
             queue = multiprocessing.Queue(maxsize=settings.visualizer_queue_size)
+            stats = VisualizerStats()
 
             # Spawn visualizer process
             process = multiprocessing.Process(
                 target=self._visualizer_process_main,
-                args=(session_id, queue, player1_name, player2_name, player1_sprite, player2_sprite),
+                args=(session_id, queue, player1_name, player2_name, player1_sprite, player2_sprite, stats),
                 daemon=True,
             )
             process.start()
+            self._stats[queue] = stats
 
             logger.info(f"Visualizer spawned for session {session_id} (PID: {process.pid})")
             return (process, queue)
@@ -82,6 +197,88 @@ class VisualizerService:
             logger.error(f"Failed to spawn visualizer for session {session_id}: {exc}", exc_info=True)
             return (None, None)
 
+    def _start_shared_renderer(self) -> None:
+        slots = settings.max_visualized_sessions
+        self._renderer_queue = multiprocessing.Queue(maxsize=settings.visualizer_queue_size * slots)
+        self._renderer_stats = stats_array(slots)
+        self._free_slots = list(range(slots))
+        self._renderer = multiprocessing.Process(
+            target=self._shared_renderer_main,
+            args=(self._renderer_queue, self._renderer_stats, tuple(settings.visualizer_shared_window_size)),
+            daemon=True,
+        )
+        self._renderer.start()
+        logger.info(f"Shared visualizer renderer started (PID: {self._renderer.pid})")
+
+    def _open_shared_session(
+        self,
+        session_id: str,
+        player1_name: str,
+        player2_name: str,
+        player1_sprite: Optional[str],
+        player2_sprite: Optional[str],
+    ) -> tuple[Optional[multiprocessing.Process], Optional[SessionChannel]]:
+        """Add a session to the shared renderer, starting it if it isn't running."""
+        with self._renderer_lock:
+            if self._renderer is None or not self._renderer.is_alive():
+                self.shutdown_shared_renderer()
+                self._start_shared_renderer()
+            if not self._free_slots:
+                logger.warning(
+                    f"Not visualizing session {session_id}: "
+                    f"{settings.max_visualized_sessions} sessions are already shown"
+                )
+                return (None, None)
+
+            channel = SessionChannel(self._renderer_queue, session_id, self._free_slots.pop(0))
+            stats = VisualizerStats(self._renderer_stats, channel.slot)
+            stats.reset()
+            try:
+                channel.put(
+                    {
+                        "event": OPEN_SESSION,
+                        "player1_name": player1_name,
+                        "player2_name": player2_name,
+                        "player1_sprite": player1_sprite,
+                        "player2_sprite": player2_sprite,
+                        "stats_slot": channel.slot,
+                    },
+                    timeout=CONTROL_PUT_TIMEOUT_SECONDS,
+                )
+            except Exception as exc:
+                # The renderer never heard of this session, so its slot is still free
+                self._free_slots.insert(0, channel.slot)
+                logger.warning(f"Not visualizing session {session_id}: could not reach the shared renderer ({exc!r})")
+                return (None, None)
+            self._stats[channel] = stats
+            logger.info(f"Session {session_id} added to the shared renderer (slot {channel.slot})")
+            return (self._renderer, channel)
+
+    def shutdown_shared_renderer(self, timeout: float = 5.0) -> None:
+        """Stop the shared renderer process, if one was started."""
+        with self._renderer_lock:
+            if self._renderer is None:
+                return
+            try:
+                with contextlib.suppress(Exception):
+                    self._renderer_queue.put_nowait((None, {"event": STOP_RENDERER}))
+                self._renderer.join(timeout=timeout)
+                if self._renderer.is_alive():
+                    self._renderer.terminate()
+                    self._renderer.join(timeout=1.0)
+                with contextlib.suppress(Exception):
+                    self._renderer_queue.close()
+                    self._renderer_queue.join_thread()
+            except Exception as exc:
+                logger.error(f"Error stopping shared renderer: {exc}", exc_info=True)
+            finally:
+                self._stats = {
+                    queue: stats for queue, stats in self._stats.items() if not isinstance(queue, SessionChannel)
+                }
+                self._renderer = None
+                self._renderer_queue = None
+                self._free_slots = []
+
     def send_event(self, queue: multiprocessing.Queue, event: Union[TurnEvent, GameOverEvent]) -> bool:
         """Send an event to the visualizer process.
 
@@ -89,20 +286,60 @@ class VisualizerService:
             queue: IPC queue to send event through
             event: Event to send (TurnEvent or GameOverEvent)
 
+        Turn updates are stamped with their send time so the visualizer can
+        tell how far behind it is. A turn update that doesn't fit in a full
+        queue is dropped and counted in the lag metrics; the visualizer sees
+        the gap in turn numbers and draws the next state it receives directly
+        instead of animating across the missing turns.
+
         Returns:
             True if sent successfully, False otherwise
 
         """
+        stats = self._stats.get(queue)
         try:
             # Serialize event to dictionary for IPC
             event_data = event.model_dump()
+            event_data["sent_at"] = time.time()
             queue.put_nowait(event_data)
+            if stats is not None and event_data["event"] == "turn_update":
+                stats.add("sent")
             return True
+        except queue_module.Full:
+            if stats is not None:
+                stats.add("dropped")
+            logger.warning(f"Visualizer queue full, dropped {event.event} event")
+            return False
         except Exception as exc:
-            # Queue full or other error - log and continue
+            # Closed queue or other error - log and continue
             logger.warning(f"Failed to send event to visualizer: {exc}")
             return False
 
+    def get_lag_metrics(self, queue: Optional[multiprocessing.Queue]) -> Optional[dict[str, Any]]:
+        """Lag counters of the visualizer fed by ``queue``, or None if it has none.
+
+        ``backlog`` is the number of turn updates waiting in the queue and
+        ``lag_seconds`` how old the last state on screen was when it was drawn.
+        """
+        stats = self._stats.get(queue)
+        return stats.snapshot() if stats is not None else None
+
+    def _close_shared_session(self, channel: SessionChannel) -> None:
+        """Remove a session's tile from the shared renderer and free its slot."""
+        if self._stats.pop(channel, None) is None:
+            return
+        try:
+            channel.put({"event": "shutdown", "reason": "session_ended"}, timeout=CONTROL_PUT_TIMEOUT_SECONDS)
+        except Exception as exc:
+            # The renderer still has the tile and writes to the slot's counters: don't reuse it
+            logger.warning(
+                f"Could not remove session {channel.session_id} from the shared renderer ({exc!r}); "
+                f"slot {channel.slot} stays in use until the renderer restarts"
+            )
+            return
+        if channel.shared_queue is self._renderer_queue:
+            self._free_slots.append(channel.slot)
+
     def terminate_visualizer(
         self,
         process: multiprocessing.Process,
@@ -121,6 +358,12 @@ class VisualizerService:
             if process is None:
                 return
 
+            if isinstance(queue, SessionChannel):
+                # Only the session's tile goes away; the shared renderer keeps running
+                with self._renderer_lock:
+                    self._close_shared_session(queue)
+                return
+
             # Send shutdown signal via queue if available
             if queue is not None:
                 try:
@@ -145,6 +388,7 @@ class VisualizerService:
 
             # Close queue
             if queue is not None:
+                self._stats.pop(queue, None)
                 try:
                     queue.close()
                     queue.join_thread()
@@ -156,6 +400,13 @@ class VisualizerService:
         except Exception as exc:
             logger.error(f"Error terminating visualizer process: {exc}", exc_info=True)
 
+    @staticmethod
+    def _shared_renderer_main(event_queue: multiprocessing.Queue, stats_values: Any, window_size: tuple[int, int]):
+        """Entry point of the shared renderer process (see ``shared_renderer``)."""
+        from .shared_renderer import run_shared_renderer
+
+        run_shared_renderer(event_queue, stats_values, window_size)
+
     @staticmethod
     def _visualizer_process_main(
         session_id: str,
@@ -164,6 +415,7 @@ class VisualizerService:
         player2_name: str,
         player1_sprite: Optional[str],
         player2_sprite: Optional[str],
+        stats: Optional[VisualizerStats] = None,
     ) -> None:
         """Entry point for visualizer child process.
 
@@ -176,6 +428,7 @@ class VisualizerService:
             player2_name: Name of player 2
             player1_sprite: Optional sprite path for player 1
             player2_sprite: Optional sprite path for player 2
+            stats: Lag counters shared with the parent process
 
         """
         # Import visualizer adapter here to avoid importing in parent process
@@ -189,4 +442,5 @@ class VisualizerService:
             player2_name=player2_name,
             player1_sprite=player1_sprite,
             player2_sprite=player2_sprite,
+            stats=stats,
         )
@@ -0,0 +1,57 @@
+"""Per-key asyncio locks, so work on different sessions never waits on each other."""
+
+import asyncio
+import contextlib
+import time
+from typing import AsyncIterator, Dict, Hashable
+
+
+class KeyedLocks:
+    """One ``asyncio.Lock`` per key, created on first use and dropped when nobody holds or awaits it.
+
+    Usage: ``async with locks(session_id): ...``. Acquisitions that had to
+    wait are counted in ``contended``, and the time spent waiting in
+    ``wait_seconds``.
+    """
+
+    def __init__(self) -> None:
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+        self._users: Dict[Hashable, int] = {}
+        self.acquisitions = 0
+        self.contended = 0
+        self.wait_seconds = 0.0
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+    @contextlib.asynccontextmanager
+    async def __call__(self, key: Hashable) -> AsyncIterator[None]:
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        self._users[key] = self._users.get(key, 0) + 1
+        try:
+            if lock.locked():
+                self.contended += 1
+                start = time.perf_counter()
+                await lock.acquire()
+                self.wait_seconds += time.perf_counter() - start
+            else:
+                await lock.acquire()
+            self.acquisitions += 1
+            try:
+                yield
+            finally:
+                lock.release()
+        finally:
+            self._users[key] -= 1
+            if not self._users[key]:
+                del self._users[key]
+                del self._locks[key]
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "acquisitions": self.acquisitions,
+            "contended": self.contended,
+            "wait_seconds": self.wait_seconds,
+        }
@@ -0,0 +1,153 @@
+"""Lock contention benchmark for the session services.
+
+Runs many sessions at once on one event loop, the way the server does: each
+session's match loop collects its players' actions through ``TurnProcessor``
+and broadcasts the turn to its SSE clients through ``SSEManager``, while the
+players submit their actions at random moments of the turn. Reports turn
+latency, throughput and how often the services' locks had to wait.
+
+``--global-lock`` puts every session behind the same lock, as the services
+did before they locked per session, for comparison::
+
+    python -m backend.bench --sessions 200
+    python -m backend.bench --sessions 200 --global-lock
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from typing import Dict, List, Optional
+
+from .app.models.actions import ActionData
+from .app.models.events import TurnEvent
+from .app.services.sse_manager import SSEManager
+from .app.services.turn_processor import TurnProcessor
+from .app.utils.locks import KeyedLocks
+
+DEFAULT_SESSIONS = 200
+DEFAULT_TURNS = 50
+DEFAULT_CLIENTS = 2  # SSE streams per session
+DEFAULT_THINK_MS = 2.0  # most a player takes to submit
+
+
+class _GlobalLocks(KeyedLocks):
+    """One lock for every key."""
+
+    def __call__(self, _key):
+        return super().__call__(None)
+
+
+async def _player(
+    processor: TurnProcessor, session_id: str, player_id: str, turn: int, rng: random.Random, think_ms: float
+) -> None:
+    await asyncio.sleep(rng.uniform(0, think_ms) / 1000)
+    await processor.submit_action(session_id, player_id, turn, ActionData(move=[1, 0]))
+
+
+async def _client(stream) -> int:
+    received = 0
+    async for _ in stream.stream():
+        received += 1
+    return received
+
+
+async def _session(
+    processor: TurnProcessor,
+    sse: SSEManager,
+    session_id: str,
+    turns: int,
+    clients: int,
+    think_ms: float,
+    rng: random.Random,
+    latencies: List[float],
+) -> int:
+    players = [f"{session_id}-p1", f"{session_id}-p2"]
+    streams = [await sse.add_connection(session_id) for _ in range(clients)]
+    readers = [asyncio.create_task(_client(stream)) for stream in streams]
+    for turn in range(1, turns + 1):
+        start = time.perf_counter()
+        submissions = [asyncio.create_task(_player(processor, session_id, pid, turn, rng, think_ms)) for pid in players]
+        actions = await processor.collect_actions(session_id, turn, players)
+        await sse.broadcast(
+            session_id,
+            TurnEvent(
+                turn=turn,
+                game_state={"turn": turn},
+                actions=[a.model_dump() for a in actions.values()],
+                log_line=f"turn {turn}",
+            ),
+        )
+        latencies.append(time.perf_counter() - start)
+        await asyncio.gather(*submissions)
+    await sse.close_session_streams(session_id)
+    await processor.cleanup_session(session_id)
+    return sum(await asyncio.gather(*readers))
+
+
+async def run_contention_bench(
+    sessions: int = DEFAULT_SESSIONS,
+    turns: int = DEFAULT_TURNS,
+    clients: int = DEFAULT_CLIENTS,
+    think_ms: float = DEFAULT_THINK_MS,
+    global_lock: bool = False,
+    seed: int = 0,
+) -> Dict[str, object]:
+    """Play ``sessions`` sessions of ``turns`` turns at once; returns the measurements."""
+    processor = TurnProcessor(timeout_seconds=max(1.0, think_ms / 100))
+    sse = SSEManager()
+    if global_lock:
+        processor._locks = _GlobalLocks()
+        sse._locks = _GlobalLocks()
+    rng = random.Random(seed)
+    latencies: List[float] = []
+
+    start = time.perf_counter()
+    received = await asyncio.gather(
+        *(_session(processor, sse, f"s{i}", turns, clients, think_ms, rng, latencies) for i in range(sessions))
+    )
+    elapsed = time.perf_counter() - start
+
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    return {
+        "sessions": sessions,
+        "turns": len(latencies),
+        "seconds": elapsed,
+        "turns_per_second": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": quantiles[49] * 1000,
+        "p99_ms": quantiles[98] * 1000,
+        "events_received": sum(received),
+        "turn_processor_locks": processor._locks.stats(),
+        "sse_locks": sse._locks.stats(),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=DEFAULT_SESSIONS, help="Concurrent sessions")
+    parser.add_argument("--turns", type=int, default=DEFAULT_TURNS, help="Turns per session")
+    parser.add_argument("--clients", type=int, default=DEFAULT_CLIENTS, help="SSE streams per session")
+    parser.add_argument("--think-ms", type=float, default=DEFAULT_THINK_MS, help="Most a player takes to submit")
+    parser.add_argument("--global-lock", action="store_true", help="Share one lock between all sessions")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the players' submission times")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(
+        run_contention_bench(args.sessions, args.turns, args.clients, args.think_ms, args.global_lock, args.seed)
+    )
+    print(
+        f"{report['sessions']} sessions, {report['turns']} turns in {report['seconds']:.2f}s "
+        f"({report['turns_per_second']:.0f} turns/s)"
+    )
+    print(f"Turn latency: p50 {report['p50_ms']:.2f}ms, p99 {report['p99_ms']:.2f}ms")
+    for name in ("turn_processor_locks", "sse_locks"):
+        stats = report[name]
+        print(
+            f"{name}: {stats['acquisitions']} acquisitions, {stats['contended']} contended, "
+            f"{stats['wait_seconds'] * 1000:.1f}ms waiting"
+        )
+
+
+if __name__ == "__main__":
+    main()
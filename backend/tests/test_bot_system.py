@@ -1,5 +1,6 @@
 """Tests for the bot system implementation."""
 
+import asyncio
 import pytest
 from datetime import datetime
 from unittest.mock import Mock, patch
@@ -379,6 +380,73 @@ class TestBuiltinBotWrapper:
 
         assert action == {"move": [0, 0], "spell": None}
 
+    def test_sandboxed_wrapper_runs_bot_in_worker(self):
+        """Test that a sandboxed wrapper delegates to a worker process and can be closed."""
+        from bots.sample_bot1.sample_bot_1 import SampleBot1
+
+        player = BuiltinBotRegistry.get_builtin_player("builtin_sample_1")
+        wrapper = BuiltinBotWrapper(player, SampleBot1, sandboxed=True)
+        try:
+            state = {
+                "turn": 1,
+                "board_size": 10,
+                "self": {"name": "Sample Bot 1", "hp": 100, "mana": 100, "position": [0, 0],
+                         "cooldowns": {"fireball": 0, "shield": 0, "teleport": 0, "summon": 0, "heal": 0,
+                                       "blink": 0, "melee_attack": 0}, "shield_active": False},
+                "opponent": {"name": "Other", "hp": 100, "mana": 100, "position": [9, 9],
+                             "cooldowns": {}, "shield_active": False},
+                "artifacts": [],
+                "minions": [],
+            }
+            action = wrapper.decide(state)
+            assert action == SampleBot1().decide(state)
+            assert wrapper._original_bot.pid is not None
+        finally:
+            wrapper.close()
+        assert wrapper._original_bot.pid is None
+
+
+    @pytest.mark.asyncio
+    async def test_wrapper_awaits_async_original_bot(self):
+        """Test that decide_async awaits bots that implement it natively."""
+
+        class AsyncBot:
+            def decide(self, state):
+                raise AssertionError("sync decide should not be called")
+
+            async def decide_async(self, state):
+                await asyncio.sleep(0)
+                return {"move": [0, 1], "spell": None}
+
+        player = Player(
+            player_id="test_player",
+            player_name="Test Player",
+            submitted_from="builtin",
+            is_builtin=True,
+            created_at=datetime.now(),
+        )
+        wrapper = BuiltinBotWrapper(player, AsyncBot)
+
+        assert await wrapper.decide_async({"turn": 1}) == {"move": [0, 1], "spell": None}
+
+    @pytest.mark.asyncio
+    async def test_wrapper_decide_async_falls_back_to_sync_bot(self):
+        """Test that sync-only bots are transparently used by decide_async."""
+        mock_original_bot = Mock()
+        mock_original_bot.decide.return_value = {"move": [1, 0], "spell": None}
+
+        player = Player(
+            player_id="test_player",
+            player_name="Test Player",
+            submitted_from="builtin",
+            is_builtin=True,
+            created_at=datetime.now(),
+        )
+        wrapper = BuiltinBotWrapper(player, lambda: mock_original_bot)
+
+        assert await wrapper.decide_async({"turn": 1}) == {"move": [1, 0], "spell": None}
+        mock_original_bot.decide.assert_called_once()
+
 
 class TestGameEngineAdapter:
     """Test the GameEngineAdapter."""
@@ -427,3 +495,84 @@ class TestGameEngineAdapter:
         result = adapter.check_game_over()
 
         assert result is None
+
+    @pytest.mark.asyncio
+    async def test_execute_turn_awaits_async_bots(self):
+        """Test that execute_turn awaits decide_async on the real engine."""
+        player1 = Player(player_id="p1", player_name="Bot1", submitted_from="test", created_at=datetime.now())
+        player2 = Player(player_id="p2", player_name="Bot2", submitted_from="test", created_at=datetime.now())
+        calls = []
+
+        class AsyncTestBot(BotInterface):
+            def decide(self, state):
+                raise AssertionError("sync decide should not be called")
+
+            async def decide_async(self, state):
+                calls.append(self.name)
+                await asyncio.sleep(0)
+                return {"move": [1, 1], "spell": None}
+
+        adapter = GameEngineAdapter()
+        adapter.initialize_match(AsyncTestBot(player1), AsyncTestBot(player2))
+        turn_event = await adapter.execute_turn()
+
+        assert turn_event.turn == 1
+        assert sorted(calls) == ["Bot1", "Bot2"]
+        assert adapter.engine.wizard1.position == [1, 1]
+
+    @pytest.mark.asyncio
+    async def test_execute_turn_decides_builtin_bots_off_the_loop(self):
+        """Test that a slow builtin bot neither blocks the event loop nor holds the turn past its deadline."""
+        import threading
+        import time
+
+        from backend.app.services.engine_executor import EngineExecutor
+
+        release = threading.Event()
+
+        class SlowBot:
+            def decide(self, state):
+                release.wait(5)
+                return {"move": [1, 1], "spell": None}
+
+        class FastBot:
+            def decide(self, state):
+                return {"move": [-1, 0], "spell": None}
+
+        def builtin(player_id, bot_class):
+            player = Player(
+                player_id=player_id,
+                player_name=player_id,
+                submitted_from="builtin",
+                is_builtin=True,
+                created_at=datetime.now(),
+            )
+            return BuiltinBotWrapper(player, bot_class, sandboxed=False)
+
+        executor = EngineExecutor(workers=2, timeout=0.1)
+        adapter = GameEngineAdapter(executor=executor)
+        adapter.initialize_match(builtin("slow", SlowBot), builtin("fast", FastBot), quiet=True)
+
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        ticker = asyncio.create_task(tick())
+        start = time.perf_counter()
+        await adapter.execute_turn()
+        elapsed = time.perf_counter() - start
+        # Still deciding turn 1: the slow bot sits turn 2 out instead of taking another thread
+        await adapter.execute_turn()
+        ticker.cancel()
+        release.set()
+        executor.shutdown()
+
+        assert elapsed < 1.0
+        assert ticks >= 5  # the loop kept running while the slow bot decided
+        assert adapter.engine.wizard1.position == [0, 0]  # default action after the deadline
+        assert adapter.engine.wizard2.position == [7, 9]  # the fast bot moved twice
+        assert executor.stats() == {"workers": 2, "calls": 3, "timeouts": 1}
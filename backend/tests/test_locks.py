@@ -0,0 +1,37 @@
+import asyncio
+
+import pytest
+
+from backend.app.utils.locks import KeyedLocks
+from backend.bench import run_contention_bench
+
+
+@pytest.mark.asyncio
+async def test_keyed_locks_serialize_same_key_only():
+    locks = KeyedLocks()
+    order = []
+
+    async def hold(key, name):
+        async with locks(key):
+            order.append(f"{name} in")
+            await asyncio.sleep(0.01)
+            order.append(f"{name} out")
+
+    await asyncio.gather(hold("s1", "a"), hold("s1", "b"), hold("s2", "c"))
+
+    # b waited for a, c didn't wait for either
+    assert order.index("a out") < order.index("b in")
+    assert order.index("c in") < order.index("a out")
+    assert locks.stats()["acquisitions"] == 3
+    assert locks.stats()["contended"] == 1
+    assert len(locks) == 0  # unused locks are dropped
+
+
+@pytest.mark.asyncio
+async def test_contention_bench_delivers_every_turn():
+    report = await run_contention_bench(sessions=20, turns=5, clients=2, think_ms=1.0)
+
+    assert report["turns"] == 100
+    assert report["events_received"] == 200
+    assert report["p99_ms"] >= report["p50_ms"] > 0
+    assert report["turn_processor_locks"]["acquisitions"] > 0
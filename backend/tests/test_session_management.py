@@ -31,7 +31,7 @@ class DummyBot:
 
 
 class DummyEngine:
-    def __init__(self, bot1, bot2):
+    def __init__(self, bot1, bot2, logger=None):
         self.bot1 = bot1
         self.bot2 = bot2
         self.turn = 0
@@ -110,3 +110,76 @@ async def test_create_session_and_run_loop(monkeypatch):
     assert ctx.game_state.turn_index >= 1
     # Cleanup
     await manager.cleanup_session(session_id)
+
+
+@pytest.mark.asyncio
+async def test_turbo_session_runs_without_collecting_actions():
+    from backend.app.services import game_adapter as ga
+    from backend.app.core.database import create_tables
+    from backend.app.models.sessions import PacingMode, TurnStatus
+
+    ga.GameEngine = DummyEngine
+    await create_tables()
+
+    mock_visualizer_service = MagicMock()
+    mock_visualizer_service.spawn_visualizer.return_value = (None, None)
+    manager = SessionManager(visualizer_service=mock_visualizer_service)
+    manager._turn_processor = MagicMock(wraps=manager._turn_processor)
+
+    p1 = PlayerConfig(player_id="builtin_sample_1", bot_type="builtin", bot_id="sample_bot_1")
+    p2 = PlayerConfig(player_id="builtin_sample_2", bot_type="builtin", bot_id="sample_bot_2")
+    session_id = await manager.create_session(p1, p2, pacing=PacingMode.TURBO)
+
+    ctx = await manager.get_session(session_id)
+    await ctx.task
+
+    assert ctx.game_state.status == TurnStatus.COMPLETED
+    assert ctx.game_state.turn_index == 2
+    manager._turn_processor.collect_actions.assert_not_called()
+    await manager.cleanup_session(session_id)
+
+
+@pytest.mark.asyncio
+async def test_turbo_pacing_requires_builtin_bots():
+    from backend.app.models.sessions import PacingMode
+
+    manager = SessionManager(visualizer_service=MagicMock())
+    remote = DummyBot("Remote", "remote_1")
+    remote._is_builtin = False
+
+    async def create_bot(cfg):
+        return remote if cfg.bot_type == "player" else DummyBot("Builtin", "builtin_1")
+
+    manager._create_bot_from_config = create_bot
+
+    p1 = PlayerConfig(player_id="remote_1", bot_type="player")
+    p2 = PlayerConfig(player_id="builtin_1", bot_type="builtin", bot_id="sample_bot_1")
+    with pytest.raises(ValueError, match="Turbo pacing"):
+        await manager.create_session(p1, p2, pacing=PacingMode.TURBO)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_creations_respect_the_session_limit():
+    import asyncio
+
+    from backend.app.core.exceptions import RateLimitError
+    from backend.app.services import game_adapter as ga
+
+    ga.GameEngine = DummyEngine
+    manager = SessionManager(visualizer_service=MagicMock(), max_sessions=2)
+
+    async def slow_insert(*args):
+        await asyncio.sleep(0.01)
+
+    manager._db.create_session_record = slow_insert
+    p1 = PlayerConfig(player_id="builtin_sample_1", bot_type="builtin", bot_id="sample_bot_1")
+    p2 = PlayerConfig(player_id="builtin_sample_2", bot_type="builtin", bot_id="sample_bot_2")
+
+    results = await asyncio.gather(*(manager.create_session(p1, p2) for _ in range(4)), return_exceptions=True)
+
+    created = [result for result in results if isinstance(result, str)]
+    assert len(created) == 2
+    assert sum(isinstance(result, RateLimitError) for result in results) == 2
+    assert manager._pending == 0
+    for session_id in created:
+        await manager.cleanup_session(session_id)
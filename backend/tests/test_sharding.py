@@ -0,0 +1,123 @@
+"""Tests for session sharding over in-process and worker-process shards."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.app.core.database import create_tables
+from backend.app.core.exceptions import RateLimitError, SessionNotFoundError
+from backend.app.models.players import PlayerConfig
+from backend.app.models.sessions import PacingMode, TurnStatus
+from backend.app.services.match_logger import MatchLogger
+from backend.app.services.session_manager import SessionSnapshot
+from backend.app.services.sharding import LocalShard, ShardedSessionManager
+from backend.app.services.sse_manager import SSEManager
+
+P1 = PlayerConfig(player_id="builtin_sample_1", bot_type="builtin", bot_id="sample_bot_1")
+P2 = PlayerConfig(player_id="builtin_sample_2", bot_type="builtin", bot_id="sample_bot_2")
+
+
+def _local_manager(shards=2, max_sessions=None):
+    visualizer_service = MagicMock()
+    visualizer_service.spawn_visualizer.return_value = (None, None)
+    return ShardedSessionManager(
+        [LocalShard(index, visualizer_service=visualizer_service) for index in range(shards)], max_sessions
+    )
+
+
+async def _wait_completed(manager, session_id):
+    for _ in range(200):
+        snapshot = await manager.get_session(session_id)
+        if snapshot.game_state.status != TurnStatus.ACTIVE:
+            return snapshot
+        await asyncio.sleep(0.05)
+    raise AssertionError(f"Session {session_id} did not finish")
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_spread_over_shards_and_routed_by_id():
+    await create_tables()
+    manager = _local_manager()
+    await manager.start()
+
+    session_ids = [await manager.create_session(P1, P2) for _ in range(4)]
+
+    assert sorted(manager.shard_index(session_id) for session_id in session_ids) == [0, 0, 1, 1]
+    for session_id in session_ids:
+        shard = manager._shards[manager.shard_index(session_id)]
+        assert session_id in shard.manager._sessions
+    snapshot = await manager.get_session(session_ids[0])
+    assert isinstance(snapshot, SessionSnapshot)
+    assert snapshot.game_state.player_1.player_id == "builtin_sample_1"
+    assert sorted(await manager.list_active_sessions()) == sorted(session_ids)
+    assert manager.session_count == 4
+
+    assert await manager.cleanup_session(session_ids[0])
+    with pytest.raises(SessionNotFoundError) as excinfo:
+        await manager.get_session(session_ids[0])
+    assert excinfo.value.session_id == session_ids[0]
+    assert manager.session_count == 3
+    await manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_session_limit_counts_every_shard():
+    await create_tables()
+    manager = _local_manager(max_sessions=2)
+
+    await manager.create_session(P1, P2)
+    await manager.create_session(P1, P2)
+    with pytest.raises(RateLimitError):
+        await manager.create_session(P1, P2)
+    await manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_sharded_sessions_cannot_be_visualized():
+    manager = _local_manager()
+
+    with pytest.raises(ValueError, match="sharded"):
+        await manager.create_session(P1, P2, visualize=True)
+    assert manager.session_count == 0 and not manager._reserved
+    await manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_creations_reserve_their_slot_and_shard():
+    await create_tables()
+    manager = _local_manager()
+
+    session_ids = await asyncio.gather(*(manager.create_session(P1, P2) for _ in range(4)))
+    assert sorted(manager.shard_index(session_id) for session_id in session_ids) == [0, 0, 1, 1]
+    await manager.shutdown()
+
+    manager = _local_manager(max_sessions=3)
+    results = await asyncio.gather(*(manager.create_session(P1, P2) for _ in range(5)), return_exceptions=True)
+    assert sum(isinstance(result, str) for result in results) == 3
+    assert sum(isinstance(result, RateLimitError) for result in results) == 2
+    assert not manager._reserved
+    await manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_process_shard_forwards_events_to_the_server(tmp_path):
+    await create_tables()
+    match_logger = MatchLogger(str(tmp_path))
+    manager = ShardedSessionManager.with_processes(1, sse_manager=SSEManager(), match_logger=match_logger)
+    await manager.start()
+    try:
+        session_id = await manager.create_session(P1, P2, pacing=PacingMode.TURBO)
+        snapshot = await _wait_completed(manager, session_id)
+
+        # Turn events logged in the server process, by the shard's forwarded calls
+        for _ in range(100):
+            if len(match_logger.get_turn_events(session_id)) == snapshot.game_state.turn_index:
+                break
+            await asyncio.sleep(0.05)
+        assert snapshot.game_state.status == TurnStatus.COMPLETED
+        assert len(match_logger.get_turn_events(session_id)) == snapshot.game_state.turn_index
+        with pytest.raises(SessionNotFoundError):
+            await manager.get_session("missing")
+    finally:
+        await manager.shutdown()
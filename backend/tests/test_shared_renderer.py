@@ -0,0 +1,182 @@
+"""Tests for the shared renderer that draws all visualized sessions in one process."""
+
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from backend.app.models.events import TurnEvent
+from backend.app.services.shared_renderer import SharedRenderer
+from backend.app.services.visualizer_service import (
+    OPEN_SESSION,
+    SessionChannel,
+    VisualizerService,
+    VisualizerStats,
+    stats_array,
+)
+
+
+def _state(turn):
+    return {
+        "turn": turn,
+        "self": {"name": "Player1", "hp": 100 - turn, "mana": 50, "position": [turn % 10, 0]},
+        "opponent": {"name": "Player2", "hp": 100, "mana": 50, "position": [9, 9]},
+        "artifacts": [],
+        "minions": [],
+    }
+
+
+def _open(session_id, slot):
+    return (
+        session_id,
+        {"event": OPEN_SESSION, "player1_name": "Player1", "player2_name": "Player2", "stats_slot": slot},
+    )
+
+
+@pytest.fixture
+def renderer(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    events = queue.Queue()
+    renderer = SharedRenderer(events, stats_array(4), (640, 480))
+    renderer.initialize()
+    yield renderer, events
+    renderer.shutdown()
+
+
+class TestSharedRenderer:
+    """Tests for tiling and coalescing in the renderer process."""
+
+    def test_sessions_are_tiled_and_show_their_latest_state(self, renderer):
+        """Queued turns of a session are coalesced into one draw of the newest state."""
+        renderer, events = renderer
+        events.put(_open("a", 0))
+        events.put(_open("b", 1))
+        for turn in range(5):
+            events.put(("a", {"event": "turn_update", "turn": turn, "game_state": _state(turn)}))
+        events.put(("b", {"event": "game_over", "winner_name": "Player1", "final_state": _state(3)}))
+
+        assert renderer.process_events(timeout=0.1) == 8
+        renderer.draw()
+
+        first, second = renderer.layout()
+        assert not first.colliderect(second)
+        assert first.right <= 640 and second.bottom <= 480
+        a_stats = VisualizerStats(renderer._stats_values, 0).snapshot()
+        assert a_stats["received"] == 5 and a_stats["skipped"] == 4 and a_stats["jumped"] == 1
+        assert all(not tile.dirty for tile in renderer._tiles.values())
+
+        events.put(("a", {"event": "shutdown"}))
+        renderer.process_events(timeout=0.1)
+        assert list(renderer._tiles) == ["b"] and len(renderer.layout()) == 1
+
+    def test_stop_event_ends_the_loop(self, renderer):
+        """The stop event ends the render loop."""
+        renderer, events = renderer
+        events.put((None, {"event": "stop_renderer"}))
+        renderer.run()
+        assert not renderer._running
+
+
+class TestSharedRendererService:
+    """Tests for VisualizerService with the shared renderer enabled."""
+
+    @patch("backend.app.services.visualizer_service.multiprocessing.Process")
+    def test_sessions_share_one_process_and_queue(self, mock_process_class):
+        """Every session goes to the same process, tagged with its id, until the slots run out."""
+        mock_process = MagicMock()
+        mock_process.is_alive.return_value = True
+        mock_process_class.return_value = mock_process
+        service = VisualizerService(shared_renderer=True)
+
+        with (
+            patch.object(service, "is_visualization_available", return_value=True),
+            patch("backend.app.services.visualizer_service.settings") as mock_settings,
+        ):
+            mock_settings.max_visualized_sessions = 2
+            mock_settings.visualizer_queue_size = 10
+            mock_settings.visualizer_shared_window_size = (640, 480)
+            spawned = [service.spawn_visualizer(f"s{i}", "Player1", "Player2") for i in range(3)]
+
+        (process1, channel1), (process2, channel2), refused = spawned
+        assert process1 is process2 is mock_process and refused == (None, None)
+        mock_process_class.assert_called_once()
+        assert isinstance(channel1, SessionChannel) and channel1.shared_queue is channel2.shared_queue
+
+        event = TurnEvent(turn=1, game_state=_state(1), actions=[], events=[], log_line="Test")
+        assert service.send_event(channel2, event) is True
+        shared = channel1.shared_queue
+        tagged = [shared.get(timeout=1.0) for _ in range(3)]
+        assert [(sid, e["event"]) for sid, e in tagged] == [
+            ("s0", OPEN_SESSION),
+            ("s1", OPEN_SESSION),
+            ("s1", "turn_update"),
+        ]
+        assert service.get_lag_metrics(channel2)["sent"] == 1
+
+        # Ending a session frees its slot but leaves the renderer running
+        service.terminate_visualizer(process1, channel1)
+        mock_process.join.assert_not_called()
+        assert shared.get(timeout=1.0) == ("s0", {"event": "shutdown", "reason": "session_ended"})
+        assert service.get_lag_metrics(channel1) is None
+        assert service._free_slots == [0]
+
+        service.shutdown_shared_renderer(timeout=0.1)
+        mock_process.join.assert_called()
+
+    @patch("backend.app.services.visualizer_service.multiprocessing.Process")
+    def test_slots_are_only_reused_once_the_renderer_let_go_of_them(self, mock_process_class):
+        """A session whose open or shutdown message doesn't fit in the queue must not leak or share a slot."""
+        mock_process = MagicMock()
+        mock_process.is_alive.return_value = True
+        mock_process_class.return_value = mock_process
+        service = VisualizerService(shared_renderer=True)
+
+        with (
+            patch.object(service, "is_visualization_available", return_value=True),
+            patch("backend.app.services.visualizer_service.settings") as mock_settings,
+            patch("backend.app.services.visualizer_service.CONTROL_PUT_TIMEOUT_SECONDS", 0.01),
+        ):
+            mock_settings.max_visualized_sessions = 2
+            mock_settings.visualizer_queue_size = 1
+            mock_settings.visualizer_shared_window_size = (640, 480)
+            _, channel0 = service.spawn_visualizer("s0", "Player1", "Player2")
+            _, channel1 = service.spawn_visualizer("s1", "Player1", "Player2")
+            # Both slots taken and the queue holds the two open messages: it is full
+            assert service._free_slots == []
+
+            service.terminate_visualizer(mock_process, channel1)
+            assert service._free_slots == []  # shutdown not delivered, slot 1 kept
+
+            shared = channel0.shared_queue
+            assert shared.get(timeout=1.0)[0] == "s0"
+            service.terminate_visualizer(mock_process, channel0)
+            assert service._free_slots == [0]
+
+            # Queue full again (s1's open message and s0's shutdown): opening gives the slot back
+            assert service.spawn_visualizer("s2", "Player1", "Player2") == (None, None)
+            assert service._free_slots == [0]
+
+        service.shutdown_shared_renderer(timeout=0.1)
+
+    @patch("backend.app.services.visualizer_service.multiprocessing.Process")
+    def test_sessions_opened_from_several_threads_get_their_own_slot(self, mock_process_class):
+        """The server opens sessions off the event loop, so concurrent opens must not share a slot."""
+        mock_process = MagicMock()
+        mock_process.is_alive.return_value = True
+        mock_process_class.return_value = mock_process
+        service = VisualizerService(shared_renderer=True)
+
+        with (
+            patch.object(service, "is_visualization_available", return_value=True),
+            patch("backend.app.services.visualizer_service.settings") as mock_settings,
+            ThreadPoolExecutor(max_workers=8) as pool,
+        ):
+            mock_settings.max_visualized_sessions = 8
+            mock_settings.visualizer_queue_size = 10
+            mock_settings.visualizer_shared_window_size = (640, 480)
+            spawned = list(pool.map(lambda i: service.spawn_visualizer(f"s{i}", "Player1", "Player2"), range(8)))
+
+        assert sorted(channel.slot for _, channel in spawned) == list(range(8))
+        mock_process_class.assert_called_once()
+        service.shutdown_shared_renderer(timeout=0.1)
@@ -49,3 +49,36 @@ async def test_collect_actions_autofill_builtin():
     collected = await tp.collect_actions(session_id, turn, players, is_builtin=is_builtin)
     assert collected["p1"].move is None  # builtin auto placeholder
     assert collected["p2"].move == [0, 0]  # timeout default
+
+
+@pytest.mark.asyncio
+async def test_collect_actions_wakes_on_last_submission():
+    tp = TurnProcessor(timeout_seconds=5.0)
+    session_id = "s4"
+    turn = 4
+    players = ["p1", "p2"]
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    task = asyncio.create_task(tp.collect_actions(session_id, turn, players))
+    await asyncio.sleep(0)
+    await tp.submit_action(session_id, "p1", turn, ActionData(move=[1, 0], spell=None))
+    await asyncio.sleep(0.05)
+    assert not task.done()
+    await tp.submit_action(session_id, "p2", turn, ActionData(move=[0, 1], spell=None))
+
+    collected = await asyncio.wait_for(task, timeout=1.0)
+    assert loop.time() - start < 1.0
+    assert collected["p2"].move == [0, 1]
+    assert not tp._sessions[session_id].waiters and not tp._sessions[session_id].pending_by_turn
+
+
+@pytest.mark.asyncio
+async def test_cleanup_session_releases_waiting_collection():
+    tp = TurnProcessor(timeout_seconds=5.0)
+    task = asyncio.create_task(tp.collect_actions("s5", 1, ["p1"]))
+    await asyncio.sleep(0)
+
+    await tp.cleanup_session("s5")
+    collected = await asyncio.wait_for(task, timeout=1.0)
+    assert collected["p1"].move == [0, 0]
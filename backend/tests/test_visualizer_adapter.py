@@ -1,11 +1,13 @@
 """Unit tests for VisualizerAdapter."""
 
 import queue
+import time
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
 from backend.app.services.visualizer_adapter import VisualizerAdapter, run_visualizer_adapter
+from backend.app.services.visualizer_service import VisualizerStats
 
 
 @pytest.fixture
@@ -247,6 +249,71 @@ class TestVisualizerAdapterProcessEvents:
         assert not adapter._running
 
 
+class TestVisualizerAdapterCatchUp:
+    """Tests for skipping and collapsing animations when the adapter falls behind."""
+
+    @staticmethod
+    def _turns(adapter, stats, turns):
+        """Queue turn updates all at once, as a fast match loop would, then handle them."""
+        events = [
+            {"event": "turn_update", "turn": i, "game_state": {"turn": i}, "sent_at": time.time()} for i in turns
+        ]
+        count = len(events)
+        stats.add("sent", count)
+        for event in events:
+            adapter.handle_turn_event(event)
+
+    def test_backlog_is_skipped_and_latest_state_drawn(self, mock_queue):
+        """A deep backlog is skipped and only the newest state is drawn, without animation."""
+        stats = VisualizerStats()
+        adapter = VisualizerAdapter("test-session", mock_queue, "Player1", "Player2", stats=stats)
+        adapter._visualizer = MagicMock()
+
+        self._turns(adapter, stats, [0])
+        self._turns(adapter, stats, range(1, 7))
+
+        assert len(adapter._states) == 7
+        # Turns 1-4 are skipped while two or more newer ones wait; turn 5 is drawn as is
+        # rather than animated from the stale turn 0, and turn 6 animates from it
+        drawn = [call.args[0]["turn"] for call in adapter._visualizer.render_frame.call_args_list]
+        assert drawn == [0, 5]
+        adapter._visualizer.animate_transition.assert_called_once()
+        assert adapter._visualizer.animate_transition.call_args.args[1]["turn"] == 6
+        metrics = stats.snapshot()
+        assert metrics["skipped"] == 4 and metrics["jumped"] == 2 and metrics["animated"] == 1
+        assert metrics["backlog"] == 0 and metrics["lag_seconds"] >= 0
+
+    def test_small_backlog_collapses_animation(self, mock_queue):
+        """One turn behind: animate quickly and skip the pause after the animation."""
+        stats = VisualizerStats()
+        adapter = VisualizerAdapter("test-session", mock_queue, "Player1", "Player2", stats=stats)
+        adapter._visualizer = MagicMock()
+        adapter._states = [{"turn": 0}]
+
+        self._turns(adapter, stats, [1, 2])
+
+        assert adapter._visualizer.animate_transition.call_count == 2
+        # Only the last turn, with nothing queued behind it, pauses
+        adapter._visualizer.wait_for.assert_called_once()
+        assert stats.get("collapsed") == 1 and stats.get("animated") == 1
+
+
+    def test_dropped_turns_are_jumped_over(self, mock_queue):
+        """A gap in turn numbers means the server dropped turns: draw the next one, don't animate to it."""
+        stats = VisualizerStats()
+        adapter = VisualizerAdapter("test-session", mock_queue, "Player1", "Player2", stats=stats)
+        adapter._visualizer = MagicMock()
+
+        for turn in (0, 1, 4, 5):
+            self._turns(adapter, stats, [turn])
+
+        drawn = [call.args[0]["turn"] for call in adapter._visualizer.render_frame.call_args_list]
+        assert drawn == [0, 4]
+        animated = [call.args[1]["turn"] for call in adapter._visualizer.animate_transition.call_args_list]
+        assert animated == [1, 5]
+        assert stats.get("jumped") == 2 and stats.get("animated") == 2
+
+
 class TestVisualizerAdapterPygameEvents:
     """Tests for pygame event handling."""
 
@@ -349,6 +416,7 @@ class TestRunVisualizerAdapter:
             player2_name="Bot2",
             player1_sprite="sprite1.png",
             player2_sprite="sprite2.png",
+            stats=None,
         )
         mock_adapter.initialize_visualizer.assert_called_once()
         mock_adapter.process_events.assert_called_once()
@@ -391,4 +459,5 @@ class TestRunVisualizerAdapter:
             player2_name="Bot2",
             player1_sprite=None,
             player2_sprite=None,
+            stats=None,
         )
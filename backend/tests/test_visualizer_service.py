@@ -141,6 +141,29 @@ class TestVisualizerService:
         # Should return False without raising exception
         assert result is False
 
+    def test_send_event_counts_sent_and_dropped_turns(self, service):
+        """Test lag metrics: turn updates sent, dropped on a full queue, and the backlog."""
+        with (
+            patch("backend.app.services.visualizer_service.multiprocessing.Process"),
+            patch("backend.app.services.visualizer_service.settings") as mock_settings,
+            patch.object(service, "is_visualization_available", return_value=True),
+        ):
+            mock_settings.visualizer_queue_size = 1
+            _process, queue = service.spawn_visualizer(
+                session_id="test-session", player1_name="Player1", player2_name="Player2"
+            )
+
+        event = TurnEvent(turn=1, game_state={"test": "state"}, actions=[], events=[], log_line="Test log")
+        assert service.send_event(queue, event) is True
+        assert service.send_event(queue, event) is False
+
+        metrics = service.get_lag_metrics(queue)
+        assert metrics["sent"] == 1 and metrics["dropped"] == 1 and metrics["backlog"] == 1
+        assert "sent_at" in queue.get(timeout=1.0)
+
+        service.terminate_visualizer(MagicMock(is_alive=MagicMock(return_value=False)), queue, timeout=0.1)
+        assert service.get_lag_metrics(queue) is None
+
     def test_send_event_with_game_over(self, service):
         """Test sending game over event."""
         mock_queue = MagicMock()
@@ -251,6 +274,7 @@ class TestVisualizerService:
                 player2_name="Player2",
                 player1_sprite=None,
                 player2_sprite=None,
+                stats=None,
             )
 
 
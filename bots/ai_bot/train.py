@@ -7,7 +7,11 @@ from collections import defaultdict
 import torch
 import torch.optim as optim
 
+from simulator.latency import record_corpus
+from simulator.loader import BotSpec
 from simulator.match import run_match
+from simulator.memo import MemoizedBot, memoize_if_deterministic
+from simulator.sequential import SPRT, DEFAULT_MARGIN
 from bots.ai_bot.ai_bot import AIBot
 from bots.sample_bot1.sample_bot_1 import SampleBot1
 from bots.sample_bot2.sample_bot_2 import SampleBot2
@@ -129,10 +133,16 @@ class PrioritizedReplay:
         indices = np.random.choice(len(self.memory), batch_size, p=probs)
         return [self.memory[idx] for idx in indices]
 
-def evaluate_bot(bot1, bot2, num_matches=10):
-    """Run multiple matches between two bots and return win rates and average reward."""
+def evaluate_bot(bot1, bot2, num_matches=10, confidence=None, margin=DEFAULT_MARGIN):
+    """Run multiple matches between two bots and return win rates and average reward.
+
+    With ``confidence`` set, num_matches is an upper bound: evaluation stops as soon
+    as an SPRT is that confident which bot is stronger.
+    """
     results = defaultdict(int)
     total_reward = 0
+    sprt = SPRT(confidence, margin) if confidence else None
+    played = 0
     
     print(f"\nEvaluating {bot1.name} vs {bot2.name} for {num_matches} matches")
     
@@ -173,8 +183,15 @@ def evaluate_bot(bot1, bot2, num_matches=10):
                     continue
         
         total_reward += match_reward
+        played += 1
+
+        if sprt:
+            sprt.add(1.0 if winner is bot1 else 0.0 if winner is bot2 else 0.5)
+            if sprt.decision:
+                print(f"Confident after {played} matches, skipping the remaining {num_matches - played}")
+                break
     
-    avg_reward = total_reward / num_matches
+    avg_reward = total_reward / played
     
     # Print match summary
     print(f"\nMatch Summary:")
@@ -185,9 +202,9 @@ def evaluate_bot(bot1, bot2, num_matches=10):
     
     # Store results with consistent keys
     return {
-        "ai_bot": results[bot1.name] / num_matches,  # Always use bot1's actual win rate
-        "opponent": results[bot2.name] / num_matches,
-        "Draw": results["Draw"] / num_matches
+        "ai_bot": results[bot1.name] / played,  # Always use bot1's actual win rate
+        "opponent": results[bot2.name] / played,
+        "Draw": results["Draw"] / played
     }, avg_reward
 
 def create_bot_pool(num_ai_variants=3):
@@ -237,6 +254,18 @@ def create_bot_pool(num_ai_variants=3):
     
     return pool
 
+def memoize_pool(bot_pool, corpus_matches=4):
+    """Cache the decisions of the pool bots that check out as deterministic."""
+    specs = list({BotSpec.of(bot): None for _, bot in bot_pool})
+    corpus = record_corpus(specs, matches=corpus_matches)
+    memoized = []
+    for diff, bot in bot_pool:
+        wrapped = memoize_if_deterministic(bot, corpus)
+        status = "memoized" if isinstance(wrapped, MemoizedBot) else "not deterministic, left as is"
+        print(f"  {bot.name}: {status}")
+        memoized.append((diff, wrapped))
+    return memoized
+
 def create_self_play_bot():
     """Create a copy of the AI bot for self-play."""
     self_play_bot = AIBot()
@@ -253,7 +282,8 @@ def save_training_stats(episode, stats, filename="stats.txt"):
             f.write(f"{bot_name}: {results}\n")
         f.write("\n")
 
-def train_ai_bot(episodes=1000, matches_per_episode=20, save_interval=10, plot_interval=10):
+def train_ai_bot(episodes=1000, matches_per_episode=20, save_interval=10, plot_interval=10, eval_confidence=None,
+                 memoize_opponents=False):
     """Main training loop with curriculum learning and self-play."""
     print("Starting AI bot training with curriculum learning and self-play...")
     
@@ -263,6 +293,9 @@ def train_ai_bot(episodes=1000, matches_per_episode=20, save_interval=10, plot_i
     
     visualizer = TrainingVisualizer()
     bot_pool = create_bot_pool()
+    if memoize_opponents:
+        print("Checking opponents for deterministic decisions...")
+        bot_pool = memoize_pool(bot_pool)
     
     # Track performance metrics
     performance_history = []
@@ -420,7 +453,7 @@ def train_ai_bot(episodes=1000, matches_per_episode=20, save_interval=10, plot_i
         
         # Training against selected opponents
         for opponent, diff in current_opponents:
-            results, avg_reward = evaluate_bot(main_bot, opponent, matches_per_episode)
+            results, avg_reward = evaluate_bot(main_bot, opponent, matches_per_episode, confidence=eval_confidence)
             episode_stats[f"vs_{opponent.name}"] = results
             episode_total_reward += avg_reward
             
@@ -500,6 +533,10 @@ def main():
     parser.add_argument("--matches", type=int, default=20, help="Matches per episode")
     parser.add_argument("--save-interval", type=int, default=10, help="Episodes between model saves")
     parser.add_argument("--plot-interval", type=int, default=10, help="Episodes between plotting metrics")
+    parser.add_argument("--eval-confidence", type=float, default=None,
+                        help="Stop each opponent's matches early once an SPRT reaches this confidence")
+    parser.add_argument("--memoize-opponents", action="store_true",
+                        help="Cache the decisions of opponents that are deterministic functions of the state")
     args = parser.parse_args()
     
     try:
@@ -507,7 +544,9 @@ def main():
             episodes=args.episodes,
             matches_per_episode=args.matches,
             save_interval=args.save_interval,
-            plot_interval=args.plot_interval
+            plot_interval=args.plot_interval,
+            eval_confidence=args.eval_confidence,
+            memoize_opponents=args.memoize_opponents
         )
     except KeyboardInterrupt:
         print("\nTraining interrupted. Progress has been saved.")
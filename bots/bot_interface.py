@@ -1,3 +1,5 @@
+import asyncio
+
 from pydantic import BaseModel
 from typing import Optional, Dict, Any, List
 from abc import ABC, abstractmethod
@@ -50,6 +52,14 @@ class BotInterface(ABC):
         """Process game state and return action decision."""
         pass
 
+    async def decide_async(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Awaitable version of decide, used by async-aware runners.
+
+        The default simply calls decide. I/O-bound bots (e.g. ones calling a
+        remote API) override this to avoid blocking the event loop.
+        """
+        return self.decide(state)
+
     ## UNUSED
     def get_registration(self) -> BotRegistration:
         """Get bot registration data."""
@@ -57,4 +67,26 @@ class BotInterface(ABC):
             name=self.name,
             sprite_path=self.sprite_path,
             minion_sprite_path=self.minion_sprite_path
-        )
\ No newline at end of file
+        )
+
+
+class AsyncBotInterface(BotInterface):
+    """Base class for bots that implement only decide_async.
+
+    decide runs the coroutine to completion so such bots still work with the
+    synchronous engine loop; it must not be called from inside a running event loop.
+    """
+
+    @abstractmethod
+    async def decide_async(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Process game state and return action decision."""
+        pass
+
+    def decide(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        return asyncio.run(self.decide_async(state))
+
+
+def has_native_async(bot: BotInterface) -> bool:
+    """True if the bot overrides decide_async rather than relying on the default."""
+    method = getattr(type(bot), "decide_async", None)
+    return method is not None and method is not BotInterface.decide_async
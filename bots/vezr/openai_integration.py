@@ -4,6 +4,7 @@ import random
 import time
 from typing import Dict, List, Tuple, Any, Optional
 import requests
+import httpx
 import hashlib
 
 # Simple cache to store API responses and avoid redundant calls
@@ -85,30 +86,15 @@ Examples:
     
     return system_prompt
 
-def call_openai_api(prompt):
-    """
-    Call the OpenAI API with the given prompt and return the decision.
-    Uses caching to avoid redundant API calls for the same prompt.
-    
-    Args:
-        prompt: The detailed game state and instructions prompt
-    
-    Returns:
-        A dictionary with the 'move' and 'spell' decisions
-    """
+OPENAI_API_URL = "https://api.openai.com/v1/chat/completions"
+
+
+def _build_openai_request(prompt):
+    """Build the headers and JSON payload for a chat completion request."""
     api_key = os.environ.get("OPENAI_API_KEY")
     if not api_key:
         raise ValueError("OPENAI_API_KEY environment variable is not set")
-    
-    # Create a hash of the prompt to use as a cache key
-    prompt_hash = hashlib.md5(prompt.encode()).hexdigest()
-    
-    # Check if we have a cached response for this prompt
-    if prompt_hash in decision_cache:
-        print("Using cached decision")
-        return decision_cache[prompt_hash]
-    
-    url = "https://api.openai.com/v1/chat/completions"
+
     headers = {
         "Content-Type": "application/json",
         "Authorization": f"Bearer {api_key}"
@@ -124,94 +110,149 @@ def call_openai_api(prompt):
         "max_tokens": 300,  # Increased token count to allow for more complex reasoning
         "response_format": {"type": "json_object"}  # Force JSON response format
     }
+    return headers, data
+
+
+def call_openai_api(prompt):
+    """
+    Call the OpenAI API with the given prompt and return the decision.
+    Uses caching to avoid redundant API calls for the same prompt.
+    
+    Args:
+        prompt: The detailed game state and instructions prompt
+    
+    Returns:
+        A dictionary with the 'move' and 'spell' decisions
+    """
+    headers, data = _build_openai_request(prompt)
+
+    # Create a hash of the prompt to use as a cache key
+    prompt_hash = hashlib.md5(prompt.encode()).hexdigest()
+    
+    # Check if we have a cached response for this prompt
+    if prompt_hash in decision_cache:
+        print("Using cached decision")
+        return decision_cache[prompt_hash]
     
     # Track time for performance monitoring
     start_time = time.time()
     
     try:
-        response = requests.post(url, headers=headers, json=data)
+        response = requests.post(OPENAI_API_URL, headers=headers, json=data)
         response.raise_for_status()  # Raise an exception for HTTP errors
         
         # Calculate and print the response time
         response_time = time.time() - start_time
         print(f"OpenAI API response time: {response_time:.2f} seconds")
         
-        response_data = response.json()
+        return _parse_openai_response(response.json(), prompt_hash)
+    
+    except Exception as e:
+        print(f"Error connecting to OpenAI API: {e}")
+        return {"move": [0, 0], "spell": None}  # Default no-op in case of API connection error
+
+
+async def call_openai_api_async(prompt):
+    """
+    Non-blocking variant of call_openai_api for use from decide_async.
+    Shares the prompt cache and response validation with the blocking version.
+    """
+    headers, data = _build_openai_request(prompt)
+
+    prompt_hash = hashlib.md5(prompt.encode()).hexdigest()
+    if prompt_hash in decision_cache:
+        print("Using cached decision")
+        return decision_cache[prompt_hash]
+
+    start_time = time.time()
+
+    try:
+        async with httpx.AsyncClient(timeout=None) as client:
+            response = await client.post(OPENAI_API_URL, headers=headers, json=data)
+        response.raise_for_status()
+
+        response_time = time.time() - start_time
+        print(f"OpenAI API response time: {response_time:.2f} seconds")
+
+        return _parse_openai_response(response.json(), prompt_hash)
+
+    except Exception as e:
+        print(f"Error connecting to OpenAI API: {e}")
+        return {"move": [0, 0], "spell": None}  # Default no-op in case of API connection error
+
+
+def _parse_openai_response(response_data, prompt_hash):
+    """Validate the assistant message and turn it into a move/spell decision."""
+    # Extract the assistant's message content
+    assistant_message = response_data["choices"][0]["message"]["content"]
+    
+    try:
+        # Parse the JSON response
+        decision = json.loads(assistant_message)
         
-        # Extract the assistant's message content
-        assistant_message = response_data["choices"][0]["message"]["content"]
+        # Validate the response format
+        if "move" not in decision:
+            raise ValueError("Response is missing 'move' field")
         
-        try:
-            # Parse the JSON response
-            decision = json.loads(assistant_message)
-            
-            # Validate the response format
-            if "move" not in decision:
-                raise ValueError("Response is missing 'move' field")
+        # Ensure move is a list of 2 integers in range [-1, 1]
+        move = decision["move"]
+        if not isinstance(move, list) or len(move) != 2:
+            raise ValueError("'move' must be a list with 2 elements")
+        
+        move[0] = max(-1, min(1, int(move[0])))  # Ensure x is in range [-1, 1]
+        move[1] = max(-1, min(1, int(move[1])))  # Ensure y is in range [-1, 1]
+        
+        # Ensure spell format is correct if present
+        if "spell" in decision and decision["spell"] is not None:
+            spell = decision["spell"]
+            if not isinstance(spell, dict) or "name" not in spell:
+                raise ValueError("'spell' must be null or a dict with a 'name' field")
             
-            # Ensure move is a list of 2 integers in range [-1, 1]
-            move = decision["move"]
-            if not isinstance(move, list) or len(move) != 2:
-                raise ValueError("'move' must be a list with 2 elements")
+            # Validate spell name against available spells
+            spell_name = spell["name"]
+            available_spells = ["fireball", "shield", "teleport", "summon", "heal", "melee_attack"]
+            if spell_name not in available_spells:
+                raise ValueError(f"Spell '{spell_name}' is not a valid spell")
             
-            move[0] = max(-1, min(1, int(move[0])))  # Ensure x is in range [-1, 1]
-            move[1] = max(-1, min(1, int(move[1])))  # Ensure y is in range [-1, 1]
+            # If spell requires a target but none is provided, raise error
+            target_required_spells = ["fireball", "teleport", "summon", "melee_attack"]
+            if spell_name in target_required_spells and "target" not in spell:
+                raise ValueError(f"Spell '{spell_name}' requires a target")
             
-            # Ensure spell format is correct if present
-            if "spell" in decision and decision["spell"] is not None:
-                spell = decision["spell"]
-                if not isinstance(spell, dict) or "name" not in spell:
-                    raise ValueError("'spell' must be null or a dict with a 'name' field")
-                
-                # Validate spell name against available spells
-                spell_name = spell["name"]
-                available_spells = ["fireball", "shield", "teleport", "summon", "heal", "melee_attack"]
-                if spell_name not in available_spells:
-                    raise ValueError(f"Spell '{spell_name}' is not a valid spell")
+            # Ensure the target is a valid position (if provided)
+            if "target" in spell:
+                target = spell["target"]
+                if not isinstance(target, list) or len(target) != 2:
+                    raise ValueError(f"Spell target must be a list with 2 elements")
                 
-                # If spell requires a target but none is provided, raise error
-                target_required_spells = ["fireball", "teleport", "summon", "melee_attack"]
-                if spell_name in target_required_spells and "target" not in spell:
-                    raise ValueError(f"Spell '{spell_name}' requires a target")
-                
-                # Ensure the target is a valid position (if provided)
-                if "target" in spell:
-                    target = spell["target"]
-                    if not isinstance(target, list) or len(target) != 2:
-                        raise ValueError(f"Spell target must be a list with 2 elements")
-                    
-                    # Convert target coordinates to integers
-                    spell["target"] = [int(target[0]), int(target[1])]
-            
-            # Cache the decision for future use with the same prompt
-            decision_cache[prompt_hash] = decision
-            
-            return decision
-            
-        except json.JSONDecodeError as e:
-            # If we can't parse the response as JSON, create a fallback response
-            print(f"Error parsing API response as JSON: {e}")
-            print(f"Raw response: {assistant_message}")
-            return {"move": [0, 0], "spell": None}  # Default no-op
+                # Convert target coordinates to integers
+                spell["target"] = [int(target[0]), int(target[1])]
+        
+        # Cache the decision for future use with the same prompt
+        decision_cache[prompt_hash] = decision
+        
+        return decision
+        
+    except json.JSONDecodeError as e:
+        # If we can't parse the response as JSON, create a fallback response
+        print(f"Error parsing API response as JSON: {e}")
+        print(f"Raw response: {assistant_message}")
+        return {"move": [0, 0], "spell": None}  # Default no-op
+        
+    except Exception as e:
+        print(f"Error processing API response: {e}")
+        print(f"Raw response: {assistant_message}")
+        
+        # Try to safely extract and correct any partial information
+        try:
+            partial_decision = json.loads(assistant_message)
+            move = partial_decision.get("move", [0, 0])
             
-        except Exception as e:
-            print(f"Error processing API response: {e}")
-            print(f"Raw response: {assistant_message}")
+            # If we have a move but spell is invalid, use the move with no spell
+            if isinstance(move, list) and len(move) == 2:
+                print(f"Using partial decision with move {move} but no spell")
+                return {"move": [max(-1, min(1, int(move[0]))), max(-1, min(1, int(move[1])))], "spell": None}
+        except:
+            pass
             
-            # Try to safely extract and correct any partial information
-            try:
-                partial_decision = json.loads(assistant_message)
-                move = partial_decision.get("move", [0, 0])
-                
-                # If we have a move but spell is invalid, use the move with no spell
-                if isinstance(move, list) and len(move) == 2:
-                    print(f"Using partial decision with move {move} but no spell")
-                    return {"move": [max(-1, min(1, int(move[0]))), max(-1, min(1, int(move[1])))], "spell": None}
-            except:
-                pass
-                
-            return {"move": [0, 0], "spell": None}  # Default no-op
-    
-    except Exception as e:
-        print(f"Error connecting to OpenAI API: {e}")
-        return {"move": [0, 0], "spell": None}  # Default no-op in case of API connection error
+        return {"move": [0, 0], "spell": None}  # Default no-op
@@ -1,7 +1,7 @@
 import random
 import os
 from bots.bot_interface import BotInterface
-from bots.vezr.openai_integration import create_openai_prompt, call_openai_api
+from bots.vezr.openai_integration import create_openai_prompt, call_openai_api, call_openai_api_async
 
 
 class Vezr(BotInterface):
@@ -55,6 +55,24 @@ class Vezr(BotInterface):
             print("Falling back to backup strategy")
             self.use_backup_strategy = True  # Use backup for future turns too
             return self.backup_strategy(state)
+
+    async def decide_async(self, state):
+        """
+        Same as decide, but awaits the OpenAI request so an async runner can
+        keep other work going while the API call is in flight.
+        """
+        if self.use_backup_strategy:
+            return self.backup_strategy(state)
+
+        try:
+            prompt = create_openai_prompt(state, self._name)
+            return await call_openai_api_async(prompt)
+
+        except Exception as e:
+            print(f"Error using OpenAI API: {e}")
+            print("Falling back to backup strategy")
+            self.use_backup_strategy = True  # Use backup for future turns too
+            return self.backup_strategy(state)
     
     def backup_strategy(self, state):
         """
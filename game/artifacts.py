@@ -2,7 +2,8 @@ import random
 from game.rules import BOARD_SIZE
 
 class ArtifactManager:
-    def __init__(self):
+    def __init__(self, board_size=BOARD_SIZE):
+        self.board_size = board_size
         self.artifacts = []  # List of dicts with position and type
 
     def spawn_random(self, occupied_positions=[], turn=0):
@@ -28,7 +29,7 @@ class ArtifactManager:
             return False
 
         # Generate all possible positions
-        all_positions = [(x, y) for x in range(BOARD_SIZE) for y in range(BOARD_SIZE)]
+        all_positions = [(x, y) for x in range(self.board_size) for y in range(self.board_size)]
 
         # Filter out occupied positions
         free_positions = [pos for pos in all_positions if pos not in occupied]
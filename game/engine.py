@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any
 from collections import deque
 
@@ -8,32 +9,75 @@ from game.artifacts import ArtifactManager
 from game.minion import Minion
 
 
+async def _decide_async(bot, state):
+    decide_async = getattr(bot, "decide_async", None)
+    if not asyncio.iscoroutinefunction(decide_async):
+        return bot.decide(state)
+    return await decide_async(state)
 
 
 class GameEngine:
-    def __init__(self, bot1, bot2):
+    def __init__(self, bot1, bot2, board_size=BOARD_SIZE, logger=None, recorder=None):
+        self.board_size = board_size
         self.wizard1 = Wizard(bot1.name, [0, 0])
-        self.wizard2 = Wizard(bot2.name, [9, 9])
+        self.wizard2 = Wizard(bot2.name, [board_size - 1, board_size - 1])
         self.bots = [bot1, bot2]
-        self.artifacts = ArtifactManager()
+        self.artifacts = ArtifactManager(board_size)
         self.turn = 0
         self.log = []
         self.minions = []
-        self.logger = GameLogger()
+        self.logger = logger if logger is not None else GameLogger()
+        self.recorder = recorder
+        if recorder is not None:
+            recorder.start_match(bot1.name, bot2.name, board_size)
 
     def run_turn(self):
-        self.log_turn()
+        states = self.begin_turn()
 
-        collision_occurred = False
+        # Step 2: Get bot actions and validate them
+        actions = [
+            self.bots[0].decide(states[0]),
+            self.bots[1].decide(states[1])
+        ]
+
+        return self.resolve_turn(actions)
+
+    async def run_turn_async(self):
+        """Same as run_turn, but awaits both bots' decisions concurrently.
+
+        Bots that only implement the synchronous ``decide`` are called directly.
+        """
+        states = self.begin_turn()
+
+        actions = await asyncio.gather(
+            _decide_async(self.bots[0], states[0]),
+            _decide_async(self.bots[1], states[1])
+        )
+
+        return self.resolve_turn(list(actions))
+
+    def begin_turn(self):
+        """Advance the turn counter, spawn artifacts and return both bots' inputs."""
+        self.log_turn()
 
         # Step 1: Artifact spawning
         self.spawn_artifacts()
 
-        # Step 2: Get bot actions and validate them
-        actions = self.validate_actions([
-            (self.bots[0].decide(self.build_input(self.wizard1, self.wizard2))),
-            (self.bots[1].decide(self.build_input(self.wizard2, self.wizard1)))
-        ])
+        states = [
+            self.build_input(self.wizard1, self.wizard2),
+            self.build_input(self.wizard2, self.wizard1)
+        ]
+        if self.recorder is not None:
+            self.recorder.record_states(self.turn, states)
+        return states
+
+    def resolve_turn(self, actions):
+        """Apply both bots' actions for the current turn and return the winner, if any."""
+        collision_occurred = False
+
+        actions = self.validate_actions(actions)
+        if self.recorder is not None:
+            self.recorder.record_actions(actions)
 
         # Step 3: Movement with collision detection
         wiz1_move = actions[0].get("move")
@@ -95,8 +139,26 @@ class GameEngine:
 
             self.logger.log_state(self.build_input(self.wizard1, self.wizard2))
 
+        if self.recorder is not None:
+            self.recorder.record_outcome(self.wizard1.hp, self.wizard2.hp)
+            if winner:
+                self.recorder.end_match(self._recorded_result(winner), self.turn)
+
         return winner
 
+    def finalize(self):
+        """Finish the match log, recording an unfinished match as a draw."""
+        self.logger.finalize()
+        if self.recorder is not None:
+            self.recorder.end_match(self._recorded_result("Draw"), self.turn)
+
+    def _recorded_result(self, winner):
+        from game.recorder import RESULT_DRAW, RESULT_FIRST_WINS, RESULT_SECOND_WINS
+
+        if winner == "Draw":
+            return RESULT_DRAW
+        return RESULT_FIRST_WINS if winner is self.bots[0] else RESULT_SECOND_WINS
+
     def spawn_artifacts(self):
         if self.turn > 0 and self.turn % ARTIFACT_SPAWN_RATE == 0:
             occupied_positions = [
@@ -122,7 +184,7 @@ class GameEngine:
     def build_input(self, self_wiz, opp_wiz):
         return {
             "turn": self.turn,
-            "board_size": BOARD_SIZE,
+            "board_size": self.board_size,
             "self": self_wiz.to_dict(),
             "opponent": opp_wiz.to_dict(),
             "artifacts": self.artifacts.active_artifacts(),
@@ -153,7 +215,7 @@ class GameEngine:
         dx, dy = move
         x, y = wizard.position
         new_x, new_y = x + dx, y + dy
-        if 0 <= new_x < BOARD_SIZE and 0 <= new_y < BOARD_SIZE:
+        if 0 <= new_x < self.board_size and 0 <= new_y < self.board_size:
             wizard.position = [new_x, new_y]
             self.logger.log(f"{wizard.name} moved to {wizard.position}")
 
@@ -178,6 +240,7 @@ class GameEngine:
 
         caster.cast_spell(spell)
         self.logger.log(f"{caster.name} cast {spell}")
+        cast_from = list(caster.position)
 
         hit = False
         if spell == "fireball":
@@ -218,7 +281,7 @@ class GameEngine:
                             ):
                                 # Only damage enemy entities
                                 splash_damage_hit = True
-                                print(self.turn, " splash_damage")
+                                self.logger.debug(f"{self.turn} splash_damage")
                                 splash_damage = FIREBALL_SPLASH_DAMAGE
                                 if hasattr(splash_entity, "shield_active") and splash_entity.shield_active:
                                     splash_damage = max(0, splash_damage - SPELLS["shield"]["block"])
@@ -302,7 +365,7 @@ class GameEngine:
             else:
                 self.logger.log(f"{caster.name} already has a minion.")
 
-        self.logger.log_spell(caster, spell, spell_action.get("target") if spell_action else None, hit)
+        self.logger.log_spell(caster, spell, spell_action.get("target") if spell_action else None, hit, cast_from)
 
     def process_minions(self):
         # Track attempted movement destinations
@@ -450,7 +513,7 @@ class GameEngine:
 
     def is_valid_tile(self, pos):
         x, y = pos
-        return 0 <= x < BOARD_SIZE and 0 <= y < BOARD_SIZE
+        return 0 <= x < self.board_size and 0 <= y < self.board_size
 
     def get_adjacent_free_tile(self, pos):
         x, y = pos
@@ -481,7 +544,7 @@ class GameEngine:
         new_x, new_y = x + dx, y + dy
 
         # Check if move is valid
-        if 0 <= new_x < BOARD_SIZE and 0 <= new_y < BOARD_SIZE:
+        if 0 <= new_x < self.board_size and 0 <= new_y < self.board_size:
             return [new_x, new_y]
         return None
 
@@ -514,7 +577,7 @@ class GameEngine:
         self.logger.log(f"{name2} takes {damage2} damage (HP: {entity2.hp})")
 
         # Move entities apart to adjacent tiles
-        print("TURN ", self.turn, ": COLLISION")
+        self.logger.debug(f"TURN {self.turn}: COLLISION")
         entity1.position = position
         entity2.position = position
         self.logger.log_state(self.build_input(self.wizard1, self.wizard2))
@@ -13,8 +13,27 @@ EVENT_SHIELD_DOWN = "shield_down"
 EVENT_ARTIFACT_SPAWN= "artifact_spawn"
 EVENT_ARTIFACT_PICK_UP = "artifact_pick_up"
 
+# Logger levels, from most to least work per turn
+LOG_LEVEL_VERBOSE = "verbose"  # record everything and echo events to the console
+LOG_LEVEL_QUIET = "quiet"      # record everything, print nothing
+LOG_LEVEL_MINIMAL = "minimal"  # no text log or event list, only the latest snapshot
+LOG_LEVELS = (LOG_LEVEL_VERBOSE, LOG_LEVEL_QUIET, LOG_LEVEL_MINIMAL)
+
 class GameLogger:
-    def __init__(self):
+    def __init__(self, level=LOG_LEVEL_VERBOSE, sink=None):
+        """Record a match at ``level``, in memory or into ``sink``.
+
+        ``sink``, if given, receives every record as ``sink.write(kind, data)``
+        instead of it being kept in memory; only the latest snapshot is kept, so
+        memory stays flat however long the match or series is.
+        """
+        if level not in LOG_LEVELS:
+            raise ValueError(f"Unknown log level {level!r}, expected one of {LOG_LEVELS}")
+        self.level = level
+        self.sink = sink
+        self._echo = level == LOG_LEVEL_VERBOSE
+        self._record = level != LOG_LEVEL_MINIMAL
+        self.turn_number = 0
         self.turn_logs = []
         self.events = []  # 📝 new: list of events
         self.current_turn = []
@@ -25,17 +44,38 @@ class GameLogger:
         self.state_index=0
 
     def new_turn(self, turn_num):
+        self.turn_number = turn_num
+        if self.sink is not None:
+            if self._record:
+                self.sink.write("turn", turn_num)
+            return
         if self.current_turn:
             self.turn_logs.append(self.current_turn)
         self.current_turn = [f"--- Turn {turn_num} ---"]
 
     def log(self, message):
-        self.current_turn.append(message)
+        if not self._record:
+            return
+        if self.sink is not None:
+            self.sink.write("log", message)
+        else:
+            self.current_turn.append(message)
+
+    def debug(self, message):
+        """Console-only diagnostics, printed at the verbose level."""
+        if self._echo:
+            print(message)
 
     def log_state(self, state_dict):
         state_dict_copy = copy.deepcopy(state_dict)
         state_dict_copy["state_index"] = self.state_index
-        self.snapshots.append(state_dict_copy)
+        if self._record and self.sink is not None:
+            self.sink.write("state", state_dict_copy)
+            self.snapshots[:] = [state_dict_copy]
+        elif self._record:
+            self.snapshots.append(state_dict_copy)
+        else:
+            self.snapshots[:] = [state_dict_copy]
         self.state_index += 1
 
     def finalize(self):
@@ -59,19 +99,28 @@ class GameLogger:
                 for line in turn:
                     f.write(line + "\n")
 
-    def log_spell(self, caster, spell_name, target=None, hit=None):
-        self.spells.append({
-            "turn": self.current_turn,
+    def _store(self, kind, entries, entry):
+        if not self._record:
+            return
+        if self.sink is not None:
+            self.sink.write(kind, entry)
+        else:
+            entries.append(entry)
+
+    def log_spell(self, caster, spell_name, target=None, hit=None, caster_position=None):
+        self._store("spell", self.spells, {
+            "turn": self.turn_number,
             "state_index": self.state_index,
             "caster": caster.name,
+            "caster_position": list(caster_position if caster_position is not None else caster.position),
             "spell": spell_name,
             "target": target,
             "hit": hit
         })
 
     def log_damage(self, position, amount, target_name, cause=None):
-        self.damage_events.append({
-            "turn": self.current_turn,
+        self._store("damage", self.damage_events, {
+            "turn": self.turn_number,
             "state_index": self.state_index,
             "position": position,
             "amount": amount,
@@ -80,8 +129,8 @@ class GameLogger:
         })
 
     def log_collision(self, position):
-        self.collision_events.append({
-            "turn": self.current_turn,
+        self._store("collision", self.collision_events, {
+            "turn": self.turn_number,
             "position": position
         })
 
@@ -89,8 +138,13 @@ class GameLogger:
     # EVENT LOGS
     
     def _log_event(self, event_data):
-        """Print event data to console for debugging"""
-        print(f"Turn {event_data['turn']} | EVENT: {event_data['event']} | {event_data['details']}")
+        """Record the event and, at the verbose level, print it for debugging"""
+        if self._record and self.sink is not None:
+            self.sink.write("event", event_data)
+        elif self._record:
+            self.events.append(event_data)
+        if self._echo:
+            print(f"Turn {event_data['turn']} | EVENT: {event_data['event']} | {event_data['details']}")
 
     def log_event_turn_start(self, turn):
         event_data = {
@@ -98,7 +152,6 @@ class GameLogger:
             "event": EVENT_TURN_START,
             "details": {}
         }
-        self.events.append(event_data)
         self._log_event(event_data)
 
     def log_event_spell(self, turn, caster, spell_name, target):
@@ -111,7 +164,6 @@ class GameLogger:
                 "target": target
             }
         }
-        self.events.append(event_data)
         self._log_event(event_data)
 
     def log_event_wizard_damage(self, turn, amount, name, remaining_hp=None):
@@ -125,7 +177,6 @@ class GameLogger:
                 "remaining_hp": remaining_hp
             }
         }
-        self.events.append(event_data)
         self._log_event(event_data)
 
     def log_event_minion_damage(self, turn, position, amount, minion_id, remaining_hp=None):
@@ -140,7 +191,6 @@ class GameLogger:
                 "remaining_hp": remaining_hp
             }
         }
-        self.events.append(event_data)
         self._log_event(event_data)
 
     def log_event_wizard_move(self, turn, wiz1: Wizard, wiz1_new_position, wiz2: Wizard, wiz2_new_position):
@@ -166,7 +216,6 @@ class GameLogger:
                 "event": EVENT_WIZARD_MOVE,
                 "details": details
             }
-            self.events.append(event_data)
             self._log_event(event_data)
 
     def log_event_minion_move(self, turn, minion_id, start_position, new_position):
@@ -178,7 +227,6 @@ class GameLogger:
                 "move": str(start_position) + '->' + str(new_position)
             }
         }
-        self.events.append(event_data)
         self._log_event(event_data)
 
     def log_event_collision(self, turn, position, entity1, entity1_bounce_position, entity2, entity2_bounce_position):
@@ -195,7 +243,6 @@ class GameLogger:
                 "entity2_bounce_position": entity2_bounce_position
             }
         }
-        self.events.append(event_data)
         self._log_event(event_data)
 
     def log_event_shield_down(self, turn, wizard_name):
@@ -206,7 +253,6 @@ class GameLogger:
                 "wizard": wizard_name
             }
         }
-        self.events.append(event_data)
         self._log_event(event_data)
 
     def log_event_spawn_artifact(self, turn, artifact):
@@ -218,7 +264,6 @@ class GameLogger:
                 "position": artifact["position"]
             }
         }
-        self.events.append(event_data)
         self._log_event(event_data)
 
     def log_event_artifact_pick_up(self, turn, wizard_name, artifact):
@@ -231,7 +276,6 @@ class GameLogger:
                 "artifact_position": artifact["position"]
             }
         }
-        self.events.append(event_data)
         self._log_event(event_data)
 
     def get_event_logs(self):
@@ -0,0 +1,492 @@
+"""Compact binary recording of bot decision points.
+
+Every turn each bot sees a state and answers with an action. A
+``DecisionRecorder`` attached to a ``GameEngine`` stores each such decision
+point as one fixed-width record: the state from that bot's point of view, the
+action it chose, and both wizards' HP once the turn has been resolved.
+
+Two files are written, both append-only:
+
+``<path>``
+    a 16-byte header followed by records of ``RECORD_DTYPE``.
+``<path>.idx``
+    a 16-byte header followed by one ``INDEX_DTYPE`` entry per finished match:
+    where its records start, how many there are, how long it lasted and who won.
+
+Bot names and board sizes go to ``<path>.meta.jsonl``, one line per match.
+
+A match's records and its metadata line are written in one go when it ends,
+followed by its index entry, so an interrupted run never leaves the index
+pointing at missing data; records and metadata of an unfinished match are cut
+off the next time the file is opened for writing. ``DecisionReader`` maps both
+binary files with ``np.memmap`` and decodes records lazily, as dicts or as
+NumPy structured arrays.
+
+Fixed width means bounded lists: at most ``MAX_ARTIFACTS`` artifacts and
+``MAX_MINIONS`` minions are stored per state (``truncated`` marks states that
+had more) and minion ids are not kept.
+"""
+
+import json
+import os
+import struct
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+
+from game.rules import SPELLS
+
+MAX_ARTIFACTS = 12
+MAX_MINIONS = 4
+
+SPELL_NAMES = list(SPELLS)
+COOLDOWN_NAMES = list(SPELLS)
+ARTIFACT_TYPES = ["health", "mana", "cooldown"]
+
+NO_SPELL = 0
+UNKNOWN_SPELL = 255
+NO_TARGET = -128
+
+# Match results in the index, from the first bot's point of view
+RESULT_DRAW = 0
+RESULT_FIRST_WINS = 1
+RESULT_SECOND_WINS = 2
+
+OWNER_SELF = 0
+OWNER_OPPONENT = 1
+
+_RECORD_MAGIC = b"SPCREC1\0"
+_INDEX_MAGIC = b"SPCIDX1\0"
+_HEADER = struct.Struct("<8sII")
+
+
+def _wizard_fields(prefix):
+    return [
+        (f"{prefix}_x", "<i1"),
+        (f"{prefix}_y", "<i1"),
+        (f"{prefix}_hp", "<i2"),
+        (f"{prefix}_mana", "<i2"),
+        (f"{prefix}_shield", "<u1"),
+        (f"{prefix}_cooldowns", "<u1", (len(COOLDOWN_NAMES),)),
+    ]
+
+
+RECORD_DTYPE = np.dtype(
+    [
+        ("match", "<u4"),
+        ("turn", "<u2"),
+        ("side", "<u1"),
+        ("board_size", "<u1"),
+    ]
+    + _wizard_fields("self")
+    + _wizard_fields("opp")
+    + [
+        ("artifact_count", "<u1"),
+        ("artifacts", "<i1", (MAX_ARTIFACTS, 3)),  # x, y, type
+        ("minion_count", "<u1"),
+        ("minions", "<i2", (MAX_MINIONS, 4)),  # x, y, hp, owner
+        ("truncated", "<u1"),
+        ("move_x", "<i1"),
+        ("move_y", "<i1"),
+        ("spell", "<u1"),
+        ("target_x", "<i1"),
+        ("target_y", "<i1"),
+        ("self_hp_after", "<i2"),
+        ("opp_hp_after", "<i2"),
+    ]
+)
+
+INDEX_DTYPE = np.dtype(
+    [
+        ("match", "<u4"),
+        ("first", "<u8"),
+        ("count", "<u4"),
+        ("turns", "<u2"),
+        ("result", "<u1"),
+        ("reserved", "<u1"),
+    ]
+)
+
+RECORD_SIZE = RECORD_DTYPE.itemsize
+INDEX_SIZE = INDEX_DTYPE.itemsize
+
+
+def _clamp(value, low, high, default):
+    try:
+        return max(low, min(high, int(value)))
+    except (TypeError, ValueError):
+        return default
+
+
+def _encode_wizard(record, prefix, wizard):
+    position = wizard.get("position") or [0, 0]
+    record[f"{prefix}_x"] = _clamp(position[0], -127, 127, 0)
+    record[f"{prefix}_y"] = _clamp(position[1], -127, 127, 0)
+    record[f"{prefix}_hp"] = _clamp(wizard.get("hp"), -32768, 32767, 0)
+    record[f"{prefix}_mana"] = _clamp(wizard.get("mana"), -32768, 32767, 0)
+    record[f"{prefix}_shield"] = 1 if wizard.get("shield_active") else 0
+    cooldowns = wizard.get("cooldowns") or {}
+    record[f"{prefix}_cooldowns"] = [_clamp(cooldowns.get(name, 0), 0, 255, 0) for name in COOLDOWN_NAMES]
+
+
+def encode_state(state: dict, record) -> None:
+    """Fill the state fields of a ``RECORD_DTYPE`` record from a bot input dict."""
+    record["board_size"] = _clamp(state.get("board_size"), 0, 255, 0)
+    _encode_wizard(record, "self", state["self"])
+    _encode_wizard(record, "opp", state["opponent"])
+
+    artifacts = state.get("artifacts") or []
+    minions = state.get("minions") or []
+    record["truncated"] = int(len(artifacts) > MAX_ARTIFACTS or len(minions) > MAX_MINIONS)
+
+    stored = artifacts[:MAX_ARTIFACTS]
+    record["artifact_count"] = len(stored)
+    for i, artifact in enumerate(stored):
+        kind = artifact.get("type")
+        record["artifacts"][i] = (
+            artifact["position"][0],
+            artifact["position"][1],
+            ARTIFACT_TYPES.index(kind) if kind in ARTIFACT_TYPES else -1,
+        )
+
+    stored = minions[:MAX_MINIONS]
+    record["minion_count"] = len(stored)
+    self_name = state["self"].get("name")
+    for i, minion in enumerate(stored):
+        owner = OWNER_SELF if minion.get("owner") == self_name else OWNER_OPPONENT
+        record["minions"][i] = (
+            minion["position"][0],
+            minion["position"][1],
+            _clamp(minion.get("hp"), -32768, 32767, 0),
+            owner,
+        )
+
+
+def encode_action(action, record) -> None:
+    """Fill the action fields of a record. Malformed parts are stored as no-ops."""
+    action = action if isinstance(action, dict) else {}
+    move = action.get("move")
+    if isinstance(move, (list, tuple)) and len(move) == 2:
+        record["move_x"] = _clamp(move[0], -127, 127, 0)
+        record["move_y"] = _clamp(move[1], -127, 127, 0)
+
+    spell = action.get("spell")
+    record["target_x"] = record["target_y"] = NO_TARGET
+    if not isinstance(spell, dict) or not spell.get("name"):
+        record["spell"] = NO_SPELL
+        return
+    name = spell["name"]
+    record["spell"] = SPELL_NAMES.index(name) + 1 if name in SPELL_NAMES else UNKNOWN_SPELL
+    target = spell.get("target")
+    if isinstance(target, (list, tuple)) and len(target) == 2:
+        record["target_x"] = _clamp(target[0], -127, 127, NO_TARGET)
+        record["target_y"] = _clamp(target[1], -127, 127, NO_TARGET)
+
+
+def _decode_wizard(record, prefix) -> dict:
+    return {
+        "position": [int(record[f"{prefix}_x"]), int(record[f"{prefix}_y"])],
+        "hp": int(record[f"{prefix}_hp"]),
+        "mana": int(record[f"{prefix}_mana"]),
+        "shield_active": bool(record[f"{prefix}_shield"]),
+        "cooldowns": {name: int(value) for name, value in zip(COOLDOWN_NAMES, record[f"{prefix}_cooldowns"])},
+    }
+
+
+def decode_record(record) -> dict:
+    """Turn a record back into {match, turn, side, state, action, outcome} dicts.
+
+    ``state`` has the shape bots receive, minus names and minion ids.
+    """
+    artifacts = [
+        {
+            "position": [int(x), int(y)],
+            "type": ARTIFACT_TYPES[kind] if 0 <= kind < len(ARTIFACT_TYPES) else None,
+        }
+        for x, y, kind in record["artifacts"][: record["artifact_count"]]
+    ]
+    minions = [
+        {"position": [int(x), int(y)], "hp": int(hp), "owner": "self" if owner == OWNER_SELF else "opponent"}
+        for x, y, hp, owner in record["minions"][: record["minion_count"]]
+    ]
+
+    spell = None
+    if record["spell"] != NO_SPELL:
+        name = SPELL_NAMES[record["spell"] - 1] if record["spell"] <= len(SPELL_NAMES) else None
+        spell = {"name": name}
+        if record["target_x"] != NO_TARGET:
+            spell["target"] = [int(record["target_x"]), int(record["target_y"])]
+
+    return {
+        "match": int(record["match"]),
+        "turn": int(record["turn"]),
+        "side": int(record["side"]),
+        "state": {
+            "turn": int(record["turn"]),
+            "board_size": int(record["board_size"]),
+            "self": _decode_wizard(record, "self"),
+            "opponent": _decode_wizard(record, "opp"),
+            "artifacts": artifacts,
+            "minions": minions,
+        },
+        "action": {"move": [int(record["move_x"]), int(record["move_y"])], "spell": spell},
+        "outcome": {"self_hp": int(record["self_hp_after"]), "opponent_hp": int(record["opp_hp_after"])},
+        "truncated": bool(record["truncated"]),
+    }
+
+
+def _check_header(f, magic: bytes, size: int, path: str) -> None:
+    header = f.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        raise ValueError(f"{path} is not a decision record file (header too short)")
+    found_magic, found_size, _ = _HEADER.unpack(header)
+    if found_magic != magic:
+        raise ValueError(f"{path} is not a decision record file")
+    if found_size != size:
+        raise ValueError(f"{path} has {found_size}-byte entries, this version uses {size}")
+
+
+def _open_append(path: str, magic: bytes, size: int):
+    if os.path.exists(path) and os.path.getsize(path) > 0:
+        f = open(path, "r+b")
+        _check_header(f, magic, size, path)
+    else:
+        f = open(path, "w+b")
+        f.write(_HEADER.pack(magic, size, 0))
+        f.flush()
+    return f
+
+
+def _truncate_meta(path: str, matches: int) -> None:
+    """Cut the metadata file after the complete lines of the first ``matches`` matches."""
+    if not os.path.exists(path):
+        return
+    keep = 0
+    with open(path, "rb") as f:
+        for line in f:
+            try:
+                complete = line.endswith(b"\n") and json.loads(line)["match"] < matches
+            except (ValueError, KeyError, TypeError):
+                complete = False
+            if not complete:
+                break
+            keep += len(line)
+    os.truncate(path, keep)
+
+
+class DecisionRecorder:
+    """Append decision points of one match after another to a record file.
+
+    Attach it with ``GameEngine(..., recorder=recorder)``; the engine reports
+    states, actions and outcomes as the turns are played.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._records = _open_append(path, _RECORD_MAGIC, RECORD_SIZE)
+        self._index = _open_append(path + ".idx", _INDEX_MAGIC, INDEX_SIZE)
+
+        # Drop a partial index entry and any records or metadata not covered by the index
+        index_bytes = os.path.getsize(path + ".idx") - _HEADER.size
+        entries = index_bytes // INDEX_SIZE
+        self._index.truncate(_HEADER.size + entries * INDEX_SIZE)
+        end = 0
+        self._next_match = 0
+        if entries:
+            self._index.seek(_HEADER.size + (entries - 1) * INDEX_SIZE)
+            last = np.frombuffer(self._index.read(INDEX_SIZE), dtype=INDEX_DTYPE)[0]
+            end = int(last["first"]) + int(last["count"])
+            self._next_match = int(last["match"]) + 1
+        self._records.truncate(_HEADER.size + end * RECORD_SIZE)
+        self._records.seek(0, os.SEEK_END)
+        self._index.seek(0, os.SEEK_END)
+        self._written = end
+        meta_path = path + ".meta.jsonl"
+        _truncate_meta(meta_path, self._next_match)
+        self._meta = open(meta_path, "a")
+
+        self._match: Optional[dict] = None
+        self._buffer: List[np.ndarray] = []
+        self._pending: Optional[np.ndarray] = None
+
+    @property
+    def matches_recorded(self) -> int:
+        return self._next_match
+
+    def start_match(self, bot1_name: str, bot2_name: str, board_size: int) -> int:
+        """Begin a new match and return its id. An unfinished previous match is dropped."""
+        self._match = {"match": self._next_match, "bot1": bot1_name, "bot2": bot2_name, "board_size": board_size}
+        self._buffer = []
+        self._pending = None
+        return self._match["match"]
+
+    def record_states(self, turn: int, states: List[dict]) -> None:
+        """Encode the inputs both bots are about to receive (before they can mutate them)."""
+        if self._match is None:
+            return
+        pending = np.zeros(len(states), dtype=RECORD_DTYPE)
+        for side, state in enumerate(states):
+            pending[side]["match"] = self._match["match"]
+            pending[side]["turn"] = turn
+            pending[side]["side"] = side
+            encode_state(state, pending[side])
+        self._pending = pending
+
+    def record_actions(self, actions: List[dict]) -> None:
+        if self._pending is None:
+            return
+        for side, action in enumerate(actions):
+            encode_action(action, self._pending[side])
+
+    def record_outcome(self, wizard1_hp: int, wizard2_hp: int) -> None:
+        """Store both wizards' HP after the turn and move the turn's records to the match buffer."""
+        if self._pending is None:
+            return
+        hps = (wizard1_hp, wizard2_hp)
+        for side in range(len(self._pending)):
+            self._pending[side]["self_hp_after"] = _clamp(hps[side], -32768, 32767, 0)
+            self._pending[side]["opp_hp_after"] = _clamp(hps[1 - side], -32768, 32767, 0)
+        self._buffer.append(self._pending)
+        self._pending = None
+
+    def end_match(self, result: int, turns: int) -> None:
+        """Write the match's records, then its index entry. Does nothing if no match is open."""
+        if self._match is None:
+            return
+        records = np.concatenate(self._buffer) if self._buffer else np.zeros(0, dtype=RECORD_DTYPE)
+        self._records.write(records.tobytes())
+        self._records.flush()
+        self._meta.write(json.dumps(self._match) + "\n")
+        self._meta.flush()
+
+        entry = np.zeros(1, dtype=INDEX_DTYPE)
+        entry["match"] = self._match["match"]
+        entry["first"] = self._written
+        entry["count"] = len(records)
+        entry["turns"] = min(turns, 65535)
+        entry["result"] = result
+        self._index.write(entry.tobytes())
+        self._index.flush()
+
+        self._written += len(records)
+        self._next_match += 1
+        self._match = None
+        self._buffer = []
+
+    def close(self) -> None:
+        """Close the files. A match still in progress is not written."""
+        self._match = None
+        self._records.close()
+        self._index.close()
+        self._meta.close()
+
+    def __enter__(self) -> "DecisionRecorder":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class DecisionReader:
+    """Random access to a decision record file without loading it.
+
+    Both binary files are mapped with ``np.memmap``; ``records`` decodes one record at a time and
+    ``array`` returns zero-copy NumPy views for bulk processing.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            _check_header(f, _RECORD_MAGIC, RECORD_SIZE, path)
+        with open(path + ".idx", "rb") as f:
+            _check_header(f, _INDEX_MAGIC, INDEX_SIZE, path + ".idx")
+
+        self._index = self._map(path + ".idx", INDEX_DTYPE)
+        self._records = self._map(path, RECORD_DTYPE)
+        self._by_match = {int(entry["match"]): i for i, entry in enumerate(self._index)}
+
+        meta_path = path + ".meta.jsonl"
+        self._meta: Dict[int, dict] = {}
+        if os.path.exists(meta_path):
+            with open(meta_path) as f:
+                for line in f:
+                    if line.strip():
+                        meta = json.loads(line)
+                        self._meta[meta["match"]] = meta
+
+    @staticmethod
+    def _map(path: str, dtype: np.dtype) -> np.ndarray:
+        count = (os.path.getsize(path) - _HEADER.size) // dtype.itemsize
+        if count <= 0:
+            return np.zeros(0, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode="r", offset=_HEADER.size, shape=(count,))
+
+    def __len__(self) -> int:
+        """Number of records belonging to finished matches."""
+        if not len(self._index):
+            return 0
+        last = self._index[-1]
+        return int(last["first"]) + int(last["count"])
+
+    @property
+    def index(self) -> np.ndarray:
+        """The match index as a structured array of ``INDEX_DTYPE``."""
+        return self._index
+
+    def matches(self) -> List[dict]:
+        """One dict per recorded match: id, bots, turns, result and record range."""
+        return [self.match_info(int(entry["match"])) for entry in self._index]
+
+    def match_info(self, match: int) -> dict:
+        entry = self._index[self._by_match[match]]
+        info = {
+            "match": match,
+            "first": int(entry["first"]),
+            "count": int(entry["count"]),
+            "turns": int(entry["turns"]),
+            "result": int(entry["result"]),
+        }
+        info.update({k: v for k, v in self._meta.get(match, {}).items() if k != "match"})
+        return info
+
+    def array(self, match: Optional[int] = None) -> np.ndarray:
+        """Records as a memory-mapped ``RECORD_DTYPE`` array, for one match or all of them."""
+        if match is None:
+            return self._records[: len(self)]
+        entry = self._index[self._by_match[match]]
+        first = int(entry["first"])
+        return self._records[first : first + int(entry["count"])]
+
+    def records(self, match: Optional[int] = None) -> Iterator[dict]:
+        """Decode records one by one, with the match result added to each outcome."""
+        entries = self._index if match is None else [self._index[self._by_match[match]]]
+        for entry in entries:
+            result = int(entry["result"])
+            first = int(entry["first"])
+            for record in self._records[first : first + int(entry["count"])]:
+                decoded = decode_record(record)
+                decoded["outcome"]["result"] = _result_for_side(result, decoded["side"])
+                yield decoded
+
+    def find(self, match: int, turn: int, side: int = 0) -> Optional[dict]:
+        """The decision of ``side`` (0 or 1) in ``turn`` of ``match``, or None."""
+        records = self.array(match)
+        # Both bots decide every turn, so the record is usually at a fixed offset
+        guess = (turn - 1) * 2 + side
+        if 0 <= guess < len(records) and records[guess]["turn"] == turn and records[guess]["side"] == side:
+            candidates = [guess]
+        else:
+            candidates = np.nonzero((records["turn"] == turn) & (records["side"] == side))[0]
+        for i in candidates:
+            decoded = decode_record(records[i])
+            entry = self._index[self._by_match[match]]
+            decoded["outcome"]["result"] = _result_for_side(int(entry["result"]), side)
+            return decoded
+        return None
+
+
+def _result_for_side(result: int, side: int) -> str:
+    if result == RESULT_DRAW:
+        return "draw"
+    won = (result == RESULT_FIRST_WINS) == (side == 0)
+    return "win" if won else "loss"
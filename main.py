@@ -1,28 +1,103 @@
 import argparse
 import importlib
 import inspect
+import json
 import os
 import random
 from typing import Optional
 
 from bots.bot_interface import BotInterface
-from simulator.match import run_match
+from game.logger import LOG_LEVELS
+from game.recorder import DecisionRecorder
+from game.rules import BOARD_SIZE
+from simulator import analytics, bench, latency, render, replay, swiss
+from simulator.league import play_league
+from simulator.loader import BotSpec
+from simulator.cache import DEFAULT_CACHE_PATH, ResultCache
+from simulator.checkpoint import load_checkpoint, restore_rng_state, rng_state, save_checkpoint
+from simulator.match import derive_seed, run_match, run_seeded_match
+from simulator.match_log import MatchLogReader, MatchLogWriter
+from simulator.sandbox import SandboxedBot
+from simulator.sequential import DEFAULT_CONFIDENCE, DEFAULT_MARGIN, play_until_confident
 from simulator.visualizer import Visualizer
 
+# Upper bound on matches for --until-confident when --count is not given
+DEFAULT_MAX_CONFIDENT_MATCHES = 1000
 
-def run_tournament(headless: bool = False):
+# Where the single-elimination tournament saves its progress for --resume
+DEFAULT_TOURNAMENT_CHECKPOINT = ".cache/tournament_checkpoint.json"
+
+# Pre-scaled sprites for 'render --atlas'
+DEFAULT_SPRITE_ATLAS = ".cache/sprite_atlas.bin"
+
+
+def run_tournament(
+    headless: bool = False,
+    sandbox: bool = False,
+    seed: Optional[int] = None,
+    cache: Optional[str] = None,
+    checkpoint: Optional[str] = DEFAULT_TOURNAMENT_CHECKPOINT,
+    resume: bool = False,
+):
     """Run a tournament with all bots from the bots folder.
     Returns the winner bot instance and tournament statistics.
 
     Args:
         headless (bool): If True, run without visualization
+        sandbox (bool): If True, run every bot in its own resource-limited worker process
+        seed (int): Base seed for pairings and matches, making the tournament reproducible
+        cache (str): Path of a match result cache to consult before playing (needs ``seed``)
+        checkpoint (str): File the tournament state is saved to after every match (None: no checkpoints)
+        resume (bool): Continue the tournament saved in ``checkpoint`` instead of starting a new one;
+            without it an unfinished tournament in ``checkpoint`` is refused rather than overwritten
     """
+    if checkpoint and not resume:
+        saved = load_checkpoint(checkpoint)
+        if saved and not saved.get("finished"):
+            raise ValueError(
+                f"{checkpoint} holds an unfinished tournament; pass --resume to continue it or delete the file"
+                " to start a new one"
+            )
+
     # Step 1: Find and load all bots
     bots = discover_bots()
     print(f"Found {len(bots)} bots for the tournament")
     for bot in bots:
         print(f"- {bot.name}")
 
+    result_cache = open_cache(cache, seed)
+    try:
+        if sandbox:
+            bots = sandbox_bots(bots)
+            try:
+                return _run_tournament_rounds(bots, headless, seed, result_cache, checkpoint, resume)
+            finally:
+                for bot in bots:
+                    bot.close()
+
+        return _run_tournament_rounds(bots, headless, seed, result_cache, checkpoint, resume)
+    finally:
+        if result_cache:
+            report_cache(result_cache)
+            result_cache.close()
+
+
+def _run_tournament_rounds(
+    bots: list[BotInterface],
+    headless: bool,
+    seed: Optional[int] = None,
+    cache: Optional[ResultCache] = None,
+    checkpoint: Optional[str] = None,
+    resume: bool = False,
+):
+    """Play single-elimination rounds until one bot is left.
+
+    With a ``checkpoint`` path the tournament state is saved after every match
+    (before it is shown), and ``resume`` continues from that file: finished
+    matches are taken from it instead of being played again.
+    """
+    by_name = {bot.name: bot for bot in bots}
+
     # Step 2: Run tournament rounds until we have a winner
     round_num = 1
     stats = {"matches": [], "rounds": []}
@@ -30,53 +105,116 @@ def run_tournament(headless: bool = False):
     # Keep track of losers and their total turns fought
     losers_stats = {}  # {bot_name: total_turns_fought}
 
+    # Pairings get their own RNG so that cached (unplayed) matches don't change the draw
+    pairing_rng = random.Random(derive_seed(seed, "pairings")) if seed is not None else random
+
+    # Round in progress when the checkpoint was taken
+    saved = load_checkpoint(checkpoint) if checkpoint and resume else None
+    if saved and saved.get("finished"):
+        print(f"Tournament in {checkpoint} is already finished; winner: {saved['winner']}")
+        return by_name.get(saved["winner"]), saved["stats"]
+    if saved:
+        missing = [name for name in saved["participants"] if name not in by_name]
+        if missing:
+            raise ValueError(f"Cannot resume {checkpoint}: bots {missing} are no longer available")
+        if saved["seed"] != seed:
+            raise ValueError(f"Cannot resume {checkpoint}: it was started with seed {saved['seed']}, not {seed}")
+        round_num = saved["round"]
+        stats = saved["stats"]
+        losers_stats = saved["losers_stats"]
+        bots = [by_name[name] for name in saved["participants"]]
+        restore_rng_state(saved["pairing_rng"], pairing_rng)
+        restore_rng_state(saved["random"])
+        print(f"Resuming tournament from {checkpoint} in round {round_num}")
+
     while len(bots) > 1:
         print(f"\n=== Round {round_num} ===")
         print(f"{len(bots)} bots competing in this round")
 
-        # Create pairs for this round
-        pairs, lucky_loser = create_pairs(bots, losers_stats)
-
-        # Store round information
-        round_info = {
-            "round": round_num,
-            "participants": [bot.name for bot in bots],
-            "pairs": [
-                (b1.name, b2.name) if b2 else (b1.name, lucky_loser.name if lucky_loser else None) for b1, b2 in pairs
-            ],
-            "lucky_loser": lucky_loser.name if lucky_loser else None,
-        }
-        stats["rounds"].append(round_info)
+        if saved:
+            pairs = [(by_name[b1], by_name[b2] if b2 else None) for b1, b2 in saved["pairs"]]
+            lucky_loser = by_name[saved["lucky_loser"]] if saved["lucky_loser"] else None
+            winners = [by_name[name] for name in saved["winners"]]
+            played = saved["played"]
+            done_pairs = saved["done_pairs"]
+            saved = None
+        else:
+            # Create pairs for this round
+            pairs, lucky_loser = create_pairs(bots, losers_stats, pairing_rng)
+            winners = []
+            played = []  # [[winner name or "Draw", turns], ...] of every match played, per pair
+            done_pairs = 0
+
+            # Store round information
+            round_info = {
+                "round": round_num,
+                "participants": [bot.name for bot in bots],
+                "pairs": [
+                    (b1.name, b2.name) if b2 else (b1.name, lucky_loser.name if lucky_loser else None)
+                    for b1, b2 in pairs
+                ],
+                "lucky_loser": lucky_loser.name if lucky_loser else None,
+            }
+            stats["rounds"].append(round_info)
+
+        def save_progress():
+            if not checkpoint:
+                return
+            save_checkpoint(checkpoint, {
+                "seed": seed,
+                "round": round_num,
+                "participants": [bot.name for bot in bots],
+                "pairs": [(b1.name, b2.name if b2 else None) for b1, b2 in pairs],
+                "lucky_loser": lucky_loser.name if lucky_loser else None,
+                "winners": [bot.name for bot in winners],
+                "played": played,
+                "done_pairs": done_pairs,
+                "losers_stats": losers_stats,
+                "stats": stats,
+                "pairing_rng": rng_state(pairing_rng),
+                "random": rng_state(),
+            })
+
+        save_progress()
+
+        def play(pair_index, b1, b2, attempt):
+            """Result of one match of a pair, from the checkpoint if it was already played."""
+            while len(played) <= pair_index:
+                played.append([])
+            if attempt < len(played[pair_index]):
+                winner_name, turns = played[pair_index][attempt]
+                return by_name.get(winner_name, winner_name), turns
+
+            match_seed = None if seed is None else derive_seed(seed, round_num, b1.name, b2.name, attempt)
+            winner, turns, logger = run_seeded_match(b1, b2, match_seed, cache)
+            played[pair_index].append([winner.name if winner != "Draw" else "Draw", turns])
+            save_progress()
+
+            # A cached result has no log to show
+            if not headless and logger is not None:
+                visualizer = Visualizer(logger, b1, b2)
+                visualizer.run(logger.get_snapshots(), len(bots) > 2)
+            return winner, turns
 
         # Run matches and collect winners
-        winners = []
-        for b1, b2 in pairs:
+        for pair_index, (b1, b2) in enumerate(pairs):
+            if pair_index < done_pairs:
+                continue
             if b2 is None:  # Odd number of bots, b1 gets a bye
                 winners.append(b1)
                 print(f"{b1.name} gets a bye")
+                done_pairs = pair_index + 1
+                save_progress()
                 continue
 
             print(f"Match: {b1.name} vs {b2.name}")
-            winner, logger = run_match(b1, b2)
-
-            turns_fought = logger.get_snapshots()[-1]["turn"]  # Get the last turn number
-            snapshots = logger.get_snapshots()
-
-            if not headless:
-                visualizer = Visualizer(logger, b1, b2)
-                visualizer.run(snapshots, len(bots) > 2)
+            winner, turns_fought = play(pair_index, b1, b2, 0)
 
             draw_counter = 0
             while winner == "Draw":
                 draw_counter += 1
                 print("Match ended in a draw")
-                winner, logger = run_match(b1, b2)
-
-                snapshots = logger.get_snapshots()
-
-                if not headless:
-                    visualizer = Visualizer(logger, b1, b2)
-                    visualizer.run(snapshots, len(bots) > 2)
+                winner, _ = play(pair_index, b1, b2, draw_counter)
 
                 if draw_counter > 2:
                     break
@@ -92,7 +230,7 @@ def run_tournament(headless: bool = False):
                     "round": round_num,
                     "bot1": b1.name,
                     "bot2": b2.name,
-                    "winner": winner,
+                    "winner": winner.name,
                     "turns": turns_fought,
                 }
                 stats["matches"].append(match_info)
@@ -111,6 +249,8 @@ def run_tournament(headless: bool = False):
                     "turns": turns_fought,
                 }
             stats["matches"].append(match_info)
+            done_pairs = pair_index + 1
+            save_progress()
 
         # Update bots for next round
         bots = winners
@@ -120,6 +260,9 @@ def run_tournament(headless: bool = False):
     winner = bots[0]
     print(f"\n🏆 Tournament Winner: {winner.name} 🏆")
 
+    if checkpoint:
+        save_checkpoint(checkpoint, {"seed": seed, "finished": True, "winner": winner.name, "stats": stats})
+
     return winner, stats
 
 
@@ -163,6 +306,39 @@ def discover_bots() -> list[BotInterface]:
     return bots
 
 
+def sandbox_bots(bots: list[BotInterface]) -> list[BotInterface]:
+    """Move each bot into a long-lived sandboxed worker process.
+
+    Bots whose worker cannot be started are dropped with a message, like bots that
+    fail to import in discover_bots.
+    """
+    sandboxed = []
+    for bot in bots:
+        try:
+            sandboxed.append(SandboxedBot.wrap(bot))
+        except RuntimeError as e:
+            print(f"Error sandboxing bot {bot.name}: {e}")
+    return sandboxed
+
+
+def open_cache(path: Optional[str], seed: Optional[int]) -> Optional[ResultCache]:
+    """Open the match result cache at ``path``, if requested.
+
+    Only seeded matches are reproducible, so the cache is ignored without a seed.
+    """
+    if not path:
+        return None
+    if seed is None:
+        print("--cache needs --seed; matches will not be cached")
+        return None
+    return ResultCache(path)
+
+
+def report_cache(cache: ResultCache):
+    """Print how many matches the cache saved."""
+    print(f"Result cache {cache.path}: {cache.hits} cached, {cache.misses} simulated")
+
+
 def find_bot_by_name(name: str) -> Optional[BotInterface]:
     """Find and instantiate a bot by its name.
     Returns None if no bot with the given name is found.
@@ -184,13 +360,13 @@ def list_available_bots():
 
 
 def create_pairs(
-    bots: list[BotInterface], losers_stats: dict[str, int]
+    bots: list[BotInterface], losers_stats: dict[str, int], rng=random
 ) -> tuple[list[tuple[BotInterface, Optional[BotInterface]]], Optional[BotInterface]]:
     """Create pairs of bots for matches.
     Returns a list of pairs and the lucky loser bot (if needed).
     """
     # Make a copy and shuffle to create random pairs
-    random.shuffle(bots)
+    rng.shuffle(bots)
     pairs = []
     lucky_loser = None
 
@@ -201,7 +377,7 @@ def create_pairs(
         candidates = [name for name, turns in losers_stats.items() if turns == max_turns]
 
         # Randomly select one if multiple candidates
-        lucky_loser_name = random.choice(candidates)
+        lucky_loser_name = rng.choice(candidates)
 
         # Find the bot instance with this name
         for bot in bots:
@@ -223,6 +399,148 @@ def create_pairs(
     return pairs, lucky_loser
 
 
+def discover_specs() -> dict[str, BotSpec]:
+    """Specs of all discovered bots by name, for playing them in worker processes."""
+    specs = {}
+    for bot in discover_bots():
+        if bot.name in specs:
+            print(f"Skipping duplicate bot name: {bot.name}")
+            continue
+        specs[bot.name] = BotSpec.of(bot)
+    return specs
+
+
+def run_swiss(
+    rounds: Optional[int] = None,
+    best_of: int = swiss.DEFAULT_BEST_OF,
+    workers: Optional[int] = None,
+    max_turns: int = 100,
+    seed: Optional[int] = None,
+    cache: Optional[str] = None,
+):
+    """Run a Swiss-system tournament with all bots and print the standings.
+
+    Args:
+        rounds (int): Number of rounds (default: log2 of the number of bots, rounded up)
+        best_of (int): Games per pairing, with sides alternating
+        workers (int): Number of worker processes (default: one per CPU)
+        max_turns (int): Turn limit per game
+        seed (int): Base seed so that the same tournament can be replayed exactly
+        cache (str): Path of a match result cache to consult before playing (needs ``seed``)
+    """
+    specs = discover_specs()
+    if len(specs) < 2:
+        print("A tournament needs at least two bots")
+        return None
+
+    rounds = swiss.default_rounds(len(specs)) if rounds is None else rounds
+    print(f"Swiss tournament: {len(specs)} bots, {rounds} rounds, best of {best_of}")
+
+    current_round = 0
+
+    def report(pairing, table):
+        nonlocal current_round
+        if pairing.round != current_round:
+            current_round = pairing.round
+            print(f"\n=== Round {current_round} ===")
+        if pairing.bot2 is None:
+            print(f"{pairing.bot1} gets a bye")
+            return
+        points = pairing.points
+        outcome = pairing.bot1 if points == 1.0 else pairing.bot2 if points == 0.0 else "Tied"
+        games = sum(pairing.scores)
+        print(f"{pairing.bot1} vs {pairing.bot2}: {outcome} ({games:g}-{len(pairing.scores) - games:g})")
+
+    result_cache = open_cache(cache, seed)
+    try:
+        table = swiss.play_swiss(
+            specs, rounds=rounds, best_of=best_of, workers=workers, max_turns=max_turns, seed=seed,
+            on_pairing=report, cache=result_cache,
+        )
+    finally:
+        if result_cache:
+            report_cache(result_cache)
+            result_cache.close()
+
+    print("\n" + "=" * 64)
+    print(f"{'#':>3}  {'Bot':<28} {'Score':>6} {'Buchholz':>9} {'Games':>6} {'Won %':>6}")
+    print("=" * 64)
+    for rank, row in enumerate(table.standings(), start=1):
+        print(
+            f"{rank:>3}  {row['name']:<28} {row['score']:>6g} {row['buchholz']:>9g} "
+            f"{row['games']:>6} {row['game_share'] * 100:>5.0f}%"
+        )
+
+    return table
+
+
+def run_league(
+    double: bool = False,
+    workers: Optional[int] = None,
+    results: Optional[str] = None,
+    max_turns: int = 100,
+    seed: Optional[int] = None,
+    cache: Optional[str] = None,
+):
+    """Run a round-robin league with all bots and print Elo/Glicko standings.
+
+    Args:
+        double (bool): Play every pairing twice, with sides swapped
+        workers (int): Number of worker processes (default: one per CPU)
+        results (str): JSONL file to append results to; an existing file resumes the league
+        max_turns (int): Turn limit per game
+        seed (int): Base seed so that the same league can be replayed exactly
+        cache (str): Path of a match result cache to consult before playing (needs ``seed``)
+    """
+    specs = discover_specs()
+    if len(specs) < 2:
+        print("A league needs at least two bots")
+        return None
+
+    pairings = len(specs) * (len(specs) - 1) // 2 * (2 if double else 1)
+    print(f"League: {len(specs)} bots, {pairings} games")
+
+    played = 0
+
+    def report(result, table):
+        nonlocal played
+        played += 1
+        if result["score"] == 1.0:
+            outcome = f"{result['bot1']} wins"
+        elif result["score"] == 0.0:
+            outcome = f"{result['bot2']} wins"
+        else:
+            outcome = "Draw"
+        print(f"[{played}] {result['bot1']} vs {result['bot2']}: {outcome} after {result['turns']} turns")
+
+    result_cache = open_cache(cache, seed)
+    try:
+        table = play_league(
+            specs, double=double, workers=workers, results_path=results, max_turns=max_turns, seed=seed,
+            on_result=report, cache=result_cache,
+        )
+    finally:
+        if result_cache:
+            report_cache(result_cache)
+            result_cache.close()
+
+    resumed = len(table.results) - played
+    if resumed:
+        print(f"Resumed {resumed} games from {results}")
+
+    print("\n" + "=" * 72)
+    print(f"{'#':>3}  {'Bot':<28} {'Glicko':>12} {'Elo':>7} {'W':>4} {'D':>4} {'L':>4}")
+    print("=" * 72)
+    for rank, row in enumerate(table.standings(), start=1):
+        glicko = f"{row['glicko']:.0f}±{row['rd']:.0f}"
+        print(
+            f"{rank:>3}  {row['name']:<28} {glicko:>12} {row['elo']:>7.0f} "
+            f"{row['wins']:>4} {row['draws']:>4} {row['losses']:>4}"
+        )
+
+    return table
+
+
 def run_single_match(
     bot1_name: str,
     bot2_name: str,
@@ -230,6 +548,14 @@ def run_single_match(
     headless: bool = False,
     count: int = 1,
     graph: bool = False,
+    sandbox: bool = False,
+    until_confident: Optional[float] = None,
+    margin: float = DEFAULT_MARGIN,
+    workers: Optional[int] = None,
+    seed: Optional[int] = None,
+    cache: Optional[str] = None,
+    record: Optional[str] = None,
+    stream: Optional[str] = None,
 ):
     """Run matches between two bots with the given names.
 
@@ -240,6 +566,16 @@ def run_single_match(
         headless (bool): Whether to run without visualization
         count (int): Number of matches to run
         graph (bool): Whether to display a graph of wins/losses over time
+        sandbox (bool): Whether to run both bots in resource-limited worker processes
+        until_confident (float): If set, play parallel batches until an SPRT reaches this
+            confidence, with ``count`` as the maximum number of matches
+        margin (float): Score difference from 50% the SPRT should detect
+        workers (int): Worker processes (and batch size) for ``until_confident``
+        seed (int): Base seed; match N of the series is always played with the same seed
+        cache (str): Path of a match result cache to consult before playing (needs ``seed``)
+        record (str): Path of a binary decision record file to append every played match to
+        stream (str): Path of a match log file to stream every played match's log to instead of
+            keeping it in memory
     """
     bot1 = find_bot_by_name(bot1_name)
     bot2 = find_bot_by_name(bot2_name)
@@ -256,6 +592,67 @@ def run_single_match(
         print("Count must be a positive integer")
         return
 
+    if until_confident is not None:
+        # Games are played from bot specs in a worker pool, not by these bot instances
+        unsupported = [option for option, value in (("--sandbox", sandbox), ("--record", record), ("--stream", stream))
+                       if value]
+        if unsupported:
+            print(f"--until-confident cannot be combined with {', '.join(unsupported)}")
+            return
+        result_cache = open_cache(cache, seed)
+        try:
+            _play_until_confident(bot1, bot2, count, until_confident, margin, workers, seed, result_cache)
+        finally:
+            if result_cache:
+                report_cache(result_cache)
+                result_cache.close()
+        return
+
+    result_cache = open_cache(cache, seed)
+    recorder = DecisionRecorder(record) if record else None
+    writer = MatchLogWriter(stream) if stream else None
+    try:
+        if sandbox:
+            bot1, bot2 = (SandboxedBot.wrap(bot1), SandboxedBot.wrap(bot2))
+            try:
+                _play_match_series(bot1, bot2, verbose, headless, count, graph, seed, result_cache, recorder, writer)
+            finally:
+                bot1.close()
+                bot2.close()
+            return
+
+        _play_match_series(bot1, bot2, verbose, headless, count, graph, seed, result_cache, recorder, writer)
+    finally:
+        if writer:
+            print(f"Match logs: {writer.matches_written} matches in {stream}")
+            writer.close()
+        if result_cache:
+            report_cache(result_cache)
+            result_cache.close()
+        if recorder:
+            print(f"Decision records: {recorder.matches_recorded} matches in {record}")
+            recorder.close()
+
+
+def _play_match_series(
+    bot1: BotInterface,
+    bot2: BotInterface,
+    verbose: bool,
+    headless: bool,
+    count: int,
+    graph: bool,
+    seed: Optional[int] = None,
+    cache: Optional[ResultCache] = None,
+    recorder: Optional[DecisionRecorder] = None,
+    stream: Optional[MatchLogWriter] = None,
+):
+    """Play ``count`` matches between two bot instances and print the summary.
+
+    Matches found in ``cache`` are not replayed, so they are neither shown nor
+    reported to the bots' ``game_over`` hooks. With a ``stream`` the match logs
+    are written to disk as they are played and only the match that is shown is
+    read back into memory.
+    """
     # Stats for multiple matches
     stats = {"bot1_wins": 0, "bot2_wins": 0, "draws": 0, "total_turns": 0}
     match_results = []  # Track results for each match: 'bot1', 'bot2', or 'draw'
@@ -266,40 +663,45 @@ def run_single_match(
         else:
             print(f"Match: {bot1.name} vs {bot2.name}")
 
-        winner, logger = run_match(bot1, bot2, verbose=verbose)
-
-        turns_fought = logger.get_snapshots()[-1]["turn"]  # Get the last turn number
+        match_seed = None if seed is None else derive_seed(seed, bot1.name, bot2.name, match_num)
+        winner, turns_fought, logger = run_seeded_match(
+            bot1, bot2, match_seed, cache, verbose=verbose, recorder=recorder, stream=stream
+        )
+        played = logger is not None
         stats["total_turns"] += turns_fought
 
         if winner == bot1:
             stats["bot1_wins"] += 1
             match_results.append('bot1')
-            if hasattr(bot1, 'game_over'):
+            if played and hasattr(bot1, 'game_over'):
                 bot1.game_over(True)
-            if hasattr(bot2, 'game_over'):
+            if played and hasattr(bot2, 'game_over'):
                 bot2.game_over(False)
         elif winner == bot2:
             stats["bot2_wins"] += 1
             match_results.append('bot2')
-            if hasattr(bot1, 'game_over'):
+            if played and hasattr(bot1, 'game_over'):
                 bot1.game_over(False)
-            if hasattr(bot2, 'game_over'):
+            if played and hasattr(bot2, 'game_over'):
                 bot2.game_over(True)
         else:
             stats["draws"] += 1
             match_results.append('draw')
-            if hasattr(bot1, 'game_over'):
+            if played and hasattr(bot1, 'game_over'):
                 bot1.game_over(False)
-            if hasattr(bot2, 'game_over'):
+            if played and hasattr(bot2, 'game_over'):
                 bot2.game_over(False)
 
         # Only visualize if not headless and (single match or last match in a series)
-        if not headless and (count == 1 or (match_num == count and count <= 5)):
+        if played and not headless and (count == 1 or (match_num == count and count <= 5)):
+            if stream is not None:
+                logger = MatchLogReader(stream.path).load(stream.matches_written - 1)
             snapshots = logger.get_snapshots()
             visualizer = Visualizer(logger, bot1, bot2)
             visualizer.run(snapshots, False)
 
-        print(f"Winner: {winner.name if winner != 'Draw' else 'Draw'} after {turns_fought} turns")
+        cached_note = "" if played else " (cached)"
+        print(f"Winner: {winner.name if winner != 'Draw' else 'Draw'} after {turns_fought} turns{cached_note}")
 
     # Print stats summary for multiple matches
     if count > 1:
@@ -321,6 +723,59 @@ def run_single_match(
             display_match_graph(match_results, bot1.name, bot2.name)
 
 
+def _play_until_confident(
+    bot1: BotInterface,
+    bot2: BotInterface,
+    max_games: int,
+    confidence: float,
+    margin: float,
+    workers: Optional[int],
+    seed: Optional[int] = None,
+    cache: Optional[ResultCache] = None,
+):
+    """Play parallel batches of matches until an SPRT picks the stronger bot, then print the summary."""
+    print(f"Playing {bot1.name} vs {bot2.name} until {confidence:.0%} confident (at most {max_games} matches)")
+
+    def report(sprt):
+        print(f"  {sprt.games} matches, log-likelihood ratio {sprt.llr:+.2f} "
+              f"(bounds {sprt.lower:.2f} / {sprt.upper:.2f})")
+
+    result = play_until_confident(
+        BotSpec.of(bot1), BotSpec.of(bot2), max_games, confidence=confidence, margin=margin, workers=workers,
+        on_batch=report, seed=seed, cache=cache,
+    )
+
+    for error in result.errors:
+        print(f"Match failed: {error}")
+    played = len(result.scores)
+    if not played:
+        print(f"\nAll {len(result.errors)} matches failed; no result")
+        return
+    bot1_wins = sum(1 for score in result.scores if score == 1.0)
+    bot2_wins = sum(1 for score in result.scores if score == 0.0)
+    draws = played - bot1_wins - bot2_wins
+
+    print("\n" + "=" * 50)
+    print(f"MATCH RESULTS: {bot1.name} vs {bot2.name} ({played} matches)")
+    print("=" * 50)
+    print(f"{bot1.name}: {bot1_wins} wins ({bot1_wins / played * 100:.1f}%)")
+    print(f"{bot2.name}: {bot2_wins} wins ({bot2_wins / played * 100:.1f}%)")
+    print(f"Draws: {draws} ({draws / played * 100:.1f}%)")
+    print(f"Average match length: {sum(result.turns) / played:.1f} turns")
+    if result.errors:
+        print(f"Failed matches (not counted): {len(result.errors)}")
+
+    if result.decision:
+        stronger = bot1 if result.decision == "bot1" else bot2
+        print(f"{stronger.name} is stronger with {confidence:.0%} confidence")
+        print(f"Stopped early: saved {result.games_saved} of {max_games} matches")
+    else:
+        print(f"No confident decision after {played} matches; the bots are within the "
+              f"{margin:.0%} margin or more matches are needed")
+
+    return result
+
+
 def display_match_graph(match_results: list[str], bot1_name: str, bot2_name: str):
     """Display a text-based graph showing wins/losses over the course of matches.
 
@@ -456,6 +911,317 @@ def display_match_graph(match_results: list[str], bot1_name: str, bot2_name: str
     print()
 
 
+def add_cache_arguments(parser: argparse.ArgumentParser):
+    """Add the --seed and --cache options shared by the match-playing commands."""
+    parser.add_argument("--seed", type=int, default=None, help="Base seed for reproducible matches")
+    parser.add_argument(
+        "--cache", nargs="?", const=DEFAULT_CACHE_PATH, default=None, metavar="PATH",
+        help=f"Reuse results of identical seeded matches (default {DEFAULT_CACHE_PATH})",
+    )
+
+
+def run_benchmarks(
+    scenarios: Optional[list[str]] = None,
+    log_levels: Optional[list[str]] = None,
+    board_sizes: Optional[list[int]] = None,
+    matches: int = bench.DEFAULT_MATCHES,
+    repeat: int = bench.DEFAULT_REPEAT,
+    output: Optional[str] = None,
+    baseline: Optional[str] = None,
+    tolerance: float = bench.DEFAULT_TOLERANCE,
+):
+    """Measure engine throughput on canned stub-bot scenarios.
+
+    Args:
+        scenarios (list[str]): Scenarios to run (default: all)
+        log_levels (list[str]): GameLogger levels to run each scenario at (default: all)
+        board_sizes (list[int]): Board sizes to run each scenario on
+        matches (int): Matches per scenario, level and board size
+        repeat (int): Times each batch of matches is timed; the fastest run counts
+        output (str): Write the JSON report to this file
+        baseline (str): Compare against a previously saved JSON report
+        tolerance (float): Relative turns/second drop that counts as a regression
+
+    Returns the report and, with a baseline, the comparison rows.
+    """
+    print(f"{'Scenario':<12} {'Level':<8} {'Board':>5} {'Turns':>7} {'Turns/s':>10} {'Matches/s':>10}")
+
+    def report_row(row):
+        print(
+            f"{row['scenario']:<12} {row['log_level']:<8} {row['board_size']:>5} {row['turns']:>7} "
+            f"{row['turns_per_second']:>10.0f} {row['matches_per_second']:>10.1f}"
+        )
+
+    report = bench.run_bench(
+        scenarios, log_levels, board_sizes or [BOARD_SIZE], matches=matches, repeat=repeat, on_result=report_row
+    )
+
+    if output:
+        bench.save_report(report, output)
+        print(f"Saved benchmark report to {output}")
+
+    comparison = None
+    if baseline:
+        comparison = bench.compare(report, bench.load_report(baseline), tolerance)
+        print(f"\nComparison with {baseline} (turns/s):")
+        for row in comparison:
+            flag = "  REGRESSION" if row["regression"] else ""
+            print(
+                f"{row['scenario']:<12} {row['log_level']:<8} {row['board_size']:>5} "
+                f"{row['baseline']:>10.0f} -> {row['current']:>10.0f} ({row['change']:+.1%}){flag}"
+            )
+
+    return report, comparison
+
+
+def run_latency(
+    bot_names: Optional[list[str]] = None,
+    corpus_path: Optional[str] = None,
+    record_matches: int = latency.DEFAULT_CORPUS_MATCHES,
+    seed: int = 0,
+    limit_ms: float = latency.DEFAULT_LIMIT_MS,
+    timeout: float = latency.DEFAULT_BOT_TIMEOUT,
+    output: Optional[str] = None,
+    record_with: Optional[list[str]] = None,
+):
+    """Measure each bot's decide latency on a corpus of recorded game states.
+
+    Args:
+        bot_names (list[str]): Bots to measure (default: all discovered bots)
+        corpus_path (str): Load the state corpus from this file, or record it there if missing
+        record_matches (int): Matches to play when recording a corpus
+        seed (int): Seed for recording the corpus
+        limit_ms (float): Decision time limit; slower bots are flagged
+        timeout (float): Seconds after which a bot's whole measurement is abandoned as stalled
+        output (str): Write the per-bot rows as JSON to this file
+        record_with (list[str]): Bots that play the corpus matches (default: the bots being measured)
+    """
+    bots = discover_bots()
+    specs = {}
+    for bot in bots:
+        specs.setdefault(bot.name, BotSpec.of(bot))
+
+    def select(names):
+        wanted = {name.lower() for name in names}
+        return {name: spec for name, spec in specs.items() if name.lower() in wanted}
+
+    measured = select(bot_names) if bot_names else specs
+    if not measured:
+        print("None of the requested bots were found. Use 'python main.py match list' to see available bots.")
+        return []
+
+    if corpus_path and os.path.exists(corpus_path):
+        corpus = latency.load_corpus(corpus_path)
+        print(f"Loaded {len(corpus)} states from {corpus_path}")
+    else:
+        recording = select(record_with) if record_with else measured
+        if not recording:
+            print("None of the bots to record with were found.")
+            return []
+        print(f"Recording a state corpus from {record_matches} matches between {', '.join(recording)}...")
+        corpus = latency.record_corpus(
+            list(recording.values()), record_matches, seed=seed,
+            on_problem=lambda name, message: print(f"  ! {name}: {message}"),
+        )
+        if not corpus:
+            print("No states were recorded")
+            return []
+        if corpus_path:
+            latency.save_corpus(corpus, corpus_path)
+            print(f"Saved {len(corpus)} states to {corpus_path}")
+        else:
+            print(f"Recorded {len(corpus)} states")
+
+    print(f"\n{'Bot':<36} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>9} {'alloc KB':>9} {'fail':>5}")
+
+    def report_row(row):
+        if "error" in row:
+            print(f"{row['name']:<36} {'':>8} {'':>8} {'':>8} {'':>9} {'':>9} {'':>5}  ! {row['error']}")
+            return
+        flag = "  ! " + "; ".join(row["flags"]) if row["flags"] else ""
+        print(
+            f"{row['name']:<36} {row['p50_ms']:>8.2f} {row['p95_ms']:>8.2f} {row['p99_ms']:>8.2f} "
+            f"{row['max_ms']:>9.2f} {row['mean_alloc_kb']:>9.1f} {row['failures'] + row['invalid_actions']:>5}{flag}"
+        )
+
+    rows = latency.run_latency_bench(measured, corpus, limit_ms=limit_ms, timeout=timeout, on_result=report_row)
+
+    flagged = [row["name"] for row in rows if row["flags"]]
+    print(f"\nLatencies in ms over {len(corpus)} states; {len(flagged)} of {len(rows)} bots flagged at {limit_ms:g}ms")
+
+    if output:
+        with open(output, "w") as f:
+            json.dump({"limit_ms": limit_ms, "states": len(corpus), "bots": rows}, f, indent=2)
+        print(f"Saved latency report to {output}")
+
+    return rows
+
+
+def view_streamed_match(path: str, match: Optional[int] = None):
+    """Show one match from a streamed match log file in the visualizer.
+
+    Args:
+        path (str): Match log written with ``match --stream``
+        match (int): Id of the match to show (default: the last one)
+    """
+    reader = MatchLogReader(path)
+    if not len(reader):
+        print(f"No finished matches in {path}")
+        return
+
+    entries = {entry["match"]: entry for entry in reader.matches()}
+    match = reader.matches()[-1]["match"] if match is None else match
+    if match not in entries:
+        print(f"Match {match} not found in {path} ({len(reader)} matches)")
+        return
+
+    entry = entries[match]
+    bot1, bot2 = find_bot_by_name(entry["bot1"]), find_bot_by_name(entry["bot2"])
+    if not bot1 or not bot2:
+        print(f"Bots '{entry['bot1']}' and '{entry['bot2']}' are needed to show this match")
+        return
+
+    print(f"Match {match}: {entry['bot1']} vs {entry['bot2']}, winner {entry['winner']} after {entry['turns']} turns")
+    logger = reader.load(match)
+    Visualizer(logger, bot1, bot2).run(logger.get_snapshots(), False)
+
+
+def replay_match(
+    path: str,
+    match: Optional[int] = None,
+    turn: int = 0,
+    speed: float = 1.0,
+    animate: bool = True,
+):
+    """Replay one match from a streamed match log, with seeking and variable speed.
+
+    Args:
+        path (str): Match log written with ``match --stream``
+        match (int): Id of the match to replay (default: the last one)
+        turn (int): Turn to start at
+        speed (float): Playback speed, from 0.25 to 16
+        animate (bool): Animate transitions between states (otherwise states are only shown)
+    """
+    reader = MatchLogReader(path)
+    if not len(reader):
+        print(f"No finished matches in {path}")
+        return
+
+    match = reader.matches()[-1]["match"] if match is None else match
+    try:
+        recorded = replay.Replay(reader, match)
+    except ValueError as e:
+        print(e)
+        return
+
+    # Bots that are no longer around are drawn with the default sprites
+    bot1 = find_bot_by_name(recorded.bot1) or render.Portrait(recorded.bot1)
+    bot2 = find_bot_by_name(recorded.bot2) or render.Portrait(recorded.bot2)
+    try:
+        player = replay.ReplayPlayer(recorded, bot1, bot2, speed=speed, animate=animate)
+    except ValueError as e:
+        print(e)
+        return
+
+    print(f"Match {match}: {recorded.bot1} vs {recorded.bot2}, winner {recorded.winner} after {recorded.turns} turns")
+    print("Keys: left/right turn, PgUp/PgDn 10 turns, Home/End, up/down speed, space pause, A animations, Q quit")
+    player.position = recorded.keyframe(turn)
+    player.play()
+
+
+def run_render(
+    path: str,
+    out_dir: str,
+    matches: Optional[list[int]] = None,
+    fmt: str = render.DEFAULT_FORMAT,
+    workers: Optional[int] = None,
+    atlas: Optional[str] = None,
+):
+    """Render matches from a streamed match log offscreen, in parallel.
+
+    Args:
+        path (str): Match log written with ``match --stream``
+        out_dir (str): Directory for the rendered files
+        matches (list[int]): Ids of the matches to render (default: all)
+        fmt (str): ``mp4``, ``gif`` or ``png`` (a directory of frames per match)
+        workers (int): Worker processes (default: one per CPU)
+        atlas (str): Sprite atlas file the workers start from; created if missing
+    """
+    portraits = {}
+    for bot in discover_bots():
+        portraits.setdefault(bot.name, render.Portrait.of(bot))
+
+    def report(row):
+        if "error" in row:
+            print(f"Match {row['match']}: failed, {row['error']}")
+        else:
+            print(f"Match {row['match']}: {row['frames']} frames in {row['seconds']:.1f}s -> {row['output']}")
+
+    try:
+        rows = render.render_match_log(
+            path, out_dir, matches, fmt=fmt, portraits=portraits, workers=workers, on_done=report, atlas=atlas
+        )
+    except (RuntimeError, ValueError) as e:
+        print(e)
+        return []
+    rendered = [row for row in rows if "error" not in row]
+    print(f"Rendered {len(rendered)} of {len(rows)} matches to {out_dir}")
+    return rows
+
+
+def run_analyze(
+    source: str,
+    export: Optional[str] = None,
+    table: Optional[str] = None,
+    where: Optional[list[str]] = None,
+    by: Optional[list[str]] = None,
+    agg: str = "count",
+):
+    """Aggregate match events from a streamed match log or a saved ``.npz`` export.
+
+    Args:
+        source (str): Match log written with ``match --stream``, or tables saved with ``--export``
+        export (str): Save the columnar tables to this ``.npz`` file
+        table (str): Table to query; without one, the row count of every table is printed
+        where (list[str]): ``column=value`` filters, all of which must match
+        by (list[str]): Columns to group by
+        agg (str): ``count``, or ``<sum|mean|min|max>:<column>``
+    """
+    if source.endswith(".npz"):
+        tables = analytics.load_tables(source)
+    else:
+        tables = analytics.export_match_log(source)
+    if export:
+        analytics.save_tables(tables, export)
+        print(f"Saved {len(tables)} tables to {export}")
+
+    if table is None:
+        for name, columns in tables.items():
+            print(f"{name:<12} {len(columns):>10} rows  ({', '.join(columns.columns)})")
+        return None
+
+    if table not in tables:
+        print(f"Unknown table '{table}', expected one of {', '.join(tables)}")
+        return None
+    selected = tables[table]
+
+    filters = {}
+    for condition in where or []:
+        column, _, value = condition.partition("=")
+        filters[column] = value if column in selected.categories else int(value)
+    selected = selected.where(**filters)
+
+    how, _, value = agg.partition(":")
+    rows = analytics.aggregate(selected, by or [], value or None, how)
+
+    header = list(by or []) + ["rows", how]
+    print("  ".join(f"{column:>12}" for column in header))
+    for row in rows:
+        cells = [row[column] for column in header]
+        print("  ".join(f"{cell:>12.3f}" if isinstance(cell, float) else f"{cell!s:>12}" for cell in cells))
+    return rows
+
+
 def parse_arguments():
     """Parse command line arguments for the application."""
     parser = argparse.ArgumentParser(description="Wizard Battle Tournament")
@@ -463,7 +1229,125 @@ def parse_arguments():
 
     # Tournament command
     tournament_parser = subparsers.add_parser("tournament", help="Run a full tournament with all bots")
-    tournament_parser.add_argument("--headless", action="store_true", help="Run without visualization")
+    tournament_parser.add_argument(
+        "--headless", action="store_true", help="Run without visualization (--swiss always runs headless)"
+    )
+    tournament_parser.add_argument(
+        "--sandbox", action="store_true", help="Run each bot in a resource-limited worker process"
+    )
+    tournament_parser.add_argument(
+        "--resume", action="store_true", help="Continue the tournament saved in the checkpoint file"
+    )
+    tournament_parser.add_argument(
+        "--checkpoint", default=DEFAULT_TOURNAMENT_CHECKPOINT,
+        help=f"Tournament progress file, saved after every match (default {DEFAULT_TOURNAMENT_CHECKPOINT})",
+    )
+    tournament_parser.add_argument(
+        "--swiss", action="store_true", help="Swiss system: pair bots on similar scores, play rounds in parallel"
+    )
+    tournament_parser.add_argument(
+        "--rounds", type=int, default=None, help="Swiss rounds (default: log2 of the number of bots)"
+    )
+    tournament_parser.add_argument(
+        "--best-of", type=int, default=swiss.DEFAULT_BEST_OF,
+        help=f"Swiss games per pairing (default {swiss.DEFAULT_BEST_OF})",
+    )
+    tournament_parser.add_argument("--workers", "-w", type=int, default=None, help="Worker processes for --swiss")
+    add_cache_arguments(tournament_parser)
+
+    # League command
+    league_parser = subparsers.add_parser("league", help="Run a round-robin league with Elo/Glicko ratings")
+    league_parser.add_argument("--double", action="store_true", help="Play every pairing twice with sides swapped")
+    league_parser.add_argument("--workers", "-w", type=int, default=None, help="Number of worker processes")
+    league_parser.add_argument(
+        "--results", "-r", default=None, help="JSONL results file; an existing file resumes the league"
+    )
+    league_parser.add_argument("--max-turns", type=int, default=100, help="Turn limit per game")
+    add_cache_arguments(league_parser)
+
+    # Bench command
+    bench_parser = subparsers.add_parser("bench", help="Measure engine throughput on canned scenarios")
+    bench_parser.add_argument(
+        "--scenarios", nargs="+", choices=list(bench.SCENARIOS), default=None, help="Scenarios to run (default: all)"
+    )
+    bench_parser.add_argument(
+        "--log-levels", nargs="+", choices=LOG_LEVELS, default=None, help="Logger levels to run (default: all)"
+    )
+    bench_parser.add_argument("--board-sizes", nargs="+", type=int, default=None, help="Board sizes to run")
+    bench_parser.add_argument(
+        "--matches", type=int, default=bench.DEFAULT_MATCHES, help="Matches per scenario, level and board size"
+    )
+    bench_parser.add_argument(
+        "--repeat", type=int, default=bench.DEFAULT_REPEAT, help="Timing runs per row; the fastest one counts"
+    )
+    bench_parser.add_argument("--output", "-o", default=None, help="Write the JSON report to this file")
+    bench_parser.add_argument("--baseline", "-b", default=None, help="Compare against a saved JSON report")
+    bench_parser.add_argument(
+        "--tolerance", type=float, default=bench.DEFAULT_TOLERANCE,
+        help="Relative turns/s drop reported as a regression (default 0.10)",
+    )
+
+    # Latency command
+    latency_parser = subparsers.add_parser("latency", help="Measure bot decision latency on recorded game states")
+    latency_parser.add_argument("bots", nargs="*", help="Bots to measure (default: all)")
+    latency_parser.add_argument(
+        "--corpus", default=None, help="State corpus file; recorded and saved there if it does not exist"
+    )
+    latency_parser.add_argument(
+        "--record-matches", type=int, default=latency.DEFAULT_CORPUS_MATCHES, help="Matches to record a corpus from"
+    )
+    latency_parser.add_argument("--seed", type=int, default=0, help="Seed for recording the corpus")
+    latency_parser.add_argument(
+        "--record-with", nargs="+", default=None, metavar="BOT",
+        help="Bots that play the corpus matches (default: the bots being measured)",
+    )
+    latency_parser.add_argument(
+        "--limit-ms", type=float, default=latency.DEFAULT_LIMIT_MS, help="Flag bots slower than this per decision"
+    )
+    latency_parser.add_argument(
+        "--timeout", type=float, default=latency.DEFAULT_BOT_TIMEOUT, help="Seconds before a bot counts as stalled"
+    )
+    latency_parser.add_argument("--output", "-o", default=None, help="Write the JSON report to this file")
+
+    analyze_parser = subparsers.add_parser("analyze", help="Aggregate spells, damage, moves, pickups and collisions")
+    analyze_parser.add_argument("source", help="Match log from 'match --stream', or a .npz export")
+    analyze_parser.add_argument("--export", "-o", default=None, help="Save the columnar tables to this .npz file")
+    analyze_parser.add_argument(
+        "--table", "-t", choices=list(analytics.SCHEMAS), default=None, help="Table to query (default: list tables)"
+    )
+    analyze_parser.add_argument("--where", nargs="+", default=None, metavar="COLUMN=VALUE", help="Row filters")
+    analyze_parser.add_argument("--by", nargs="+", default=None, metavar="COLUMN", help="Columns to group by")
+    analyze_parser.add_argument(
+        "--agg", default="count", help="count, or sum/mean/min/max with a column, e.g. mean:hit (default count)"
+    )
+
+    view_parser = subparsers.add_parser("view", help="Show a match from a file written with 'match --stream'")
+    view_parser.add_argument("path", help="Match log file")
+    view_parser.add_argument("match", nargs="?", type=int, default=None, help="Match id (default: the last match)")
+
+    replay_parser = subparsers.add_parser("replay", help="Replay a match from 'match --stream' with seeking")
+    replay_parser.add_argument("path", help="Match log file")
+    replay_parser.add_argument("match", nargs="?", type=int, default=None, help="Match id (default: the last match)")
+    replay_parser.add_argument("--turn", "-t", type=int, default=0, help="Turn to start at (default 0)")
+    replay_parser.add_argument(
+        "--speed", "-s", type=float, default=1.0,
+        help=f"Playback speed, {replay.MIN_SPEED:g} to {replay.MAX_SPEED:g} (default 1)",
+    )
+    replay_parser.add_argument("--no-animations", action="store_true", help="Show states without animating moves")
+
+    render_parser = subparsers.add_parser("render", help="Render matches from 'match --stream' to video offscreen")
+    render_parser.add_argument("path", help="Match log file")
+    render_parser.add_argument("matches", nargs="*", type=int, help="Match ids to render (default: all)")
+    render_parser.add_argument("--output", "-o", default="renders", help="Output directory (default renders)")
+    render_parser.add_argument(
+        "--format", "-f", choices=render.FORMATS, default=render.DEFAULT_FORMAT,
+        help="mp4 or gif (both need ffmpeg), or png frames (default mp4)",
+    )
+    render_parser.add_argument("--workers", "-w", type=int, default=None, help="Worker processes")
+    render_parser.add_argument(
+        "--atlas", nargs="?", const=DEFAULT_SPRITE_ATLAS, default=None, metavar="PATH",
+        help=f"Start workers from a pre-scaled sprite atlas, created if missing (default {DEFAULT_SPRITE_ATLAS})",
+    )
 
     # Match command
     match_parser = subparsers.add_parser("match", help="Run a single match between two bots or list available bots")
@@ -471,22 +1355,95 @@ def parse_arguments():
     match_parser.add_argument("bot2", nargs="?", help="Name of the second bot")
     match_parser.add_argument("--verbose", "-v", action="store_true", help="Show detailed match logs")
     match_parser.add_argument("--headless", action="store_true", help="Run without visualization")
-    match_parser.add_argument("--count", "-c", type=int, default=1, help="Number of matches to run")
+    match_parser.add_argument(
+        "--count", "-c", type=int, default=None,
+        help=f"Number of matches to run (maximum with --until-confident, default {DEFAULT_MAX_CONFIDENT_MATCHES})",
+    )
     match_parser.add_argument("--graph", "-g", action="store_true", help="Display a graph of wins/losses over matches")
-
-    return parser.parse_args()
+    match_parser.add_argument("--sandbox", action="store_true", help="Run both bots in resource-limited worker processes")
+    match_parser.add_argument(
+        "--until-confident", nargs="?", type=float, const=DEFAULT_CONFIDENCE, default=None, metavar="CONFIDENCE",
+        help=f"Play parallel batches until an SPRT is this confident which bot is stronger (default {DEFAULT_CONFIDENCE})",
+    )
+    match_parser.add_argument(
+        "--margin", type=float, default=DEFAULT_MARGIN, help="Score difference from 50%% the SPRT should detect"
+    )
+    match_parser.add_argument("--workers", "-w", type=int, default=None, help="Worker processes for --until-confident")
+    match_parser.add_argument(
+        "--record", default=None, metavar="PATH",
+        help="Append every decision of the played matches to this binary record file (cached matches are skipped)",
+    )
+    match_parser.add_argument(
+        "--stream", default=None, metavar="PATH",
+        help="Write match logs to this file as they are played instead of keeping them in memory (.gz to compress)",
+    )
+    add_cache_arguments(match_parser)
+
+    args = parser.parse_args()
+    if args.command == "tournament" and args.swiss:
+        # Swiss games are played from bot specs in a worker pool and keep no checkpoint
+        unsupported = [option for option in ("sandbox", "resume") if getattr(args, option)]
+        if unsupported:
+            tournament_parser.error(f"--swiss cannot be combined with {', '.join('--' + o for o in unsupported)}")
+    return args
 
 
 def main():
     """Main entry point for the Spellcasters game."""
     args = parse_arguments()
 
-    if args.command == "tournament" or args.command is None:
+    if args.command == "tournament" and args.swiss:
+        run_swiss(
+            rounds=args.rounds, best_of=args.best_of, workers=args.workers, seed=args.seed, cache=args.cache,
+        )
+
+    elif args.command == "tournament" or args.command is None:
         # Run the full tournament
         headless = getattr(args, "headless", False)
-        winner, stats = run_tournament(headless=headless)
+        sandbox = getattr(args, "sandbox", False)
+        seed = getattr(args, "seed", None)
+        cache = getattr(args, "cache", None)
+        checkpoint = getattr(args, "checkpoint", DEFAULT_TOURNAMENT_CHECKPOINT)
+        resume = getattr(args, "resume", False)
+        winner, stats = run_tournament(
+            headless=headless, sandbox=sandbox, seed=seed, cache=cache, checkpoint=checkpoint, resume=resume
+        )
         print(f"Tournament completed with {len(stats['matches'])} matches across {len(stats['rounds'])} rounds")
 
+    elif args.command == "league":
+        run_league(
+            double=args.double, workers=args.workers, results=args.results, max_turns=args.max_turns, seed=args.seed,
+            cache=args.cache,
+        )
+
+    elif args.command == "bench":
+        _, comparison = run_benchmarks(
+            args.scenarios, args.log_levels, args.board_sizes, matches=args.matches, repeat=args.repeat, output=args.output,
+            baseline=args.baseline, tolerance=args.tolerance,
+        )
+        if comparison and any(row["regression"] for row in comparison):
+            raise SystemExit(1)
+
+    elif args.command == "latency":
+        run_latency(
+            args.bots, args.corpus, args.record_matches, seed=args.seed, limit_ms=args.limit_ms,
+            timeout=args.timeout, output=args.output, record_with=args.record_with,
+        )
+
+    elif args.command == "analyze":
+        run_analyze(args.source, args.export, args.table, args.where, args.by, args.agg)
+
+    elif args.command == "view":
+        view_streamed_match(args.path, args.match)
+
+    elif args.command == "replay":
+        replay_match(args.path, args.match, turn=args.turn, speed=args.speed, animate=not args.no_animations)
+
+    elif args.command == "render":
+        run_render(
+            args.path, args.output, args.matches or None, fmt=args.format, workers=args.workers, atlas=args.atlas
+        )
+
     elif args.command == "match":
         if args.bot1 == "list" or (args.bot1 is None and args.bot2 is None):
             # List available bots
@@ -494,12 +1451,20 @@ def main():
         elif args.bot1 and args.bot2:
             # Run a match between two specific bots
             headless = getattr(args, "headless", False)
-            count = getattr(args, "count", 1)
+            until_confident = getattr(args, "until_confident", None)
+            count = getattr(args, "count", None)
+            if count is None:
+                count = DEFAULT_MAX_CONFIDENT_MATCHES if until_confident is not None else 1
             graph = getattr(args, "graph", False)
-            run_single_match(args.bot1, args.bot2, args.verbose, headless=headless, count=count, graph=graph)
+            sandbox = getattr(args, "sandbox", False)
+            run_single_match(
+                args.bot1, args.bot2, args.verbose, headless=headless, count=count, graph=graph, sandbox=sandbox,
+                until_confident=until_confident, margin=args.margin, workers=args.workers,
+                seed=args.seed, cache=args.cache, record=args.record, stream=args.stream,
+            )
         else:
             print("Please provide two bot names or use 'list' to see available bots.")
-            print("Usage: python main.py match <bot1> <bot2> [--headless] [--verbose] [--count N] [--graph]")
+            print("Usage: python main.py match <bot1> <bot2> [--headless] [--verbose] [--count N] [--graph] [--sandbox] [--until-confident [C]]")
             print("       python main.py match list")
 
 
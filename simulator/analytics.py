@@ -0,0 +1,355 @@
+"""Columnar tables of match events for fast aggregate queries.
+
+Match logs keep spells, damage and events as lists of small dicts. The
+exporter turns a batch of matches into one table per record type, each column
+a typed NumPy array, with string columns dictionary-encoded (integer codes plus
+a list of categories). Tables are saved together as a single ``.npz`` file and
+queried with ``aggregate``, which groups and reduces whole columns at once::
+
+    spells = tables["spells"].where(spell="fireball")
+    aggregate(spells, by=["caster", "range"], value="hit", how="mean")
+
+Tables and their columns (``match`` and ``turn`` are in every table):
+
+spells
+    caster, spell, caster_x, caster_y, target_x, target_y, range (Chebyshev
+    distance from caster to target, -1 without a target), hit
+damage
+    target, cause, amount, x, y
+moves
+    wizard, from_x, from_y, to_x, to_y
+pickups
+    wizard, artifact, x, y
+collisions
+    entity1_type, entity2_type, x, y
+
+Coordinates are -1 where the log has none.
+"""
+
+import json
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from game.logger import EVENT_ARTIFACT_PICK_UP, EVENT_COLLISION, EVENT_WIZARD_MOVE
+from simulator.match_log import MatchLogReader
+
+CATEGORY = "category"
+
+# table -> ((column, dtype), ...); CATEGORY columns are stored as int32 codes
+SCHEMAS: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "spells": (
+        ("match", "i4"),
+        ("turn", "i2"),
+        ("caster", CATEGORY),
+        ("spell", CATEGORY),
+        ("caster_x", "i2"),
+        ("caster_y", "i2"),
+        ("target_x", "i2"),
+        ("target_y", "i2"),
+        ("range", "i2"),
+        ("hit", "?"),
+    ),
+    "damage": (
+        ("match", "i4"),
+        ("turn", "i2"),
+        ("target", CATEGORY),
+        ("cause", CATEGORY),
+        ("amount", "i2"),
+        ("x", "i2"),
+        ("y", "i2"),
+    ),
+    "moves": (
+        ("match", "i4"),
+        ("turn", "i2"),
+        ("wizard", CATEGORY),
+        ("from_x", "i2"),
+        ("from_y", "i2"),
+        ("to_x", "i2"),
+        ("to_y", "i2"),
+    ),
+    "pickups": (
+        ("match", "i4"),
+        ("turn", "i2"),
+        ("wizard", CATEGORY),
+        ("artifact", CATEGORY),
+        ("x", "i2"),
+        ("y", "i2"),
+    ),
+    "collisions": (
+        ("match", "i4"),
+        ("turn", "i2"),
+        ("entity1_type", CATEGORY),
+        ("entity2_type", CATEGORY),
+        ("x", "i2"),
+        ("y", "i2"),
+    ),
+}
+
+AGGREGATIONS = ("count", "sum", "mean", "min", "max")
+
+# Record kinds the exporter reads from a match log
+EXPORTED_KINDS = ("spell", "damage", "event")
+
+
+class ColumnTable:
+    """Named, equally long NumPy columns; category columns hold codes into ``categories``."""
+
+    def __init__(self, name: str, columns: Dict[str, np.ndarray], categories: Dict[str, List[str]]):
+        self.name = name
+        self.columns = columns
+        self.categories = categories
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self.columns[column]
+
+    def decoded(self, column: str) -> np.ndarray:
+        """A category column as strings (other columns are returned as they are)."""
+        if column not in self.categories:
+            return self.columns[column]
+        return np.asarray(self.categories[column], dtype=object)[self.columns[column]]
+
+    def code(self, column: str, value) -> int:
+        """Code of ``value`` in a category column, -1 if it never occurs."""
+        try:
+            return self.categories[column].index(value)
+        except ValueError:
+            return -1
+
+    def filter(self, mask: np.ndarray) -> "ColumnTable":
+        return ColumnTable(self.name, {k: v[mask] for k, v in self.columns.items()}, self.categories)
+
+    def where(self, **equals) -> "ColumnTable":
+        """Rows where every given column equals the value (category columns compare by string)."""
+        mask = np.ones(len(self), dtype=bool)
+        for column, value in equals.items():
+            if column not in self.columns:
+                raise KeyError(f"Table {self.name!r} has no column {column!r}, expected one of {list(self.columns)}")
+            if column in self.categories:
+                value = self.code(column, value)
+            mask &= self.columns[column] == value
+        return self.filter(mask)
+
+
+class _TableBuilder:
+    def __init__(self, name: str):
+        self.name = name
+        self.schema = SCHEMAS[name]
+        self.values: Dict[str, list] = {column: [] for column, _ in self.schema}
+        self.codes: Dict[str, Dict[str, int]] = {column: {} for column, kind in self.schema if kind == CATEGORY}
+
+    def add(self, **row) -> None:
+        for column, kind in self.schema:
+            value = row[column]
+            if kind == CATEGORY:
+                value = self.codes[column].setdefault("" if value is None else str(value), len(self.codes[column]))
+            self.values[column].append(value)
+
+    def build(self) -> ColumnTable:
+        columns = {}
+        for column, kind in self.schema:
+            dtype = "i4" if kind == CATEGORY else kind
+            columns[column] = np.asarray(self.values[column], dtype=dtype)
+        categories = {column: list(codes) for column, codes in self.codes.items()}
+        return ColumnTable(self.name, columns, categories)
+
+
+def _xy(position) -> Tuple[int, int]:
+    if isinstance(position, (list, tuple)) and len(position) == 2:
+        try:
+            return int(position[0]), int(position[1])
+        except (TypeError, ValueError):
+            pass
+    return -1, -1
+
+
+def _parse_move(move: str) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+    start, _, end = move.partition("->")
+    try:
+        return _xy(json.loads(start)), _xy(json.loads(end))
+    except ValueError:
+        # Moves off the board are logged with "None" as the destination
+        return (-1, -1), (-1, -1)
+
+
+class EventExporter:
+    """Accumulates the records of many matches into columnar tables."""
+
+    def __init__(self):
+        self._builders = {name: _TableBuilder(name) for name in SCHEMAS}
+        self.matches = 0
+
+    def add_records(self, match: int, records: Iterable[Tuple[str, object]]) -> None:
+        """Add one match given as the (kind, data) records of a streamed match log."""
+        for kind, data in records:
+            if kind == "spell":
+                self._add_spell(match, data)
+            elif kind == "damage":
+                self._add_damage(match, data)
+            elif kind == "event":
+                self._add_event(match, data)
+        self.matches += 1
+
+    def add_logger(self, match: int, logger) -> None:
+        """Add one match from an in-memory ``GameLogger``."""
+        records = [("spell", spell) for spell in logger.spells]
+        records += [("damage", damage) for damage in logger.damage_events]
+        records += [("event", event) for event in logger.events]
+        self.add_records(match, records)
+
+    def _add_spell(self, match: int, spell: dict) -> None:
+        caster_x, caster_y = _xy(spell.get("caster_position"))
+        target_x, target_y = _xy(spell.get("target"))
+        has_range = target_x >= 0 and caster_x >= 0
+        self._builders["spells"].add(
+            match=match,
+            turn=spell["turn"],
+            caster=spell["caster"],
+            spell=spell["spell"],
+            caster_x=caster_x,
+            caster_y=caster_y,
+            target_x=target_x,
+            target_y=target_y,
+            range=max(abs(target_x - caster_x), abs(target_y - caster_y)) if has_range else -1,
+            hit=bool(spell.get("hit")),
+        )
+
+    def _add_damage(self, match: int, damage: dict) -> None:
+        x, y = _xy(damage.get("position"))
+        self._builders["damage"].add(
+            match=match,
+            turn=damage["turn"],
+            target=damage["target"],
+            cause=damage.get("cause"),
+            amount=damage["amount"],
+            x=x,
+            y=y,
+        )
+
+    def _add_event(self, match: int, event: dict) -> None:
+        details = event["details"]
+        if event["event"] == EVENT_WIZARD_MOVE:
+            for wizard in details.values():
+                (from_x, from_y), (to_x, to_y) = _parse_move(wizard["move"])
+                self._builders["moves"].add(
+                    match=match,
+                    turn=event["turn"],
+                    wizard=wizard["name"],
+                    from_x=from_x,
+                    from_y=from_y,
+                    to_x=to_x,
+                    to_y=to_y,
+                )
+        elif event["event"] == EVENT_ARTIFACT_PICK_UP:
+            x, y = _xy(details["artifact_position"])
+            self._builders["pickups"].add(
+                match=match,
+                turn=event["turn"],
+                wizard=details["wizard"],
+                artifact=details["artifact_type"],
+                x=x,
+                y=y,
+            )
+        elif event["event"] == EVENT_COLLISION:
+            x, y = _xy(details["position"])
+            self._builders["collisions"].add(
+                match=match,
+                turn=event["turn"],
+                entity1_type=details["entity1_type"],
+                entity2_type=details["entity2_type"],
+                x=x,
+                y=y,
+            )
+
+    def tables(self) -> Dict[str, ColumnTable]:
+        return {name: builder.build() for name, builder in self._builders.items()}
+
+
+def export_match_log(path: str, matches: Optional[Sequence[int]] = None) -> Dict[str, ColumnTable]:
+    """Tables for the matches of a streamed match log (all of them by default)."""
+    reader = MatchLogReader(path)
+    exporter = EventExporter()
+    ids = matches if matches is not None else [entry["match"] for entry in reader.matches()]
+    for match in ids:
+        exporter.add_records(match, reader.records(match, kinds=EXPORTED_KINDS))
+    return exporter.tables()
+
+
+def save_tables(tables: Dict[str, ColumnTable], path: str) -> None:
+    """Write all tables to one compressed ``.npz`` file."""
+    arrays = {}
+    for name, table in tables.items():
+        for column, values in table.columns.items():
+            arrays[f"{name}.{column}"] = values
+        for column, categories in table.categories.items():
+            arrays[f"{name}.{column}.categories"] = np.asarray(categories, dtype=str)
+    np.savez_compressed(path, **arrays)
+
+
+def load_tables(path: str) -> Dict[str, ColumnTable]:
+    with np.load(path) as data:
+        tables = {}
+        for name, schema in SCHEMAS.items():
+            if f"{name}.match" not in data:
+                continue
+            columns = {column: data[f"{name}.{column}"] for column, _ in schema}
+            categories = {
+                column: [str(value) for value in data[f"{name}.{column}.categories"]]
+                for column, kind in schema
+                if kind == CATEGORY
+            }
+            tables[name] = ColumnTable(name, columns, categories)
+    return tables
+
+
+def aggregate(
+    table: ColumnTable, by: Sequence[str] = (), value: Optional[str] = None, how: str = "count"
+) -> List[dict]:
+    """Group rows by the ``by`` columns and reduce ``value`` with ``how`` in each group.
+
+    Returns one dict per group, sorted by the group keys, with the keys
+    (decoded for category columns), ``rows`` and the aggregate under ``how``.
+    """
+    if how not in AGGREGATIONS:
+        raise ValueError(f"Unknown aggregation {how!r}, expected one of {AGGREGATIONS}")
+    if how != "count" and value is None:
+        raise ValueError(f"Aggregation {how!r} needs a value column")
+    for column in list(by) + ([value] if value else []):
+        if column not in table.columns:
+            raise KeyError(f"Table {table.name!r} has no column {column!r}, expected one of {list(table.columns)}")
+    if not len(table):
+        return []
+
+    if by:
+        keys = np.stack([table[column].astype(np.int64) for column in by], axis=1)
+        groups, inverse = np.unique(keys, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+    else:
+        groups, inverse = np.zeros((1, 0), dtype=np.int64), np.zeros(len(table), dtype=np.int64)
+
+    counts = np.bincount(inverse, minlength=len(groups))
+    if how == "count":
+        results = counts
+    else:
+        values = table[value].astype(np.float64)
+        if how in ("sum", "mean"):
+            results = np.bincount(inverse, weights=values, minlength=len(groups))
+            if how == "mean":
+                results = results / counts
+        else:
+            results = np.full(len(groups), np.inf if how == "min" else -np.inf)
+            (np.minimum if how == "min" else np.maximum).at(results, inverse, values)
+
+    rows = []
+    for group, count, result in zip(groups, counts, results):
+        row = {}
+        for column, key in zip(by, group):
+            row[column] = table.categories[column][key] if column in table.categories else int(key)
+        row["rows"] = int(count)
+        row[how] = int(result) if how == "count" else float(result)
+        rows.append(row)
+    rows.sort(key=lambda row: tuple(row[column] for column in by))
+    return rows
@@ -0,0 +1,182 @@
+"""Sprites decoded once per process and shared by every Visualizer.
+
+The sprite files are large PNGs, and decoding, converting and scaling them
+takes most of the time a Visualizer needs to start. ``ASSETS`` keeps each image
+at every size (and rotation) it has been asked for, so only the first
+visualizer in a process pays for it and the following matches start at once.
+Only the scaled surfaces are kept, not the full-size originals.
+
+A process that has never loaded them (a render worker, a freshly started
+server) can start from an atlas instead: a single file with the scaled
+surfaces packed into one image. ``use_atlas`` names it; it is read the first
+time a surface is missing, skipping entries whose source file has changed
+since, and ``save_atlas`` writes it atomically.
+"""
+
+import json
+import os
+import zlib
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import pygame
+
+ATLAS_WIDTH = 1024
+
+Size = Tuple[int, int]
+
+
+class AssetKey(NamedTuple):
+    path: str
+    size: Optional[Size] = None  # None: the image as stored
+    smooth: bool = False  # smoothscale rather than scale
+    angle: float = 0.0
+
+
+def _source_stamp(path: str) -> Optional[List[int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+class AssetCache:
+    """Converted surfaces keyed by source path, size, scaling mode and rotation.
+
+    Surfaces are converted for the display, so one must have been set up with
+    ``pygame.display.set_mode`` first. Callers share the surfaces they get and
+    must not draw on them.
+    """
+
+    def __init__(self):
+        self.surfaces: Dict[AssetKey, pygame.Surface] = {}
+        self.loads = 0  # files decoded from disk
+        self.unsaved = 0  # surfaces made since the atlas was read or written
+        self.atlas_path: Optional[str] = None
+        self._atlas_read = False
+
+    def __len__(self) -> int:
+        return len(self.surfaces)
+
+    def use_atlas(self, path: Optional[str]) -> None:
+        """Take missing surfaces from the atlas at ``path``, if there is one."""
+        self.atlas_path = path
+        self._atlas_read = False
+
+    def _get(self, key: AssetKey) -> Optional[pygame.Surface]:
+        surface = self.surfaces.get(key)
+        if surface is None and self.atlas_path and not self._atlas_read:
+            self._atlas_read = True
+            self.load_atlas(self.atlas_path)
+            surface = self.surfaces.get(key)
+        return surface
+
+    def _put(self, key: AssetKey, surface: pygame.Surface) -> pygame.Surface:
+        self.surfaces[key] = surface
+        self.unsaved += 1
+        return surface
+
+    def _load(self, path: str) -> pygame.Surface:
+        self.loads += 1
+        return pygame.image.load(path).convert_alpha()
+
+    def image(self, path: str, size: Optional[Size] = None, smooth: bool = False) -> pygame.Surface:
+        key = AssetKey(path, tuple(size) if size else None, smooth)
+        surface = self._get(key)
+        if surface is not None:
+            return surface
+        if key.size is None:
+            return self._put(key, self._load(path))
+        original = self.surfaces.get(AssetKey(path)) or self._load(path)
+        scale = pygame.transform.smoothscale if smooth else pygame.transform.scale
+        return self._put(key, scale(original, key.size))
+
+    def rotated(self, path: str, size: Optional[Size], angle: float, smooth: bool = False) -> pygame.Surface:
+        key = AssetKey(path, tuple(size) if size else None, smooth, angle)
+        surface = self._get(key)
+        if surface is None:
+            surface = self._put(key, pygame.transform.rotate(self.image(path, size, smooth), angle))
+        return surface
+
+    def frames(self, path: str, size: Optional[Size] = None) -> List[pygame.Surface]:
+        """Animation frames of a sprite; every sprite is a single image for now."""
+        return [self.image(path, size)]
+
+    def clear(self) -> None:
+        self.surfaces.clear()
+        self._atlas_read = False
+
+    def save_atlas(self, path: str) -> int:
+        """Pack every scaled or rotated surface into the atlas file ``path``.
+
+        The file is a JSON index line followed by the zlib-compressed RGBA
+        pixels of the packed image. Returns the number of surfaces saved.
+        """
+        entries = sorted(
+            ((key, surface) for key, surface in self.surfaces.items() if key.size is not None or key.angle),
+            key=lambda item: -item[1].get_height(),
+        )
+        # Shelf packing: fill rows left to right, tallest surfaces first
+        rects = []
+        x = y = shelf = 0
+        for _, surface in entries:
+            width, height = surface.get_size()
+            if x + width > ATLAS_WIDTH and x > 0:
+                x, y, shelf = 0, y + shelf, 0
+            rects.append((x, y, width, height))
+            x += width
+            shelf = max(shelf, height)
+
+        size = (ATLAS_WIDTH, max(1, y + shelf))
+        atlas = pygame.Surface(size, pygame.SRCALPHA)
+        index = []
+        for (key, surface), rect in zip(entries, rects):
+            atlas.blit(surface, rect[:2])
+            index.append({"key": [key.path, key.size, key.smooth, key.angle], "rect": rect})
+        header = {
+            "size": size,
+            "entries": index,
+            "sources": {key.path: _source_stamp(key.path) for key, _ in entries},
+        }
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        # Workers may save the same atlas at once; each write replaces the file whole
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(json.dumps(header).encode() + b"\n")
+            f.write(zlib.compress(pygame.image.tobytes(atlas, "RGBA"), 1))
+        os.replace(tmp_path, path)
+        self.unsaved = 0
+        return len(index)
+
+    def load_atlas(self, path: str) -> int:
+        """Add the surfaces of an atlas written by ``save_atlas``; returns how many were added.
+
+        Entries whose source image changed (or is gone) since the atlas was
+        saved are skipped and will be loaded from the source again. A missing
+        atlas adds nothing.
+        """
+        if not os.path.exists(path):
+            return 0
+        with open(path, "rb") as f:
+            header = json.loads(f.readline())
+            pixels = zlib.decompress(f.read())
+        fresh = {
+            source
+            for source, stamp in header["sources"].items()
+            if stamp is not None and _source_stamp(source) == stamp
+        }
+        atlas = pygame.image.frombytes(pixels, tuple(header["size"]), "RGBA").convert_alpha()
+        added = 0
+        for entry in header["entries"]:
+            source, size, smooth, angle = entry["key"]
+            key = AssetKey(source, tuple(size) if size else None, smooth, angle)
+            if source in fresh and key not in self.surfaces:
+                self.surfaces[key] = atlas.subsurface(entry["rect"]).copy()
+                added += 1
+        return added
+
+
+# Shared by every Visualizer in the process
+ASSETS = AssetCache()
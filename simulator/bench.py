@@ -0,0 +1,214 @@
+"""Engine throughput benchmarks.
+
+Canned scenarios are played by cheap stub bots, so the measured time is almost
+entirely spent in ``GameEngine`` and ``GameLogger``. Every scenario is run for
+each combination of logger level and board size, and the results can be saved
+as JSON and compared against a saved baseline to catch engine slowdowns.
+"""
+
+import contextlib
+import json
+import os
+import platform
+import random
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+from bots.bot_interface import BotInterface
+from game.engine import GameEngine
+from game.logger import LOG_LEVELS, GameLogger
+from game.rules import BOARD_SIZE
+
+DEFAULT_MATCHES = 20
+DEFAULT_REPEAT = 3
+DEFAULT_MAX_TURNS = 100
+DEFAULT_TOLERANCE = 0.10
+
+
+def _step_towards(start, target):
+    return [(target[0] > start[0]) - (target[0] < start[0]), (target[1] > start[1]) - (target[1] < start[1])]
+
+
+class StubBot(BotInterface):
+    """Bot whose whole strategy is a small function of the state."""
+
+    def __init__(self, name: str, strategy: Callable[[dict, random.Random], dict], seed: int):
+        self._name = name
+        self._strategy = strategy
+        self._rng = random.Random(seed)
+
+    @property
+    def name(self):
+        return self._name
+
+    def decide(self, state):
+        return self._strategy(state, self._rng)
+
+
+def _random_walk(_state, rng):
+    return {"move": [rng.randint(-1, 1), rng.randint(-1, 1)], "spell": None}
+
+
+def _minions(state, rng):
+    me = state["self"]
+    if me["cooldowns"]["summon"] == 0 and me["mana"] >= 50:
+        return {"move": [0, 0], "spell": {"name": "summon"}}
+    return {"move": [rng.randint(-1, 1), rng.randint(-1, 1)], "spell": None}
+
+
+def _fireball(state, _rng):
+    me, opponent = state["self"], state["opponent"]
+    if me["cooldowns"]["fireball"] == 0 and me["mana"] >= 30:
+        spell = {"name": "fireball", "target": opponent["position"]}
+    elif me["cooldowns"]["heal"] == 0 and me["mana"] >= 25:
+        spell = {"name": "heal"}
+    else:
+        spell = None
+    return {"move": _step_towards(me["position"], opponent["position"]), "spell": spell}
+
+
+def _collision(state, _rng):
+    return {"move": _step_towards(state["self"]["position"], state["opponent"]["position"]), "spell": None}
+
+
+def _idle(_state, _rng):
+    return {"move": [0, 0], "spell": None}
+
+
+# name -> (description, strategy)
+SCENARIOS: Dict[str, tuple] = {
+    "random_walk": ("Both wizards wander an otherwise empty board", _random_walk),
+    "minions": ("Both wizards keep summoning minions", _minions),
+    "fireball": ("Fireball spam with heals while closing in", _fireball),
+    "collision": ("Both wizards walk into each other every turn", _collision),
+    "long_draw": ("Idle wizards, every match runs to the turn limit", _idle),
+}
+
+
+def run_scenario(
+    scenario: str,
+    log_level: str,
+    board_size: int = BOARD_SIZE,
+    matches: int = DEFAULT_MATCHES,
+    max_turns: int = DEFAULT_MAX_TURNS,
+    seed: int = 0,
+    repeat: int = DEFAULT_REPEAT,
+) -> dict:
+    """Play ``matches`` seeded matches of ``scenario`` and return the timing row.
+
+    The same matches are played ``repeat`` times and the fastest run is kept,
+    as timeit does, to keep noise from other processes out of the comparison.
+    """
+    _, strategy = SCENARIOS[scenario]
+    best = None
+    # Verbose logging prints every event; the cost of printing stays, the terminal doesn't fill up
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for _ in range(repeat):
+            turns = 0
+            elapsed = 0.0
+            for match in range(matches):
+                random.seed(seed + match)
+                bot1 = StubBot("Stub A", strategy, seed + match)
+                bot2 = StubBot("Stub B", strategy, seed + match + 1)
+
+                start = time.perf_counter()
+                engine = GameEngine(bot1, bot2, board_size=board_size, logger=GameLogger(log_level))
+                for _ in range(max_turns):
+                    if engine.run_turn():
+                        break
+                engine.logger.finalize()
+                elapsed += time.perf_counter() - start
+                turns += engine.turn
+            if best is None or elapsed < best:
+                best = elapsed
+    elapsed = best
+
+    return {
+        "scenario": scenario,
+        "log_level": log_level,
+        "board_size": board_size,
+        "matches": matches,
+        "turns": turns,
+        "seconds": elapsed,
+        "turns_per_second": turns / elapsed if elapsed else 0.0,
+        "matches_per_second": matches / elapsed if elapsed else 0.0,
+    }
+
+
+def run_bench(
+    scenarios: Optional[Sequence[str]] = None,
+    log_levels: Optional[Sequence[str]] = None,
+    board_sizes: Sequence[int] = (BOARD_SIZE,),
+    matches: int = DEFAULT_MATCHES,
+    max_turns: int = DEFAULT_MAX_TURNS,
+    repeat: int = DEFAULT_REPEAT,
+    on_result: Optional[Callable[[dict], None]] = None,
+) -> dict:
+    """Run every scenario x log level x board size and return the JSON-ready report."""
+    scenarios = list(scenarios or SCENARIOS)
+    log_levels = list(log_levels or LOG_LEVELS)
+    for scenario in scenarios:
+        if scenario not in SCENARIOS:
+            raise ValueError(f"Unknown scenario {scenario!r}, expected one of {list(SCENARIOS)}")
+
+    results = []
+    for scenario in scenarios:
+        for log_level in log_levels:
+            for board_size in board_sizes:
+                row = run_scenario(scenario, log_level, board_size, matches, max_turns, repeat=repeat)
+                results.append(row)
+                if on_result:
+                    on_result(row)
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "matches": matches,
+            "max_turns": max_turns,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float = DEFAULT_TOLERANCE) -> List[dict]:
+    """Compare turns/second with a baseline report, row by row.
+
+    Each returned row carries the relative ``change`` and a ``regression`` flag,
+    set when throughput dropped by more than ``tolerance``.
+    """
+
+    def key(row):
+        return row["scenario"], row["log_level"], row["board_size"]
+
+    baseline_rows = {key(row): row for row in baseline.get("results", [])}
+    comparison = []
+    for row in report["results"]:
+        old = baseline_rows.get(key(row))
+        if old is None or not old["turns_per_second"]:
+            continue
+        change = row["turns_per_second"] / old["turns_per_second"] - 1
+        comparison.append(
+            {
+                "scenario": row["scenario"],
+                "log_level": row["log_level"],
+                "board_size": row["board_size"],
+                "baseline": old["turns_per_second"],
+                "current": row["turns_per_second"],
+                "change": change,
+                "regression": change < -tolerance,
+            }
+        )
+    return comparison
+
+
+def save_report(report: dict, path: str) -> None:
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+
+
+def load_report(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
@@ -0,0 +1,134 @@
+"""Content-addressed cache of match results.
+
+A result is stored under a key built from the fingerprints of both bots (every
+file in the bot's directory, including model weights), a fingerprint of the
+game engine and rules, the seed, the turn limit and the side assignment. As
+long as none of those change, replaying the match would give the same outcome,
+so it can be read back instead. Changing one bot only invalidates the pairings
+that bot takes part in.
+
+Sandboxed bots draw from their worker's RNG rather than the match's, so their
+results are kept apart from those of the same bots played in-process.
+
+Only seeded matches are cached, and bots that learn between matches (or use
+randomness other than the ``random`` module) are not reproducible by seed
+alone; cache them at your own discretion.
+"""
+
+import functools
+import hashlib
+import importlib
+import os
+import sqlite3
+import sys
+import time
+from typing import Optional, Tuple
+
+from simulator.loader import BotSpec
+
+DEFAULT_CACHE_PATH = ".cache/match_results.sqlite"
+
+_GAME_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "game")
+_SKIP_DIRS = {"__pycache__"}
+_SKIP_SUFFIXES = (".pyc", ".pyo")
+
+
+def spec_for(bot) -> BotSpec:
+    """Spec of the bot that actually plays (sandboxed bots carry their own)."""
+    spec = getattr(bot, "spec", None)
+    return spec if isinstance(spec, BotSpec) else BotSpec.of(bot)
+
+
+def _hash_tree(root: str, digest) -> None:
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in _SKIP_DIRS)
+        for filename in sorted(filenames):
+            if filename.endswith(_SKIP_SUFFIXES):
+                continue
+            path = os.path.join(dirpath, filename)
+            digest.update(os.path.relpath(path, root).encode())
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+
+
+@functools.cache
+def bot_fingerprint(spec: BotSpec) -> str:
+    """Hash of every file in the directory holding the bot's module."""
+    module = sys.modules.get(spec.module) or importlib.import_module(spec.module)
+    digest = hashlib.sha256(spec.qualname.encode())
+    _hash_tree(os.path.dirname(os.path.abspath(module.__file__)), digest)
+    return digest.hexdigest()
+
+
+@functools.cache
+def engine_fingerprint() -> str:
+    """Hash of the game package: engine, rules, wizards, minions and artifacts."""
+    digest = hashlib.sha256()
+    _hash_tree(_GAME_DIR, digest)
+    return digest.hexdigest()
+
+
+def result_key(
+    spec1: BotSpec, spec2: BotSpec, seed: int, max_turns: int, sandboxed: Tuple[bool, bool] = (False, False)
+) -> str:
+    """Cache key for ``spec1`` (playing first) against ``spec2``; ``sandboxed`` marks bots run in workers."""
+    parts = (bot_fingerprint(spec1), bot_fingerprint(spec2), engine_fingerprint(), str(seed), str(max_turns))
+    if any(sandboxed):
+        parts += ("sandboxed:" + "".join("1" if flag else "0" for flag in sandboxed),)
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+
+class ResultCache:
+    """SQLite store of (score of the first bot, turns) per result key."""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "key TEXT PRIMARY KEY, score REAL NOT NULL, turns INTEGER NOT NULL, created REAL NOT NULL)"
+        )
+        self._conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self, spec1: BotSpec, spec2: BotSpec, seed: int, max_turns: int, sandboxed: Tuple[bool, bool] = (False, False)
+    ) -> Optional[Tuple[float, int]]:
+        row = self._conn.execute(
+            "SELECT score, turns FROM results WHERE key = ?", (result_key(spec1, spec2, seed, max_turns, sandboxed),)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return row[0], row[1]
+
+    def put(
+        self,
+        spec1: BotSpec,
+        spec2: BotSpec,
+        seed: int,
+        max_turns: int,
+        score: float,
+        turns: int,
+        sandboxed: Tuple[bool, bool] = (False, False),
+    ) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO results (key, score, turns, created) VALUES (?, ?, ?, ?)",
+            (result_key(spec1, spec2, seed, max_turns, sandboxed), score, turns, time.time()),
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "ResultCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
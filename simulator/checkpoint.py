@@ -0,0 +1,41 @@
+"""Atomic JSON checkpoints for long-running, resumable runs.
+
+A checkpoint is written to a temporary file next to the target, flushed to
+disk and then renamed over it, so a crash at any point leaves either the
+previous or the new checkpoint, never a half-written one.
+"""
+
+import json
+import os
+import random
+from typing import Optional
+
+
+def save_checkpoint(path: str, state: dict) -> None:
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(state, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path: str) -> Optional[dict]:
+    """The saved state, or None if there is no checkpoint yet."""
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def rng_state(rng=random) -> list:
+    """JSON-ready state of a ``random.Random`` (or of the ``random`` module)."""
+    version, internal, gauss_next = rng.getstate()
+    return [version, list(internal), gauss_next]
+
+
+def restore_rng_state(state: list, rng=random) -> None:
+    version, internal, gauss_next = state
+    rng.setstate((version, tuple(internal), gauss_next))
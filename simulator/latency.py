@@ -0,0 +1,245 @@
+"""Bot decision latency measurement over a fixed corpus of game states.
+
+The corpus is captured from ``GameLogger`` snapshots of real matches, so every
+bot is measured on the same, realistic inputs. Those matches are played by
+sandboxed bots, and each bot is then measured alone in a fresh worker process:
+no other bot shares its interpreter, and a bot that hangs is killed after a
+timeout and reported as stalled instead of blocking the run.
+"""
+
+import contextlib
+import copy
+import json
+import math
+import multiprocessing
+import os
+import random
+import time
+import tracemalloc
+from typing import Dict, List, Sequence
+
+from simulator.loader import BotSpec, load_bot
+from simulator.match import run_seeded_match
+from simulator.sandbox import SandboxedBot
+
+DEFAULT_CORPUS_MATCHES = 10
+DEFAULT_LIMIT_MS = 100.0
+DEFAULT_BOT_TIMEOUT = 300.0
+DEFAULT_RECORD_DECIDE_TIMEOUT = 2.0
+
+
+def flip_state(state: dict) -> dict:
+    """The same state seen from the other wizard's side."""
+    flipped = dict(state)
+    flipped["self"], flipped["opponent"] = state["opponent"], state["self"]
+    return flipped
+
+
+def record_corpus(
+    specs: Sequence[BotSpec],
+    matches: int = DEFAULT_CORPUS_MATCHES,
+    seed: int = 0,
+    max_turns: int = 100,
+    decide_timeout: float = DEFAULT_RECORD_DECIDE_TIMEOUT,
+    on_problem=None,
+) -> List[dict]:
+    """Play seeded matches between randomly paired bots and collect the distinct states.
+
+    The bots play sandboxed, so one that raises or takes longer than
+    ``decide_timeout`` to decide only plays the default action, and one that
+    fails to start is left out. Either way ``on_problem(name, message)`` is
+    called for it.
+
+    Snapshots are logged from the first wizard's point of view, so each one is
+    also added flipped, giving states as seen from both sides of the board.
+    """
+    bots = []
+    for spec in specs:
+        try:
+            bots.append(SandboxedBot(spec, decide_timeout=decide_timeout))
+        except RuntimeError as e:
+            if on_problem:
+                on_problem(spec.qualname, str(e))
+
+    rng = random.Random(seed)
+    corpus = []
+    seen = set()
+    try:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            for match in range(matches if bots else 0):
+                bot1, bot2 = rng.sample(bots, 2) if len(bots) > 1 else (bots[0], bots[0])
+                _, _, logger = run_seeded_match(bot1, bot2, seed=seed + match, max_turns=max_turns)
+
+                for snapshot in logger.get_snapshots():
+                    state = {key: value for key, value in snapshot.items() if key != "state_index"}
+                    for candidate in (state, flip_state(state)):
+                        key = json.dumps(candidate, sort_keys=True)
+                        if key not in seen:
+                            seen.add(key)
+                            corpus.append(candidate)
+    finally:
+        for bot in bots:
+            bot.close()
+
+    if on_problem:
+        for bot in bots:
+            problems = [
+                f"{count} {what}"
+                for count, what in (
+                    (bot.errors, "failed decisions"),
+                    (bot.timeouts, "timeouts"),
+                    (bot.restarts, "restarts"),
+                )
+                if count
+            ]
+            if problems:
+                on_problem(bot.name, ", ".join(problems) + " while recording (default actions played)")
+    return corpus
+
+
+def save_corpus(corpus: List[dict], path: str) -> None:
+    with open(path, "w") as f:
+        json.dump(corpus, f)
+
+
+def load_corpus(path: str) -> List[dict]:
+    with open(path) as f:
+        return json.load(f)
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def _is_valid_action(action) -> bool:
+    return isinstance(action, dict) and isinstance(action.get("move"), list) and len(action["move"]) == 2
+
+
+def measure_bot(bot, corpus: List[dict]) -> dict:
+    """Time ``bot.decide`` on every corpus state, then measure its allocations.
+
+    Timing and allocation tracking are separate passes because tracemalloc slows
+    allocation-heavy bots down by an order of magnitude. Every call gets its own
+    copy of the state, so bots that mutate their input can't affect later calls.
+    """
+    latencies = []
+    failures = 0
+    invalid = 0
+    for state in corpus:
+        state = copy.deepcopy(state)
+        start = time.perf_counter()
+        try:
+            action = bot.decide(state)
+        except Exception:
+            failures += 1
+            continue
+        finally:
+            latencies.append((time.perf_counter() - start) * 1000)
+        if not _is_valid_action(action):
+            invalid += 1
+
+    peaks = []
+    tracemalloc.start()
+    try:
+        for state in corpus:
+            state = copy.deepcopy(state)
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            try:
+                bot.decide(state)
+            except Exception:
+                pass
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(max(0, peak - before))
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "calls": len(corpus),
+        "failures": failures,
+        "invalid_actions": invalid,
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+        "max_ms": latencies[-1] if latencies else 0.0,
+        "mean_alloc_kb": sum(peaks) / len(peaks) / 1024 if peaks else 0.0,
+        "peak_alloc_kb": max(peaks) / 1024 if peaks else 0.0,
+    }
+
+
+def _measure_worker(conn, spec: BotSpec, corpus: List[dict]) -> None:
+    try:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            report = measure_bot(load_bot(spec), corpus)
+        conn.send(("ok", report))
+    except BaseException as e:
+        conn.send(("error", f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
+
+def measure_isolated(spec: BotSpec, corpus: List[dict], timeout: float = DEFAULT_BOT_TIMEOUT) -> dict:
+    """Run ``measure_bot`` for one bot in its own process.
+
+    Returns the measurement, or a row with ``error`` set if the bot failed to
+    load, crashed its process, or did not finish within ``timeout`` seconds.
+    """
+    parent_conn, child_conn = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(target=_measure_worker, args=(child_conn, spec, corpus), daemon=True)
+    process.start()
+    child_conn.close()
+    try:
+        if not parent_conn.poll(timeout):
+            return {"error": f"stalled: no result within {timeout:.0f}s"}
+        status, payload = parent_conn.recv()
+    except EOFError:
+        process.join(timeout=1.0)
+        return {"error": f"worker crashed (exit code {process.exitcode})"}
+    finally:
+        if process.is_alive():
+            process.kill()
+        process.join(timeout=1.0)
+        parent_conn.close()
+
+    if status != "ok":
+        return {"error": payload}
+    return payload
+
+
+def flag_row(row: dict, limit_ms: float) -> List[str]:
+    """Reasons this bot would hold up a live bracket with a ``limit_ms`` time limit."""
+    if "error" in row:
+        return [row["error"]]
+    reasons = []
+    if row["p99_ms"] > limit_ms:
+        reasons.append(f"p99 {row['p99_ms']:.1f}ms over {limit_ms:g}ms limit")
+    elif row["max_ms"] > limit_ms:
+        reasons.append(f"max {row['max_ms']:.1f}ms over {limit_ms:g}ms limit")
+    if row["failures"]:
+        reasons.append(f"{row['failures']} failed decisions")
+    if row["invalid_actions"]:
+        reasons.append(f"{row['invalid_actions']} invalid actions")
+    return reasons
+
+
+def run_latency_bench(
+    specs: Dict[str, BotSpec],
+    corpus: List[dict],
+    limit_ms: float = DEFAULT_LIMIT_MS,
+    timeout: float = DEFAULT_BOT_TIMEOUT,
+    on_result=None,
+) -> List[dict]:
+    """Measure every bot in ``specs`` (name -> spec), one at a time, on ``corpus``."""
+    rows = []
+    for name, spec in specs.items():
+        row = {"name": name, **measure_isolated(spec, corpus, timeout)}
+        row["flags"] = flag_row(row, limit_ms)
+        rows.append(row)
+        if on_result:
+            on_result(row)
+    return rows
@@ -0,0 +1,206 @@
+"""Round-robin league play across a pool of worker processes.
+
+Every pairing is an independent game, so games are farmed out to a
+``ProcessPoolExecutor`` and consumed in completion order: one long game never
+holds back the results of the short ones. Each finished game is appended to an
+optional JSONL results file, which is also how an interrupted league resumes.
+"""
+
+import contextlib
+import json
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from simulator.cache import ResultCache
+from simulator.loader import BotSpec, load_bot
+from simulator.match import derive_seed, run_match
+from simulator.ratings import Elo, Glicko
+
+
+class LeagueGame(NamedTuple):
+    """One scheduled game. ``game_id`` is stable across runs for resuming."""
+
+    game_id: str
+    bot1: str
+    bot2: str
+    seed: int
+
+
+class LeagueTable:
+    """Ratings and win/draw/loss records, updated one game at a time."""
+
+    def __init__(self, names: List[str]):
+        self.elo = Elo()
+        self.glicko = Glicko()
+        self.records: Dict[str, List[int]] = {name: [0, 0, 0] for name in names}
+        self.results: List[dict] = []
+
+    def add(self, result: dict) -> None:
+        bot1, bot2, score = result["bot1"], result["bot2"], result["score"]
+        self.elo.update(bot1, bot2, score)
+        self.glicko.update(bot1, bot2, score)
+        for name, own_score in ((bot1, score), (bot2, 1.0 - score)):
+            record = self.records.setdefault(name, [0, 0, 0])
+            record[0 if own_score == 1.0 else 1 if own_score == 0.5 else 2] += 1
+        self.results.append(result)
+
+    def standings(self) -> List[dict]:
+        """One row per bot, ordered by Glicko rating."""
+        rows = []
+        for name, rating, rd in self.glicko.leaderboard():
+            wins, draws, losses = self.records[name]
+            rows.append(
+                {
+                    "name": name,
+                    "glicko": rating,
+                    "rd": rd,
+                    "elo": self.elo.rating(name),
+                    "wins": wins,
+                    "draws": draws,
+                    "losses": losses,
+                }
+            )
+        return rows
+
+
+def schedule_league(names: List[str], double: bool = False, seed: Optional[int] = None) -> List[LeagueGame]:
+    """Every pairing once, or twice with sides swapped when ``double`` is set.
+
+    With a ``seed`` each game's seed is derived from its id, so a rerun of the
+    same league replays the same games.
+    """
+    names = sorted(names)
+    legs = 2 if double else 1
+    games = []
+    for i, first in enumerate(names):
+        for second in names[i + 1 :]:
+            for leg in range(legs):
+                bot1, bot2 = (first, second) if leg == 0 else (second, first)
+                game_id = f"{bot1} vs {bot2}#{leg}"
+                if seed is None:
+                    game_seed = random.randrange(2**31)
+                else:
+                    game_seed = derive_seed(seed, game_id)
+                games.append(LeagueGame(game_id, bot1, bot2, game_seed))
+    return games
+
+
+def play_game(spec1: BotSpec, spec2: BotSpec, seed: int, max_turns: int = 100) -> Tuple[float, int]:
+    """Worker entry point: play one seeded game and return (score of bot1, turns)."""
+    # The engine and logger print every event; keep worker output off the console
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        bot1, bot2 = load_bot(spec1), load_bot(spec2)
+        # Seeded after loading, like an in-process match between existing bots
+        random.seed(seed)
+        winner, logger = run_match(bot1, bot2, max_turns=max_turns)
+    turns = logger.get_snapshots()[-1]["turn"]
+    if winner is bot1:
+        return 1.0, turns
+    if winner is bot2:
+        return 0.0, turns
+    return 0.5, turns
+
+
+def load_results(path: str) -> List[dict]:
+    """Read the games already recorded in a results file (missing file: none)."""
+    if not os.path.exists(path):
+        return []
+    results = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                results.append(json.loads(line))
+            except json.JSONDecodeError:
+                # A line cut short by an interruption; that game is simply replayed
+                continue
+    return results
+
+
+def play_league(
+    specs: Dict[str, BotSpec],
+    double: bool = False,
+    workers: Optional[int] = None,
+    results_path: Optional[str] = None,
+    max_turns: int = 100,
+    seed: Optional[int] = None,
+    on_result: Optional[Callable[[dict, LeagueTable], None]] = None,
+    cache: Optional[ResultCache] = None,
+) -> LeagueTable:
+    """Play a round-robin league between the bots in ``specs`` (name -> spec).
+
+    Games already present in ``results_path`` are not replayed; their results are
+    fed into the ratings first. Games found in ``cache`` are not played either.
+    ``on_result`` is called after every new game.
+    """
+    table = LeagueTable(list(specs))
+    games = schedule_league(list(specs), double=double, seed=seed)
+
+    done = set()
+    if results_path:
+        for result in load_results(results_path):
+            if result["bot1"] in specs and result["bot2"] in specs and result["game"] not in done:
+                done.add(result["game"])
+                table.add(result)
+
+    pending = [game for game in games if game.game_id not in done]
+    if not pending:
+        return table
+
+    results_file = open(results_path, "a") if results_path else None
+
+    def record(game: LeagueGame, score: float, turns: int) -> None:
+        result = {
+            "game": game.game_id,
+            "bot1": game.bot1,
+            "bot2": game.bot2,
+            "seed": game.seed,
+            "score": score,
+            "turns": turns,
+        }
+        if results_file:
+            results_file.write(json.dumps(result) + "\n")
+            results_file.flush()
+        table.add(result)
+        if on_result:
+            on_result(result, table)
+
+    if cache is not None:
+        uncached = []
+        for game in pending:
+            hit = cache.get(specs[game.bot1], specs[game.bot2], game.seed, max_turns)
+            if hit is None:
+                uncached.append(game)
+            else:
+                record(game, *hit)
+        pending = uncached
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = {
+            executor.submit(play_game, specs[game.bot1], specs[game.bot2], game.seed, max_turns): game
+            for game in pending
+        }
+        for future in as_completed(futures):
+            game = futures[future]
+            try:
+                score, turns = future.result()
+            except Exception as e:
+                # Left out of the results file, so a resumed league retries it
+                print(f"Game {game.game_id} failed: {type(e).__name__}: {e}")
+                continue
+
+            if cache is not None:
+                cache.put(specs[game.bot1], specs[game.bot2], game.seed, max_turns, score, turns)
+            record(game, score, turns)
+    finally:
+        # On interruption neither wait for running games nor start queued ones; they are replayed on resume
+        executor.shutdown(wait=False, cancel_futures=True)
+        if results_file:
+            results_file.close()
+
+    return table
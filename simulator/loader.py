@@ -0,0 +1,25 @@
+import importlib
+from typing import NamedTuple
+
+from bots.bot_interface import BotInterface
+
+
+class BotSpec(NamedTuple):
+    """Importable reference to a bot class, cheap to send to another process."""
+
+    module: str
+    qualname: str
+
+    @classmethod
+    def of(cls, bot) -> "BotSpec":
+        """Build a spec from a bot instance or a bot class."""
+        bot_class = bot if isinstance(bot, type) else type(bot)
+        return cls(bot_class.__module__, bot_class.__qualname__)
+
+
+def load_bot(spec: BotSpec) -> BotInterface:
+    """Import the bot class referenced by ``spec`` and instantiate it."""
+    target = importlib.import_module(spec.module)
+    for part in spec.qualname.split("."):
+        target = getattr(target, part)
+    return target()
@@ -1,7 +1,25 @@
+import asyncio
+import random
+
+from bots.bot_interface import has_native_async
 from game.engine import GameEngine
+from game.logger import LOG_LEVEL_QUIET, LOG_LEVEL_VERBOSE, GameLogger
+from simulator.cache import spec_for
+from simulator.sandbox import SandboxedBot
+
+
+def run_match(bot1, bot2, max_turns=100, verbose=False, sandbox=False, recorder=None, stream=None):
+    """Play one match and return (winner, logger).
+
+    With a ``stream`` (a ``MatchLogWriter``) the match log goes to disk as it is
+    played and the returned logger only holds the final snapshot.
+    """
+    if sandbox:
+        return _run_sandboxed_match(bot1, bot2, max_turns, verbose, recorder, stream)
+    if has_native_async(bot1) or has_native_async(bot2):
+        return asyncio.run(run_match_async(bot1, bot2, max_turns, verbose, recorder, stream))
 
-def run_match(bot1, bot2, max_turns=100, verbose=False):
-    engine = GameEngine(bot1, bot2)
+    engine = _new_engine(bot1, bot2, verbose, recorder, stream)
     winner = None
 
     for _ in range(max_turns):
@@ -9,9 +27,100 @@ def run_match(bot1, bot2, max_turns=100, verbose=False):
         if winner:
             break
 
-    engine.logger.finalize()
+    return _finish_match(engine, winner, verbose, stream)
+
+
+async def run_match_async(bot1, bot2, max_turns=100, verbose=False, recorder=None, stream=None):
+    """Play a match awaiting bots' decide_async, so I/O-bound bots decide concurrently."""
+    engine = _new_engine(bot1, bot2, verbose, recorder, stream)
+    winner = None
+
+    for _ in range(max_turns):
+        winner = await engine.run_turn_async()
+        if winner:
+            break
+
+    return _finish_match(engine, winner, verbose, stream)
+
+
+def _new_engine(bot1, bot2, verbose, recorder, stream):
+    logger = None
+    if stream is not None:
+        stream.start_match(bot1.name, bot2.name)
+        logger = GameLogger(LOG_LEVEL_VERBOSE if verbose else LOG_LEVEL_QUIET, sink=stream)
+    return GameEngine(bot1, bot2, logger=logger, recorder=recorder)
+
+
+def _finish_match(engine, winner, verbose, stream):
+    engine.finalize()
+    winner = winner or "Draw"
+    if stream is not None:
+        stream.end_match(winner if winner == "Draw" else winner.name, engine.turn)
 
     if verbose:
         engine.logger.print_log()
 
-    return winner or "Draw", engine.logger
+    return winner, engine.logger
+
+
+def derive_seed(base, *parts):
+    """Deterministic per-match seed from a base seed and identifying parts."""
+    key = ":".join(str(part) for part in (base,) + parts)
+    return random.Random(key).randrange(2 ** 31)
+
+
+def run_seeded_match(bot1, bot2, seed=None, cache=None, max_turns=100, verbose=False, recorder=None, stream=None):
+    """Play a match with the global RNG seeded, consulting a ResultCache first.
+
+    Returns (winner, turns, logger). On a cache hit nothing is played and the
+    logger is None. Without a seed the match is neither seeded nor cached.
+    Sandboxed bots have their workers seeded too, from the same seed.
+    """
+    sandboxed = (isinstance(bot1, SandboxedBot), isinstance(bot2, SandboxedBot))
+    if seed is not None and cache is not None:
+        hit = cache.get(spec_for(bot1), spec_for(bot2), seed, max_turns, sandboxed)
+        if hit is not None:
+            score, turns = hit
+            winner = bot1 if score == 1.0 else bot2 if score == 0.0 else "Draw"
+            return winner, turns, None
+
+    if seed is not None:
+        random.seed(seed)
+        for side, bot in enumerate((bot1, bot2)):
+            if isinstance(bot, SandboxedBot):
+                bot.reseed(derive_seed(seed, "sandbox", side))
+    winner, logger = run_match(bot1, bot2, max_turns=max_turns, verbose=verbose, recorder=recorder, stream=stream)
+    turns = logger.get_snapshots()[-1]["turn"]
+
+    if seed is not None and cache is not None:
+        score = 1.0 if winner is bot1 else 0.0 if winner is bot2 else 0.5
+        cache.put(spec_for(bot1), spec_for(bot2), seed, max_turns, score, turns, sandboxed)
+
+    return winner, turns, logger
+
+
+def _run_sandboxed_match(bot1, bot2, max_turns, verbose, recorder=None, stream=None):
+    # Bots that are already sandboxed keep their long-lived workers; the rest get
+    # workers for this match only. Proxies are per seat, so a mirror match (bot1 is
+    # bot2) still gets two workers, and the winner is mapped back to the caller's bot.
+    bots = (bot1, bot2)
+    owned = []
+    proxies = []
+    for bot in bots:
+        if isinstance(bot, SandboxedBot):
+            proxies.append(bot)
+        else:
+            proxy = SandboxedBot.wrap(bot)
+            owned.append(proxy)
+            proxies.append(proxy)
+
+    try:
+        winner, logger = run_match(proxies[0], proxies[1], max_turns, verbose, recorder=recorder, stream=stream)
+    finally:
+        for proxy in owned:
+            proxy.close()
+
+    for seat, proxy in enumerate(proxies):
+        if winner is proxy:
+            return bots[seat], logger
+    return winner, logger
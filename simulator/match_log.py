@@ -0,0 +1,179 @@
+"""Streaming match logs for long match series.
+
+A ``MatchLogWriter`` is a ``GameLogger`` sink: every log line, snapshot, event,
+spell, damage and collision record is written to disk as the match runs, so
+a logger attached to it keeps only the latest snapshot in memory. Matches are
+appended one after another as JSON lines; with a ``.gz`` path each match is
+its own gzip member, so the whole file still reads with ``zcat``.
+
+Alongside goes ``<path>.index.jsonl`` with one line per finished match: the
+bots, the result and the byte range of its log. ``MatchLogReader`` uses it to
+load a single match back into a ``GameLogger`` (for the visualizer) without
+reading the rest of the file. The index line is written last, so a match that
+was cut off by a crash is not listed and is overwritten on the next run.
+"""
+
+import json
+import os
+import zlib
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from game.logger import LOG_LEVEL_QUIET, GameLogger
+
+_GZIP_WBITS = 31
+
+
+class MatchLogWriter:
+    """Append-only match log; pass it as ``GameLogger(sink=writer)``."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.index_path = path + ".index.jsonl"
+        self._compress = path.endswith(".gz")
+
+        entries, index_end = _read_index(self.index_path)
+        end = entries[-1]["offset"] + entries[-1]["length"] if entries else 0
+        self._next_match = entries[-1]["match"] + 1 if entries else 0
+
+        # Cut off whatever an interrupted run left after the last indexed match
+        self._file = open(path, "r+b" if os.path.exists(path) else "w+b")
+        self._file.truncate(end)
+        self._file.seek(end)
+        self._index = open(self.index_path, "a")
+        self._index.truncate(index_end)
+
+        self._match: Optional[dict] = None
+        self._compressor = None
+        self._length = 0
+
+    @property
+    def matches_written(self) -> int:
+        return self._next_match
+
+    def start_match(self, bot1_name: str, bot2_name: str, **meta) -> int:
+        """Begin a new match and return its id. ``meta`` is stored in the index line."""
+        self._match = {"match": self._next_match, "bot1": bot1_name, "bot2": bot2_name, **meta}
+        self._match["offset"] = self._file.tell()
+        self._compressor = zlib.compressobj(wbits=_GZIP_WBITS) if self._compress else None
+        self._length = 0
+        return self._match["match"]
+
+    def write(self, kind: str, data) -> None:
+        if self._match is None:
+            raise RuntimeError("start_match() must be called before writing match records")
+        line = (json.dumps([kind, data], separators=(",", ":")) + "\n").encode()
+        self._write_bytes(self._compressor.compress(line) if self._compressor else line)
+
+    def end_match(self, winner: str, turns: int) -> None:
+        """Finish the match's log and add it to the index."""
+        if self._match is None:
+            return
+        if self._compressor:
+            self._write_bytes(self._compressor.flush())
+        self._file.flush()
+
+        entry = dict(self._match, length=self._length, winner=winner, turns=turns)
+        self._index.write(json.dumps(entry) + "\n")
+        self._index.flush()
+
+        self._next_match += 1
+        self._match = None
+        self._compressor = None
+
+    def _write_bytes(self, chunk: bytes) -> None:
+        if chunk:
+            self._file.write(chunk)
+            self._length += len(chunk)
+
+    def close(self) -> None:
+        """Close the files. A match still in progress is not indexed."""
+        self._match = None
+        self._file.close()
+        self._index.close()
+
+    def __enter__(self) -> "MatchLogWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class MatchLogReader:
+    """Index-driven access to the matches of a ``MatchLogWriter`` file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._entries, _ = _read_index(path + ".index.jsonl")
+        self._by_match = {entry["match"]: entry for entry in self._entries}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def matches(self) -> List[dict]:
+        """Index lines of all finished matches: id, bots, winner, turns and byte range."""
+        return list(self._entries)
+
+    def read(self, match: int) -> bytes:
+        """The raw (decompressed) JSON lines of one match."""
+        entry = self._by_match[match]
+        with open(self.path, "rb") as f:
+            f.seek(entry["offset"])
+            data = f.read(entry["length"])
+        if self.path.endswith(".gz"):
+            data = zlib.decompress(data, wbits=_GZIP_WBITS)
+        return data
+
+    def records(self, match: int, kinds: Optional[Sequence[str]] = None) -> Iterator[Tuple[str, object]]:
+        """The (kind, data) records of one match, in the order they were logged.
+
+        With ``kinds`` other records are skipped before being parsed, which
+        makes reading e.g. only events much cheaper than reading snapshots too.
+        """
+        data = self.read(match)
+        prefixes = tuple(f'["{kind}",'.encode() for kind in kinds) if kinds else None
+        for line in data.splitlines():
+            if prefixes and not line.startswith(prefixes):
+                continue
+            kind, payload = json.loads(line)
+            yield kind, payload
+
+    def load(self, match: int) -> GameLogger:
+        """Rebuild the full in-memory ``GameLogger`` of one match."""
+        logger = GameLogger(LOG_LEVEL_QUIET)
+        for kind, data in self.records(match):
+            if kind == "turn":
+                logger.new_turn(data)
+            elif kind == "log":
+                logger.log(data)
+            elif kind == "state":
+                logger.snapshots.append(data)
+                logger.state_index = data["state_index"] + 1
+            elif kind == "event":
+                logger.events.append(data)
+            elif kind == "spell":
+                logger.spells.append(data)
+            elif kind == "damage":
+                logger.damage_events.append(data)
+            elif kind == "collision":
+                logger.collision_events.append(data)
+        logger.finalize()
+        return logger
+
+
+def _read_index(path: str) -> Tuple[List[dict], int]:
+    """Complete index entries and the byte length they take up."""
+    if not os.path.exists(path):
+        return [], 0
+    entries = []
+    end = 0
+    with open(path, "rb") as f:
+        for line in f:
+            try:
+                if not line.endswith(b"\n"):
+                    raise ValueError("unterminated line")
+                entries.append(json.loads(line))
+            except ValueError:
+                # Torn last line from an interrupted write
+                break
+            end += len(line)
+    return entries, end
@@ -0,0 +1,129 @@
+"""Memoized decisions for opponents that are pure functions of the state.
+
+Training plays the same builtin opponents over and over, and many of them
+always answer the same state with the same action. ``MemoizedBot`` caches
+``decide`` under a hash of the canonical (key-sorted JSON) state so repeated
+states cost a dictionary lookup instead of a decision.
+
+Caching is only correct for deterministic, stateless bots, so it is opt-in and
+guarded: ``check_deterministic`` replays a sample of states on a copy of the
+bot, in a different order and with the random generators reseeded, and
+``memoize_if_deterministic`` only wraps bots whose answers never change.
+"""
+
+import copy
+import hashlib
+import json
+import random
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+from bots.bot_interface import BotInterface
+from simulator.cache import spec_for
+
+DEFAULT_MAX_ENTRIES = 100_000
+DEFAULT_SAMPLE_SIZE = 200
+
+
+def state_key(state: Dict[str, Any]) -> str:
+    """Hash of the canonical JSON form of a state."""
+    canonical = json.dumps(state, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+
+class MemoizedBot(BotInterface):
+    """Wraps a deterministic bot and caches its decisions, least recently used first out."""
+
+    def __init__(self, bot: BotInterface, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.bot = bot
+        self.max_entries = max_entries
+        # Memoizing doesn't change what the bot plays, so results cache under the wrapped bot
+        self.spec = spec_for(bot)
+        self.hits = 0
+        self.misses = 0
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    @property
+    def name(self):
+        return self.bot.name
+
+    @property
+    def sprite_path(self):
+        return self.bot.sprite_path
+
+    @property
+    def minion_sprite_path(self):
+        return self.bot.minion_sprite_path
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def decide(self, state):
+        key = state_key(state)
+        action = self._cache.get(key)
+        if action is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            # Callers may modify the action they get back
+            return copy.deepcopy(action)
+
+        self.misses += 1
+        action = self.bot.decide(state)
+        self._cache[key] = copy.deepcopy(action)
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return action
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+def check_deterministic(bot: BotInterface, states: Sequence[Dict[str, Any]]) -> bool:
+    """True if ``bot`` gives the same action for each state however it is asked.
+
+    The states are decided twice on a copy of the bot: in order with the random
+    generators seeded one way, then in reverse with them seeded another way. A
+    bot that keeps state between turns or draws random numbers answers some
+    state differently and is rejected, as is a bot that raises. The caller's
+    random state is left untouched.
+    """
+    try:
+        probe = copy.deepcopy(bot)
+    except Exception:
+        return False
+
+    saved = random.getstate(), np.random.get_state()
+    try:
+        first = _decide_all(probe, states, range(len(states)), seed=1)
+        second = _decide_all(probe, states, reversed(range(len(states))), seed=2)
+    except Exception:
+        return False
+    finally:
+        random.setstate(saved[0])
+        np.random.set_state(saved[1])
+    return first == second
+
+
+def _decide_all(bot, states, order, seed) -> Dict[int, str]:
+    random.seed(seed)
+    np.random.seed(seed)
+    return {i: json.dumps(bot.decide(copy.deepcopy(states[i])), sort_keys=True, default=repr) for i in order}
+
+
+def memoize_if_deterministic(
+    bot: BotInterface,
+    states: Sequence[Dict[str, Any]],
+    sample_size: Optional[int] = DEFAULT_SAMPLE_SIZE,
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+) -> BotInterface:
+    """``bot`` wrapped in a ``MemoizedBot`` if it checks out as deterministic, else ``bot`` itself."""
+    sample = list(states)
+    if sample_size is not None and len(sample) > sample_size:
+        sample = random.Random(0).sample(sample, sample_size)
+    if not sample or not check_deterministic(bot, sample):
+        return bot
+    return MemoizedBot(bot, max_entries=max_entries)
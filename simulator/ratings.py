@@ -0,0 +1,94 @@
+"""Incremental rating systems for league play.
+
+Both systems are updated one game at a time, so a league can refresh its table
+as results arrive from the worker pool instead of waiting for the whole schedule.
+Scores are from the first bot's point of view: 1 win, 0.5 draw, 0 loss.
+"""
+
+import math
+from typing import Dict, List, Tuple
+
+DEFAULT_RATING = 1500.0
+DEFAULT_ELO_K = 32.0
+DEFAULT_GLICKO_RD = 350.0
+MIN_GLICKO_RD = 30.0
+
+_GLICKO_Q = math.log(10) / 400
+
+
+def expected_score(rating_a: float, rating_b: float) -> float:
+    """Probability-like expected score of A against B under the Elo model."""
+    return 1.0 / (1.0 + 10 ** ((rating_b - rating_a) / 400))
+
+
+class Elo:
+    """Classic Elo with a fixed K-factor."""
+
+    def __init__(self, k: float = DEFAULT_ELO_K, initial: float = DEFAULT_RATING):
+        self.k = k
+        self.initial = initial
+        self.ratings: Dict[str, float] = {}
+        self.games: Dict[str, int] = {}
+
+    def rating(self, name: str) -> float:
+        return self.ratings.get(name, self.initial)
+
+    def update(self, name_a: str, name_b: str, score_a: float) -> None:
+        rating_a, rating_b = self.rating(name_a), self.rating(name_b)
+        delta = self.k * (score_a - expected_score(rating_a, rating_b))
+        self.ratings[name_a] = rating_a + delta
+        self.ratings[name_b] = rating_b - delta
+        for name in (name_a, name_b):
+            self.games[name] = self.games.get(name, 0) + 1
+
+    def leaderboard(self) -> List[Tuple[str, float]]:
+        """(name, rating) pairs, best first."""
+        return sorted(self.ratings.items(), key=lambda item: item[1], reverse=True)
+
+
+class Glicko:
+    """Glicko-1, treating every game as its own rating period.
+
+    The rating deviation (RD) shrinks as a bot plays more games, so the table
+    also says how much each rating can still be trusted.
+    """
+
+    def __init__(
+        self, initial: float = DEFAULT_RATING, initial_rd: float = DEFAULT_GLICKO_RD, min_rd: float = MIN_GLICKO_RD
+    ):
+        self.initial = initial
+        self.initial_rd = initial_rd
+        self.min_rd = min_rd
+        self.ratings: Dict[str, Tuple[float, float]] = {}
+
+    def rating(self, name: str) -> Tuple[float, float]:
+        """(rating, RD) for ``name``."""
+        return self.ratings.get(name, (self.initial, self.initial_rd))
+
+    @staticmethod
+    def _g(rd: float) -> float:
+        return 1.0 / math.sqrt(1 + 3 * _GLICKO_Q**2 * rd**2 / math.pi**2)
+
+    def _updated(self, player: Tuple[float, float], opponent: Tuple[float, float], score: float):
+        rating, rd = player
+        opp_rating, opp_rd = opponent
+        g = self._g(opp_rd)
+        expected = 1.0 / (1.0 + 10 ** (-g * (rating - opp_rating) / 400))
+        d_squared = 1.0 / (_GLICKO_Q**2 * g**2 * expected * (1 - expected))
+        denominator = 1.0 / rd**2 + 1.0 / d_squared
+        new_rating = rating + _GLICKO_Q / denominator * g * (score - expected)
+        new_rd = max(self.min_rd, math.sqrt(1.0 / denominator))
+        return new_rating, new_rd
+
+    def update(self, name_a: str, name_b: str, score_a: float) -> None:
+        a, b = self.rating(name_a), self.rating(name_b)
+        self.ratings[name_a] = self._updated(a, b, score_a)
+        self.ratings[name_b] = self._updated(b, a, 1.0 - score_a)
+
+    def leaderboard(self) -> List[Tuple[str, float, float]]:
+        """(name, rating, RD) triples, best first."""
+        return sorted(
+            ((name, rating, rd) for name, (rating, rd) in self.ratings.items()),
+            key=lambda item: item[1],
+            reverse=True,
+        )
@@ -0,0 +1,209 @@
+"""Offscreen rendering of recorded matches to video, GIF or PNG frames.
+
+The visualizer runs on SDL's dummy video driver and hands every frame to a
+writer instead of a window, so frames are produced as fast as they can be
+drawn rather than at ``FPS``. MP4 and GIF are encoded by an ``ffmpeg`` process
+fed raw frames through a pipe; PNG frames need nothing beyond pygame. Matches
+are independent, so a match log is rendered on a pool of worker processes,
+one match per task.
+"""
+
+import os
+import re
+import shutil
+import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence
+
+import pygame
+
+from simulator.assets import ASSETS
+from simulator.match_log import MatchLogReader
+from simulator.visualizer import FPS, Visualizer
+
+FORMATS = ("mp4", "gif", "png")
+DEFAULT_FORMAT = "mp4"
+
+
+class Portrait(NamedTuple):
+    """What the visualizer needs of a bot, cheap to send to another process."""
+
+    name: str
+    sprite_path: Optional[str] = None
+    minion_sprite_path: Optional[str] = None
+
+    @classmethod
+    def of(cls, bot) -> "Portrait":
+        return cls(bot.name, bot.sprite_path, bot.minion_sprite_path)
+
+
+def require_ffmpeg() -> str:
+    path = shutil.which("ffmpeg")
+    if path is None:
+        raise RuntimeError("ffmpeg was not found on PATH; install it, or render PNG frames instead")
+    return path
+
+
+class PngSequenceWriter:
+    """Saves each frame as ``frame_00000.png``, ``frame_00001.png``, ... in a directory."""
+
+    def __init__(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.frames = 0
+        self._last_pixels: Optional[bytes] = None
+
+    def write(self, surface) -> None:
+        path = os.path.join(self.directory, f"frame_{self.frames:05d}.png")
+        pixels = pygame.image.tobytes(surface, "RGB")
+        if pixels == self._last_pixels:
+            # Held frames (pauses, the end screen) repeat the previous one; copying beats re-encoding
+            shutil.copyfile(os.path.join(self.directory, f"frame_{self.frames - 1:05d}.png"), path)
+        else:
+            pygame.image.save(surface, path)
+            self._last_pixels = pixels
+        self.frames += 1
+
+    def close(self) -> None:
+        pass
+
+
+class FfmpegWriter:
+    """Pipes raw RGB frames into ffmpeg, which encodes them to MP4 (H.264) or GIF."""
+
+    def __init__(self, path: str, fps: int):
+        self.ffmpeg = require_ffmpeg()
+        self.path = path
+        self.fps = fps
+        self.frames = 0
+        self._process: Optional[subprocess.Popen] = None
+
+    def _start(self, size) -> None:
+        width, height = size
+        command = [
+            self.ffmpeg,
+            "-y",
+            "-loglevel",
+            "error",
+            "-f",
+            "rawvideo",
+            "-pix_fmt",
+            "rgb24",
+            "-s",
+            f"{width}x{height}",
+            "-r",
+            str(self.fps),
+            "-i",
+            "-",
+        ]
+        if self.path.endswith(".gif"):
+            # A palette computed from the whole clip looks far better than the default one
+            command += ["-vf", "split[a][b];[a]palettegen[p];[b][p]paletteuse"]
+        else:
+            command += ["-c:v", "libx264", "-pix_fmt", "yuv420p", "-preset", "veryfast"]
+        command.append(self.path)
+        self._process = subprocess.Popen(command, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+
+    def write(self, surface) -> None:
+        if self._process is None:
+            self._start(surface.get_size())
+        self._process.stdin.write(pygame.image.tobytes(surface, "RGB"))
+        self.frames += 1
+
+    def close(self) -> None:
+        if self._process is None:
+            return
+        _, stderr = self._process.communicate()
+        if self._process.returncode:
+            raise RuntimeError(f"ffmpeg failed on {self.path}: {stderr.decode(errors='replace').strip()}")
+
+
+def open_writer(output: str, fmt: str, fps: int):
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format {fmt!r}, expected one of {FORMATS}")
+    if fmt == "png":
+        return PngSequenceWriter(output)
+    return FfmpegWriter(output, fps)
+
+
+def render_logger(logger, bot1, bot2, output: str, fmt: str = DEFAULT_FORMAT) -> int:
+    """Render the match recorded by ``logger`` to ``output``; returns the number of frames."""
+    writer = open_writer(output, fmt, FPS)
+    try:
+        Visualizer(logger, bot1, bot2, on_frame=writer.write).run(logger.get_snapshots(), False)
+    finally:
+        writer.close()
+    return writer.frames
+
+
+def output_name(match: int, bot1: str, bot2: str, fmt: str) -> str:
+    """File name for a rendered match; PNG frames go to a directory of the same name."""
+    stem = re.sub(r"[^A-Za-z0-9_.-]+", "_", f"match_{match:04d}_{bot1}_vs_{bot2}")
+    return stem if fmt == "png" else f"{stem}.{fmt}"
+
+
+def _render_worker(
+    path: str, match: int, portraits: Dict[str, Portrait], output: str, fmt: str, atlas: Optional[str]
+) -> dict:
+    start = time.perf_counter()
+    if atlas and ASSETS.atlas_path != atlas:
+        ASSETS.use_atlas(atlas)
+    reader = MatchLogReader(path)
+    entry = next(entry for entry in reader.matches() if entry["match"] == match)
+    bot1 = portraits.get(entry["bot1"], Portrait(entry["bot1"]))
+    bot2 = portraits.get(entry["bot2"], Portrait(entry["bot2"]))
+    frames = render_logger(reader.load(match), bot1, bot2, output, fmt)
+    if atlas and ASSETS.unsaved:
+        ASSETS.save_atlas(atlas)
+    return {"match": match, "output": output, "frames": frames, "seconds": time.perf_counter() - start}
+
+
+def render_match_log(
+    path: str,
+    out_dir: str,
+    matches: Optional[Sequence[int]] = None,
+    fmt: str = DEFAULT_FORMAT,
+    portraits: Optional[Dict[str, Portrait]] = None,
+    workers: Optional[int] = None,
+    on_done: Optional[Callable[[dict], None]] = None,
+    atlas: Optional[str] = None,
+) -> List[dict]:
+    """Render matches of a streamed match log (default: all of them) into ``out_dir``.
+
+    ``portraits`` maps bot names to their sprites; bots missing from it are
+    drawn with the default sprites. Workers start from the sprite ``atlas``,
+    if given, and add whatever they had to load to it. A match that fails to
+    render is reported with an ``error`` instead of stopping the others.
+    Returns one row per match, in match order.
+    """
+    if fmt != "png":
+        require_ffmpeg()
+    os.makedirs(out_dir, exist_ok=True)
+    entries = {entry["match"]: entry for entry in MatchLogReader(path).matches()}
+    wanted = sorted(entries) if matches is None else list(matches)
+    missing = [match for match in wanted if match not in entries]
+    if missing:
+        raise ValueError(f"Matches not found in {path}: {missing}")
+
+    rows = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {}
+        for match in wanted:
+            entry = entries[match]
+            output = os.path.join(out_dir, output_name(match, entry["bot1"], entry["bot2"], fmt))
+            future = executor.submit(_render_worker, path, match, portraits or {}, output, fmt, atlas)
+            futures[future] = (match, output)
+
+        for future in as_completed(futures):
+            match, output = futures[future]
+            try:
+                row = future.result()
+            except Exception as e:
+                row = {"match": match, "output": output, "error": f"{type(e).__name__}: {e}"}
+            rows.append(row)
+            if on_done:
+                on_done(row)
+
+    rows.sort(key=lambda row: row["match"])
+    return rows
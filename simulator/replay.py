@@ -0,0 +1,233 @@
+"""Seekable replays of recorded matches.
+
+``Replay`` reads one match of a streamed match log and indexes it without
+parsing the snapshots: it keeps the raw line of every state and the state each
+turn starts at (the keyframes), and parses a state only when it is shown. The
+spells and damage the visualizer draws are small and read up front, which lets
+a ``Replay`` stand in for the match's ``GameLogger``.
+
+``ReplayPlayer`` drives a ``Visualizer`` over a replay. Seeking renders the
+target state directly, never the states in between, so jumping to the last
+turn of a long match costs one frame; playback runs at 0.25x to 16x and can
+skip the transition animations altogether.
+"""
+
+import bisect
+import json
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+import pygame
+
+from bots.bot_interface import BotInterface
+from simulator.match_log import MatchLogReader
+from simulator.visualizer import ANIMATION_DURATION, FPS, Visualizer
+
+MIN_SPEED = 0.25
+MAX_SPEED = 16.0
+DEFAULT_CACHE_SIZE = 64
+SEEK_TURNS = 10  # turns skipped by PageUp / PageDown
+
+
+def check_speed(speed: float) -> float:
+    if not MIN_SPEED <= speed <= MAX_SPEED:
+        raise ValueError(f"Speed must be between {MIN_SPEED:g}x and {MAX_SPEED:g}x, got {speed:g}")
+    return speed
+
+
+class Replay:
+    """One match of a match log, indexed by state and turn."""
+
+    def __init__(self, reader: MatchLogReader, match: int, cache_size: int = DEFAULT_CACHE_SIZE):
+        entry = next((entry for entry in reader.matches() if entry["match"] == match), None)
+        if entry is None:
+            raise ValueError(f"Match {match} not found in {reader.path}")
+        self.match = match
+        self.bot1: str = entry["bot1"]
+        self.bot2: str = entry["bot2"]
+        self.winner: str = entry["winner"]
+        self.turns: int = entry["turns"]
+        self.cache_size = cache_size
+        self.parsed = 0  # states parsed so far
+
+        self.spells: List[Dict[str, Any]] = []
+        self.damage_events: List[Dict[str, Any]] = []
+        self.state_turns: List[int] = []  # turn of each state, never decreasing
+        self.keyframes: Dict[int, int] = {}  # turn -> index of its first state
+        self._lines: List[bytes] = []
+        self._cache: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+
+        turn = 0
+        for line in reader.read(match).splitlines():
+            if line.startswith(b'["state",'):
+                self.keyframes.setdefault(turn, len(self._lines))
+                self.state_turns.append(turn)
+                self._lines.append(line)
+            elif line.startswith(b'["turn",'):
+                turn = json.loads(line)[1]
+            elif line.startswith(b'["spell",'):
+                self.spells.append(json.loads(line)[1])
+            elif line.startswith(b'["damage",'):
+                self.damage_events.append(json.loads(line)[1])
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def state(self, index: int) -> Dict[str, Any]:
+        """The snapshot at ``index``, parsed on first use; don't change it."""
+        state = self._cache.get(index)
+        if state is not None:
+            self._cache.move_to_end(index)
+            return state
+        state = json.loads(self._lines[index])[1]
+        self.parsed += 1
+        self._cache[index] = state
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return state
+
+    def keyframe(self, turn: int) -> int:
+        """Index of the first state of ``turn``, or of the nearest turn that has one."""
+        index = self.keyframes.get(turn)
+        if index is None:
+            index = min(bisect.bisect_left(self.state_turns, turn), len(self) - 1)
+        return index
+
+
+class ReplayPlayer:
+    """Shows a ``Replay`` and moves through it; ``play`` adds keyboard controls.
+
+    Keys: left/right a turn back/forward, PageUp/PageDown ``SEEK_TURNS`` turns,
+    Home/End the first/last state, up/down double/halve the speed, space pause,
+    A toggle animations, Esc or Q quit.
+    """
+
+    def __init__(
+        self,
+        replay: Replay,
+        bot1: BotInterface,
+        bot2: BotInterface,
+        speed: float = 1.0,
+        animate: bool = True,
+        on_frame: Optional[Callable[[pygame.Surface], None]] = None,
+    ):
+        if not len(replay):
+            raise ValueError(f"Match {replay.match} has no recorded states")
+        check_speed(speed)
+        self.replay = replay
+        self.visualizer = Visualizer(replay, bot1, bot2, on_frame=on_frame)
+        self.visualizer.on_event = self._queue
+        self.animate = animate
+        self.position = 0
+        self.paused = False
+        self.running = True
+        self._pending: List[pygame.event.Event] = []
+        self.speed = speed
+
+    @property
+    def speed(self) -> float:
+        return self.visualizer.speed
+
+    @speed.setter
+    def speed(self, speed: float) -> None:
+        self.visualizer.speed = check_speed(speed)
+
+    @property
+    def turn(self) -> int:
+        return self.replay.state_turns[self.position]
+
+    def show(self) -> None:
+        """Render the current state as one full frame."""
+        state = self.replay.state(self.position)
+        self.visualizer.info_bar_state = state
+        self.visualizer.render_frame(state, state["turn"])
+        if self.visualizer.on_frame is not None:
+            self.visualizer.emit_frame()
+        else:
+            pygame.display.set_caption(
+                f"Replay: {self.replay.bot1} vs {self.replay.bot2} - turn {self.turn}/{self.replay.turns}"
+                f" - {self.speed:g}x{' - paused' if self.paused else ''}"
+            )
+
+    def seek(self, index: int) -> None:
+        """Jump to state ``index`` (clamped to the match) without rendering the states in between."""
+        self.position = max(0, min(index, len(self.replay) - 1))
+        self.show()
+
+    def seek_turn(self, turn: int) -> None:
+        """Jump to the first state of ``turn``."""
+        self.seek(self.replay.keyframe(max(0, turn)))
+
+    def step(self) -> bool:
+        """Move one state forward, animated unless animations are off; False at the end."""
+        if self.position + 1 >= len(self.replay):
+            return False
+        if not self.animate:
+            self.seek(self.position + 1)
+            return True
+        curr, nxt = self.replay.state(self.position), self.replay.state(self.position + 1)
+        self.visualizer.animate_transition(curr, nxt, self.position)
+        self.position += 1
+        self.visualizer.info_bar_state = nxt
+        return True
+
+    def faster(self) -> None:
+        self.speed = min(self.speed * 2, MAX_SPEED)
+
+    def slower(self) -> None:
+        self.speed = max(self.speed / 2, MIN_SPEED)
+
+    def hold_ms(self) -> int:
+        """How long a state stays on screen before the next step."""
+        return int(ANIMATION_DURATION * 1000 / self.speed)
+
+    def _queue(self, event: pygame.event.Event) -> None:
+        # Events arrive mid-animation too; they are acted on between steps
+        if event.type == pygame.KEYDOWN:
+            self._pending.append(event)
+
+    def command(self, key: int) -> None:
+        """Act on a key press."""
+        if key in (pygame.K_ESCAPE, pygame.K_q):
+            self.running = False
+        elif key == pygame.K_SPACE:
+            self.paused = not self.paused
+            self.show()
+        elif key == pygame.K_a:
+            self.animate = not self.animate
+        elif key == pygame.K_UP:
+            self.faster()
+            self.show()
+        elif key == pygame.K_DOWN:
+            self.slower()
+            self.show()
+        elif key == pygame.K_RIGHT:
+            self.seek_turn(self.turn + 1)
+        elif key == pygame.K_LEFT:
+            self.seek_turn(self.turn - 1)
+        elif key == pygame.K_PAGEDOWN:
+            self.seek_turn(self.turn + SEEK_TURNS)
+        elif key == pygame.K_PAGEUP:
+            self.seek_turn(self.turn - SEEK_TURNS)
+        elif key == pygame.K_HOME:
+            self.seek(0)
+        elif key == pygame.K_END:
+            self.seek(len(self.replay) - 1)
+
+    def play(self) -> None:
+        """Play in a window from the current state until quit; stops on the last state."""
+        visualizer = self.visualizer
+        self.show()
+        next_step = visualizer.ticks() + self.hold_ms()
+        while self.running:
+            visualizer.handle_events()
+            while self._pending and self.running:
+                self.command(self._pending.pop(0).key)
+                next_step = visualizer.ticks() + self.hold_ms()
+            if not self.paused and visualizer.ticks() >= next_step:
+                if self.step():
+                    next_step = visualizer.ticks() + self.hold_ms()
+                else:
+                    self.paused = True
+                    self.show()
+            visualizer.clock.tick(FPS)
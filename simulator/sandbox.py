@@ -0,0 +1,295 @@
+"""Out-of-process bot execution.
+
+Each ``SandboxedBot`` hosts one bot instance in a long-lived worker process and
+talks to it over a ``multiprocessing.Pipe``. The worker applies memory and CPU
+rlimits to itself, so a bot that leaks memory or loops forever only takes down
+its own worker, which is then restarted while the engine keeps going.
+"""
+
+import contextlib
+import logging
+import math
+import multiprocessing
+import os
+import random
+from typing import Any, Dict, Optional
+
+from bots.bot_interface import BotInterface
+from simulator.loader import BotSpec, load_bot
+
+logger = logging.getLogger(__name__)
+
+# Defaults for local runs (the backend passes its own settings)
+DEFAULT_MEMORY_LIMIT_MB = 1024
+DEFAULT_CPU_SECONDS = 5.0
+DEFAULT_DECIDE_TIMEOUT = 2.0
+DEFAULT_STARTUP_TIMEOUT = 60.0
+DEFAULT_MAX_RESTARTS = 3
+
+
+def default_action() -> Dict[str, Any]:
+    """Safe no-op action used whenever a sandboxed bot fails to answer."""
+    return {"move": [0, 0], "spell": None}
+
+
+def _current_vm_bytes() -> int:
+    """Virtual memory size of the current process, or 0 if it can't be read."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[0])
+        return pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return 0
+
+
+def _apply_memory_limit(memory_limit_mb: Optional[int]) -> None:
+    """Cap the address space at the worker's current size plus ``memory_limit_mb``.
+
+    The budget is relative to the size after the bot has been loaded, so a forked
+    worker does not fail immediately because of what it inherited from the parent.
+    """
+    if not memory_limit_mb:
+        return
+    try:
+        import resource
+    except ImportError:  # Windows: no rlimits, timeouts still apply
+        return
+    limit = _current_vm_bytes() + memory_limit_mb * 1024 * 1024
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def _arm_cpu_limit(cpu_seconds: Optional[float]) -> None:
+    """Allow at most ``cpu_seconds`` of additional CPU time before SIGXCPU.
+
+    RLIMIT_CPU is cumulative, so the soft limit is moved forward before every
+    decision; the kernel then kills a bot that spins inside ``decide``.
+    """
+    if not cpu_seconds:
+        return
+    try:
+        import resource
+    except ImportError:
+        return
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    soft = int(usage.ru_utime + usage.ru_stime) + math.ceil(cpu_seconds) + 1
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _worker_main(conn, spec: BotSpec, memory_limit_mb: Optional[int], cpu_seconds: Optional[float]) -> None:
+    """Worker process loop: load the bot, then answer requests until closed."""
+    try:
+        bot = load_bot(spec)
+        conn.send(("ready", bot.name, bot.sprite_path, bot.minion_sprite_path))
+    except BaseException as e:
+        with contextlib.suppress(Exception):
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+        return
+
+    _apply_memory_limit(memory_limit_mb)
+
+    while True:
+        try:
+            request = conn.recv()
+        except (EOFError, OSError):
+            return
+
+        op = request[0]
+        if op == "decide":
+            _arm_cpu_limit(cpu_seconds)
+            try:
+                reply = ("ok", bot.decide(request[1]))
+            except MemoryError:
+                # Past the rlimit the interpreter itself is unreliable; let the parent restart us
+                return
+            except Exception as e:
+                reply = ("error", f"{type(e).__name__}: {e}")
+            conn.send(reply)
+        elif op == "seed":
+            random.seed(request[1])
+        elif op == "game_over":
+            hook = getattr(bot, "game_over", None)
+            if callable(hook):
+                with contextlib.suppress(Exception):
+                    hook(request[1])
+        elif op == "close":
+            return
+
+
+class SandboxedBot(BotInterface):
+    """Proxy that runs a bot in a worker process with resource limits.
+
+    ``decide`` never raises: on error, timeout or worker crash the default action
+    is returned and (for timeouts and crashes) the worker is restarted, up to
+    ``max_restarts`` times, after which the bot only plays the default action.
+    """
+
+    def __init__(
+        self,
+        spec: BotSpec,
+        memory_limit_mb: Optional[int] = DEFAULT_MEMORY_LIMIT_MB,
+        cpu_seconds: Optional[float] = DEFAULT_CPU_SECONDS,
+        decide_timeout: float = DEFAULT_DECIDE_TIMEOUT,
+        startup_timeout: float = DEFAULT_STARTUP_TIMEOUT,
+        max_restarts: int = DEFAULT_MAX_RESTARTS,
+        start_method: Optional[str] = None,
+    ):
+        self.spec = spec
+        self.memory_limit_mb = memory_limit_mb
+        self.cpu_seconds = cpu_seconds
+        self.decide_timeout = decide_timeout
+        self.startup_timeout = startup_timeout
+        self.max_restarts = max_restarts
+        # "spawn" for callers with threads running, where forking could copy a held lock
+        self._context = multiprocessing.get_context(start_method)
+
+        self.restarts = 0
+        self.timeouts = 0
+        self.errors = 0
+
+        self._name = spec.qualname
+        self._sprite_path: Optional[str] = None
+        self._minion_sprite_path: Optional[str] = None
+        self._process: Optional[multiprocessing.Process] = None
+        self._conn = None
+        self._disabled = False
+        self._seed: Optional[int] = None
+        self._start()
+
+    @classmethod
+    def wrap(cls, bot: BotInterface, **kwargs) -> "SandboxedBot":
+        """Sandbox a freshly constructed copy of ``bot``'s class."""
+        if isinstance(bot, SandboxedBot):
+            return bot
+        return cls(BotSpec.of(bot), **kwargs)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def sprite_path(self) -> Optional[str]:
+        return self._sprite_path
+
+    @property
+    def minion_sprite_path(self) -> Optional[str]:
+        return self._minion_sprite_path
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._process.pid if self._process else None
+
+    def _start(self) -> None:
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self.spec, self.memory_limit_mb, self.cpu_seconds),
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        self._process = process
+        self._conn = parent_conn
+
+        if not parent_conn.poll(self.startup_timeout):
+            self._kill()
+            raise RuntimeError(f"Bot worker for {self.spec.qualname} did not start within {self.startup_timeout}s")
+        try:
+            message = parent_conn.recv()
+        except (EOFError, OSError) as e:
+            self._kill()
+            raise RuntimeError(f"Bot worker for {self.spec.qualname} died during startup") from e
+        if message[0] != "ready":
+            self._kill()
+            raise RuntimeError(f"Bot worker for {self.spec.qualname} failed to load: {message[1]}")
+        _, self._name, self._sprite_path, self._minion_sprite_path = message
+        if self._seed is not None:
+            parent_conn.send(("seed", self._seed))
+
+    def _kill(self) -> None:
+        if self._conn is not None:
+            with contextlib.suppress(Exception):
+                self._conn.close()
+            self._conn = None
+        if self._process is not None:
+            if self._process.is_alive():
+                self._process.kill()
+            self._process.join(timeout=1.0)
+            self._process = None
+
+    def _restart(self, reason: str) -> None:
+        self._kill()
+        if self.restarts >= self.max_restarts:
+            logger.error(f"Sandboxed bot {self.name} {reason}; restart budget exhausted, bot disabled")
+            self._disabled = True
+            return
+        self.restarts += 1
+        logger.warning(f"Sandboxed bot {self.name} {reason}; restarting worker ({self.restarts}/{self.max_restarts})")
+        try:
+            self._start()
+        except RuntimeError as e:
+            logger.error(f"Failed to restart sandboxed bot {self.name}: {e}")
+            self._disabled = True
+
+    def decide(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        if self._disabled or self._conn is None:
+            return default_action()
+
+        try:
+            self._conn.send(("decide", state))
+            if not self._conn.poll(self.decide_timeout):
+                self.timeouts += 1
+                self._restart(f"timed out after {self.decide_timeout}s")
+                return default_action()
+            status, payload = self._conn.recv()
+        except (EOFError, OSError):
+            exitcode = None
+            if self._process is not None:
+                self._process.join(timeout=0.5)
+                exitcode = self._process.exitcode
+            self._restart(f"worker crashed (exit code {exitcode})")
+            return default_action()
+
+        if status != "ok":
+            self.errors += 1
+            logger.warning(f"Sandboxed bot {self.name} raised {payload}")
+            return default_action()
+        return payload
+
+    def reseed(self, seed: int) -> None:
+        """Seed the ``random`` module in the worker, which doesn't share the parent's RNG.
+
+        A restarted worker is seeded again with the last seed.
+        """
+        self._seed = seed
+        if self._conn is None:
+            return
+        with contextlib.suppress(EOFError, OSError):
+            self._conn.send(("seed", seed))
+
+    def game_over(self, won: bool) -> None:
+        """Forward the end-of-match hook for bots that learn between matches."""
+        if self._conn is None:
+            return
+        with contextlib.suppress(EOFError, OSError):
+            self._conn.send(("game_over", won))
+
+    def close(self) -> None:
+        """Stop the worker process."""
+        if self._conn is not None:
+            with contextlib.suppress(EOFError, OSError):
+                self._conn.send(("close",))
+        if self._process is not None:
+            self._process.join(timeout=1.0)
+        self._kill()
+
+    def __enter__(self) -> "SandboxedBot":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,140 @@
+"""Sequential testing for head-to-head evaluations.
+
+Instead of always playing a fixed number of games, games are played in parallel
+batches and a sequential probability ratio test (SPRT) is updated after every
+batch. Play stops as soon as the test is confident that one bot is stronger.
+"""
+
+import math
+import os
+import random
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+from typing import List, NamedTuple, Optional
+
+from simulator.cache import ResultCache
+from simulator.league import play_game
+from simulator.loader import BotSpec
+from simulator.match import derive_seed
+
+DEFAULT_CONFIDENCE = 0.95
+DEFAULT_MARGIN = 0.1
+
+
+class SPRT:
+    """SPRT on bot1's expected score (win 1, draw 0.5, loss 0).
+
+    H0: score = 0.5 - margin (bot2 is stronger) against
+    H1: score = 0.5 + margin (bot1 is stronger), with both error rates set to
+    ``1 - confidence``. If the bots are closer than ``margin`` the test can run
+    long, so callers always cap the number of games.
+    """
+
+    def __init__(self, confidence: float = DEFAULT_CONFIDENCE, margin: float = DEFAULT_MARGIN):
+        if not 0.5 < confidence < 1:
+            raise ValueError("confidence must be between 0.5 and 1")
+        if not 0 < margin < 0.5:
+            raise ValueError("margin must be between 0 and 0.5")
+        error = 1 - confidence
+        p0, p1 = 0.5 - margin, 0.5 + margin
+        self._win_step = math.log(p1 / p0)
+        self._loss_step = math.log((1 - p1) / (1 - p0))
+        self.upper = math.log((1 - error) / error)
+        self.lower = math.log(error / (1 - error))
+        self.llr = 0.0
+        self.games = 0
+
+    def add(self, score: float) -> None:
+        self.llr += score * self._win_step + (1 - score) * self._loss_step
+        self.games += 1
+
+    @property
+    def decision(self) -> Optional[str]:
+        """ "bot1" or "bot2" once one side is significantly stronger, else None."""
+        if self.llr >= self.upper:
+            return "bot1"
+        if self.llr <= self.lower:
+            return "bot2"
+        return None
+
+
+class SequentialResult(NamedTuple):
+    decision: Optional[str]
+    scores: List[float]
+    turns: List[int]
+    errors: List[str]
+    max_games: int
+
+    @property
+    def games_saved(self) -> int:
+        return self.max_games - len(self.scores) - len(self.errors)
+
+
+def play_until_confident(
+    spec1: BotSpec,
+    spec2: BotSpec,
+    max_games: int,
+    confidence: float = DEFAULT_CONFIDENCE,
+    margin: float = DEFAULT_MARGIN,
+    workers: Optional[int] = None,
+    max_turns: int = 100,
+    on_batch=None,
+    seed: Optional[int] = None,
+    cache: Optional[ResultCache] = None,
+) -> SequentialResult:
+    """Play batches of games between two bots until the SPRT decides or ``max_games`` is reached.
+
+    Sides alternate between games; scores are always from bot1's point of view.
+    ``on_batch(sprt)`` is called after every batch. With a ``seed`` game N is
+    always played with the same seed and can be read from ``cache``. A game that
+    fails is left out of the test and its error is returned in ``errors``; it
+    still counts towards ``max_games``, and a broken worker pool ends the run.
+    """
+    if seed is None:
+        cache = None
+    sprt = SPRT(confidence, margin)
+    scores: List[float] = []
+    turns: List[int] = []
+    errors: List[str] = []
+
+    batch_size = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=batch_size) as executor:
+        broken = False
+        while not broken and len(scores) + len(errors) < max_games and sprt.decision is None:
+            batch = min(batch_size, max_games - len(scores) - len(errors))
+            games = []
+            for i in range(batch):
+                game = len(scores) + len(errors) + i
+                swapped = game % 2 == 1
+                first, second = (spec2, spec1) if swapped else (spec1, spec2)
+                if seed is None:
+                    game_seed = random.randrange(2**31)
+                else:
+                    game_seed = derive_seed(seed, spec1.qualname, spec2.qualname, game)
+                hit = cache.get(first, second, game_seed, max_turns) if cache is not None else None
+                if hit is not None:
+                    games.append((swapped, first, second, game_seed, hit, None))
+                    continue
+                future = executor.submit(play_game, first, second, game_seed, max_turns)
+                games.append((swapped, first, second, game_seed, None, future))
+
+            # Consume in scheduling order so sides stay balanced in what the test has seen
+            for swapped, first, second, game_seed, hit, future in games:
+                if hit is None:
+                    try:
+                        hit = future.result()
+                    except Exception as e:
+                        errors.append(f"{first.qualname} vs {second.qualname}: {type(e).__name__}: {e}")
+                        broken = broken or isinstance(e, BrokenExecutor)
+                        continue
+                    if cache is not None:
+                        cache.put(first, second, game_seed, max_turns, *hit)
+                score, game_turns = hit
+                score = 1.0 - score if swapped else score
+                sprt.add(score)
+                scores.append(score)
+                turns.append(game_turns)
+
+            if on_batch:
+                on_batch(sprt)
+
+    return SequentialResult(sprt.decision, scores, turns, errors, max_games)
@@ -0,0 +1,220 @@
+"""Swiss-system tournaments.
+
+Every round, bots are paired with opponents on the same or a close score that
+they have not met yet, and each pairing plays a best-of-N series. All games of
+a round are independent, so they are played in parallel on a worker pool.
+About log2(N) rounds rank the field about as well as a full round-robin would
+for a fraction of the games.
+
+Scoring is per pairing: 1 for winning the series, 0.5 for a tied series and 0
+for losing it. A bot left without an opponent in an odd field gets a bye,
+scored as a win, at most once per tournament when that can be avoided. Ties in
+the standings are broken by Buchholz (the sum of the opponents' scores), then
+by the share of games won.
+"""
+
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, FrozenSet, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from simulator.cache import ResultCache
+from simulator.league import play_game
+from simulator.loader import BotSpec
+from simulator.match import derive_seed
+
+DEFAULT_BEST_OF = 3
+
+
+class SwissPairing(NamedTuple):
+    """One series of a round. ``bot2`` is None for a bye."""
+
+    round: int
+    bot1: str
+    bot2: Optional[str]
+    scores: Tuple[float, ...]  # bot1's score in each game
+
+    @property
+    def points(self) -> float:
+        """bot1's series result: 1, 0.5 or 0."""
+        if self.bot2 is None:
+            return 1.0
+        total = sum(self.scores)
+        half = len(self.scores) / 2
+        return 1.0 if total > half else 0.0 if total < half else 0.5
+
+
+class SwissTable:
+    """Series results and the standings derived from them."""
+
+    def __init__(self, names: Sequence[str]):
+        self.names = list(names)
+        self.pairings: List[SwissPairing] = []
+        self.scores: Dict[str, float] = dict.fromkeys(names, 0.0)
+        self.opponents: Dict[str, List[str]] = {name: [] for name in names}
+        self.game_points: Dict[str, float] = dict.fromkeys(names, 0.0)
+        self.games: Dict[str, int] = dict.fromkeys(names, 0)
+        self.byes: Set[str] = set()
+
+    def add(self, pairing: SwissPairing) -> None:
+        self.pairings.append(pairing)
+        if pairing.bot2 is None:
+            self.scores[pairing.bot1] += 1.0
+            self.byes.add(pairing.bot1)
+            return
+        points = pairing.points
+        self.scores[pairing.bot1] += points
+        self.scores[pairing.bot2] += 1.0 - points
+        self.opponents[pairing.bot1].append(pairing.bot2)
+        self.opponents[pairing.bot2].append(pairing.bot1)
+        self.game_points[pairing.bot1] += sum(pairing.scores)
+        self.game_points[pairing.bot2] += len(pairing.scores) - sum(pairing.scores)
+        self.games[pairing.bot1] += len(pairing.scores)
+        self.games[pairing.bot2] += len(pairing.scores)
+
+    def played(self) -> Set[FrozenSet[str]]:
+        return {frozenset((p.bot1, p.bot2)) for p in self.pairings if p.bot2 is not None}
+
+    def buchholz(self, name: str) -> float:
+        return sum(self.scores[opponent] for opponent in self.opponents[name])
+
+    def standings(self) -> List[dict]:
+        rows = []
+        for name in self.names:
+            games = self.games[name]
+            rows.append(
+                {
+                    "name": name,
+                    "score": self.scores[name],
+                    "buchholz": self.buchholz(name),
+                    "game_share": self.game_points[name] / games if games else 0.0,
+                    "games": games,
+                }
+            )
+        rows.sort(key=lambda row: (-row["score"], -row["buchholz"], -row["game_share"], row["name"]))
+        return rows
+
+
+def default_rounds(bots: int) -> int:
+    return max(1, math.ceil(math.log2(bots))) if bots > 1 else 0
+
+
+def pair_round(table: SwissTable, rng: random.Random) -> List[Tuple[str, Optional[str]]]:
+    """Pair bots on equal or close scores without repeating a pairing.
+
+    Bots are ordered by score (random order within a score group) and each one
+    is matched with the highest-placed bot it has not met, backtracking when
+    that leaves the rest unpairable. If no repeat-free pairing exists at all,
+    repeats are allowed. Returns (bot1, bot2) tuples, with bot2 None for a bye.
+    """
+    order = list(table.names)
+    rng.shuffle(order)
+    order.sort(key=lambda name: -table.scores[name])
+
+    pairs: List[Tuple[str, Optional[str]]] = []
+    if len(order) % 2:
+        # Bye for the lowest-placed bot that hasn't had one yet
+        candidates = [name for name in reversed(order) if name not in table.byes] or [order[-1]]
+        order.remove(candidates[0])
+        pairs.append((candidates[0], None))
+
+    played = table.played()
+    matched = _pair_without_repeats(order, played, [_SEARCH_LIMIT])
+    if matched is None:
+        matched = _pair_without_repeats(order, set(), [_SEARCH_LIMIT])
+    return matched + pairs
+
+
+# Backtracking steps before giving up on a repeat-free pairing
+_SEARCH_LIMIT = 100_000
+
+
+def _pair_without_repeats(
+    order: List[str], played: Set[FrozenSet[str]], budget: List[int]
+) -> Optional[List[Tuple[str, str]]]:
+    if not order:
+        return []
+    first, rest = order[0], order[1:]
+    for i, opponent in enumerate(rest):
+        if frozenset((first, opponent)) in played:
+            continue
+        budget[0] -= 1
+        if budget[0] < 0:
+            return None
+        remaining = _pair_without_repeats(rest[:i] + rest[i + 1 :], played, budget)
+        if remaining is not None:
+            return [(first, opponent)] + remaining
+    return None
+
+
+def play_swiss(
+    specs: Dict[str, BotSpec],
+    rounds: Optional[int] = None,
+    best_of: int = DEFAULT_BEST_OF,
+    workers: Optional[int] = None,
+    max_turns: int = 100,
+    seed: Optional[int] = None,
+    on_pairing: Optional[Callable[[SwissPairing, SwissTable], None]] = None,
+    cache: Optional[ResultCache] = None,
+) -> SwissTable:
+    """Play a Swiss tournament between the bots in ``specs`` (name -> spec).
+
+    Sides alternate between the games of a series. Every game of a round is
+    submitted to the pool at once; pairings for the next round are made when
+    the whole round is in. ``on_pairing`` is called as each series completes.
+    """
+    if best_of < 1:
+        raise ValueError("best_of must be at least 1")
+    table = SwissTable(sorted(specs))
+    rounds = default_rounds(len(specs)) if rounds is None else rounds
+    rng = random.Random(derive_seed(seed, "swiss")) if seed is not None else random.Random()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for round_num in range(1, rounds + 1):
+            series: Dict[Tuple[str, str], List[Optional[float]]] = {}
+            futures = {}
+            for bot1, bot2 in pair_round(table, rng):
+                if bot2 is None:
+                    _finish(table, SwissPairing(round_num, bot1, None, ()), on_pairing)
+                    continue
+                series[(bot1, bot2)] = [None] * best_of
+                for game in range(best_of):
+                    first, second = (bot1, bot2) if game % 2 == 0 else (bot2, bot1)
+                    game_seed = (
+                        derive_seed(seed, round_num, bot1, bot2, game) if seed is not None else rng.randrange(2**31)
+                    )
+                    hit = cache.get(specs[first], specs[second], game_seed, max_turns) if cache else None
+                    if hit is not None:
+                        _record_game(table, series, (bot1, bot2), game, hit[0], round_num, on_pairing)
+                        continue
+                    future = executor.submit(play_game, specs[first], specs[second], game_seed, max_turns)
+                    futures[future] = (bot1, bot2, game, first, second, game_seed)
+
+            for future in as_completed(futures):
+                bot1, bot2, game, first, second, game_seed = futures[future]
+                try:
+                    score, turns = future.result()
+                except Exception as e:
+                    # The series still needs a result; a failed game counts as a draw
+                    print(f"Game {first} vs {second} failed: {type(e).__name__}: {e}")
+                    score, turns = 0.5, 0
+                else:
+                    if cache is not None:
+                        cache.put(specs[first], specs[second], game_seed, max_turns, score, turns)
+                _record_game(table, series, (bot1, bot2), game, score, round_num, on_pairing)
+
+    return table
+
+
+def _record_game(table, series, pair, game, first_score, round_num, on_pairing):
+    """Store one game's result (from its first side's view) and close the series when complete."""
+    scores = series[pair]
+    scores[game] = first_score if game % 2 == 0 else 1.0 - first_score
+    if all(score is not None for score in scores):
+        _finish(table, SwissPairing(round_num, pair[0], pair[1], tuple(scores)), on_pairing)
+
+
+def _finish(table, pairing, on_pairing):
+    table.add(pairing)
+    if on_pairing:
+        on_pairing(pairing, table)
@@ -1,11 +1,14 @@
 import math
+import os
 import sys
 import time
-from typing import Dict, List, Tuple, Optional, Any
+from collections import defaultdict
+from typing import Callable, Dict, List, Tuple, Optional, Any
 
 import pygame
 
 from bots.bot_interface import BotInterface
+from simulator.assets import ASSETS
 
 # Constants
 TILE_SIZE = 64
@@ -15,6 +18,8 @@ BOARD_SIZE = 10
 WIDTH = HEIGHT = TILE_SIZE * BOARD_SIZE
 FPS = 30
 ANIMATION_DURATION = 0.5  # seconds
+END_SCREEN_DURATION = 2.0  # seconds the result stays up when rendering offscreen
+MAX_CACHED_SURFACES = 2048  # text, scaled sprites and effect frames kept for reuse
 
 # Colors
 WHITE = (255, 255, 255)
@@ -45,6 +50,8 @@ MELEE_SPRITE_PATH = "assets/spells/melee.png"
 
 # Animation settings
 SPRITE_SCALE = 0.8  # 80% of the tile size
+SPRITE_SIZE = (int(TILE_SIZE * SPRITE_SCALE), int(TILE_SIZE * SPRITE_SCALE))
+EXPLOSION_BASE_SIZE = (2 * TILE_SIZE, 2 * TILE_SIZE)  # the explosion grows to 1.8 tiles
 SPRITE_FRAME_DURATION = 200  # ms per frame
 SHIELD_EFFECT_DURATION = 2.0  # seconds
 SHIELD_PULSE_RATE = 2  # Hz
@@ -57,19 +64,37 @@ TELEPORT_PULSE_RATE = 5  # Hz
 Position = List[float]  # [x, y]
 
 
-def load_frames(path: str) -> List[pygame.Surface]:
-    """Load sprite frames from a path."""
-    return [pygame.image.load(path).convert_alpha()]
+def load_frames(path: str, size: Optional[Tuple[int, int]] = None) -> List[pygame.Surface]:
+    """Load sprite frames from a path, scaled to ``size`` if given (shared, don't draw on them)."""
+    return ASSETS.frames(path, size)
 
 
 class Visualizer:
-    def __init__(self, logger: Any, bot1: BotInterface, bot2: BotInterface):
+    def __init__(self, logger: Any, bot1: BotInterface, bot2: BotInterface,
+                 on_frame: Optional[Callable[[pygame.Surface], None]] = None,
+                 screen: Optional[pygame.Surface] = None):
+        """``on_frame``, if given, renders offscreen instead of to a window: every
+        finished frame is handed to it as soon as it is drawn, waits are counted
+        in frames at ``FPS`` instead of slept, and the end screen closes by itself.
+
+        ``screen`` draws on that surface rather than on a window of its own, so
+        one process can render several matches; it needs ``on_frame`` too, and
+        a display mode set by the caller.
+        """
+        self.on_frame = on_frame
+        self.frame_count = 0
+        self.on_event: Optional[Callable[[pygame.event.Event], None]] = None
+        self.speed = 1.0  # animation speed multiplier, used by replays
+        if on_frame is not None and screen is None:
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
         pygame.init()
         self.logger = logger
         self.bot1 = bot1
         self.bot2 = bot2
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT + INFO_BAR_HEIGHT + BOTTOM_BAR_HEIGHT))
-        pygame.display.set_caption("Spellcasters: Code Duel")
+        if screen is None:
+            screen = pygame.display.set_mode((WIDTH, HEIGHT + INFO_BAR_HEIGHT + BOTTOM_BAR_HEIGHT))
+            pygame.display.set_caption("Spellcasters: Code Duel")
+        self.screen = screen
         self.clock = pygame.time.Clock()
         self.font = pygame.font.SysFont("arial", 20)
         self.wizard_sprites: Dict[str, List[pygame.Surface]] = {}
@@ -79,21 +104,28 @@ class Visualizer:
         self.minion_sprites: Dict[str, List[pygame.Surface]] = {}
         self.load_minion_sprites()
         self.info_bar_state = {}
-        self.info_bar_state = {}
-
-        original = pygame.image.load(FIREBALL_SPRITE_PATH).convert_alpha()
-        self.fireball_sprite = pygame.transform.smoothscale(original, (32, 32))
-
-        original = pygame.image.load(HEAL_SPRITE_PATH).convert_alpha()
-        self.heal_sprite = pygame.transform.smoothscale(original, (TILE_SIZE, TILE_SIZE))
 
-        original = pygame.image.load(SHIELD_SPRITE_PATH).convert_alpha()
-        self.shield_sprite = pygame.transform.smoothscale(original, (TILE_SIZE, TILE_SIZE))
-
-        original = pygame.image.load(MELEE_SPRITE_PATH).convert_alpha()
-        self.melee_sprite = pygame.transform.smoothscale(original, (TILE_SIZE, TILE_SIZE))
-
-        self.fireball_explosion_sprite = pygame.image.load(EXPLOSION_SPRITE_PATH).convert_alpha()
+        # The grid never changes: it is drawn once and frames start from a copy of it
+        self.background = pygame.Surface(self.screen.get_size())
+        self.background.fill(WHITE)
+        for x in range(0, WIDTH, TILE_SIZE):
+            for y in range(0, HEIGHT, TILE_SIZE):
+                pygame.draw.rect(self.background, GRAY, (x, y + INFO_BAR_HEIGHT, TILE_SIZE, TILE_SIZE), 1)
+        self.surface_cache: Dict[Any, pygame.Surface] = {}
+        # Screen areas drawn over the background in the current and the previous frame;
+        # only those are restored and pushed to the window
+        self.drawn: List[pygame.Rect] = [self.screen.get_rect()]
+        self.last_drawn: List[pygame.Rect] = []
+        self.shown_bars: Dict[str, Any] = {}
+        # Logged events by state index, see effects_at
+        self.event_index: Dict[str, Tuple[Dict[int, List[Dict[str, Any]]], List[Dict[str, Any]], int]] = {}
+
+        # Decoded and scaled once per process, see simulator.assets
+        self.fireball_sprite = ASSETS.image(FIREBALL_SPRITE_PATH, (32, 32), smooth=True)
+        self.heal_sprite = ASSETS.image(HEAL_SPRITE_PATH, (TILE_SIZE, TILE_SIZE), smooth=True)
+        self.shield_sprite = ASSETS.image(SHIELD_SPRITE_PATH, (TILE_SIZE, TILE_SIZE), smooth=True)
+        self.melee_sprite = ASSETS.image(MELEE_SPRITE_PATH, (TILE_SIZE, TILE_SIZE), smooth=True)
+        self.fireball_explosion_sprite = ASSETS.image(EXPLOSION_SPRITE_PATH, EXPLOSION_BASE_SIZE, smooth=True)
 
     def load_wizard_sprites(self) -> None:
         """Load wizard sprites for both bots with fallback to defaults if needed."""
@@ -101,22 +133,22 @@ class Visualizer:
             try:
                 sprite_path = bot.sprite_path
                 if sprite_path not in self.wizard_sprites:
-                    frames = load_frames(sprite_path)
+                    frames = load_frames(sprite_path, SPRITE_SIZE)
                     self.wizard_sprites[bot.name] = frames
             except Exception as e:
                 print(f"Error loading sprite for {bot.name}: {e}")
                 # Fallback to default sprite
                 if bot.name not in self.wizard_sprites:
                     default_sprite = DEFAULT_WIZARD_SPRITES[0] if bot.name == self.bot1.name else DEFAULT_WIZARD_SPRITES[1]
-                    frames = load_frames(default_sprite)
+                    frames = load_frames(default_sprite, SPRITE_SIZE)
                     self.wizard_sprites[bot.name] = frames
 
     def load_artifact_sprites(self) -> None:
         """Load artifact sprites."""
         self.artifact_sprites = {
-            "health": load_frames("assets/artifacts/health_20.png"),
-            "mana": load_frames("assets/artifacts/mana_20.png"),
-            "cooldown": load_frames("assets/artifacts/cooldown_1.png")
+            "health": load_frames("assets/artifacts/health_20.png", SPRITE_SIZE),
+            "mana": load_frames("assets/artifacts/mana_20.png", SPRITE_SIZE),
+            "cooldown": load_frames("assets/artifacts/cooldown_1.png", SPRITE_SIZE)
         }
 
     def load_minion_sprites(self) -> None:
@@ -125,14 +157,14 @@ class Visualizer:
             try:
                 sprite_path = bot.minion_sprite_path
                 if sprite_path not in self.minion_sprites:
-                    frames = load_frames(sprite_path)
+                    frames = load_frames(sprite_path, SPRITE_SIZE)
                     self.minion_sprites[bot.name] = frames
             except Exception as e:
                 print(f"Error loading sprite for {bot.name}: {e}")
                 # Fallback to default sprite
                 if bot.name not in self.minion_sprites:
                     default_sprite = DEFAULT_MINION_SPRITES[0] if bot.name == self.bot1.name else DEFAULT_MINION_SPRITES[1]
-                    frames = load_frames(default_sprite)
+                    frames = load_frames(default_sprite, SPRITE_SIZE)
                     self.minion_sprites[bot.name] = frames
 
     def draw_wizard_info_bar(self, state: Dict[str, Any] = None) -> None:
@@ -147,7 +179,13 @@ class Visualizer:
             print(f"Error in draw_wizard_info_bar: {e}")
             return
 
-        pygame.draw.rect(self.screen, BLACK, (0, 0, WIDTH, INFO_BAR_HEIGHT))  # top bar
+        key = tuple((state[wiz]["name"], state[wiz]["hp"], state[wiz]["mana"]) for wiz in ["self", "opponent"])
+        self.draw_bar("top", key, (0, 0), lambda: self.build_wizard_info_bar(state))
+
+    def build_wizard_info_bar(self, state: Dict[str, Any]) -> pygame.Surface:
+        """Render the top bar for a state onto its own surface."""
+        bar = pygame.Surface((WIDTH, INFO_BAR_HEIGHT))
+        bar.fill(BLACK)  # top bar
 
         padding = 20
         spacing = WIDTH // 2
@@ -158,28 +196,64 @@ class Visualizer:
             x_offset = i * spacing + padding
 
             # Name
-            name = self.font.render(wiz["name"], True, color)
-            self.screen.blit(name, (x_offset, 10))
+            bar.blit(self.text(wiz["name"], color), (x_offset, 10))
 
             # HP Bar
             hp = wiz["hp"]
-            pygame.draw.rect(self.screen, HP_BG_COLOR, (x_offset, 30, 100, 10))  # background
-            pygame.draw.rect(self.screen, HP_COLOR, (x_offset, 30, hp, 10))  # current HP
-            hp_text = self.font.render(f"{hp} HP", True, WHITE)
-            self.screen.blit(hp_text, (x_offset + 105, 28))
+            pygame.draw.rect(bar, HP_BG_COLOR, (x_offset, 30, 100, 10))  # background
+            pygame.draw.rect(bar, HP_COLOR, (x_offset, 30, hp, 10))  # current HP
+            bar.blit(self.text(f"{hp} HP", WHITE), (x_offset + 105, 28))
 
             # Mana Bar
             mana = wiz["mana"]
-            pygame.draw.rect(self.screen, HP_BG_COLOR, (x_offset, 45, 100, 10))
-            pygame.draw.rect(self.screen, MANA_COLOR, (x_offset, 45, mana, 10))
-            mana_text = self.font.render(f"{mana} MP", True, WHITE)
-            self.screen.blit(mana_text, (x_offset + 105, 43))
+            pygame.draw.rect(bar, HP_BG_COLOR, (x_offset, 45, 100, 10))
+            pygame.draw.rect(bar, MANA_COLOR, (x_offset, 45, mana, 10))
+            bar.blit(self.text(f"{mana} MP", WHITE), (x_offset + 105, 43))
+        return bar
+
+    def draw_bar(self, slot: str, key: Any, position: Tuple[int, int], build: Callable[[], pygame.Surface]) -> None:
+        """Blit a cached bar; its area only counts as changed when it shows something new."""
+        surface = self.cached(("bar", slot, key), build)
+        rect = self.screen.blit(surface, position)
+        if self.shown_bars.get(slot) != key:
+            self.shown_bars[slot] = key
+            self.drawn.append(rect)
+
+    def cached(self, key: Any, build: Callable[[], Any]) -> Any:
+        """The surface stored under ``key``, built the first time it is asked for."""
+        surface = self.surface_cache.get(key)
+        if surface is None:
+            if len(self.surface_cache) >= MAX_CACHED_SURFACES:
+                self.surface_cache.clear()
+            surface = self.surface_cache[key] = build()
+        return surface
+
+    def text(self, message: str, color: Tuple[int, int, int], font: Optional[pygame.font.Font] = None) -> pygame.Surface:
+        """Rendered text, cached; don't change the returned surface."""
+        font = font or self.font
+        return self.cached(("text", id(font), message, color), lambda: font.render(message, True, color))
+
+    def blit(self, surface: pygame.Surface, rect: Any) -> pygame.Rect:
+        """Blit onto the screen and remember the area as changed."""
+        drawn = self.screen.blit(surface, rect)
+        self.drawn.append(drawn)
+        return drawn
+
+    def draw_background(self) -> None:
+        """Start a frame: restore the board wherever the last frame drew over it."""
+        for rect in self.drawn:
+            self.screen.blit(self.background, rect, rect)
+        self.last_drawn, self.drawn = self.drawn, []
+
+    def present(self) -> None:
+        """Push the areas changed since the previous frame to the window."""
+        pygame.display.update(self.last_drawn + self.drawn)
 
     def draw_board(self) -> None:
         """Draw the game board grid."""
-        for x in range(0, WIDTH, TILE_SIZE):
-            for y in range(0, HEIGHT, TILE_SIZE):
-                pygame.draw.rect(self.screen, GRAY, (x, y + INFO_BAR_HEIGHT, TILE_SIZE, TILE_SIZE), 1)
+        board = pygame.Rect(0, INFO_BAR_HEIGHT, WIDTH, HEIGHT)
+        self.screen.blit(self.background, board, board)
+        self.drawn.append(board)
 
     def draw_unit(self, position: Position, color: Tuple[int, int, int], symbol: str, name: Optional[str] = None) -> None:
         """Draw a game unit (wizard, minion, artifact) on the board."""
@@ -187,9 +261,9 @@ class Visualizer:
         center = (x * TILE_SIZE + TILE_SIZE // 2, y * TILE_SIZE + TILE_SIZE // 2 + INFO_BAR_HEIGHT)
 
         if symbol == "W" and name:
-            name_text = self.font.render(name, True, color)
+            name_text = self.text(name, color)
             name_rect = name_text.get_rect(center=(center[0], center[1] - TILE_SIZE // 2))
-            self.screen.blit(name_text, name_rect)
+            self.blit(name_text, name_rect)
 
         if symbol == "W" and name in self.wizard_sprites:
             frames = self.wizard_sprites[name]
@@ -201,31 +275,35 @@ class Visualizer:
             frames = self.minion_sprites[name]
             self.draw_sprite(frames, center)
         else:
-            pygame.draw.circle(self.screen, color, center, TILE_SIZE // 3)
-            text = self.font.render(symbol, True, BLACK)
+            self.drawn.append(pygame.draw.circle(self.screen, color, center, TILE_SIZE // 3))
+            text = self.text(symbol, BLACK)
             text_rect = text.get_rect(center=center)
-            self.screen.blit(text, text_rect)
+            self.blit(text, text_rect)
 
     def draw_sprite(self, frames: List[pygame.Surface], center: Tuple[int, int]) -> None:
         """Draw an animated sprite from frames at the specified position."""
-        frame = frames[pygame.time.get_ticks() // SPRITE_FRAME_DURATION % len(frames)]
+        frame = frames[self.ticks() // SPRITE_FRAME_DURATION % len(frames)]
         # Scale the sprite to fit the tile size (slightly smaller for visual clarity)
-        sprite_size = int(TILE_SIZE * SPRITE_SCALE)
-        scaled_frame = pygame.transform.scale(frame, (sprite_size, sprite_size))
+        scaled_frame = frame
+        if frame.get_size() != SPRITE_SIZE:
+            scaled_frame = self.cached(("sprite", id(frame)), lambda: pygame.transform.scale(frame, SPRITE_SIZE))
         frame_rect = scaled_frame.get_rect(center=center)
-        self.screen.blit(scaled_frame, frame_rect)
+        self.blit(scaled_frame, frame_rect)
 
     def draw_info_bar(self, turn: int) -> None:
         """Draw the bottom info bar showing turn number."""
-        pygame.draw.rect(self.screen, BLACK, (0, HEIGHT + INFO_BAR_HEIGHT, WIDTH, BOTTOM_BAR_HEIGHT))
-        text = self.font.render(f"Turn {turn + 1}", True, WHITE)
-        self.screen.blit(text, (10, HEIGHT + INFO_BAR_HEIGHT + 10))
+        self.draw_bar("bottom", turn, (0, HEIGHT + INFO_BAR_HEIGHT), lambda: self.build_info_bar(turn))
+
+    def build_info_bar(self, turn: int) -> pygame.Surface:
+        bar = pygame.Surface((WIDTH, BOTTOM_BAR_HEIGHT))
+        bar.fill(BLACK)
+        bar.blit(self.text(f"Turn {turn + 1}", WHITE), (10, 10))
+        return bar
 
     def render_frame(self, state: Dict[str, Any], turn: int, skip_entities: bool = False) -> None:
         """Render a complete frame with all entities."""
-        self.screen.fill(WHITE)
+        self.draw_background()
         self.draw_wizard_info_bar()
-        self.draw_board()
 
         if not skip_entities:
             for artifact in state.get("artifacts", []):
@@ -246,16 +324,38 @@ class Visualizer:
                 self.draw_active_shield(wiz_data, wiz_data["position"])
 
         self.draw_info_bar(turn)
-        pygame.display.flip()
+        if self.on_frame is None:
+            self.present()
+
+    def ticks(self) -> int:
+        """Animation time in ms; offscreen it follows the frames rendered, not the wall clock."""
+        if self.on_frame is not None:
+            return self.frame_count * 1000 // FPS
+        return pygame.time.get_ticks()
+
+    def emit_frame(self) -> None:
+        """Hand the current screen to ``on_frame`` as the next frame."""
+        self.on_frame(self.screen)
+        self.frame_count += 1
+
+    def next_frame(self) -> None:
+        """Show the frame just drawn and wait until the next one is due."""
+        if self.on_frame is not None:
+            self.emit_frame()
+            return
+        self.present()
+        self.clock.tick(FPS)
+        self.handle_events()
 
     def wait_for(self, duration: float) -> None:
         """Wait for a specified duration while handling events."""
+        if self.on_frame is not None:
+            for _ in range(round(duration * FPS)):
+                self.emit_frame()
+            return
         start_time = time.time()
         while time.time() - start_time < duration:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
+            self.handle_events()
             self.clock.tick(FPS)
 
     def display_end_game_message(self, winner: Optional[str], has_more_matches: bool) -> None:
@@ -263,7 +363,7 @@ class Visualizer:
         # Draw a transparent grey rectangle over the screen
         overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
         overlay.fill((50, 50, 50, 180))  # Grey with 180 alpha for transparency
-        self.screen.blit(overlay, (0, 0))
+        self.blit(overlay, (0, 0))
 
         # Determine the message and color
         if winner is None:
@@ -287,7 +387,10 @@ class Visualizer:
         pygame.draw.rect(self.screen, GRAY, button_rect.inflate(20, 10))
         self.screen.blit(button_text, button_rect)
 
-        pygame.display.flip()
+        if self.on_frame is not None:
+            self.wait_for(END_SCREEN_DURATION)
+            return
+        self.present()
 
         # Wait for user interaction
         while True:
@@ -332,21 +435,21 @@ class Visualizer:
     def animate_transition(self, curr_state: Dict[str, Any], next_state: Dict[str, Any], state_index: int) -> None:
         """Animate the transition between two game states."""
         # First half of animation: movement only
-        move_steps = int(FPS * ANIMATION_DURATION / 2)
-        damage_this_state = [d for d in self.logger.damage_events if d["state_index"] == state_index]
+        move_steps = self.animation_steps()
+        spell_effects, damage_this_state = self.effects_at(state_index)
 
+        # Minions are matched between the states by id: those in both move, the others were just summoned
         curr_minions = curr_state.get("minions", [])
         next_minions = next_state.get("minions", [])
-
-        existing_minions = []
-        for m in next_minions:
-            if any(cm["id"] == m["id"] for cm in curr_minions):
-                existing_minions.append(m)
+        next_by_id = {m["id"]: m for m in next_minions}
+        curr_ids = {m["id"] for m in curr_minions}
+        moving_minions = [(m, next_by_id[m["id"]]) for m in curr_minions if m["id"] in next_by_id]
+        existing_minions = [m for m in next_minions if m["id"] in curr_ids]
+        new_minions = [m for m in next_minions if m["id"] not in curr_ids]
 
         for frame in range(move_steps):
             progress = frame / move_steps
-            self.screen.fill(WHITE)
-            self.draw_board()
+            self.draw_background()
             self.draw_wizard_info_bar()
 
             # Interpolate wizards
@@ -360,9 +463,7 @@ class Visualizer:
                 self.draw_active_shield(wiz_curr, pos)
 
             # Interpolate existing minions
-            for i in range(min(len(curr_minions), len(existing_minions))):
-                curr_m = curr_minions[i]
-                next_m = existing_minions[i]
+            for curr_m, next_m in moving_minions:
                 color = RED if curr_m["owner"] == self.bot2.name else BLUE
                 pos = self.interpolate(curr_m["position"], next_m["position"], progress)
                 self.draw_unit(pos, color, "M", curr_m["owner"])
@@ -372,18 +473,15 @@ class Visualizer:
                 self.draw_unit(artifact["position"], YELLOW, "A", artifact["type"])
 
             self.draw_info_bar(curr_state["turn"])
-            pygame.display.flip()
-            self.clock.tick(FPS)
-            self.handle_events()
+            self.next_frame()
 
         # Second half: spell casting (entities at their final positions)
-        spell_steps = int(FPS * ANIMATION_DURATION / 2)
-        spell_effects = [s for s in self.logger.spells if s["state_index"] == state_index]
+        spell_steps = self.animation_steps()
 
         for frame in range(spell_steps):
             progress = frame / spell_steps
-            self.screen.fill(WHITE)
-            self.render_frame(next_state, curr_state["turn"], skip_entities=True)
+            self.draw_background()
+            self.draw_wizard_info_bar()
 
             # Draw wizards at final positions
             for wiz_key in ["self", "opponent"]:
@@ -398,18 +496,16 @@ class Visualizer:
                 color = RED if m["owner"] == self.bot2.name else BLUE
                 self.draw_unit(m["position"], color, "M", m["owner"])
 
-            new_minions = [m for m in next_minions if not any(cm["id"] == m["id"] for cm in curr_minions)]
-
             for m in new_minions:
                 color = RED if m["owner"] == self.bot2.name else BLUE
                 center = self.pixel_center(m["position"])
                 # Grow effect
                 size = int(TILE_SIZE * 0.6 * progress)  # Start small and grow
-                pygame.draw.circle(self.screen, color, center, size)
+                self.drawn.append(pygame.draw.circle(self.screen, color, center, size))
                 if progress > 0.5:  # Show "M" text after halfway through animation
-                    text = self.font.render("M", True, BLACK)
+                    text = self.text("M", BLACK)
                     text_rect = text.get_rect(center=center)
-                    self.screen.blit(text, text_rect)
+                    self.blit(text, text_rect)
 
             # Animate spell effects
             for spell in spell_effects:
@@ -435,9 +531,9 @@ class Visualizer:
                             center = self.pixel_center(target)
                             result_text = "SWIPE!"
                             color = HIT_COLOR
-                            result_surface = self.font.render(result_text, True, color)
+                            result_surface = self.text(result_text, color)
                             result_rect = result_surface.get_rect(center=(center[0], center[1] - 50))
-                            self.screen.blit(result_surface, result_rect)
+                            self.blit(result_surface, result_rect)
                 elif spell_name == "fireball" and target:
                     actual_target = target
                     if hit:
@@ -452,9 +548,9 @@ class Visualizer:
                         center = self.pixel_center(actual_target)
                         result_text = "HIT!" if hit else "MISS"
                         color = HIT_COLOR if hit else MISS_COLOR
-                        result_surface = self.font.render(result_text, True, color)
+                        result_surface = self.text(result_text, color)
                         result_rect = result_surface.get_rect(center=(center[0], center[1] - 50))
-                        self.screen.blit(result_surface, result_rect)
+                        self.blit(result_surface, result_rect)
                 elif spell_name == "teleport":
                     self.draw_teleport_pulse(caster_pos)
 
@@ -465,25 +561,49 @@ class Visualizer:
                 center = self.pixel_center(dmg["position"])
                 rise = int((1 - progress) * 20)  # float upward
                 alpha = int(255 * (1 - progress))  # fade out
-                dmg_text = self.font.render(f"-{dmg['amount']}", True, RED)
+                dmg_text = self.cached(("damage", dmg["amount"]), lambda: self.font.render(f"-{dmg['amount']}", True, RED))
                 dmg_text.set_alpha(alpha)
-                self.screen.blit(dmg_text, (center[0] - 10, center[1] - 20 - rise))
+                self.blit(dmg_text, (center[0] - 10, center[1] - 20 - rise))
 
             # Static artifacts
             for artifact in curr_state.get("artifacts", []):
                 self.draw_unit(artifact["position"], YELLOW, "A", artifact["type"])
 
             self.draw_info_bar(curr_state["turn"])
-            pygame.display.flip()
-            self.clock.tick(FPS)
-            self.handle_events()
+            self.next_frame()
+
+    def animation_steps(self) -> int:
+        """Frames in each half of a transition at the current ``speed``."""
+        return max(1, int(FPS * ANIMATION_DURATION / 2 / self.speed))
+
+    def effects_at(self, state_index: int) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """The spells and the damage logged at ``state_index``.
+
+        Events are indexed by state once, as they are appended to the logger,
+        so a lookup costs the same however long the match has been running.
+        """
+        spells = self.index_events("spells", self.logger.spells)
+        damage = self.index_events("damage", self.logger.damage_events)
+        return spells.get(state_index, []), damage.get(state_index, [])
+
+    def index_events(self, name: str, events: List[Dict[str, Any]]) -> Dict[int, List[Dict[str, Any]]]:
+        index, source, indexed = self.event_index.get(name, (None, None, 0))
+        if source is not events or indexed > len(events):
+            # A new (or truncated) event list: start over
+            index, indexed = defaultdict(list), 0
+        for event in events[indexed:]:
+            index[event["state_index"]].append(event)
+        self.event_index[name] = (index, events, len(events))
+        return index
 
     def handle_events(self) -> None:
-        """Handle pygame events."""
+        """Handle pygame events; anything but QUIT goes to ``on_event``, if set."""
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
+            elif self.on_event is not None:
+                self.on_event(event)
 
     def interpolate(self, start: Position, end: Position, progress: float) -> Position:
         """Interpolate between two positions based on progress (0-1)."""
@@ -503,7 +623,12 @@ class Visualizer:
     def draw_shield_effect(self, pos: Position) -> None:
         """Draw shield effect animation."""
         center = self.pixel_center(pos)
+        glow_surface, sprite_surface = self.cached("shield_effect", self.build_shield_effect)
+        self.blit(glow_surface, glow_surface.get_rect(center=center))
+        self.blit(sprite_surface, sprite_surface.get_rect(center=center))
 
+    def build_shield_effect(self) -> Tuple[pygame.Surface, pygame.Surface]:
+        """The glow and the sprite of the shield effect, which always look the same."""
         # We want a consistent shield appearance during casting
         scale = 1.0  # Full size immediately
         size = int(TILE_SIZE * scale)
@@ -525,25 +650,20 @@ class Visualizer:
             glow_radius
         )
 
-        # Draw the glow behind the shield
-        glow_rect = glow_surface.get_rect(center=center)
-        self.screen.blit(glow_surface, glow_rect)
-
         # Create a surface for the shield sprite
         sprite_surface = pygame.Surface((size, size), pygame.SRCALPHA)
         sprite_surface.blit(scaled, (0, 0))
         sprite_surface.set_alpha(alpha)
 
-        # Draw the shield sprite on top of the glow
-        sprite_rect = sprite_surface.get_rect(center=center)
-        self.screen.blit(sprite_surface, sprite_rect)
+        # The glow is drawn behind the shield sprite
+        return glow_surface, sprite_surface
 
     def draw_heal_effect(self, pos: Position) -> None:
         """Draw heal effect animation."""
         center = self.pixel_center(pos)
 
         # Create an animation based on time
-        t = pygame.time.get_ticks() / 1000.0  # Time in seconds
+        t = self.ticks() / 1000.0  # Time in seconds
 
         # Create pulsing effect (0.5 to 1.0 scale)
         pulse = 0.5 + 0.5 * math.sin(t * HEAL_PULSE_RATE)
@@ -559,7 +679,7 @@ class Visualizer:
         temp = pygame.Surface((size, size), pygame.SRCALPHA)
 
         # Scale the heal sprite
-        scaled = pygame.transform.smoothscale(self.heal_sprite, (size, size))
+        scaled = self.cached(("heal", size), lambda: pygame.transform.smoothscale(self.heal_sprite, (size, size)))
 
         # Set the alpha/transparency
         scaled.set_alpha(alpha)
@@ -569,7 +689,7 @@ class Visualizer:
 
         # Draw temp surface centered on position
         rect = temp.get_rect(center=center)
-        self.screen.blit(temp, rect)
+        self.blit(temp, rect)
 
         # Draw additional sparkle particles
         for i in range(HEAL_PARTICLE_COUNT):
@@ -580,12 +700,12 @@ class Visualizer:
             particle_size = 3 + 2 * pulse
 
             # Small particles around the main sprite
-            pygame.draw.circle(
+            self.drawn.append(pygame.draw.circle(
                 self.screen,
                 (*HEAL_PARTICLE_COLOR, alpha),  # Light green with same alpha
                 (int(particle_x), int(particle_y)),
                 int(particle_size)
-            )
+            ))
 
     def draw_fireball_explosion(self, position: Position, progress: float) -> None:
         """Draw fireball explosion effect at the target position."""
@@ -597,12 +717,14 @@ class Visualizer:
         alpha = int(255 * (1 - progress))  # Fade out as progress increases
 
         # Scale the explosion sprite
-        scaled_explosion = pygame.transform.smoothscale(self.fireball_explosion_sprite, (size, size))
+        scaled_explosion = self.cached(
+            ("explosion", size), lambda: pygame.transform.smoothscale(self.fireball_explosion_sprite, (size, size))
+        )
         scaled_explosion.set_alpha(alpha)
 
         # Draw the explosion sprite centered at the target position
         rect = scaled_explosion.get_rect(center=center)
-        self.screen.blit(scaled_explosion, rect)
+        self.blit(scaled_explosion, rect)
 
     def draw_melee_attack(self, position: Position, progress: float) -> None:
         """Draw melee attack animation at the given position."""
@@ -617,7 +739,15 @@ class Visualizer:
             scale = 1.8 - 1.6 * ((progress - 0.5) * 2)  # Scale from 1.8 to 0.2
 
         size = int(TILE_SIZE * scale)
+        # The effect only depends on progress, which takes the same steps in every transition
+        temp = self.cached(("melee", progress), lambda: self.build_melee_attack(progress, size))
 
+        # Draw temp surface centered on position
+        rect = temp.get_rect(center=center)
+        self.blit(temp, rect)
+
+    def build_melee_attack(self, progress: float, size: int) -> pygame.Surface:
+        """One frame of the melee attack sprite."""
         # Rotate the sprite a bit for dynamic effect
         angle = progress * 30  # Rotate up to 30 degrees
 
@@ -635,10 +765,7 @@ class Visualizer:
         # Draw to temp surface
         temp_rect = temp.get_rect(center=(temp.get_width() // 2, temp.get_height() // 2))
         temp.blit(rotated, temp_rect)
-
-        # Draw temp surface centered on position
-        rect = temp.get_rect(center=center)
-        self.screen.blit(temp, rect)
+        return temp
 
     def draw_fireball(self, caster_pos: Position, target_pos: Position, progress: float) -> None:
         """Draw fireball effect animation."""
@@ -648,10 +775,10 @@ class Visualizer:
 
         # Compute angle and rotate sprite
         angle = self.angle_between(caster_pos, target_pos) + 90
-        rotated = pygame.transform.rotate(self.fireball_sprite, angle)
+        rotated = ASSETS.rotated(FIREBALL_SPRITE_PATH, (32, 32), angle, smooth=True)
         rect = rotated.get_rect(center=center)
 
-        self.screen.blit(rotated, rect)
+        self.blit(rotated, rect)
 
         # Add a trail effect - slightly transparent circles behind the fireball
         trail_length = FIREBALL_TRAIL_LENGTH
@@ -662,25 +789,30 @@ class Visualizer:
                 ty = caster_pos[1] + (target_pos[1] - caster_pos[1]) * trail_progress
                 trail_center = self.pixel_center([tx, ty])
 
-                # Size and alpha decrease for trail parts farther from the fireball
-                size = max(3, 8 - i * 1.5)
-                alpha = max(20, 150 - i * 30)  # Gradually decreasing alpha
-
-                # Create a transparent surface for the trail
-                trail_surface = pygame.Surface((int(size*2), int(size*2)), pygame.SRCALPHA)
-                pygame.draw.circle(
-                    trail_surface,
-                    (*FIREBALL_TRAIL_COLOR, alpha),  # Orange with fading transparency
-                    (int(size), int(size)),
-                    int(size)
-                )
+                trail_surface = self.cached(("trail", i), lambda: self.build_fireball_trail(i))
                 trail_rect = trail_surface.get_rect(center=trail_center)
-                self.screen.blit(trail_surface, trail_rect)
+                self.blit(trail_surface, trail_rect)
 
         # Draw explosion effect if progress is near the end
         if progress > 0.8:
             self.draw_fireball_explosion(target_pos, (progress - 0.8) / 0.2)
 
+    def build_fireball_trail(self, i: int) -> pygame.Surface:
+        """The i-th circle of the fireball trail."""
+        # Size and alpha decrease for trail parts farther from the fireball
+        size = max(3, 8 - i * 1.5)
+        alpha = max(20, 150 - i * 30)  # Gradually decreasing alpha
+
+        # Create a transparent surface for the trail
+        trail_surface = pygame.Surface((int(size*2), int(size*2)), pygame.SRCALPHA)
+        pygame.draw.circle(
+            trail_surface,
+            (*FIREBALL_TRAIL_COLOR, alpha),  # Orange with fading transparency
+            (int(size), int(size)),
+            int(size)
+        )
+        return trail_surface
+
     def angle_between(self, start: Position, end: Position) -> float:
         """Calculate the angle between two positions in degrees."""
         dx = end[0] - start[0]
@@ -693,7 +825,7 @@ class Visualizer:
         center = self.pixel_center(pos)
 
         # Get animation time
-        t = pygame.time.get_ticks() / 1000.0  # Time in seconds
+        t = self.ticks() / 1000.0  # Time in seconds
 
         # Create a pulsing circle
         pulse = 0.2 + 0.8 * (1 + math.sin(t * TELEPORT_PULSE_RATE)) / 2  # Oscillate between 0.2 and 1.0
@@ -713,7 +845,7 @@ class Visualizer:
         )
 
         glow_rect = glow.get_rect(center=center)
-        self.screen.blit(glow, glow_rect)
+        self.blit(glow, glow_rect)
 
         # Add a smaller pulsing circle with reverse timing
         inner_pulse = 0.2 + 0.6 * (1 + math.sin(t * TELEPORT_PULSE_RATE + math.pi)) / 2  # Opposite phase
@@ -730,36 +862,38 @@ class Visualizer:
         )
 
         inner_rect = inner_glow.get_rect(center=center)
-        self.screen.blit(inner_glow, inner_rect)
+        self.blit(inner_glow, inner_rect)
 
     def draw_active_shield(self, wizard_data: Dict[str, Any], position: Position) -> None:
         """Draw shield effect around a wizard if shield is active."""
         if wizard_data.get("shield_active", False):
             # Convert to pixel coordinates for shield drawing
             pixel_pos = self.pixel_center(position)
-
-            # Use a constant appearance for continuous shield
-            size = int(TILE_SIZE * 0.8)  # Fixed size for the shield
-
-            # Draw a constant blue transparent circle around the wizard
-            shield_radius = int(TILE_SIZE * 0.6)
-            shield_alpha = 120  # Constant transparency value
-
-            # Create a transparent surface for the shield circle
-            shield_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(
-                shield_surface,
-                (*SHIELD_GLOW_COLOR, shield_alpha),  # Light blue with constant transparency
-                (size, size),
-                shield_radius,
-                3  # Circle thickness
-            )
+            shield_surface = self.cached("active_shield", self.build_active_shield)
 
             # Blit the shield surface directly without any time-based modulation
             shield_rect = shield_surface.get_rect(center=pixel_pos)
-            self.screen.blit(shield_surface, shield_rect)
+            self.blit(shield_surface, shield_rect)
 
             # No longer drawing the shield sprite for active shield status
             # Only the blue circle remains visible
 
+    def build_active_shield(self) -> pygame.Surface:
+        """The circle drawn around a shielded wizard."""
+        # Use a constant appearance for continuous shield
+        size = int(TILE_SIZE * 0.8)  # Fixed size for the shield
+
+        # Draw a constant blue transparent circle around the wizard
+        shield_radius = int(TILE_SIZE * 0.6)
+        shield_alpha = 120  # Constant transparency value
 
+        # Create a transparent surface for the shield circle
+        shield_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(
+            shield_surface,
+            (*SHIELD_GLOW_COLOR, shield_alpha),  # Light blue with constant transparency
+            (size, size),
+            shield_radius,
+            3  # Circle thickness
+        )
+        return shield_surface
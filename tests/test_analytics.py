@@ -0,0 +1,49 @@
+import random
+
+from simulator.analytics import EventExporter, aggregate, export_match_log, load_tables, save_tables
+from simulator.match import run_match
+from simulator.match_log import MatchLogWriter
+from tests.test_league import ChaserBot, IdleBot
+
+
+def test_fireball_hit_rate_by_range(tmp_path):
+    path = str(tmp_path / "matches.jsonl")
+    with MatchLogWriter(path) as writer:
+        for seed in range(4):
+            random.seed(seed)
+            run_match(ChaserBot(), IdleBot(), max_turns=60, stream=writer)
+
+    tables = export_match_log(path)
+    spells = tables["spells"]
+    assert set(spells.decoded("caster")) == {"Chaser"}
+    assert set(spells["match"]) == {0, 1, 2, 3}
+
+    rows = aggregate(spells.where(spell="fireball"), by=["caster", "range"], value="hit", how="mean")
+    assert [row["range"] for row in rows] == sorted(row["range"] for row in rows)
+    assert all(0.0 <= row["mean"] <= 1.0 for row in rows)
+    # Fireballs cast from too far away are logged, and always miss
+    assert all(row["mean"] == 0.0 for row in rows if row["range"] > 5)
+    assert sum(row["rows"] for row in rows) == len(spells)
+
+    damage = aggregate(tables["damage"], by=["target"], value="amount", how="sum")
+    by_target = {row["target"]: row["sum"] for row in damage}
+    assert by_target["Idle"] >= 100
+    assert aggregate(tables["moves"], by=["wizard"])[0]["wizard"] == "Chaser"
+
+
+def test_tables_round_trip_through_npz(tmp_path):
+    exporter = EventExporter()
+    for match in range(2):
+        random.seed(match)
+        _, logger = run_match(ChaserBot(), IdleBot(), max_turns=60)
+        exporter.add_logger(match, logger)
+    tables = exporter.tables()
+
+    path = str(tmp_path / "tables.npz")
+    save_tables(tables, path)
+    loaded = load_tables(path)
+    for name, table in tables.items():
+        assert loaded[name].categories == table.categories
+        for column, values in table.columns.items():
+            assert (loaded[name][column] == values).all()
+            assert loaded[name][column].dtype == values.dtype
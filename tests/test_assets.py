@@ -0,0 +1,53 @@
+import os
+
+import pygame
+
+from bots.sample_bot1.sample_bot_1 import SampleBot1
+from bots.sample_bot3.sample_bot_3 import SampleBot3
+from game.logger import GameLogger
+from simulator.assets import ASSETS, AssetCache
+from simulator.visualizer import Visualizer
+
+
+def _visualizer():
+    return Visualizer(GameLogger(), SampleBot1(), SampleBot3(), on_frame=lambda screen: None)
+
+
+def test_visualizers_share_decoded_sprites():
+    _visualizer()
+    loads, surfaces = ASSETS.loads, len(ASSETS)
+    second = _visualizer()
+    assert (ASSETS.loads, len(ASSETS)) == (loads, surfaces)
+    assert second.fireball_sprite is _visualizer().fireball_sprite
+    # Only scaled surfaces are kept, not the full-size images they came from
+    assert all(key.size is not None for key in ASSETS.surfaces)
+
+
+def test_atlas_round_trip_skips_changed_sources(tmp_path):
+    _visualizer()
+    sprite = tmp_path / "sprite.png"
+    source = pygame.Surface((40, 20), pygame.SRCALPHA)
+    source.fill((200, 40, 10, 128))
+    pygame.image.save(source, str(sprite))
+
+    cache = AssetCache()
+    scaled = cache.image(str(sprite), (10, 5))
+    rotated = cache.rotated(str(sprite), (10, 5), 90)
+    cache.image("assets/spells/fireball.png", (32, 32), smooth=True)
+    atlas = str(tmp_path / "atlas.bin")
+    assert cache.save_atlas(atlas) == 3 and cache.unsaved == 0
+
+    fresh = AssetCache()
+    fresh.use_atlas(atlas)
+    assert pygame.image.tobytes(fresh.rotated(str(sprite), (10, 5), 90), "RGBA") == pygame.image.tobytes(
+        rotated, "RGBA"
+    )
+    assert pygame.image.tobytes(fresh.image(str(sprite), (10, 5)), "RGBA") == pygame.image.tobytes(scaled, "RGBA")
+    assert fresh.loads == 0
+
+    os.utime(sprite, ns=(0, 0))
+    stale = AssetCache()
+    assert stale.load_atlas(atlas) == 1
+    stale.image(str(sprite), (10, 5))
+    assert stale.loads == 1
+    assert AssetCache().load_atlas(str(tmp_path / "missing.bin")) == 0
@@ -0,0 +1,47 @@
+import asyncio
+import time
+
+from bots.bot_interface import AsyncBotInterface, BotInterface, has_native_async
+from simulator.match import run_match
+
+
+class SyncBot(BotInterface):
+    @property
+    def name(self):
+        return "Sync Bot"
+
+    def decide(self, state):
+        return {"move": [1, 0], "spell": None}
+
+
+class SlowIOBot(AsyncBotInterface):
+    """Simulates a bot waiting on a remote service every turn."""
+
+    @property
+    def name(self):
+        return "Slow IO Bot"
+
+    async def decide_async(self, state):
+        await asyncio.sleep(0.05)
+        return {"move": [0, 1], "spell": None}
+
+
+def test_sync_bots_are_wrapped_transparently():
+    assert not has_native_async(SyncBot())
+    assert asyncio.run(SyncBot().decide_async({"turn": 1})) == {"move": [1, 0], "spell": None}
+
+
+def test_async_only_bot_still_has_sync_decide():
+    assert has_native_async(SlowIOBot())
+    assert SlowIOBot().decide({"turn": 1}) == {"move": [0, 1], "spell": None}
+
+
+def test_run_match_awaits_async_bots_concurrently():
+    start = time.perf_counter()
+    winner, logger = run_match(SlowIOBot(), SlowIOBot(), max_turns=4)
+    elapsed = time.perf_counter() - start
+
+    assert winner == "Draw"
+    assert logger.get_snapshots()
+    # Both bots wait in parallel: ~4 x 0.05s, not 8 x 0.05s
+    assert elapsed < 0.35
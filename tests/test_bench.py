@@ -0,0 +1,59 @@
+import pytest
+
+from bots.bot_interface import BotInterface
+from game.engine import GameEngine
+from game.logger import LOG_LEVEL_MINIMAL, LOG_LEVEL_QUIET, GameLogger
+from simulator.bench import SCENARIOS, compare, run_bench, run_scenario
+
+
+class IdleBot(BotInterface):
+    @property
+    def name(self):
+        return "Idle"
+
+    def decide(self, state):
+        return {"move": [0, 0], "spell": None}
+
+
+def test_logger_levels(capsys):
+    with pytest.raises(ValueError):
+        GameLogger("loud")
+
+    engine = GameEngine(IdleBot(), IdleBot(), logger=GameLogger(LOG_LEVEL_MINIMAL))
+    for _ in range(5):
+        engine.run_turn()
+    assert len(engine.logger.get_snapshots()) == 1
+    assert engine.logger.get_snapshots()[-1]["turn"] == 5
+    assert engine.logger.get_event_logs() == []
+    engine.logger.log_damage([0, 0], 10, "Idle")
+    engine.logger.log_collision([0, 0])
+    assert engine.logger.damage_events == engine.logger.collision_events == []
+
+    engine = GameEngine(IdleBot(), IdleBot(), logger=GameLogger(LOG_LEVEL_QUIET))
+    for _ in range(5):
+        engine.run_turn()
+    assert len(engine.logger.get_snapshots()) > 5
+    assert capsys.readouterr().out == ""
+
+
+def test_engine_board_size():
+    engine = GameEngine(IdleBot(), IdleBot(), board_size=16)
+    assert engine.wizard2.position == [15, 15]
+    assert engine.build_input(engine.wizard1, engine.wizard2)["board_size"] == 16
+
+
+def test_long_draw_runs_to_turn_limit():
+    row = run_scenario("long_draw", LOG_LEVEL_QUIET, matches=2, max_turns=20, repeat=1)
+    assert row["turns"] == 40
+    assert row["turns_per_second"] > 0
+
+
+def test_bench_report_and_baseline_comparison():
+    report = run_bench(log_levels=[LOG_LEVEL_MINIMAL], matches=1, max_turns=10, repeat=1)
+    assert [row["scenario"] for row in report["results"]] == list(SCENARIOS)
+
+    slower = {"results": [dict(row, turns_per_second=row["turns_per_second"] * 2) for row in report["results"]]}
+    comparison = compare(report, slower, tolerance=0.1)
+    assert len(comparison) == len(SCENARIOS)
+    assert all(row["regression"] for row in comparison)
+    assert not any(row["regression"] for row in compare(report, report))
@@ -0,0 +1,73 @@
+import operator
+import random
+
+from bots.bot_interface import BotInterface
+from simulator.cache import ResultCache, result_key, spec_for
+from simulator.league import play_league
+from simulator.loader import BotSpec
+from simulator.match import run_seeded_match
+from simulator.sandbox import SandboxedBot
+from tests.test_league import ChaserBot, IdleBot
+
+
+class WanderBot(BotInterface):
+    """Moves and aims at random, so the outcome depends on the bot's RNG."""
+
+    @property
+    def name(self):
+        return "Wanderer"
+
+    def decide(self, state):
+        opp = state["opponent"]["position"]
+        target = [opp[0] + random.randint(-1, 1), opp[1] + random.randint(-1, 1)]
+        return {"move": [random.randint(-1, 1), random.randint(-1, 1)], "spell": {"name": "fireball", "target": target}}
+
+
+def test_key_depends_on_side_seed_and_turn_limit():
+    chaser, idle = BotSpec.of(ChaserBot), BotSpec.of(IdleBot)
+    key = result_key(chaser, idle, 1, 100)
+    assert key == result_key(chaser, idle, 1, 100)
+    assert key != result_key(idle, chaser, 1, 100)
+    assert key != result_key(chaser, idle, 2, 100)
+    assert key != result_key(chaser, idle, 1, 50)
+
+
+def test_sandboxed_bots_are_keyed_apart_from_in_process_runs():
+    with SandboxedBot.wrap(ChaserBot()) as bot:
+        assert spec_for(bot) == BotSpec.of(ChaserBot)
+    chaser, idle = BotSpec.of(ChaserBot), BotSpec.of(IdleBot)
+    assert result_key(chaser, idle, 1, 100, (True, True)) != result_key(chaser, idle, 1, 100)
+
+
+def _sandboxed_run(seed):
+    with SandboxedBot.wrap(WanderBot()) as bot1, SandboxedBot.wrap(WanderBot()) as bot2:
+        winner, turns, logger = run_seeded_match(bot1, bot2, seed=seed, max_turns=40)
+        return winner if winner == "Draw" else [bot1, bot2].index(winner), turns, logger.get_snapshots()
+
+
+def test_sandboxed_seeded_match_reproduces():
+    # Fresh workers every run, so only the seed sent to them can make the runs agree
+    assert _sandboxed_run(5) == _sandboxed_run(5)
+    assert _sandboxed_run(5)[2] != _sandboxed_run(6)[2]
+
+
+def test_seeded_match_is_read_back_from_cache(tmp_path):
+    chaser, idle = ChaserBot(), IdleBot()
+    with ResultCache(str(tmp_path / "cache.sqlite")) as cache:
+        winner, turns, logger = run_seeded_match(chaser, idle, seed=3, cache=cache, max_turns=30)
+        assert logger is not None
+
+        cached_winner, cached_turns, cached_logger = run_seeded_match(chaser, idle, seed=3, cache=cache, max_turns=30)
+        assert cached_logger is None
+        assert (cached_winner, cached_turns) == (winner, turns)
+        assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_league_skips_cached_games(tmp_path):
+    specs = {"Chaser": BotSpec.of(ChaserBot), "Idle": BotSpec.of(IdleBot)}
+    with ResultCache(str(tmp_path / "cache.sqlite")) as cache:
+        first = play_league(specs, double=True, workers=2, max_turns=30, seed=4, cache=cache)
+        second = play_league(specs, double=True, workers=2, max_turns=30, seed=4, cache=cache)
+        assert cache.hits == 2
+        by_game = operator.itemgetter("game")
+        assert sorted(second.results, key=by_game) == sorted(first.results, key=by_game)
@@ -0,0 +1,80 @@
+import random
+
+import pytest
+
+import main
+from bots.bot_interface import BotInterface
+from simulator.checkpoint import load_checkpoint, restore_rng_state, rng_state, save_checkpoint
+
+
+def test_rng_state_survives_a_json_round_trip(tmp_path):
+    path = str(tmp_path / "state.json")
+    rng = random.Random(3)
+    save_checkpoint(path, {"rng": rng_state(rng)})
+    expected = [rng.random() for _ in range(5)]
+
+    restored = random.Random()
+    restore_rng_state(load_checkpoint(path)["rng"], restored)
+    assert [restored.random() for _ in range(5)] == expected
+    assert load_checkpoint(str(tmp_path / "missing.json")) is None
+
+
+def _field(size):
+    bots = []
+    for i in range(size):
+
+        class Duelist(BotInterface):
+            name = f"Duelist {i}"
+            aggression = 0.6 + i / 40
+
+            def decide(self, state):
+                me, opp = state["self"]["position"], state["opponent"]["position"]
+                step = [(opp[0] > me[0]) - (opp[0] < me[0]), random.randint(-1, 1)]
+                spell = {"name": "fireball", "target": opp} if random.random() < self.aggression else None
+                return {"move": step, "spell": spell}
+
+        bots.append(Duelist())
+    return bots
+
+
+def test_resumed_tournament_skips_finished_matches(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "discover_bots", lambda: _field(7))
+    checkpoint = str(tmp_path / "tournament.json")
+    expected_winner, expected_stats = main.run_tournament(headless=True, seed=5, checkpoint=None)
+
+    real_match = main.run_seeded_match
+    played = []
+
+    def crash_on_fourth(*args, **kwargs):
+        if len(played) == 3:
+            raise RuntimeError("crashed")
+        played.append(args)
+        return real_match(*args, **kwargs)
+
+    monkeypatch.setattr(main, "run_seeded_match", crash_on_fourth)
+    with pytest.raises(RuntimeError):
+        main.run_tournament(headless=True, seed=5, checkpoint=checkpoint)
+
+    resumed = []
+    monkeypatch.setattr(main, "run_seeded_match", lambda *a, **k: resumed.append(a) or real_match(*a, **k))
+    winner, stats = main.run_tournament(headless=True, seed=5, checkpoint=checkpoint, resume=True)
+
+    assert winner.name == expected_winner.name
+    assert [m["winner"] for m in stats["matches"]] == [m["winner"] for m in expected_stats["matches"]]
+    assert not {(a[0].name, a[1].name, a[2]) for a in played} & {(a[0].name, a[1].name, a[2]) for a in resumed}
+    assert load_checkpoint(checkpoint)["finished"]
+
+
+def test_unfinished_checkpoint_is_not_overwritten_without_resume(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "discover_bots", lambda: _field(4))
+    checkpoint = str(tmp_path / "tournament.json")
+    save_checkpoint(checkpoint, {"seed": 5, "round": 1})
+
+    with pytest.raises(ValueError, match="--resume"):
+        main.run_tournament(headless=True, seed=5, checkpoint=checkpoint)
+    assert load_checkpoint(checkpoint) == {"seed": 5, "round": 1}
+
+    save_checkpoint(checkpoint, {"seed": 5, "finished": True, "winner": "Duelist 0", "stats": {}})
+    winner, _ = main.run_tournament(headless=True, seed=5, checkpoint=checkpoint)
+    assert winner is not None
+    assert load_checkpoint(checkpoint)["finished"]
@@ -0,0 +1,52 @@
+from simulator.latency import flag_row, flip_state, measure_bot, measure_isolated, percentile, record_corpus
+from simulator.loader import BotSpec
+from tests.test_league import ChaserBot, IdleBot
+from tests.test_sandbox import FaultyBot, SleepyBot
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile(values, 100) == 100
+    assert percentile([], 50) == 0.0
+
+
+def test_corpus_contains_both_points_of_view():
+    corpus = record_corpus([BotSpec.of(ChaserBot), BotSpec.of(IdleBot)], matches=2, max_turns=10)
+    assert corpus
+    assert all("state_index" not in state for state in corpus)
+    assert flip_state(corpus[0]) in corpus
+
+
+def test_measure_bot_counts_failures():
+    corpus = record_corpus([BotSpec.of(ChaserBot), BotSpec.of(IdleBot)], matches=1, max_turns=5)
+    row = measure_bot(FaultyBot(), corpus)
+    assert row["calls"] == row["failures"] == len(corpus)
+    assert "failed decisions" in " ".join(flag_row(row, limit_ms=100))
+
+    row = measure_bot(ChaserBot(), corpus)
+    assert row["failures"] == row["invalid_actions"] == 0
+    assert 0 <= row["p50_ms"] <= row["p99_ms"] <= row["max_ms"]
+
+
+def test_stalled_bot_is_abandoned():
+    row = measure_isolated(BotSpec.of(SleepyBot), [{"turn": 1}], timeout=0.5)
+    assert row["error"].startswith("stalled")
+    assert flag_row(row, limit_ms=100) == [row["error"]]
+
+
+def test_corpus_recording_survives_failing_and_stalling_bots():
+    problems = {}
+    specs = [BotSpec.of(ChaserBot), BotSpec.of(FaultyBot), BotSpec.of(SleepyBot)]
+    corpus = record_corpus(
+        specs,
+        matches=3,
+        max_turns=5,
+        decide_timeout=0.2,
+        on_problem=lambda name, message: problems.setdefault(name, message),
+    )
+    assert corpus
+    assert "failed decisions" in problems["Faulty Bot"]
+    assert "timeouts" in problems["Sleepy Bot"]
+    assert "Chaser" not in problems
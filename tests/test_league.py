@@ -0,0 +1,69 @@
+from bots.bot_interface import BotInterface
+from simulator.league import load_results, play_league, schedule_league
+from simulator.loader import BotSpec
+from simulator.ratings import Elo, Glicko
+
+
+class ChaserBot(BotInterface):
+    @property
+    def name(self):
+        return "Chaser"
+
+    def decide(self, state):
+        me, opp = state["self"]["position"], state["opponent"]["position"]
+        move = [(opp[0] > me[0]) - (opp[0] < me[0]), (opp[1] > me[1]) - (opp[1] < me[1])]
+        return {"move": move, "spell": {"name": "fireball", "target": opp}}
+
+
+class IdleBot(BotInterface):
+    @property
+    def name(self):
+        return "Idle"
+
+    def decide(self, state):
+        return {"move": [0, 0], "spell": None}
+
+
+def test_elo_is_zero_sum_and_rewards_winner():
+    elo = Elo()
+    elo.update("a", "b", 1.0)
+    assert elo.rating("a") > 1500 > elo.rating("b")
+    assert elo.rating("a") + elo.rating("b") == 3000
+
+
+def test_glicko_deviation_shrinks_with_games():
+    glicko = Glicko()
+    for _ in range(5):
+        glicko.update("a", "b", 1.0)
+    (name, rating, rd), _ = glicko.leaderboard()
+    assert name == "a" and rating > 1500
+    assert rd < glicko.initial_rd
+
+
+def test_double_round_robin_schedule_is_reproducible():
+    games = schedule_league(["a", "b", "c"], double=True, seed=7)
+    assert len(games) == 6
+    assert {(g.bot1, g.bot2) for g in games} == {("a", "b"), ("b", "a"), ("a", "c"), ("c", "a"), ("b", "c"), ("c", "b")}
+    assert games == schedule_league(["c", "b", "a"], double=True, seed=7)
+
+
+def test_league_resumes_from_results_file(tmp_path):
+    specs = {"Chaser": BotSpec.of(ChaserBot), "Idle": BotSpec.of(IdleBot)}
+    results = tmp_path / "league.jsonl"
+
+    table = play_league(specs, double=True, workers=2, results_path=str(results), max_turns=30, seed=1)
+    assert len(table.results) == 2
+    assert table.standings()[0]["name"] == "Chaser"
+
+    played = []
+    resumed = play_league(
+        specs,
+        double=True,
+        workers=2,
+        results_path=str(results),
+        max_turns=30,
+        seed=1,
+        on_result=lambda result, _: played.append(result),
+    )
+    assert played == []
+    assert resumed.results == load_results(str(results)) == table.results
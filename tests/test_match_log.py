@@ -0,0 +1,63 @@
+import random
+
+import pytest
+
+from game.engine import GameEngine
+from game.logger import LOG_LEVEL_QUIET, GameLogger
+from simulator.match import run_match
+from simulator.match_log import MatchLogReader, MatchLogWriter
+from tests.test_league import ChaserBot, IdleBot
+
+
+def _play_in_memory(seed):
+    random.seed(seed)
+    engine = GameEngine(ChaserBot(), IdleBot(), logger=GameLogger(LOG_LEVEL_QUIET))
+    for _ in range(60):
+        if engine.run_turn():
+            break
+    engine.finalize()
+    return engine.logger
+
+
+@pytest.mark.parametrize("filename", ["matches.jsonl", "matches.jsonl.gz"])
+def test_streamed_match_loads_back_like_the_in_memory_log(tmp_path, filename):
+    path = str(tmp_path / filename)
+    with MatchLogWriter(path) as writer:
+        for seed in range(3):
+            random.seed(seed)
+            _, logger = run_match(ChaserBot(), IdleBot(), max_turns=60, stream=writer)
+            # Only the latest snapshot stays in memory
+            assert len(logger.get_snapshots()) == 1
+            assert not logger.events and not logger.spells and not logger.get_log()
+
+    reader = MatchLogReader(path)
+    assert [entry["match"] for entry in reader.matches()] == [0, 1, 2]
+    assert reader.matches()[1]["winner"] == "Chaser"
+
+    expected = _play_in_memory(1)
+    loaded = reader.load(1)
+    assert loaded.get_snapshots() == expected.get_snapshots()
+    # The closing line names the winning bot object, which differs between runs
+    assert loaded.get_log()[:-1] == expected.get_log()[:-1]
+    assert loaded.get_event_logs() == expected.get_event_logs()
+    assert loaded.spells == expected.spells
+    assert loaded.damage_events == expected.damage_events
+
+
+def test_writer_drops_unindexed_tail_on_reopen(tmp_path):
+    path = str(tmp_path / "matches.jsonl")
+    with MatchLogWriter(path) as writer:
+        run_match(IdleBot(), IdleBot(), max_turns=3, stream=writer)
+        # Started but never finished, as after a crash
+        writer.start_match("Idle", "Idle")
+        writer.write("log", "partial")
+    with open(path + ".index.jsonl", "a") as f:
+        f.write('{"match": 1, "off')
+
+    with MatchLogWriter(path) as writer:
+        assert writer.matches_written == 1
+        run_match(IdleBot(), IdleBot(), max_turns=2, stream=writer)
+
+    reader = MatchLogReader(path)
+    assert [(entry["match"], entry["turns"]) for entry in reader.matches()] == [(0, 3), (1, 2)]
+    assert "partial" not in [data for kind, data in reader.records(1)]
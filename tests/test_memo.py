@@ -0,0 +1,68 @@
+import random
+
+from bots.bot_interface import BotInterface
+from simulator.latency import record_corpus
+from simulator.loader import BotSpec
+from simulator.match import run_match
+from simulator.memo import MemoizedBot, check_deterministic, memoize_if_deterministic, state_key
+from tests.test_league import ChaserBot, IdleBot
+
+
+class CoinFlipBot(BotInterface):
+    name = "CoinFlip"
+
+    def decide(self, state):
+        return {"move": [random.choice([-1, 1]), 0], "spell": None}
+
+
+class CountingBot(BotInterface):
+    name = "Counting"
+
+    def __init__(self):
+        self.turns = 0
+
+    def decide(self, state):
+        self.turns += 1
+        return {"move": [1 if self.turns % 3 else -1, 0], "spell": None}
+
+
+def _corpus():
+    return record_corpus([BotSpec.of(ChaserBot), BotSpec.of(IdleBot)], matches=2, max_turns=20)
+
+
+def test_state_key_ignores_key_order():
+    assert state_key({"a": 1, "b": [1, 2]}) == state_key({"b": [1, 2], "a": 1})
+    assert state_key({"a": 1}) != state_key({"a": 2})
+
+
+def test_only_deterministic_bots_are_memoized():
+    corpus = _corpus()
+    assert check_deterministic(ChaserBot(), corpus)
+    assert isinstance(memoize_if_deterministic(ChaserBot(), corpus), MemoizedBot)
+
+    random.seed(7)
+    expected = random.random()
+    random.seed(7)
+    for bot in (CoinFlipBot(), CountingBot()):
+        assert not check_deterministic(bot, corpus)
+        assert memoize_if_deterministic(bot, corpus) is bot
+    # The check doesn't disturb the caller's random sequence
+    assert random.random() == expected
+
+
+def test_memoized_bot_plays_the_same_match():
+    random.seed(3)
+    winner, logger = run_match(ChaserBot(), IdleBot(), max_turns=40)
+    memoized = MemoizedBot(ChaserBot(), max_entries=8)
+    random.seed(3)
+    memo_winner, memo_logger = run_match(memoized, IdleBot(), max_turns=40)
+
+    assert memo_winner.name == winner.name
+    assert memo_logger.get_snapshots() == logger.get_snapshots()
+    assert memoized.misses > 0 and len(memoized._cache) <= 8
+
+    state = memo_logger.get_snapshots()[0]
+    first = memoized.decide(state)
+    first["move"][0] = 99
+    assert memoized.decide(state)["move"][0] != 99
+    assert memoized.hits >= 1
@@ -0,0 +1,84 @@
+import os
+
+from game.recorder import RECORD_SIZE, RESULT_FIRST_WINS, DecisionReader, DecisionRecorder
+from simulator.match import run_match
+from tests.test_league import ChaserBot, IdleBot
+
+
+def test_records_every_decision_of_a_match(tmp_path):
+    path = str(tmp_path / "decisions.bin")
+    with DecisionRecorder(path) as recorder:
+        winner, logger = run_match(ChaserBot(), IdleBot(), max_turns=60, recorder=recorder)
+        run_match(IdleBot(), IdleBot(), max_turns=5, recorder=recorder)
+
+    reader = DecisionReader(path)
+    first, second = reader.matches()
+    turns = logger.get_snapshots()[-1]["turn"]
+    assert (first["turns"], first["count"]) == (turns, 2 * turns)
+    assert (first["bot1"], first["bot2"]) == ("Chaser", "Idle")
+    assert first["result"] == RESULT_FIRST_WINS and winner.name == "Chaser"
+    assert (second["first"], second["count"], second["result"]) == (first["count"], 10, 0)
+    assert len(reader) == first["count"] + 10
+
+    records = list(reader.records(0))
+    opening = records[0]
+    assert (opening["turn"], opening["side"]) == (1, 0)
+    assert opening["state"]["self"]["position"] == [0, 0]
+    assert opening["state"]["opponent"]["position"] == [9, 9]
+    assert opening["action"]["move"] == [1, 1]
+    assert records[1]["state"]["self"]["position"] == [9, 9]
+    assert records[1]["action"]["move"] == [0, 0]
+    assert records[-2]["outcome"]["result"] == "win" and records[-1]["outcome"]["result"] == "loss"
+    assert records[-1]["outcome"]["self_hp"] <= 0
+
+
+def test_find_and_array_views(tmp_path):
+    path = str(tmp_path / "decisions.bin")
+    with DecisionRecorder(path) as recorder:
+        run_match(ChaserBot(), IdleBot(), max_turns=60, recorder=recorder)
+
+    reader = DecisionReader(path)
+    found = reader.find(0, turn=3, side=1)
+    assert (found["turn"], found["side"]) == (3, 1)
+    assert reader.find(0, turn=1000) is None
+
+    array = reader.array(0)
+    assert len(array) == reader.matches()[0]["count"]
+    assert (array["side"][:4] == [0, 1, 0, 1]).all()
+    assert array["self_hp"][1] == 100
+
+
+def test_unfinished_match_is_dropped_on_reopen(tmp_path):
+    path = str(tmp_path / "decisions.bin")
+    with DecisionRecorder(path) as recorder:
+        run_match(IdleBot(), IdleBot(), max_turns=3, recorder=recorder)
+    size = os.path.getsize(path)
+
+    # Records without an index entry, as left by a crash while writing
+    with open(path, "ab") as f:
+        f.write(b"\0" * (RECORD_SIZE + 7))
+
+    with DecisionRecorder(path) as recorder:
+        assert os.path.getsize(path) == size
+        run_match(IdleBot(), IdleBot(), max_turns=2, recorder=recorder)
+
+    reader = DecisionReader(path)
+    assert [m["match"] for m in reader.matches()] == [0, 1]
+    assert [r["turn"] for r in reader.records(1)] == [1, 1, 2, 2]
+
+
+def test_metadata_of_an_unfinished_match_is_dropped_on_reopen(tmp_path):
+    path = str(tmp_path / "decisions.bin")
+    with DecisionRecorder(path) as recorder:
+        run_match(ChaserBot(), IdleBot(), max_turns=3, recorder=recorder)
+
+    # A metadata line written just before a crash, ahead of its index entry, and a torn one
+    with open(path + ".meta.jsonl", "a") as f:
+        f.write('{"match": 1, "bot1": "Lost", "bot2": "Lost", "board_size": 10}\n{"match": 2, "bo')
+
+    with DecisionRecorder(path) as recorder:
+        run_match(IdleBot(), ChaserBot(), max_turns=2, recorder=recorder)
+
+    with open(path + ".meta.jsonl") as f:
+        assert len(f.readlines()) == 2
+    assert [(m["match"], m["bot1"]) for m in DecisionReader(path).matches()] == [(0, "Chaser"), (1, "Idle")]
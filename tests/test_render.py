@@ -0,0 +1,52 @@
+import os
+import random
+
+import pytest
+
+from simulator.match import run_match
+from simulator.match_log import MatchLogWriter
+from simulator.render import Portrait, render_logger, render_match_log
+from simulator.visualizer import ANIMATION_DURATION, END_SCREEN_DURATION, FPS, Visualizer
+from tests.test_league import ChaserBot, IdleBot
+
+
+def _expected_frames(states):
+    per_transition = 2 * int(FPS * ANIMATION_DURATION / 2) + round(ANIMATION_DURATION * FPS)
+    return round(0.3 * FPS) + (states - 1) * per_transition + round(END_SCREEN_DURATION * FPS)
+
+
+def test_renders_every_frame_offscreen():
+    random.seed(0)
+    _, logger = run_match(ChaserBot(), IdleBot(), max_turns=3)
+    frames = []
+    visualizer = Visualizer(logger, Portrait("Chaser"), Portrait("Idle"), on_frame=lambda s: frames.append(s.copy()))
+    visualizer.run(logger.get_snapshots(), False)
+
+    assert len(frames) == visualizer.frame_count == _expected_frames(len(logger.get_snapshots()))
+    # Animation time follows the frames, so the last frame is at the clip's length
+    assert visualizer.ticks() == len(frames) * 1000 // FPS
+
+
+def test_png_frames(tmp_path):
+    random.seed(0)
+    _, logger = run_match(ChaserBot(), IdleBot(), max_turns=1)
+    frames = render_logger(logger, Portrait("Chaser"), Portrait("Idle"), str(tmp_path / "frames"), "png")
+    assert len(os.listdir(tmp_path / "frames")) == frames == _expected_frames(len(logger.get_snapshots()))
+
+
+def test_match_log_is_rendered_in_parallel(tmp_path):
+    path = str(tmp_path / "matches.jsonl")
+    with MatchLogWriter(path) as writer:
+        for seed in range(3):
+            random.seed(seed)
+            run_match(ChaserBot(), IdleBot(), max_turns=1, stream=writer)
+
+    done = []
+    rows = render_match_log(path, str(tmp_path / "out"), matches=[0, 2], fmt="png", workers=2, on_done=done.append)
+    assert [row["match"] for row in rows] == [0, 2] and len(done) == 2
+    for row in rows:
+        assert "error" not in row
+        assert len(os.listdir(row["output"])) == row["frames"] > 0
+
+    with pytest.raises(ValueError):
+        render_match_log(path, str(tmp_path / "out"), matches=[5], fmt="png")
@@ -0,0 +1,70 @@
+import random
+
+import pytest
+
+from simulator.match import run_match
+from simulator.match_log import MatchLogReader, MatchLogWriter
+from simulator.render import Portrait
+from simulator.replay import Replay, ReplayPlayer
+from simulator.visualizer import ANIMATION_DURATION, FPS
+from tests.test_league import ChaserBot, IdleBot
+
+
+def _replay(tmp_path, max_turns=12):
+    path = str(tmp_path / "matches.jsonl.gz")
+    with MatchLogWriter(path) as writer:
+        random.seed(0)
+        run_match(ChaserBot(), IdleBot(), max_turns=max_turns, stream=writer)
+    return Replay(MatchLogReader(path), 0), MatchLogReader(path).load(0)
+
+
+def _player(replay, **kwargs):
+    frames = []
+    player = ReplayPlayer(replay, Portrait("Chaser"), Portrait("Idle"), on_frame=frames.append, **kwargs)
+    return player, frames
+
+
+def test_replay_indexes_turns_and_parses_states_lazily(tmp_path):
+    replay, logger = _replay(tmp_path)
+    states = logger.get_snapshots()
+    assert len(replay) == len(states) and replay.parsed == 0
+    assert replay.spells == logger.spells and replay.damage_events == logger.damage_events
+    for turn, index in replay.keyframes.items():
+        assert states[index]["turn"] == turn and (index == 0 or states[index - 1]["turn"] < turn)
+
+    assert replay.state(len(states) - 1) == states[-1]
+    assert replay.parsed == 1
+
+
+def test_seeking_renders_only_the_target_state(tmp_path):
+    replay, logger = _replay(tmp_path)
+    player, frames = _player(replay)
+
+    last_turn = logger.get_snapshots()[-1]["turn"]
+    player.seek_turn(last_turn)
+    assert len(frames) == 1 and replay.parsed == 1
+    assert player.turn == last_turn and player.position == replay.keyframes[last_turn]
+
+    player.seek(0)
+    player.seek_turn(last_turn + 5)
+    assert player.position == len(replay) - 1
+
+
+def test_speed_and_skipped_animations_shorten_steps(tmp_path):
+    replay, _ = _replay(tmp_path)
+
+    player, frames = _player(replay)
+    assert player.step()
+    assert len(frames) == 2 * int(FPS * ANIMATION_DURATION / 2)
+
+    player, frames = _player(replay, speed=4)
+    player.step()
+    assert len(frames) == 2 * int(FPS * ANIMATION_DURATION / 8)
+
+    player, frames = _player(replay, animate=False)
+    while player.step():
+        pass
+    assert len(frames) == len(replay) - 1 and player.position == len(replay) - 1
+
+    with pytest.raises(ValueError):
+        player.speed = 32
@@ -0,0 +1,110 @@
+import os
+import time
+
+from bots.bot_interface import BotInterface
+from simulator.loader import BotSpec, load_bot
+from simulator.match import run_match
+from simulator.sandbox import SandboxedBot, default_action
+
+
+class StepBot(BotInterface):
+    @property
+    def name(self):
+        return "Step Bot"
+
+    def decide(self, state):
+        return {"move": [1, 1], "spell": None}
+
+
+class CrashOnceBot(BotInterface):
+    """Kills its worker on turn 2, behaves afterwards."""
+
+    @property
+    def name(self):
+        return "Crash Bot"
+
+    def decide(self, state):
+        if state["turn"] == 2:
+            os._exit(1)
+        return {"move": [0, 1], "spell": None}
+
+
+class SleepyBot(BotInterface):
+    @property
+    def name(self):
+        return "Sleepy Bot"
+
+    def decide(self, state):
+        time.sleep(5)
+        return {"move": [1, 0], "spell": None}
+
+
+class FaultyBot(BotInterface):
+    @property
+    def name(self):
+        return "Faulty Bot"
+
+    def decide(self, state):
+        raise ValueError("boom")
+
+
+def test_bot_spec_round_trip():
+    spec = BotSpec.of(StepBot())
+    assert spec.qualname == "StepBot"
+    assert spec == BotSpec.of(StepBot)
+    assert isinstance(load_bot(spec), StepBot)
+
+
+def test_sandboxed_bot_decides_in_worker():
+    with SandboxedBot.wrap(StepBot()) as bot:
+        assert bot.name == "Step Bot"
+        assert bot.pid is not None and bot.pid != os.getpid()
+        assert bot.decide({"turn": 1}) == {"move": [1, 1], "spell": None}
+
+
+def test_crashed_worker_is_restarted():
+    with SandboxedBot.wrap(CrashOnceBot()) as bot:
+        first_pid = bot.pid
+        assert bot.decide({"turn": 2}) == default_action()
+        assert bot.restarts == 1
+        assert bot.pid != first_pid
+        assert bot.decide({"turn": 3}) == {"move": [0, 1], "spell": None}
+
+
+def test_slow_decision_times_out():
+    with SandboxedBot(BotSpec.of(SleepyBot), decide_timeout=0.2, max_restarts=0) as bot:
+        assert bot.decide({"turn": 1}) == default_action()
+        assert bot.timeouts == 1
+        # Restart budget exhausted: the bot is disabled and answers instantly
+        assert bot.decide({"turn": 2}) == default_action()
+
+
+def test_bot_errors_do_not_restart_worker():
+    with SandboxedBot.wrap(FaultyBot()) as bot:
+        pid = bot.pid
+        assert bot.decide({"turn": 1}) == default_action()
+        assert bot.errors == 1
+        assert bot.restarts == 0
+        assert bot.pid == pid
+
+
+def test_run_match_sandboxed_maps_winner_back():
+    bot1, bot2 = StepBot(), FaultyBot()
+    winner, logger = run_match(bot1, bot2, max_turns=5, sandbox=True)
+    assert winner in (bot1, bot2, "Draw")
+    assert logger.get_snapshots()
+
+
+def test_mirror_match_sandboxes_each_seat(monkeypatch):
+    bot = StepBot()
+    proxies = []
+    wrap = SandboxedBot.wrap
+
+    def spy(bot, **kwargs):
+        proxies.append(wrap(bot, **kwargs))
+        return proxies[-1]
+
+    monkeypatch.setattr(SandboxedBot, "wrap", spy)
+    winner, logger = run_match(bot, bot, max_turns=5, sandbox=True)
+    assert len(proxies) == 2 and proxies[0] is not proxies[1]
+    assert winner in (bot, "Draw")
@@ -0,0 +1,58 @@
+import pytest
+
+from simulator.cache import ResultCache
+from simulator.loader import BotSpec
+from simulator.sequential import SPRT, play_until_confident
+from tests.test_league import ChaserBot, IdleBot
+from tests.test_sandbox import FaultyBot
+
+
+def test_sprt_decides_for_dominant_bot():
+    sprt = SPRT(confidence=0.95, margin=0.1)
+    for _ in range(20):
+        if sprt.decision:
+            break
+        sprt.add(0.0)
+    assert sprt.decision == "bot2"
+    assert sprt.games < 20
+
+
+def test_sprt_stays_undecided_on_even_results():
+    sprt = SPRT()
+    for score in [1.0, 0.0] * 10:
+        sprt.add(score)
+    assert sprt.decision is None
+
+
+def test_sprt_rejects_bad_parameters():
+    with pytest.raises(ValueError):
+        SPRT(confidence=0.4)
+    with pytest.raises(ValueError):
+        SPRT(margin=0.6)
+
+
+def test_play_until_confident_stops_early():
+    result = play_until_confident(BotSpec.of(ChaserBot), BotSpec.of(IdleBot), max_games=50, workers=2, max_turns=30)
+    assert result.decision == "bot1"
+    assert result.games_saved > 0
+    assert len(result.scores) == len(result.turns) == result.max_games - result.games_saved
+
+
+def test_failed_games_are_reported_without_aborting_the_run():
+    result = play_until_confident(BotSpec.of(FaultyBot), BotSpec.of(IdleBot), max_games=4, workers=2, max_turns=5)
+    assert result.decision is None
+    assert result.scores == []
+    assert len(result.errors) == 4
+    assert "ValueError: boom" in result.errors[0]
+    assert result.games_saved == 0
+
+
+def test_seeded_run_is_replayed_from_the_cache(tmp_path):
+    specs = BotSpec.of(ChaserBot), BotSpec.of(IdleBot)
+    with ResultCache(str(tmp_path / "results.sqlite")) as cache:
+        first = play_until_confident(*specs, max_games=6, workers=2, max_turns=30, seed=3, cache=cache)
+        assert cache.misses == len(first.scores)
+
+        second = play_until_confident(*specs, max_games=6, workers=2, max_turns=30, seed=3, cache=cache)
+        assert cache.hits == len(second.scores)
+        assert (second.scores, second.turns) == (first.scores, first.turns)
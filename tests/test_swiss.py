@@ -0,0 +1,39 @@
+import random
+
+from simulator.loader import BotSpec
+from simulator.swiss import SwissPairing, SwissTable, pair_round, play_swiss
+from tests.test_league import ChaserBot, IdleBot
+
+
+def test_pairings_never_repeat_and_byes_rotate():
+    names = [f"bot{i}" for i in range(7)]
+    table = SwissTable(names)
+    rng = random.Random(0)
+    for round_num in range(1, 6):
+        pairs = pair_round(table, rng)
+        byes = [bot1 for bot1, bot2 in pairs if bot2 is None]
+        assert len(byes) == 1 and byes[0] not in table.byes
+        assert not {frozenset(pair) for pair in pairs if pair[1]} & table.played()
+        assert sorted(name for pair in pairs for name in pair if name) == sorted(names)
+        for bot1, bot2 in pairs:
+            scores = () if bot2 is None else (float(bot1 < bot2),)
+            table.add(SwissPairing(round_num, bot1, bot2, scores))
+
+
+def test_pairs_bots_on_equal_scores():
+    table = SwissTable(["a", "b", "c", "d"])
+    table.add(SwissPairing(1, "a", "b", (1.0,)))
+    table.add(SwissPairing(1, "c", "d", (1.0,)))
+    pairs = {frozenset(pair) for pair in pair_round(table, random.Random(1))}
+    assert pairs == {frozenset(("a", "c")), frozenset(("b", "d"))}
+
+
+def test_series_score_and_standings():
+    specs = {"Chaser": BotSpec.of(ChaserBot), "Idle": BotSpec.of(IdleBot)}
+    seen = []
+    table = play_swiss(
+        specs, best_of=3, workers=2, max_turns=30, seed=2, on_pairing=lambda pairing, _: seen.append(pairing)
+    )
+    assert len(seen) == 1 and len(seen[0].scores) == 3
+    assert [row["name"] for row in table.standings()] == ["Chaser", "Idle"]
+    assert table.standings()[0]["score"] == 1.0
@@ -0,0 +1,58 @@
+import random
+import zlib
+
+import pygame
+
+from bots.sample_bot1.sample_bot_1 import SampleBot1
+from bots.sample_bot3.sample_bot_3 import SampleBot3
+from simulator.match import run_match
+from simulator.visualizer import Visualizer
+
+
+def _frames(logger, bot1, bot2, full_redraw):
+    frames = []
+
+    def keep(screen):
+        frames.append(zlib.crc32(pygame.image.tobytes(screen, "RGB")))
+        if full_redraw:
+            visualizer.drawn = [screen.get_rect()]
+
+    visualizer = Visualizer(logger, bot1, bot2, on_frame=keep)
+    states = logger.get_snapshots()
+    for i in range(len(states) - 1):
+        visualizer.animate_transition(states[i], states[i + 1], i)
+    return frames, visualizer
+
+
+def test_dirty_rect_frames_match_full_redraws():
+    random.seed(4)
+    bot1, bot2 = SampleBot1(), SampleBot3()
+    _, logger = run_match(bot1, bot2, max_turns=8)
+    assert logger.spells and logger.damage_events
+
+    partial, visualizer = _frames(logger, bot1, bot2, full_redraw=False)
+    full, _ = _frames(logger, bot1, bot2, full_redraw=True)
+    assert len(partial) == len(full) > 0
+    assert partial == full
+
+    # Replaying the same transitions reuses the cached text, sprites and effect frames
+    cached = len(visualizer.surface_cache)
+    states = logger.get_snapshots()
+    visualizer.animate_transition(states[0], states[1], 0)
+    assert len(visualizer.surface_cache) == cached
+
+
+def test_effects_are_indexed_by_state_as_the_log_grows():
+    random.seed(4)
+    bot1, bot2 = SampleBot1(), SampleBot3()
+    _, logger = run_match(bot1, bot2, max_turns=12)
+    visualizer = Visualizer(logger, bot1, bot2, on_frame=lambda screen: None)
+
+    for index in range(len(logger.get_snapshots())):
+        spells, damage = visualizer.effects_at(index)
+        assert spells == [s for s in logger.spells if s["state_index"] == index]
+        assert damage == [d for d in logger.damage_events if d["state_index"] == index]
+
+    late = {"state_index": 999, "caster": bot1.name, "spell": "heal", "target": None, "hit": None}
+    logger.spells.append(late)
+    assert visualizer.effects_at(999) == ([late], [])